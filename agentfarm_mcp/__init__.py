@@ -1,7 +1,28 @@
 """MCP Server for Simulation Analysis."""
 
-from .config import MCPConfig
-from .server import SimulationMCPServer
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .config import MCPConfig
+    from .server import SimulationMCPServer
 
 __version__ = "0.1.0"
-__all__ = ["SimulationMCPServer", "MCPConfig"]
\ No newline at end of file
+__all__ = ["SimulationMCPServer", "MCPConfig"]
+
+# Public names are resolved on first access so that importing a submodule
+# (e.g. ``agentfarm_mcp.config``) does not pull in FastMCP and every tool.
+_LAZY_ATTRS = {
+    "MCPConfig": ".config",
+    "SimulationMCPServer": ".server",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import public names."""
+    if name in _LAZY_ATTRS:
+        from importlib import import_module
+
+        value = getattr(import_module(_LAZY_ATTRS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
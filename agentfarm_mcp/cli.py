@@ -4,10 +4,62 @@ import argparse
 import sys
 
 from .config import CacheConfig, MCPConfig
-from .server import SimulationMCPServer
 from .utils.logging import setup_logging
 
 
+def list_tools() -> None:
+    """Print the tool catalog without connecting to a database."""
+    from .tools.registry import describe_tools
+
+    tools = sorted(describe_tools(), key=lambda tool: tool["name"])
+
+    print("\nAvailable Tools:")
+    print("=" * 60)
+    for tool in tools:
+        print(f"\n{tool['name']}")
+        print(f"  {tool['description'].strip()[:100]}...")
+    print("\n" + "=" * 60)
+    print(f"Total: {len(tools)} tools")
+
+
+def export_data(config: MCPConfig, args: argparse.Namespace) -> int:
+    """Export simulation tables to files without starting the MCP server.
+
+    Returns:
+        Process exit code
+    """
+    from .services.database_service import DatabaseService
+    from .services.export_service import DEFAULT_EXPORT_TABLES, ExportService
+    from .utils.exceptions import MCPException
+
+    db_service = DatabaseService(config.database)
+    try:
+        if not db_service.validate_simulation_exists(args.export):
+            print(f"\nError: Simulation not found: {args.export}", file=sys.stderr)
+            return 1
+        result = ExportService(db_service).export(
+            args.export,
+            args.output_dir,
+            tables=args.tables or DEFAULT_EXPORT_TABLES,
+            export_format=args.export_format,
+            chunk_size=args.chunk_size,
+        )
+    except MCPException as e:
+        print(f"\nError: {e}", file=sys.stderr)
+        return 1
+    finally:
+        db_service.close()
+
+    print(f"\nExported {args.export} ({result['format']}):")
+    for file in result["files"]:
+        print(f"  {file['path']}: {file['rows']:,} rows, {file['bytes']:,} bytes")
+    print(
+        f"Total: {result['total_rows']:,} rows in {result['elapsed_seconds']}s "
+        f"({result['rows_per_second'] or 0:,.0f} rows/s)"
+    )
+    return 0
+
+
 def main():
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -27,8 +79,17 @@ Examples:
   # Disable caching
   %(prog)s --db-path simulation.db --no-cache
   
-  # List available tools
-  %(prog)s --db-path simulation.db --list-tools
+  # List available tools (no database needed)
+  %(prog)s --list-tools
+
+  # Serve over HTTP (exposes /metrics for Prometheus)
+  %(prog)s --db-path simulation.db --transport http --port 8000
+
+  # Serve over HTTP from 4 pre-forked worker processes
+  %(prog)s --db-path simulation.db --transport http --workers 4
+
+  # Export agent states and actions of a simulation to Parquet and exit
+  %(prog)s --db-path simulation.db --export sim_001 --tables agent_states agent_actions
         """,
     )
 
@@ -54,11 +115,61 @@ Examples:
 
     parser.add_argument("--list-tools", action="store_true", help="List available tools and exit")
 
+    parser.add_argument(
+        "--transport",
+        type=str,
+        default="stdio",
+        choices=["stdio", "http", "sse"],
+        help="MCP transport (default: stdio)",
+    )
+
+    parser.add_argument(
+        "--host", type=str, default="127.0.0.1", help="Bind host for HTTP/SSE transport"
+    )
+
+    parser.add_argument("--port", type=int, default=8000, help="Bind port for HTTP/SSE transport")
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for HTTP transport (default: server.workers from config, 1)",
+    )
+
+    export_group = parser.add_argument_group("export")
+    export_group.add_argument(
+        "--export",
+        metavar="SIMULATION_ID",
+        help="Export tables of a simulation to files and exit",
+    )
+    export_group.add_argument(
+        "--tables",
+        nargs="+",
+        help="Tables to export (default: agent_states agent_actions interactions)",
+    )
+    export_group.add_argument(
+        "--export-format",
+        default="parquet",
+        choices=["parquet", "arrow", "csv"],
+        help="Export file format (default: parquet)",
+    )
+    export_group.add_argument(
+        "--output-dir", default="exports", help="Export base directory (default: exports)"
+    )
+    export_group.add_argument(
+        "--chunk-size", type=int, default=50000, help="Rows per export chunk (default: 50000)"
+    )
+
     args = parser.parse_args()
 
     # Setup logging first
     setup_logging(log_level=args.log_level, log_file=args.log_file)
 
+    # Listing tools needs neither a database nor the MCP server
+    if args.list_tools:
+        list_tools()
+        sys.exit(0)
+
     # Validate arguments
     if not args.config and not args.db_path:
         parser.error("Either --db-path or --config must be specified")
@@ -74,29 +185,39 @@ Examples:
         if args.no_cache:
             config.cache = CacheConfig(enabled=False)
 
-        # Create server
-        server = SimulationMCPServer(config)
+        if args.export:
+            sys.exit(export_data(config, args))
+
+        workers = args.workers if args.workers is not None else config.server.workers
+        if workers < 1:
+            parser.error("--workers must be >= 1")
+        if workers > 1 and args.transport != "http":
+            parser.error("--workers > 1 requires --transport http")
 
-        # List tools if requested
-        if args.list_tools:
-            print("\nAvailable Tools:")
-            print("=" * 60)
-            for tool_name in sorted(server.list_tools()):
-                tool = server.get_tool(tool_name)
-                print(f"\n{tool_name}")
-                print(f"  {tool.description.strip()[:100]}...")
-            print("\n" + "=" * 60)
-            print(f"Total: {len(server.list_tools())} tools")
-            sys.exit(0)
+        # Create server (imports FastMCP and all tools)
+        from .server import SimulationMCPServer
+
+        server = SimulationMCPServer(config)
 
         # Run server
         print(f"\nStarting MCP server with {len(server.list_tools())} tools...")
         print(f"Database: {config.database.path}")
         print(f"Cache: {'enabled' if config.cache.enabled else 'disabled'}")
         print(f"Log level: {args.log_level}")
+        if args.transport != "stdio":
+            print(f"Listening on http://{args.host}:{args.port} (metrics at /metrics)")
+        if workers > 1:
+            print(f"Workers: {workers} (stateless HTTP)")
         print("\nPress Ctrl+C to stop the server.\n")
 
-        server.run()
+        if args.transport == "stdio":
+            server.run()
+        elif workers > 1:
+            from .workers import serve_workers
+
+            serve_workers(server, workers, transport=args.transport, host=args.host, port=args.port)
+        else:
+            server.run(transport=args.transport, host=args.host, port=args.port)
 
     except KeyboardInterrupt:
         print("\n\nShutting down server...")
@@ -12,6 +12,26 @@ class DatabaseConfig(BaseModel):
     pool_size: int = Field(5, ge=1, le=20, description="Connection pool size")
     query_timeout: int = Field(30, ge=5, le=300, description="Query timeout in seconds")
     read_only: bool = Field(True, description="Read-only access mode")
+    collect_query_stats: bool = Field(
+        False, description="Attach per-call SQL statistics to response metadata"
+    )
+    slow_query_threshold_ms: float | None = Field(
+        1000.0, ge=0, description="Log statements slower than this (None disables)"
+    )
+    search_index_path: str | None = Field(
+        None,
+        description="SQLite file for the full-text search index "
+        "(default: <database>.search.db, or the temp directory)",
+    )
+    rollup_path: str | None = Field(
+        None,
+        description="SQLite file for precomputed analysis rollups "
+        "(default: <database>.rollups.db, or the temp directory)",
+    )
+    export_dir: str = Field(
+        "exports",
+        description="Directory that the export_simulation_data tool may write under",
+    )
     database_type: str = Field("sqlite", description="Database type (sqlite, postgresql, etc.)")
     
     # PostgreSQL specific fields (optional)
@@ -157,6 +177,9 @@ class ServerConfig(BaseModel):
     environment: str = Field("development", description="Environment: development, staging, production")
     structured_logging: bool = Field(True, description="Use structured logging (structlog)")
     json_logs: bool = Field(False, description="Output JSON formatted logs")
+    workers: int = Field(
+        1, ge=1, le=64, description="Worker processes for the HTTP transport (1 = single process)"
+    )
 
     @field_validator("log_level")
     @classmethod
@@ -179,12 +202,54 @@ class ServerConfig(BaseModel):
         return v_lower
 
 
+class AdmissionConfig(BaseModel):
+    """Admission control (load shedding) configuration."""
+
+    enabled: bool = Field(True, description="Enable adaptive admission control")
+    initial_limit: int = Field(32, ge=1, le=1024, description="Initial concurrency limit")
+    min_limit: int = Field(4, ge=1, le=1024, description="Minimum concurrency limit")
+    max_limit: int = Field(256, ge=1, le=4096, description="Maximum concurrency limit")
+    latency_threshold_ms: float = Field(
+        2000.0, gt=0, description="Latency above which the limit is decreased"
+    )
+    backoff_ratio: float = Field(
+        0.9, gt=0, lt=1, description="Multiplicative decrease applied on congestion"
+    )
+    low_priority_ratio: float = Field(
+        0.75, gt=0, le=1, description="Fraction of the limit available to low-priority tools"
+    )
+
+    @field_validator("max_limit")
+    @classmethod
+    def validate_limits(cls, v: int, info) -> int:
+        """Validate that the limit bounds are consistent."""
+        min_limit = info.data.get("min_limit")
+        if min_limit is not None and v < min_limit:
+            raise ValueError(f"max_limit ({v}) must be >= min_limit ({min_limit})")
+        return v
+
+
+class ProfilingConfig(BaseModel):
+    """On-demand tool profiling configuration."""
+
+    enabled: bool = Field(False, description="Profile every executed tool call")
+    allow_per_call: bool = Field(
+        False, description="Allow callers to request profiling with the _profile parameter"
+    )
+    top_n: int = Field(15, ge=1, le=200, description="Number of hotspots to report")
+    output_dir: str | None = Field(
+        None, description="Directory to store raw .prof files (None keeps reports in-response only)"
+    )
+
+
 class MCPConfig(BaseModel):
     """Main MCP server configuration."""
 
     database: DatabaseConfig
     cache: CacheConfig = Field(default_factory=CacheConfig)
     server: ServerConfig = Field(default_factory=ServerConfig)
+    admission: AdmissionConfig = Field(default_factory=AdmissionConfig)
+    profiling: ProfilingConfig = Field(default_factory=ProfilingConfig)
 
     @classmethod
     def from_db_path(
@@ -63,6 +63,15 @@ class AgentModel(Base):
         Index("idx_agents_agent_type", "agent_type"),
         Index("idx_agents_birth_time", "birth_time"),
         Index("idx_agents_death_time", "death_time"),
+        # Serve top-k ORDER BY ... LIMIT within one simulation (ties on agent_id)
+        Index("idx_agents_simulation_generation", "simulation_id", "generation", "agent_id"),
+        Index("idx_agents_simulation_birth_time", "simulation_id", "birth_time", "agent_id"),
+        Index(
+            "idx_agents_simulation_initial_resources",
+            "simulation_id",
+            "initial_resources",
+            "agent_id",
+        ),
     )
 
     simulation_id = Column(String(64), ForeignKey("simulations.simulation_id"))
@@ -149,6 +158,7 @@ class AgentStateModel(Base):
         Index("idx_agent_states_agent_id", "agent_id"),
         Index("idx_agent_states_step_number", "step_number"),
         Index("idx_agent_states_agent_step", "agent_id", "step_number"),
+        Index("idx_agent_states_simulation_step", "simulation_id", "step_number"),
         {"sqlite_autoincrement": False},
     )
 
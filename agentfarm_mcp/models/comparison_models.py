@@ -7,8 +7,6 @@ import statistics
 from dataclasses import dataclass
 from typing import Any, Dict
 
-from deepdiff import DeepDiff
-
 from .simulation_models import Simulation, SimulationStepModel
 
 
@@ -88,6 +86,9 @@ class SimulationComparison:
         Returns:
             Dictionary of parameter differences
         """
+        # deepdiff pulls in pandas; import it only when a comparison runs
+        from deepdiff import DeepDiff
+
         return DeepDiff(self.sim1.parameters, self.sim2.parameters, ignore_order=True)
 
     def _compare_results(self) -> Dict:
@@ -96,6 +97,8 @@ class SimulationComparison:
         Returns:
             Dictionary of results differences
         """
+        from deepdiff import DeepDiff
+
         return DeepDiff(self.sim1.results_summary, self.sim2.results_summary, ignore_order=True)
 
     def _compare_step_metrics(self, session: Any) -> Dict[str, Dict[str, float]]:
@@ -41,6 +41,7 @@ class ResourceModel(Base):
     __table_args__ = (
         Index("idx_resource_states_step_number", "step_number"),
         Index("idx_resource_states_resource_id", "resource_id"),
+        Index("idx_resource_states_simulation_step", "simulation_id", "step_number"),
     )
 
     id = Column(Integer, primary_key=True)
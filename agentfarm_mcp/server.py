@@ -1,52 +1,112 @@
 """Main MCP server implementation."""
 
+import asyncio
+import copy
+import threading
 from datetime import datetime
-from typing import Any
-
-from fastmcp import FastMCP
+from typing import TYPE_CHECKING, Any
+
+from fastmcp import Context, FastMCP
+from fastmcp.exceptions import ToolError
+from fastmcp.server.dependencies import get_context
+from fastmcp.tools import Tool, ToolResult
+from mcp.types import TextContent
+from pydantic import PrivateAttr
 from structlog import get_logger
 
 from .config import MCPConfig
 from .services.cache_service import CacheService
 from .services.database_service import DatabaseService
-from .services.redis_cache_service import RedisCacheConfig, RedisCacheService
-from .tools.advanced_tools import BuildAgentLineageTool, GetAgentLifecycleTool
-from .tools.analysis_tools import (
-    AnalyzeAgentPerformanceTool,
-    AnalyzePopulationDynamicsTool,
-    AnalyzeReproductionTool,
-    AnalyzeResourceEfficiencyTool,
-    AnalyzeSocialPatternsTool,
-    AnalyzeSurvivalRatesTool,
-    IdentifyCriticalEventsTool,
-)
-from .tools.base import ToolBase
-from .tools.comparison_tools import (
-    CompareGenerationsTool,
-    CompareParametersTool,
-    CompareSimulationsTool,
-    RankConfigurationsTool,
-)
-from .tools.health_tools import HealthCheckTool, SystemInfoTool
-from .tools.metadata_tools import (
-    GetExperimentInfoTool,
-    GetSimulationInfoTool,
-    ListExperimentsTool,
-    ListSimulationsTool,
-)
-from .tools.query_tools import (
-    GetSimulationMetricsTool,
-    QueryActionsTool,
-    QueryAgentsTool,
-    QueryInteractionsTool,
-    QueryResourcesTool,
-    QueryStatesTool,
-)
+from .tools.base import RESPONSE_FORMATS, ToolBase
+from .tools.registry import TOOL_CATALOG, ToolSpec, load_catalog, load_tool_class
+from .utils import metrics, serialization
+from .utils.admission_control import AdmissionController
 from .utils.exceptions import ToolNotFoundError
+from .utils.profiling import ToolProfiler
+
+if TYPE_CHECKING:
+    from .services.redis_cache_service import RedisCacheService
 
 logger = get_logger(__name__)
 
 
+def to_tool_result(response: dict[str, Any]) -> ToolResult:
+    """Wrap a tool response for FastMCP with its JSON text encoded once.
+
+    Pre-encoded cached data is spliced into the text content as-is instead
+    of being serialized again on every cache hit.
+
+    Args:
+        response: Response produced by ``ToolBase``
+
+    Returns:
+        Tool result with text and structured content
+    """
+    text = serialization.encode_response(response).decode()
+    return ToolResult(content=[TextContent(type="text", text=text)], structured_content=response)
+
+
+async def stream_to_context(tool: ToolBase, arguments: dict[str, Any], ctx: Context) -> dict:
+    """Run a streaming tool call, forwarding chunks as MCP progress notifications.
+
+    Each chunk envelope is sent as the JSON ``message`` of a progress
+    notification (clients must supply a progress token to receive them);
+    the final end envelope is returned as the tool result.
+
+    Args:
+        tool: Streamable tool instance
+        arguments: Tool arguments
+        ctx: FastMCP request context
+
+    Returns:
+        Final stream envelope (summary and metadata)
+    """
+    loop = asyncio.get_running_loop()
+
+    def consume() -> dict:
+        for envelope in tool.stream(**arguments):
+            if envelope["type"] != "chunk":
+                return envelope
+            message = serialization.dumps(envelope).decode()
+            asyncio.run_coroutine_threadsafe(
+                ctx.report_progress(progress=envelope["index"] + 1, message=message), loop
+            ).result()
+        return {}
+
+    return await asyncio.to_thread(consume)
+
+
+class CatalogTool(Tool):
+    """FastMCP tool registered from catalog metadata.
+
+    The ``ToolBase`` instance implementing the tool is resolved through the
+    server on the first call, which imports the tool's module.
+    """
+
+    _server: Any = PrivateAttr(default=None)
+
+    async def run(self, arguments: dict[str, Any]) -> ToolResult:
+        """Run the tool in a worker thread.
+
+        Args:
+            arguments: Tool arguments from the MCP request
+
+        Returns:
+            Tool result; with ``stream`` the final stream envelope
+        """
+        unexpected = set(arguments) - set(self.parameters.get("properties", {}))
+        if unexpected:
+            raise ToolError(f"Unexpected arguments for {self.name}: {sorted(unexpected)}")
+
+        tool = await asyncio.to_thread(self._server.get_tool, self.name)
+        arguments = dict(arguments)
+        if arguments.pop("stream", False):
+            response = await stream_to_context(tool, arguments, get_context())
+        else:
+            response = await asyncio.to_thread(tool, **arguments)
+        return to_tool_result(response)
+
+
 class SimulationMCPServer:
     """Main MCP server for simulation database analysis."""
 
@@ -63,6 +123,9 @@ class SimulationMCPServer:
         
         # Initialize cache service based on backend
         if config.cache.backend == "redis":
+            # redis is only imported when the Redis backend is selected
+            from .services.redis_cache_service import RedisCacheConfig, RedisCacheService
+
             redis_config = RedisCacheConfig(
                 enabled=config.cache.enabled,
                 host=config.cache.redis_host,
@@ -72,135 +135,121 @@ class SimulationMCPServer:
                 ttl_seconds=config.cache.ttl_seconds,
                 key_prefix=config.cache.redis_key_prefix,
             )
-            self.cache_service: CacheService | RedisCacheService = RedisCacheService(redis_config)
+            self.cache_service: "CacheService | RedisCacheService" = RedisCacheService(redis_config)
             logger.info("redis_cache_initialized", host=config.cache.redis_host, port=config.cache.redis_port)
         else:
             self.cache_service = CacheService(config.cache)
             logger.info("memory_cache_initialized", max_size=config.cache.max_size)
 
+        # Initialize admission control shared by all tools
+        self.admission_controller: AdmissionController | None = None
+        if config.admission.enabled:
+            self.admission_controller = AdmissionController(
+                initial_limit=config.admission.initial_limit,
+                min_limit=config.admission.min_limit,
+                max_limit=config.admission.max_limit,
+                latency_threshold_ms=config.admission.latency_threshold_ms,
+                backoff_ratio=config.admission.backoff_ratio,
+                low_priority_ratio=config.admission.low_priority_ratio,
+                name="tool_admission",
+            )
+
+        # Initialize profiler when profiling is enabled or may be requested per call
+        self.profiler: ToolProfiler | None = None
+        if config.profiling.enabled or config.profiling.allow_per_call:
+            self.profiler = ToolProfiler(
+                always=config.profiling.enabled,
+                allow_per_call=config.profiling.allow_per_call,
+                top_n=config.profiling.top_n,
+                output_dir=config.profiling.output_dir,
+            )
+
         # Initialize FastMCP
         self.mcp = FastMCP("simulation-analysis")
 
-        # Tool registry
+        # Tool registry: catalog metadata of every registered tool, and the
+        # tools instantiated so far
+        self._catalog: dict[str, ToolSpec] = {}
         self._tools: dict[str, ToolBase] = {}
+        self._tools_lock = threading.Lock()
 
         # Register all tools
         self._register_tools()
 
-        logger.info("mcp_server_initialized", tools_count=len(self._tools))
-
-    def _register_tools(self):
-        """Register all MCP tools."""
-        # Define all tools to register
-        tool_classes = [
-            # Metadata tools
-            GetSimulationInfoTool,
-            ListSimulationsTool,
-            GetExperimentInfoTool,
-            ListExperimentsTool,
-            # Query tools
-            QueryAgentsTool,
-            QueryActionsTool,
-            QueryStatesTool,
-            QueryResourcesTool,
-            QueryInteractionsTool,
-            GetSimulationMetricsTool,
-            # Analysis tools
-            AnalyzePopulationDynamicsTool,
-            AnalyzeSurvivalRatesTool,
-            AnalyzeResourceEfficiencyTool,
-            AnalyzeAgentPerformanceTool,
-            IdentifyCriticalEventsTool,
-            AnalyzeSocialPatternsTool,
-            AnalyzeReproductionTool,
-            # Comparison tools
-            CompareSimulationsTool,
-            CompareParametersTool,
-            RankConfigurationsTool,
-            CompareGenerationsTool,
-            # Advanced tools
-            BuildAgentLineageTool,
-            GetAgentLifecycleTool,
-            # Health and monitoring tools
-            HealthCheckTool,
-            SystemInfoTool,
-        ]
+        # Expose metrics over HTTP (only served by HTTP/SSE transports)
+        self._register_metrics_route()
 
-        # Instantiate and register each tool
-        for tool_class in tool_classes:
-            tool = tool_class(self.db_service, self.cache_service)
-            self._tools[tool.name] = tool
+        logger.info("mcp_server_initialized", tools_count=len(self._catalog))
 
-            # Register with FastMCP
-            self._register_tool_with_mcp(tool)
+    def _register_tools(self) -> None:
+        """Register all MCP tools from the catalog.
 
-            logger.debug("tool_registered", tool_name=tool.name)
+        Tool modules are not imported here: ``get_tool`` imports a tool's
+        module and instantiates the tool on its first call.
+        """
+        for spec in load_catalog():
+            self._catalog[spec.name] = spec
+            self._register_tool_with_mcp(spec)
+            logger.debug("tool_registered", tool_name=spec.name)
 
-    def _register_tool_with_mcp(self, tool: ToolBase) -> None:
+    def _register_tool_with_mcp(self, spec: ToolSpec) -> None:
         """Register a tool with FastMCP.
 
         Args:
-            tool: Tool instance to register
+            spec: Catalog metadata of the tool
         """
-        # Get the parameter schema to create proper function signature
-        schema = tool.parameters_schema
-        schema_fields = schema.model_fields
-
-        # Create a function with specific parameters based on the schema
-        def create_tool_function(tool_instance, fields):
-            # Create function signature dynamically
-            import inspect
-            from typing import get_type_hints
-
-            # Build parameter list for the function signature
-            params = []
-            for field_name, field_info in fields.items():
-                # Get the default value
-                default = field_info.default if field_info.default is not ... else None
-                if default is None and field_info.default_factory is not None:
-                    default = field_info.default_factory()
-
-                # Add parameter to signature
-                if default is ...:
-                    # Required parameter
-                    params.append(
-                        inspect.Parameter(field_name, inspect.Parameter.POSITIONAL_OR_KEYWORD)
-                    )
-                else:
-                    # Optional parameter with default
-                    params.append(
-                        inspect.Parameter(
-                            field_name, inspect.Parameter.POSITIONAL_OR_KEYWORD, default=default
-                        )
-                    )
-
-            # Create function signature
-            sig = inspect.Signature(params)
-
-            def tool_func(*args, **kwargs):
-                """Tool function with proper signature."""
-                # Bind arguments to signature
-                bound_args = sig.bind(*args, **kwargs)
-                bound_args.apply_defaults()
-
-                # Call the tool with the bound arguments
-                return tool_instance(**bound_args.arguments)
-
-            # Set the signature on the function
-            tool_func.__signature__ = sig
-            tool_func.__name__ = tool_instance.name
-            tool_func.__doc__ = tool_instance.description
-
-            return tool_func
-
-        # Create the tool function with proper signature
-        tool_func = create_tool_function(tool, schema_fields)
-
-        # Register with FastMCP
-        self.mcp.tool()(tool_func)
+        parameters = copy.deepcopy(spec.parameters)
+        properties = parameters.setdefault("properties", {})
+
+        # Every tool accepts an optional per-call deadline
+        properties["timeout_ms"] = {
+            "anyOf": [{"type": "number", "exclusiveMinimum": 0}, {"type": "null"}],
+            "default": None,
+            "description": "Time budget for the call in milliseconds",
+        }
+
+        # Expose the reserved profiling flag only when the operator allows it
+        if self.profiler is not None and self.profiler.allow_per_call:
+            properties["_profile"] = {
+                "type": "boolean",
+                "default": False,
+                "description": "Include a profile report in the response metadata",
+            }
+
+        # Tabular tools accept the reserved ``format`` parameter
+        if spec.tabular:
+            properties["format"] = {
+                "enum": list(RESPONSE_FORMATS),
+                "default": "rows",
+                "description": "Row lists as 'rows' or as 'columnar' column arrays",
+            }
+
+        # Streamable tools deliver chunks as progress notifications with ``stream``
+        if spec.streamable:
+            properties["stream"] = {
+                "type": "boolean",
+                "default": False,
+                "description": "Send result chunks as progress notifications",
+            }
+
+        tool = CatalogTool(name=spec.name, description=spec.description, parameters=parameters)
+        tool._server = self
+        self.mcp.add_tool(tool)
+
+    def _register_metrics_route(self) -> None:
+        """Register a ``/metrics`` endpoint in Prometheus text format."""
+        from starlette.requests import Request
+        from starlette.responses import PlainTextResponse
+
+        @self.mcp.custom_route("/metrics", methods=["GET"], include_in_schema=False)
+        async def metrics_endpoint(request: Request) -> PlainTextResponse:
+            return PlainTextResponse(
+                metrics.REGISTRY.render_prometheus(),
+                media_type="text/plain; version=0.0.4",
+            )
 
     def get_tool(self, name: str) -> ToolBase:
-        """Get tool by name.
+        """Get tool by name, importing and instantiating it on first use.
 
         Args:
             name: Tool name
@@ -212,17 +261,39 @@ class SimulationMCPServer:
             ToolNotFoundError: If tool doesn't exist
         """
         tool = self._tools.get(name)
-        if tool is None:
+        if tool is not None:
+            return tool
+
+        spec = self._catalog.get(name)
+        if spec is None:
             raise ToolNotFoundError(name)
+
+        with self._tools_lock:
+            tool = self._tools.get(name)
+            if tool is None:
+                tool_class = load_tool_class(spec.module, spec.class_name)
+                tool = tool_class(
+                    self.db_service, self.cache_service, self.admission_controller, self.profiler
+                )
+                self._tools[name] = tool
+                logger.debug("tool_loaded", tool_name=name)
         return tool
 
+    def load_tools(self) -> None:
+        """Import and instantiate every tool now instead of on first call.
+
+        Used before forking workers so that they share the loaded modules.
+        """
+        for name in self._catalog:
+            self.get_tool(name)
+
     def list_tools(self) -> list[str]:
         """List all registered tools.
 
         Returns:
             List of tool names
         """
-        return list(self._tools.keys())
+        return list(self._catalog)
 
     def get_tool_schemas(self) -> list[dict[str, Any]]:
         """Get schemas for all registered tools.
@@ -230,7 +301,10 @@ class SimulationMCPServer:
         Returns:
             List of tool schema dictionaries
         """
-        return [tool.get_schema() for tool in self._tools.values()]
+        return [
+            {"name": spec.name, "description": spec.description, "parameters": spec.parameters}
+            for spec in self._catalog.values()
+        ]
 
     def get_cache_stats(self) -> dict[str, Any]:
         """Get cache statistics.
@@ -251,7 +325,7 @@ class SimulationMCPServer:
         Args:
             **kwargs: Additional arguments for FastMCP.run()
         """
-        logger.info("mcp_server_starting", tools_count=len(self._tools))
+        logger.info("mcp_server_starting", tools_count=len(self._catalog))
         self.mcp.run(**kwargs)
 
     def health_check(self) -> dict[str, Any]:
@@ -292,14 +366,20 @@ class SimulationMCPServer:
         except (ConnectionError, TimeoutError, OSError) as e:
             health_info["components"]["cache"] = f"error: {str(e)}"
 
-        # Tool registry status
+        # Admission control status
+        if self.admission_controller is not None:
+            health_info["components"]["admission"] = self.admission_controller.get_state()
+
+        # Tool registry status: a stale catalog file registers a different number
+        # of tools (tools with clashing names collapse into one entry)
         health_info["components"]["tools"] = {
-            "registered": len(self._tools),
-            "expected": 25,  # Updated to include health tools
+            "registered": len(self._catalog),
+            "expected": len(TOOL_CATALOG),
+            "loaded": len(self._tools),
         }
 
         # Overall health
-        if health_info["components"]["tools"]["registered"] != 25:
+        if len(self._catalog) != len(TOOL_CATALOG):
             health_info["status"] = "degraded"
 
         return health_info
@@ -1,7 +1,5 @@
 """In-memory cache service for MCP server."""
 
-import hashlib
-import json
 import time
 from collections import OrderedDict
 from typing import Any
@@ -9,6 +7,7 @@ from typing import Any
 from structlog import get_logger
 
 from ..config import CacheConfig
+from ..utils import metrics, serialization
 
 logger = get_logger(__name__)
 
@@ -55,6 +54,7 @@ class CacheService:
 
         if key not in self._cache:
             self._misses += 1
+            metrics.CACHE_REQUESTS.inc(backend="memory", result="miss")
             logger.debug(f"Cache miss: {key}")
             return None
 
@@ -64,12 +64,14 @@ class CacheService:
             if age > self.config.ttl_seconds:
                 self._evict(key)
                 self._misses += 1
+                metrics.CACHE_REQUESTS.inc(backend="memory", result="miss")
                 logger.debug(f"Cache miss (expired): {key}")
                 return None
 
         # Move to end (LRU)
         self._cache.move_to_end(key)
         self._hits += 1
+        metrics.CACHE_REQUESTS.inc(backend="memory", result="hit")
 
         logger.debug("cache_hit", key=key)
         return self._cache[key]
@@ -96,6 +98,8 @@ class CacheService:
         self._cache[key] = value
         self._timestamps[key] = time.time()
         self._cache.move_to_end(key)
+        metrics.CACHE_SETS.inc(backend="memory")
+        metrics.CACHE_ENTRIES.set(len(self._cache), backend="memory")
 
         logger.debug("cache_set", key=key)
 
@@ -119,6 +123,7 @@ class CacheService:
         self._timestamps.clear()
         self._hits = 0
         self._misses = 0
+        metrics.CACHE_ENTRIES.set(0, backend="memory")
         logger.info("cache_cleared")
 
     def get_stats(self) -> dict[str, Any]:
@@ -159,7 +164,4 @@ class CacheService:
         Example:
             >>> key = CacheService.generate_key("query_agents", {"limit": 100})
         """
-        # Sort parameters for consistent hashing
-        param_str = json.dumps(params, sort_keys=True, default=str)
-        param_hash = hashlib.sha256(param_str.encode()).hexdigest()
-        return f"{tool_name}:{param_hash}"
\ No newline at end of file
+        return serialization.hash_key(tool_name, params)
\ No newline at end of file
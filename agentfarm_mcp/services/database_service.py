@@ -1,16 +1,18 @@
 """Database service for MCP server."""
 
-from collections.abc import Callable, Generator
+import time
+from collections.abc import Callable, Generator, Iterator
 from contextlib import contextmanager
 from typing import Any, TypeVar
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import Query, Session, sessionmaker
 from sqlalchemy.pool import QueuePool
 from structlog import get_logger
 
 from ..config import DatabaseConfig
 from ..models.database_models import Simulation
+from ..utils import deadlines, metrics, query_stats
 from ..utils.exceptions import ConnectionError as MCPConnectionError
 from ..utils.exceptions import (
     DatabaseError,
@@ -34,7 +36,8 @@ class DatabaseService:
     - Session management
     - Error handling
     - Read-only enforcement
-    - Query timeout support
+    - Query timeout support and per-call deadlines
+    - Per-call SQL statistics and slow query logging
     """
 
     def __init__(self, config: DatabaseConfig):
@@ -55,7 +58,9 @@ class DatabaseService:
             failure_threshold=5,
             timeout=60,
             success_threshold=2,
-            name="database_service"
+            name="database_service",
+            # Missed caller deadlines say nothing about database health
+            ignored_exceptions=(QueryTimeoutError,),
         )
         
         self._initialize_engine()
@@ -82,8 +87,12 @@ class DatabaseService:
                 echo=False,  # Set to True for SQL debugging
             )
 
+            self._register_pool_metrics()
+            self._register_query_instrumentation()
+
             # Create session factory
             self._SessionFactory = sessionmaker(bind=self._engine, expire_on_commit=False)
+            self._register_row_counting()
 
             logger.info(
                 "Database service initialized: %s (type=%s, read_only=%s)",
@@ -99,6 +108,63 @@ class DatabaseService:
                 f"Database initialization failed: {exc}", database_type=db_type
             ) from exc
 
+    def _register_pool_metrics(self) -> None:
+        """Track connection pool checkouts in the metrics registry."""
+        metrics.DB_POOL_SIZE.set(self.config.pool_size)
+
+        @event.listens_for(self._engine, "checkout")
+        def on_checkout(dbapi_connection, connection_record, connection_proxy):
+            metrics.DB_CHECKOUTS.inc()
+            metrics.DB_CONNECTIONS_IN_USE.inc()
+
+        @event.listens_for(self._engine, "checkin")
+        def on_checkin(dbapi_connection, connection_record):
+            metrics.DB_CONNECTIONS_IN_USE.dec()
+
+    def _register_query_instrumentation(self) -> None:
+        """Time every statement and log the ones above the slow query threshold."""
+        threshold_ms = self.config.slow_query_threshold_ms
+
+        @event.listens_for(self._engine, "before_cursor_execute")
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            context._mcp_query_start = time.perf_counter()
+
+        @event.listens_for(self._engine, "after_cursor_execute")
+        def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            duration_ms = (time.perf_counter() - context._mcp_query_start) * 1000
+            slow = threshold_ms is not None and duration_ms >= threshold_ms
+
+            stats = query_stats.current_stats()
+            if stats is not None:
+                stats.record_statement(duration_ms, slow)
+
+            if slow:
+                logger.warning(
+                    "slow_query",
+                    duration_ms=round(duration_ms, 2),
+                    threshold_ms=threshold_ms,
+                    statement=statement,
+                    parameters=parameters,
+                )
+
+    def _register_row_counting(self) -> None:
+        """Count rows returned by ORM selects while a collector is active."""
+
+        @event.listens_for(self._SessionFactory, "do_orm_execute")
+        def count_rows(orm_execute_state):
+            stats = query_stats.current_stats()
+            if stats is None or not orm_execute_state.is_select:
+                return None
+
+            # Streaming queries must stay streaming; their rows are not counted
+            options = orm_execute_state.execution_options
+            if options.get("yield_per") or options.get("stream_results"):
+                return None
+
+            frozen = orm_execute_state.invoke_statement().freeze()
+            stats.record_rows(len(frozen.data))
+            return frozen()
+
     @contextmanager
     def get_session(self) -> Generator[Session, None, None]:
         """Provide a transactional scope for database operations.
@@ -119,6 +185,9 @@ class DatabaseService:
             # Read-only mode, no commit needed
             if not self.config.read_only:
                 session.commit()
+        except QueryTimeoutError:
+            session.rollback()
+            raise
         except Exception as exc:
             session.rollback()
             logger.error("database_session_error", error=str(exc), exc_info=exc)
@@ -129,6 +198,10 @@ class DatabaseService:
     def execute_query(self, query_func: Callable[[Session], T]) -> T:
         """Execute a query function with error handling and circuit breaker protection.
 
+        When a deadline is bound to the current context (see
+        ``utils.deadlines``), expired calls are refused and statements still
+        running when it passes are interrupted.
+
         Args:
             query_func: Function that takes a session and returns results
 
@@ -137,7 +210,7 @@ class DatabaseService:
 
         Raises:
             DatabaseError: If query execution fails
-            QueryTimeoutError: If query exceeds timeout
+            QueryTimeoutError: If the current deadline passes
             CircuitOpenError: If circuit breaker is open
 
         Example:
@@ -145,20 +218,26 @@ class DatabaseService:
             ...     return session.query(AgentModel).count()
             >>> count = db_service.execute_query(my_query)
         """
+        deadline = deadlines.current_deadline()
+
         def execute_with_session():
             with self.get_session() as session:
                 try:
-                    # Note: SQLite doesn't support statement-level timeouts natively
-                    # For production with PostgreSQL, you would set statement_timeout here
-                    result = query_func(session)
+                    with self._enforce_deadline(session, deadline):
+                        result = query_func(session)
                     return result
 
                 except QueryTimeoutError:
                     raise
                 except Exception as exc:
+                    if deadline is not None and deadline.expired:
+                        raise QueryTimeoutError(deadline.timeout_ms / 1000) from exc
                     logger.error("query_execution_error", error=str(exc), exc_info=exc)
                     raise QueryExecutionError(f"Query failed: {exc}") from exc
-        
+
+        if deadline is not None and deadline.expired:
+            raise QueryTimeoutError(deadline.timeout_ms / 1000)
+
         # Execute with circuit breaker protection
         try:
             return self._circuit_breaker.call(execute_with_session)
@@ -166,6 +245,76 @@ class DatabaseService:
             logger.error("circuit_breaker_rejected_query", error=str(e))
             raise DatabaseError(f"Database unavailable: {e}") from e
 
+    @contextmanager
+    def _enforce_deadline(
+        self, session: Session, deadline: deadlines.Deadline | None
+    ) -> Generator[None, None, None]:
+        """Make the database abandon statements once the deadline passes.
+
+        SQLite statements are interrupted from a progress handler; PostgreSQL
+        gets a transaction-scoped ``statement_timeout`` for the remaining time.
+
+        Args:
+            session: Session the query runs in
+            deadline: Deadline for the current call, if any
+        """
+        if deadline is None:
+            yield
+            return
+
+        connection = session.connection()
+        dialect = connection.dialect.name
+
+        if dialect == "sqlite":
+            dbapi_connection = connection.connection.dbapi_connection
+            # A non-zero return value interrupts the running statement
+            dbapi_connection.set_progress_handler(lambda: deadline.expired, 1000)
+            try:
+                yield
+            finally:
+                dbapi_connection.set_progress_handler(None, 0)
+            return
+
+        if dialect == "postgresql":
+            timeout_ms = max(1, int(deadline.remaining_ms()))
+            session.execute(text(f"SET LOCAL statement_timeout = {timeout_ms}"))
+        yield
+
+    def stream_query(
+        self, query_func: Callable[[Session], Query], chunk_size: int = 500
+    ) -> Iterator[list[Any]]:
+        """Stream the results of a query in chunks.
+
+        Rows are fetched with ``yield_per`` so only about one chunk is held in
+        memory at a time. The session stays open until the iterator is
+        exhausted or closed.
+
+        Args:
+            query_func: Function that takes a session and returns an ORM query
+            chunk_size: Number of rows per chunk
+
+        Yields:
+            Lists of at most ``chunk_size`` rows
+
+        Raises:
+            QueryExecutionError: If query execution fails
+
+        Example:
+            >>> def steps(session):
+            ...     return session.query(SimulationStepModel).order_by(SimulationStepModel.step_number)
+            >>> for chunk in db_service.stream_query(steps, chunk_size=1000):
+            ...     process(chunk)
+        """
+        with self.get_session() as session:
+            chunk: list[Any] = []
+            for row in query_func(session).yield_per(chunk_size):
+                chunk.append(row)
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+            if chunk:
+                yield chunk
+
     def validate_simulation_exists(self, simulation_id: str) -> bool:
         """Check if simulation exists in database.
 
@@ -268,6 +417,15 @@ class DatabaseService:
         """
         self._circuit_breaker.reset()
 
+    def reset_pool(self) -> None:
+        """Close all pooled connections; new ones are opened on next use.
+
+        Call this before forking worker processes so that no connection is
+        shared between processes.
+        """
+        if self._engine:
+            self._engine.dispose()
+
     def close(self):
         """Close database connections and dispose of engine.
 
@@ -0,0 +1,315 @@
+"""Bulk export of simulation tables to files.
+
+Tables are read with ``DatabaseService.stream_query`` (server-side
+``yield_per`` chunks) and each chunk is appended to the output file before the
+next one is fetched, so memory stays bounded by the chunk size regardless of
+table size.
+
+CSV is written with the standard library. Parquet and Arrow IPC require the
+optional ``pyarrow`` dependency (``pip install agentfarm-mcp[export]``).
+"""
+
+import csv
+import json
+import os
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import JSON, Boolean, Column, DateTime, Float, Integer, Table
+from structlog import get_logger
+
+from ..models.database_models import (
+    ActionModel,
+    AgentModel,
+    AgentStateModel,
+    InteractionModel,
+    ReproductionEventModel,
+    ResourceModel,
+    SimulationStepModel,
+)
+from ..utils.exceptions import ExportError, ValidationError
+from .database_service import DatabaseService
+
+logger = get_logger(__name__)
+
+# Exportable tables (all scoped by a simulation_id column)
+EXPORT_TABLES: Dict[str, Table] = {
+    model.__tablename__: model.__table__
+    for model in (
+        AgentStateModel,
+        ActionModel,
+        InteractionModel,
+        AgentModel,
+        ResourceModel,
+        SimulationStepModel,
+        ReproductionEventModel,
+    )
+}
+
+DEFAULT_EXPORT_TABLES = ("agent_states", "agent_actions", "interactions")
+
+# Output format -> file extension
+EXPORT_FORMATS = {"parquet": "parquet", "arrow": "arrow", "csv": "csv"}
+
+
+def _require_pyarrow(export_format: str) -> Any:
+    """Import pyarrow or explain how to get it."""
+    try:
+        import pyarrow
+    except ImportError as exc:
+        raise ValidationError(
+            f"Format {export_format!r} requires pyarrow; install agentfarm-mcp[export] "
+            "or use format='csv'",
+            {"format": export_format},
+        ) from exc
+    return pyarrow
+
+
+def _arrow_type(pa: Any, column: Column) -> Any:
+    """Map a SQLAlchemy column type to an Arrow type."""
+    column_type = column.type
+    if isinstance(column_type, Boolean):
+        return pa.bool_()
+    if isinstance(column_type, Integer):
+        return pa.int64()
+    if isinstance(column_type, Float):
+        return pa.float64()
+    if isinstance(column_type, DateTime):
+        return pa.timestamp("us")
+    return pa.string()
+
+
+def _cell_converter(column: Column, for_csv: bool) -> Optional[Callable[[Any], Any]]:
+    """Get the value conversion for a column, or None if values pass through."""
+    if isinstance(column.type, JSON):
+        return lambda value: None if value is None else json.dumps(value, default=str)
+    if for_csv and isinstance(column.type, DateTime):
+        return lambda value: value.isoformat() if isinstance(value, (datetime, date)) else value
+    return None
+
+
+def resolve_export_dir(export_root: str, output_dir: str) -> Path:
+    """Resolve an output directory that must stay inside an export root.
+
+    Args:
+        export_root: Directory exports are confined to
+        output_dir: Directory relative to ``export_root``
+
+    Returns:
+        Resolved output directory
+
+    Raises:
+        ValidationError: If ``output_dir`` resolves outside ``export_root``
+    """
+    root = Path(export_root).resolve()
+    target = (root / output_dir).resolve()
+    if target != root and root not in target.parents:
+        raise ValidationError(
+            f"Output directory {output_dir!r} is outside the export directory {str(root)!r}",
+            {"output_dir": output_dir, "export_dir": str(root)},
+        )
+    return target
+
+
+class _CsvWriter:
+    """Append row chunks to a CSV file."""
+
+    def __init__(self, path: Path, table: Table) -> None:
+        self._file = open(path, "w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow([column.name for column in table.columns])
+
+    def write(self, columns: List[List[Any]]) -> None:
+        self._writer.writerows(zip(*columns))
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ArrowWriter:
+    """Append row chunks to a Parquet file (one row group per chunk) or Arrow IPC file."""
+
+    def __init__(self, path: Path, table: Table, export_format: str) -> None:
+        pa = _require_pyarrow(export_format)
+        self._pa = pa
+        self._schema = pa.schema(
+            [pa.field(column.name, _arrow_type(pa, column)) for column in table.columns]
+        )
+        if export_format == "parquet":
+            import pyarrow.parquet as pq
+
+            self._writer = pq.ParquetWriter(str(path), self._schema, compression="zstd")
+        else:
+            self._writer = pa.ipc.new_file(str(path), self._schema)
+
+    def write(self, columns: List[List[Any]]) -> None:
+        arrays = [
+            self._pa.array(values, type=field.type) for values, field in zip(columns, self._schema)
+        ]
+        batch = self._pa.RecordBatch.from_arrays(arrays, schema=self._schema)
+        if hasattr(self._writer, "write_batch"):
+            self._writer.write_batch(batch)
+        else:
+            self._writer.write_table(self._pa.Table.from_batches([batch]))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+class ExportService:
+    """Stream simulation tables to Parquet, Arrow IPC or CSV files."""
+
+    def __init__(self, db_service: DatabaseService) -> None:
+        """Initialize export service.
+
+        Args:
+            db_service: Database service to read from
+        """
+        self.db = db_service
+
+    def export(
+        self,
+        simulation_id: str,
+        output_dir: str,
+        tables: Iterable[str] = DEFAULT_EXPORT_TABLES,
+        export_format: str = "parquet",
+        chunk_size: int = 50000,
+    ) -> Dict[str, Any]:
+        """Export tables of one simulation to ``<output_dir>/<simulation_id>/<table>.<ext>``.
+
+        Files are written under a temporary name and renamed when complete,
+        so readers never see a partial export.
+
+        Args:
+            simulation_id: Simulation to export
+            output_dir: Base output directory
+            tables: Table names (keys of ``EXPORT_TABLES``)
+            export_format: One of ``EXPORT_FORMATS``
+            chunk_size: Rows fetched and written per chunk
+
+        Returns:
+            Dictionary with per-file paths, row counts, sizes and throughput
+
+        Raises:
+            ValidationError: If a table, format, chunk size or simulation ID is invalid, or
+                pyarrow is missing for Parquet/Arrow
+            ExportError: If the output files cannot be written
+        """
+        tables = list(dict.fromkeys(tables))
+        unknown = [name for name in tables if name not in EXPORT_TABLES]
+        if not tables or unknown:
+            raise ValidationError(
+                f"Unknown tables: {unknown}. Valid tables: {sorted(EXPORT_TABLES)}",
+                {"tables": tables},
+            )
+        if export_format not in EXPORT_FORMATS:
+            raise ValidationError(
+                f"Unknown format {export_format!r}. Valid formats: {sorted(EXPORT_FORMATS)}",
+                {"format": export_format},
+            )
+        if chunk_size < 1:
+            raise ValidationError(
+                f"Invalid chunk_size: {chunk_size}. Use a positive number of rows",
+                {"chunk_size": chunk_size},
+            )
+        if export_format != "csv":
+            _require_pyarrow(export_format)
+        if Path(simulation_id).name != simulation_id or simulation_id.startswith("."):
+            raise ValidationError(
+                f"Simulation ID {simulation_id!r} cannot be used as a directory name",
+                {"simulation_id": simulation_id},
+            )
+
+        target_dir = Path(output_dir) / simulation_id
+        start = time.perf_counter()
+        try:
+            target_dir.mkdir(parents=True, exist_ok=True)
+            files = [
+                self._export_table(simulation_id, name, target_dir, export_format, chunk_size)
+                for name in tables
+            ]
+        except OSError as exc:
+            raise ExportError(
+                f"Cannot write export to {target_dir}: {exc}", {"output_dir": str(target_dir)}
+            ) from exc
+        elapsed = time.perf_counter() - start
+        total_rows = sum(file["rows"] for file in files)
+
+        logger.info(
+            "simulation_exported",
+            simulation_id=simulation_id,
+            format=export_format,
+            tables=tables,
+            rows=total_rows,
+            seconds=round(elapsed, 3),
+        )
+
+        return {
+            "simulation_id": simulation_id,
+            "format": export_format,
+            "output_dir": str(target_dir.resolve()),
+            "files": files,
+            "total_rows": total_rows,
+            "total_bytes": sum(file["bytes"] for file in files),
+            "elapsed_seconds": round(elapsed, 3),
+            "rows_per_second": round(total_rows / elapsed, 1) if elapsed else None,
+        }
+
+    def _export_table(
+        self, simulation_id: str, name: str, target_dir: Path, export_format: str, chunk_size: int
+    ) -> Dict[str, Any]:
+        """Stream one table into its output file."""
+        table = EXPORT_TABLES[name]
+        path = target_dir / f"{name}.{EXPORT_FORMATS[export_format]}"
+        partial = path.with_name(path.name + ".part")
+        converters = [
+            _cell_converter(column, for_csv=export_format == "csv") for column in table.columns
+        ]
+
+        def query_func(session):
+            return (
+                session.query(*table.columns)
+                .filter(table.c.simulation_id == simulation_id)
+                .order_by(*table.primary_key.columns)
+            )
+
+        start = time.perf_counter()
+        writer = (
+            _CsvWriter(partial, table)
+            if export_format == "csv"
+            else _ArrowWriter(partial, table, export_format)
+        )
+        rows = 0
+        try:
+            for chunk in self.db.stream_query(query_func, chunk_size=chunk_size):
+                writer.write(self._to_columns(chunk, converters))
+                rows += len(chunk)
+        except BaseException:
+            writer.close()
+            partial.unlink(missing_ok=True)
+            raise
+        writer.close()
+        os.replace(partial, path)
+        elapsed = time.perf_counter() - start
+
+        return {
+            "table": name,
+            "path": str(path.resolve()),
+            "rows": rows,
+            "bytes": path.stat().st_size,
+            "seconds": round(elapsed, 3),
+            "rows_per_second": round(rows / elapsed, 1) if elapsed else None,
+        }
+
+    @staticmethod
+    def _to_columns(
+        chunk: List[Tuple[Any, ...]], converters: List[Optional[Callable[[Any], Any]]]
+    ) -> List[List[Any]]:
+        """Transpose a chunk of rows into converted column lists."""
+        columns = [list(values) for values in zip(*chunk)] or [[] for _ in converters]
+        for index, convert in enumerate(converters):
+            if convert is not None:
+                columns[index] = [convert(value) for value in columns[index]]
+        return columns
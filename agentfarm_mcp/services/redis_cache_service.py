@@ -3,7 +3,6 @@
 This module provides Redis caching for query results with automatic serialization.
 """
 
-import hashlib
 import json
 import logging
 from typing import Any, Dict, Optional
@@ -11,6 +10,9 @@ from typing import Any, Dict, Optional
 import redis
 from pydantic import BaseModel, Field
 
+from ..utils import metrics, serialization
+from ..utils.serialization import PreEncoded
+
 logger = logging.getLogger(__name__)
 
 
@@ -119,17 +121,24 @@ class RedisCacheService:
 
             if value is None:
                 self._misses += 1
+                metrics.CACHE_REQUESTS.inc(backend="redis", result="miss")
                 logger.debug("Redis cache miss: %s", key)
                 return None
 
-            # Deserialize JSON
+            # Deserialize JSON, keeping the stored encoding for dict payloads
+            decoded = serialization.loads(value)
             self._hits += 1
+            metrics.CACHE_REQUESTS.inc(backend="redis", result="hit")
             logger.debug("Redis cache hit: %s", key)
-            return json.loads(value)
+            if isinstance(decoded, dict):
+                encoded = value.encode() if isinstance(value, str) else value
+                return PreEncoded(decoded, encoded=encoded)
+            return decoded
 
         except (redis.ConnectionError, redis.TimeoutError, json.JSONDecodeError) as exc:
             logger.warning("Redis get error for key %s: %s", key, exc)
             self._misses += 1
+            metrics.CACHE_REQUESTS.inc(backend="redis", result="error")
             return None
 
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
@@ -151,7 +160,7 @@ class RedisCacheService:
 
         try:
             namespaced_key = self._make_key(key)
-            serialized = json.dumps(value, default=str)
+            serialized = serialization.dumps(value)
             ttl_seconds = ttl if ttl is not None else self.config.ttl_seconds
 
             if ttl_seconds > 0:
@@ -159,6 +168,7 @@ class RedisCacheService:
             else:
                 self._redis_client.set(namespaced_key, serialized)
 
+            metrics.CACHE_SETS.inc(backend="redis")
             logger.debug("Redis cache set: %s (ttl=%d)", key, ttl_seconds)
             return True
 
@@ -272,10 +282,7 @@ class RedisCacheService:
         Example:
             >>> key = RedisCacheService.generate_key("query_agents", {"limit": 100})
         """
-        # Sort parameters for consistent hashing
-        param_str = json.dumps(params, sort_keys=True, default=str)
-        param_hash = hashlib.sha256(param_str.encode()).hexdigest()
-        return f"{tool_name}:{param_hash}"
+        return serialization.hash_key(tool_name, params)
 
     def close(self) -> None:
         """Close Redis connections.
@@ -0,0 +1,708 @@
+"""Precomputed analysis rollups of completed simulations.
+
+Survival, reproduction and social analyses aggregate whole tables on every
+call, although the data of a completed run never changes. The rollup builder
+computes those aggregates once per completed simulation and stores them in a
+sidecar SQLite file (see ``sidecar_path``):
+
+- ``rollup_cohorts``: alive/dead counts and lifespan statistics per
+  generation and per agent type
+- ``rollup_reproduction`` and ``rollup_reproduction_failures``: attempt
+  counts, resource costs and failure reasons
+- ``rollup_social``: social interaction counts per type and per outcome
+- ``rollup_step_buckets``: population, births and deaths per bucket of steps
+  (see ``step_bucket_statistics``)
+
+Analysis tools read a rollup when the simulation has one and fall back to the
+raw tables otherwise. Both paths use the same aggregation functions (below
+and in ``utils.cohorts``), so a rollup answers exactly what the raw query
+would.
+"""
+
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import func
+from structlog import get_logger
+
+from ..config import DatabaseConfig
+from ..models.database_models import (
+    ReproductionEventModel,
+    Simulation,
+    SimulationStepModel,
+    SocialInteractionModel,
+)
+from ..utils.cohorts import cohort_statistics
+from ..utils.exceptions import DatabaseError, SimulationNotFoundError, ValidationError
+from .database_service import DatabaseService
+from .sidecar import sidecar_path
+
+logger = get_logger(__name__)
+
+# Cohort groupings stored per simulation
+COHORT_GROUPINGS = ("generation", "agent_type")
+
+DEFAULT_BUCKET_SIZE = 100
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rollup_simulations (
+    simulation_id TEXT PRIMARY KEY,
+    bucket_size INTEGER NOT NULL,
+    agents INTEGER NOT NULL,
+    social_interactions INTEGER NOT NULL,
+    resources_transferred REAL NOT NULL,
+    build_seconds REAL NOT NULL,
+    built_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rollup_cohorts (
+    simulation_id TEXT NOT NULL,
+    group_by TEXT NOT NULL,
+    cohort TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    alive INTEGER NOT NULL,
+    dead INTEGER NOT NULL,
+    lifespan_mean REAL,
+    lifespan_median REAL,
+    lifespan_max NUMERIC,
+    lifespan_min NUMERIC,
+    PRIMARY KEY (simulation_id, group_by, cohort)
+);
+CREATE TABLE IF NOT EXISTS rollup_reproduction (
+    simulation_id TEXT PRIMARY KEY,
+    attempts INTEGER NOT NULL,
+    successful INTEGER NOT NULL,
+    failed INTEGER NOT NULL,
+    cost_mean REAL,
+    cost_min REAL,
+    cost_max REAL,
+    max_offspring_generation INTEGER
+);
+CREATE TABLE IF NOT EXISTS rollup_reproduction_failures (
+    simulation_id TEXT NOT NULL,
+    reason TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (simulation_id, reason)
+);
+CREATE TABLE IF NOT EXISTS rollup_social (
+    simulation_id TEXT NOT NULL,
+    dimension TEXT NOT NULL,
+    value TEXT,
+    count INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_rollup_social_simulation ON rollup_social (simulation_id);
+CREATE TABLE IF NOT EXISTS rollup_step_buckets (
+    simulation_id TEXT NOT NULL,
+    bucket_start INTEGER NOT NULL,
+    bucket_end INTEGER NOT NULL,
+    steps INTEGER NOT NULL,
+    population_min INTEGER,
+    population_max INTEGER,
+    population_mean REAL,
+    births INTEGER,
+    deaths INTEGER,
+    max_generation INTEGER,
+    PRIMARY KEY (simulation_id, bucket_start)
+);
+"""
+
+# Tables holding per-simulation rows, cleared on rebuild
+_TABLES = (
+    "rollup_cohorts",
+    "rollup_reproduction",
+    "rollup_reproduction_failures",
+    "rollup_social",
+    "rollup_step_buckets",
+    "rollup_simulations",
+)
+
+
+def default_rollup_path(config: DatabaseConfig) -> str:
+    """Get the rollup sidecar path for a database.
+
+    ``config.rollup_path`` wins; otherwise see ``sidecar_path``.
+    """
+    return sidecar_path(config, "rollups", config.rollup_path)
+
+
+def reproduction_rollup(events: Iterable[Tuple[Any, Any, Any, Any, Any]]) -> Dict[str, Any]:
+    """Aggregate reproduction attempts.
+
+    Args:
+        events: ``(success, parent_resources_before, parent_resources_after,
+            failure_reason, offspring_generation)`` rows
+
+    Returns:
+        Dictionary with ``attempts``, ``successful``, ``failed``,
+        ``cost_mean``/``_min``/``_max`` over successful attempts,
+        ``max_offspring_generation`` and ``failure_reasons`` counts
+    """
+    import numpy as np
+
+    attempts = 0
+    costs: List[float] = []
+    generations: List[int] = []
+    failure_reasons: Dict[str, int] = {}
+    for success, before, after, reason, offspring_generation in events:
+        attempts += 1
+        if success:
+            costs.append(before - after)
+            if offspring_generation:
+                generations.append(offspring_generation)
+        else:
+            reason = reason or "unknown"
+            failure_reasons[reason] = failure_reasons.get(reason, 0) + 1
+
+    return {
+        "attempts": attempts,
+        "successful": len(costs),
+        "failed": attempts - len(costs),
+        "cost_mean": float(np.mean(costs)) if costs else None,
+        "cost_min": min(costs) if costs else None,
+        "cost_max": max(costs) if costs else None,
+        "max_offspring_generation": max(generations) if generations else None,
+        "failure_reasons": failure_reasons,
+    }
+
+
+def social_rollup(interactions: Iterable[Tuple[Any, Any, Any]]) -> Dict[str, Any]:
+    """Aggregate social interactions.
+
+    Args:
+        interactions: ``(interaction_type, outcome, resources_transferred)`` rows
+
+    Returns:
+        Dictionary with ``interactions``, ``interaction_types`` and
+        ``outcomes`` counts and the ``resources_transferred`` total
+    """
+    count = 0
+    type_counts: Dict[Any, int] = {}
+    outcome_counts: Dict[Any, int] = {}
+    resources = 0.0
+    for interaction_type, outcome, transferred in interactions:
+        count += 1
+        type_counts[interaction_type] = type_counts.get(interaction_type, 0) + 1
+        outcome_counts[outcome] = outcome_counts.get(outcome, 0) + 1
+        if transferred:
+            resources += transferred
+
+    return {
+        "interactions": count,
+        "interaction_types": type_counts,
+        "outcomes": outcome_counts,
+        "resources_transferred": resources,
+    }
+
+
+# Columns of a step bucket, as stored and as returned by ``step_bucket_statistics``
+STEP_BUCKET_COLUMNS = (
+    "bucket_start",
+    "bucket_end",
+    "steps",
+    "population_min",
+    "population_max",
+    "population_mean",
+    "births",
+    "deaths",
+    "max_generation",
+)
+
+
+def step_bucket_statistics(
+    session: Any,
+    simulation_id: str,
+    bucket_size: int,
+    start_step: Optional[int] = None,
+    end_step: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Aggregate population per bucket of steps in the database.
+
+    Buckets are aligned to step 0: bucket ``i`` covers steps
+    ``i * bucket_size`` to ``(i + 1) * bucket_size - 1``, of which ``steps``
+    were recorded (fewer at the edges of a step range).
+
+    Args:
+        session: Database session
+        simulation_id: Simulation to aggregate
+        bucket_size: Steps per bucket
+        start_step: First step (inclusive), or None
+        end_step: Last step (inclusive), or None
+
+    Returns:
+        One dictionary per bucket with ``STEP_BUCKET_COLUMNS`` keys, in step order
+    """
+    bucket = (SimulationStepModel.step_number // bucket_size).label("bucket")
+    query = session.query(
+        bucket,
+        func.count(),
+        func.min(SimulationStepModel.total_agents),
+        func.max(SimulationStepModel.total_agents),
+        func.avg(SimulationStepModel.total_agents),
+        func.sum(SimulationStepModel.births),
+        func.sum(SimulationStepModel.deaths),
+        func.max(SimulationStepModel.current_max_generation),
+    ).filter(SimulationStepModel.simulation_id == simulation_id)
+    if start_step is not None:
+        query = query.filter(SimulationStepModel.step_number >= start_step)
+    if end_step is not None:
+        query = query.filter(SimulationStepModel.step_number <= end_step)
+
+    return [
+        dict(
+            zip(
+                STEP_BUCKET_COLUMNS,
+                (
+                    index * bucket_size,
+                    index * bucket_size + bucket_size - 1,
+                    steps,
+                    population_min,
+                    population_max,
+                    None if population_mean is None else float(population_mean),
+                    births,
+                    deaths,
+                    max_generation,
+                ),
+            )
+        )
+        for (
+            index,
+            steps,
+            population_min,
+            population_max,
+            population_mean,
+            births,
+            deaths,
+            max_generation,
+        ) in query.group_by(bucket).order_by(bucket).all()
+    ]
+
+
+class RollupService:
+    """Build and read the rollup sidecar of completed simulations."""
+
+    def __init__(
+        self,
+        db_service: DatabaseService,
+        rollup_path: Optional[str] = None,
+        batch_size: int = 5000,
+    ) -> None:
+        """Initialize rollup service.
+
+        Args:
+            db_service: Database service to read simulations from
+            rollup_path: Sidecar SQLite file (default: ``default_rollup_path``)
+            batch_size: Rows streamed per batch while building
+        """
+        self.db = db_service
+        self.rollup_path = rollup_path or default_rollup_path(db_service.config)
+        self.batch_size = batch_size
+        self._build_lock = threading.Lock()
+        self._schema_ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the sidecar for writing, creating its schema on first use."""
+        try:
+            Path(self.rollup_path).parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.rollup_path, timeout=60, isolation_level=None)
+            if not self._schema_ready:
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.executescript(_SCHEMA)
+                self._schema_ready = True
+        except sqlite3.Error as exc:
+            raise DatabaseError(
+                f"Cannot open rollup store {self.rollup_path}: {exc}",
+                {"rollup_path": self.rollup_path},
+            ) from exc
+        return connection
+
+    def _read(self, sql: str, args: Tuple[Any, ...]) -> List[Tuple[Any, ...]]:
+        """Run a read query on a read-only connection.
+
+        Reads never create the sidecar or its schema: a sidecar that was
+        never built, or lacks the queried table, reads as empty.
+        """
+        path = Path(self.rollup_path)
+        if not path.exists():
+            return []
+        try:
+            with closing(
+                sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True, timeout=60)
+            ) as connection:
+                return connection.execute(sql, args).fetchall()
+        except sqlite3.OperationalError as exc:
+            if "no such table" in str(exc):
+                return []
+            raise DatabaseError(
+                f"Cannot read rollup store {self.rollup_path}: {exc}",
+                {"rollup_path": self.rollup_path},
+            ) from exc
+
+    def info(self, simulation_id: str) -> Optional[Dict[str, Any]]:
+        """Get build statistics of a simulation's rollup, or None if it has none."""
+        rows = self._read(
+            "SELECT bucket_size, agents, build_seconds, built_at FROM rollup_simulations "
+            "WHERE simulation_id = ?",
+            (simulation_id,),
+        )
+        if not rows:
+            return None
+        bucket_size, agents, build_seconds, built_at = rows[0]
+        return {
+            "bucket_size": bucket_size,
+            "agents": agents,
+            "build_seconds": build_seconds,
+            "built_at": built_at,
+        }
+
+    def completed_simulations(self) -> List[str]:
+        """Get the IDs of all completed simulations, in ID order."""
+
+        def query_func(session):
+            return [
+                row.simulation_id
+                for row in session.query(Simulation.simulation_id)
+                .filter(Simulation.status == "completed")
+                .order_by(Simulation.simulation_id)
+            ]
+
+        return self.db.execute_query(query_func)
+
+    def build_all(
+        self, rebuild: bool = False, bucket_size: int = DEFAULT_BUCKET_SIZE
+    ) -> Dict[str, Dict[str, Any]]:
+        """Build rollups of every completed simulation.
+
+        Args:
+            rebuild: Recompute simulations that already have a rollup
+            bucket_size: Steps per step bucket
+
+        Returns:
+            Build statistics per simulation ID
+        """
+        return {
+            simulation_id: self.build(simulation_id, rebuild=rebuild, bucket_size=bucket_size)
+            for simulation_id in self.completed_simulations()
+        }
+
+    def build(
+        self, simulation_id: str, rebuild: bool = False, bucket_size: int = DEFAULT_BUCKET_SIZE
+    ) -> Dict[str, Any]:
+        """Compute and store the rollup of one completed simulation.
+
+        Concurrent builds of the same sidecar are serialized by an immediate
+        write transaction; a build that finds the simulation already rolled up
+        returns the existing statistics.
+
+        Args:
+            simulation_id: Simulation to roll up
+            rebuild: Replace an existing rollup
+            bucket_size: Steps per step bucket
+
+        Returns:
+            Dictionary with ``bucket_size``, ``agents``, ``build_seconds``,
+            ``built_at`` and ``built_now`` (False when an existing rollup was kept)
+
+        Raises:
+            SimulationNotFoundError: If the simulation does not exist
+            ValidationError: If the simulation has not completed or bucket_size < 1
+        """
+        if bucket_size < 1:
+            raise ValidationError("bucket_size must be at least 1", {"bucket_size": bucket_size})
+
+        def status_func(session):
+            row = (
+                session.query(Simulation.status)
+                .filter(Simulation.simulation_id == simulation_id)
+                .first()
+            )
+            return None if row is None else row.status
+
+        status = self.db.execute_query(status_func)
+        if status is None:
+            raise SimulationNotFoundError(simulation_id)
+        if status != "completed":
+            raise ValidationError(
+                f"Simulation {simulation_id} is {status!r}; only completed runs are rolled up",
+                {"simulation_id": simulation_id, "status": status},
+            )
+
+        with self._build_lock, closing(self._connect()) as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                existing = connection.execute(
+                    "SELECT 1 FROM rollup_simulations WHERE simulation_id = ?", (simulation_id,)
+                ).fetchone()
+                if existing is not None and not rebuild:
+                    connection.execute("COMMIT")
+                    return {**self.info(simulation_id), "built_now": False}
+
+                start = time.perf_counter()
+                for table in _TABLES:
+                    connection.execute(
+                        f"DELETE FROM {table} WHERE simulation_id = ?", (simulation_id,)
+                    )
+                agents = self._insert_cohorts(connection, simulation_id)
+                self._insert_reproduction(connection, simulation_id)
+                social = self._insert_social(connection, simulation_id)
+                self._insert_step_buckets(connection, simulation_id, bucket_size)
+                elapsed = round(time.perf_counter() - start, 3)
+                built_at = datetime.now(timezone.utc).isoformat()
+                connection.execute(
+                    "INSERT INTO rollup_simulations VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        simulation_id,
+                        bucket_size,
+                        agents,
+                        social["interactions"],
+                        social["resources_transferred"],
+                        elapsed,
+                        built_at,
+                    ),
+                )
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+
+        logger.info(
+            "rollup_built",
+            simulation_id=simulation_id,
+            agents=agents,
+            seconds=elapsed,
+            rollup_path=self.rollup_path,
+        )
+        return {
+            "bucket_size": bucket_size,
+            "agents": agents,
+            "build_seconds": elapsed,
+            "built_at": built_at,
+            "built_now": True,
+        }
+
+    def _stream(self, simulation_id: str, model: Any, *columns: Any) -> Iterator[Any]:
+        """Stream columns of a simulation's rows from the source database."""
+
+        def query_func(session):
+            return session.query(*columns).filter(model.simulation_id == simulation_id)
+
+        for chunk in self.db.stream_query(query_func, chunk_size=self.batch_size):
+            yield from chunk
+
+    def _insert_cohorts(self, connection: sqlite3.Connection, simulation_id: str) -> int:
+        """Store survival cohorts of every grouping and return the agent count."""
+        agents = 0
+        for group_by in COHORT_GROUPINGS:
+            cohorts = self.db.execute_query(
+                lambda session, group_by=group_by: cohort_statistics(
+                    session, simulation_id, group_by
+                )
+            )
+            connection.executemany(
+                "INSERT INTO rollup_cohorts VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        simulation_id,
+                        group_by,
+                        str(cohort),
+                        position,
+                        stats["alive"],
+                        stats["dead"],
+                        stats["lifespan_mean"],
+                        stats["lifespan_median"],
+                        stats["lifespan_max"],
+                        stats["lifespan_min"],
+                    )
+                    for position, (cohort, stats) in enumerate(cohorts.items())
+                ],
+            )
+            agents = sum(stats["alive"] + stats["dead"] for stats in cohorts.values())
+        return agents
+
+    def _insert_reproduction(self, connection: sqlite3.Connection, simulation_id: str) -> None:
+        """Store reproduction totals and failure reasons."""
+        stats = reproduction_rollup(
+            self._stream(
+                simulation_id,
+                ReproductionEventModel,
+                ReproductionEventModel.success,
+                ReproductionEventModel.parent_resources_before,
+                ReproductionEventModel.parent_resources_after,
+                ReproductionEventModel.failure_reason,
+                ReproductionEventModel.offspring_generation,
+            )
+        )
+        connection.execute(
+            "INSERT INTO rollup_reproduction VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                simulation_id,
+                stats["attempts"],
+                stats["successful"],
+                stats["failed"],
+                stats["cost_mean"],
+                stats["cost_min"],
+                stats["cost_max"],
+                stats["max_offspring_generation"],
+            ),
+        )
+        connection.executemany(
+            "INSERT INTO rollup_reproduction_failures VALUES (?, ?, ?)",
+            [(simulation_id, reason, count) for reason, count in stats["failure_reasons"].items()],
+        )
+
+    def _insert_social(
+        self, connection: sqlite3.Connection, simulation_id: str
+    ) -> Dict[str, Any]:
+        """Store social interaction counts and return the totals."""
+        stats = social_rollup(
+            self._stream(
+                simulation_id,
+                SocialInteractionModel,
+                SocialInteractionModel.interaction_type,
+                SocialInteractionModel.outcome,
+                SocialInteractionModel.resources_transferred,
+            )
+        )
+        rows = [
+            (simulation_id, dimension, value, count)
+            for dimension, key in (
+                ("interaction_type", "interaction_types"),
+                ("outcome", "outcomes"),
+            )
+            for value, count in stats[key].items()
+        ]
+        connection.executemany("INSERT INTO rollup_social VALUES (?, ?, ?, ?)", rows)
+        return stats
+
+    def _insert_step_buckets(
+        self, connection: sqlite3.Connection, simulation_id: str, bucket_size: int
+    ) -> None:
+        """Store per-bucket population aggregates, computed by the source database."""
+        buckets = self.db.execute_query(
+            lambda session: step_bucket_statistics(session, simulation_id, bucket_size)
+        )
+        connection.executemany(
+            f"INSERT INTO rollup_step_buckets (simulation_id, {', '.join(STEP_BUCKET_COLUMNS)}) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (simulation_id, *(bucket[name] for name in STEP_BUCKET_COLUMNS))
+                for bucket in buckets
+            ],
+        )
+
+    def cohorts(self, simulation_id: str, group_by: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Get stored survival cohorts in the shape of ``cohort_statistics``, keyed by string.
+
+        Returns None when the simulation has no rollup or ``group_by`` is not
+        one of ``COHORT_GROUPINGS``.
+        """
+        if group_by not in COHORT_GROUPINGS or self.info(simulation_id) is None:
+            return None
+        rows = self._read(
+            "SELECT cohort, alive, dead, lifespan_mean, lifespan_median, lifespan_max, "
+            "lifespan_min FROM rollup_cohorts WHERE simulation_id = ? AND group_by = ? "
+            "ORDER BY position",
+            (simulation_id, group_by),
+        )
+        return {
+            cohort: {
+                "alive": alive,
+                "dead": dead,
+                "lifespan_mean": mean,
+                "lifespan_median": median,
+                "lifespan_max": maximum,
+                "lifespan_min": minimum,
+            }
+            for cohort, alive, dead, mean, median, maximum, minimum in rows
+        }
+
+    def reproduction(self, simulation_id: str) -> Optional[Dict[str, Any]]:
+        """Get stored reproduction totals in the shape of ``reproduction_rollup``."""
+        rows = self._read(
+            "SELECT attempts, successful, failed, cost_mean, cost_min, cost_max, "
+            "max_offspring_generation FROM rollup_reproduction WHERE simulation_id = ?",
+            (simulation_id,),
+        )
+        if not rows:
+            return None
+        attempts, successful, failed, cost_mean, cost_min, cost_max, max_generation = rows[0]
+        failures = self._read(
+            "SELECT reason, count FROM rollup_reproduction_failures WHERE simulation_id = ? "
+            "ORDER BY count DESC, reason",
+            (simulation_id,),
+        )
+        return {
+            "attempts": attempts,
+            "successful": successful,
+            "failed": failed,
+            "cost_mean": cost_mean,
+            "cost_min": cost_min,
+            "cost_max": cost_max,
+            "max_offspring_generation": max_generation,
+            "failure_reasons": dict(failures),
+        }
+
+    def social(self, simulation_id: str) -> Optional[Dict[str, Any]]:
+        """Get stored social interaction counts in the shape of ``social_rollup``."""
+        totals = self._read(
+            "SELECT social_interactions, resources_transferred FROM rollup_simulations "
+            "WHERE simulation_id = ?",
+            (simulation_id,),
+        )
+        if not totals:
+            return None
+        counts = self._read(
+            "SELECT dimension, value, count FROM rollup_social WHERE simulation_id = ? "
+            "ORDER BY dimension, count DESC, value",
+            (simulation_id,),
+        )
+        by_dimension: Dict[str, Dict[Any, int]] = {"interaction_type": {}, "outcome": {}}
+        for dimension, value, count in counts:
+            by_dimension[dimension][value] = count
+        return {
+            "interactions": totals[0][0],
+            "interaction_types": by_dimension["interaction_type"],
+            "outcomes": by_dimension["outcome"],
+            "resources_transferred": totals[0][1],
+        }
+
+    def step_buckets(
+        self,
+        simulation_id: str,
+        bucket_size: Optional[int] = None,
+        start_step: Optional[int] = None,
+        end_step: Optional[int] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Get stored step buckets in the shape of ``step_bucket_statistics``.
+
+        Returns None when the simulation has no rollup, when it was built with
+        another ``bucket_size``, or when the step range does not start and end
+        on bucket boundaries (its edge buckets would be partial).
+        """
+        info = self.info(simulation_id)
+        if info is None:
+            return None
+        stored_size = info["bucket_size"]
+        if bucket_size is not None and bucket_size != stored_size:
+            return None
+        if start_step is not None and start_step % stored_size:
+            return None
+        if end_step is not None and (end_step + 1) % stored_size:
+            return None
+
+        conditions, args = ["simulation_id = ?"], [simulation_id]
+        if start_step is not None:
+            conditions.append("bucket_start >= ?")
+            args.append(start_step)
+        if end_step is not None:
+            conditions.append("bucket_end <= ?")
+            args.append(end_step)
+        rows = self._read(
+            f"SELECT {', '.join(STEP_BUCKET_COLUMNS)} FROM rollup_step_buckets "
+            f"WHERE {' AND '.join(conditions)} ORDER BY bucket_start",
+            tuple(args),
+        )
+        return [dict(zip(STEP_BUCKET_COLUMNS, row)) for row in rows]
@@ -0,0 +1,522 @@
+"""Full-text search over action and interaction details.
+
+The simulation database is opened read-only (and may be PostgreSQL), so event
+text is indexed into a separate SQLite file with an FTS5 table, the *sidecar*.
+Each simulation is indexed on its first search by streaming its actions,
+interactions and social interactions. The index records a high-water mark of
+the source tables (largest event ID and event count per source): a later
+search of a simulation that was still running when it was indexed compares the
+mark with the source tables and rebuilds the index when events were added.
+Indexes of completed simulations are used without that check.
+
+Two columns are indexed per event:
+
+- ``text``: event type plus all words of the details (keys and values)
+- ``paths``: one entry per JSON leaf, ``jpath <key tokens> jvalue <value tokens>``,
+  so ``json_path``/``json_value`` filters become FTS5 phrase queries
+"""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import func
+from structlog import get_logger
+
+from ..config import DatabaseConfig
+from ..models.database_models import (
+    ActionModel,
+    InteractionModel,
+    Simulation,
+    SocialInteractionModel,
+)
+from ..utils.exceptions import DatabaseError, ValidationError
+from .database_service import DatabaseService
+from .sidecar import sidecar_path
+
+logger = get_logger(__name__)
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS search_simulations (
+    simulation_id TEXT PRIMARY KEY,
+    documents INTEGER NOT NULL,
+    build_seconds REAL NOT NULL,
+    built_at TEXT NOT NULL,
+    watermark TEXT NOT NULL,
+    completed INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS search_documents (
+    doc_id INTEGER PRIMARY KEY,
+    simulation_id TEXT NOT NULL,
+    source TEXT NOT NULL,
+    event_id INTEGER NOT NULL,
+    step_number INTEGER,
+    agent_id TEXT,
+    target_id TEXT,
+    event_type TEXT,
+    details TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_search_documents_simulation
+    ON search_documents (simulation_id, source, step_number);
+CREATE VIRTUAL TABLE IF NOT EXISTS search_text USING fts5(text, paths, tokenize='unicode61');
+"""
+
+
+def _flatten_json(
+    value: Any, path: Tuple[str, ...] = ()
+) -> Iterator[Tuple[Tuple[str, ...], Any]]:
+    """Yield (key path, leaf value) pairs of a JSON value."""
+    if isinstance(value, dict):
+        for key, child in value.items():
+            yield from _flatten_json(child, path + (str(key),))
+    elif isinstance(value, list):
+        for child in value:
+            yield from _flatten_json(child, path)
+    else:
+        yield path, value
+
+
+def _parse_details(details: Any) -> Any:
+    """Decode JSON details stored as text; other values are returned unchanged."""
+    if isinstance(details, str):
+        stripped = details.strip()
+        if stripped[:1] in ("{", "["):
+            try:
+                return json.loads(stripped)
+            except ValueError:
+                return details
+    return details
+
+
+def _document_text(words: Iterable[Any], details: Any) -> Tuple[str, str]:
+    """Build the ``text`` and ``paths`` column values of one event."""
+    parsed = _parse_details(details)
+    text = [str(word) for word in words if word is not None]
+    paths = []
+    if isinstance(parsed, (dict, list)):
+        for path, leaf in _flatten_json(parsed):
+            leaf_text = "" if leaf is None else str(leaf)
+            text.extend(path)
+            text.append(leaf_text)
+            paths.append(f"jpath {' '.join(path)} jvalue {leaf_text}")
+    elif parsed is not None:
+        text.append(str(parsed))
+    return " ".join(text), " ; ".join(paths)
+
+
+def _phrase(*parts: str) -> str:
+    """Quote words as one FTS5 phrase."""
+    tokens = [token for part in parts for token in _TOKEN.findall(part)]
+    return '"' + " ".join(tokens) + '"'
+
+
+# Source name -> (model, id column, actor, target, type, extra words)
+_SEARCH_SOURCES: Dict[str, Dict[str, Any]] = {
+    "actions": {
+        "model": ActionModel,
+        "id": ActionModel.action_id,
+        "agent": ActionModel.agent_id,
+        "target": ActionModel.action_target_id,
+        "type": ActionModel.action_type,
+        "words": (),
+    },
+    "interactions": {
+        "model": InteractionModel,
+        "id": InteractionModel.interaction_id,
+        "agent": InteractionModel.source_id,
+        "target": InteractionModel.target_id,
+        "type": InteractionModel.interaction_type,
+        "words": (
+            InteractionModel.action_type,
+            InteractionModel.source_type,
+            InteractionModel.target_type,
+        ),
+    },
+    "social_interactions": {
+        "model": SocialInteractionModel,
+        "id": SocialInteractionModel.interaction_id,
+        "agent": SocialInteractionModel.initiator_id,
+        "target": SocialInteractionModel.recipient_id,
+        "type": SocialInteractionModel.interaction_type,
+        "words": (SocialInteractionModel.subtype, SocialInteractionModel.outcome),
+    },
+}
+
+SEARCH_SOURCES = tuple(_SEARCH_SOURCES)
+
+
+def default_index_path(config: DatabaseConfig) -> str:
+    """Get the sidecar path for a database.
+
+    ``config.search_index_path`` wins; otherwise see ``sidecar_path``.
+    """
+    return sidecar_path(config, "search", config.search_index_path)
+
+
+class EventSearchService:
+    """Build and query the FTS5 sidecar index of simulation events."""
+
+    def __init__(
+        self, db_service: DatabaseService, index_path: Optional[str] = None, batch_size: int = 5000
+    ) -> None:
+        """Initialize search service.
+
+        Args:
+            db_service: Database service to read events from
+            index_path: Sidecar SQLite file (default: ``default_index_path``)
+            batch_size: Events streamed and inserted per batch while building
+        """
+        self.db = db_service
+        self.index_path = index_path or default_index_path(db_service.config)
+        self.batch_size = batch_size
+        self._build_lock = threading.Lock()
+        self._schema_ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the sidecar, creating its schema on first use."""
+        try:
+            Path(self.index_path).parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.index_path, timeout=60, isolation_level=None)
+            if not self._schema_ready:
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.executescript(_SCHEMA)
+                columns = {
+                    row[1] for row in connection.execute("PRAGMA table_info(search_simulations)")
+                }
+                if "watermark" not in columns:
+                    # Sidecar written before indexes had a high-water mark: the
+                    # index is a cache, so drop it and index again on demand
+                    connection.executescript(
+                        "DROP TABLE search_simulations; DROP TABLE search_documents; "
+                        "DROP TABLE search_text;" + _SCHEMA
+                    )
+                self._schema_ready = True
+        except sqlite3.Error as exc:
+            raise DatabaseError(
+                f"Cannot open search index {self.index_path}: {exc}",
+                {"index_path": self.index_path},
+            ) from exc
+        return connection
+
+    def _source_state(self, simulation_id: str) -> Tuple[str, bool]:
+        """Get the high-water mark of a simulation's events and whether it has completed.
+
+        Returns:
+            Tuple of (JSON mark with ``[max event ID, event count]`` per source,
+            True if the simulation's status is ``completed``)
+        """
+
+        def query_func(session):
+            status = (
+                session.query(Simulation.status)
+                .filter(Simulation.simulation_id == simulation_id)
+                .scalar()
+            )
+            mark = {}
+            for source, spec in _SEARCH_SOURCES.items():
+                model = spec["model"]
+                max_id, count = (
+                    session.query(func.max(spec["id"]), func.count())
+                    .filter(model.simulation_id == simulation_id)
+                    .one()
+                )
+                mark[source] = [max_id, count]
+            return json.dumps(mark, sort_keys=True), status == "completed"
+
+        return self.db.execute_query(query_func)
+
+    def _stored_index(self, connection: sqlite3.Connection, simulation_id: str) -> Optional[tuple]:
+        """Get ``(documents, build_seconds, built_at, watermark, completed)`` of an index."""
+        return connection.execute(
+            "SELECT documents, build_seconds, built_at, watermark, completed "
+            "FROM search_simulations WHERE simulation_id = ?",
+            (simulation_id,),
+        ).fetchone()
+
+    def index_info(self, simulation_id: str) -> Optional[Dict[str, Any]]:
+        """Get build statistics of a simulation's index, or None if it is not indexed."""
+        with closing(self._connect()) as connection:
+            row = self._stored_index(connection, simulation_id)
+        if row is None:
+            return None
+        return {"documents": row[0], "build_seconds": row[1], "built_at": row[2]}
+
+    def _current_index(self, simulation_id: str) -> Optional[Dict[str, Any]]:
+        """Get build statistics of an index that is up to date, or None if it must be built."""
+        with closing(self._connect()) as connection:
+            row = self._stored_index(connection, simulation_id)
+        if row is None:
+            return None
+        documents, build_seconds, built_at, watermark, completed = row
+        if not completed and self._source_state(simulation_id)[0] != watermark:
+            return None
+        return {
+            "documents": documents,
+            "build_seconds": build_seconds,
+            "built_at": built_at,
+            "built_now": False,
+        }
+
+    def build(self, simulation_id: str, rebuild: bool = False) -> Dict[str, Any]:
+        """Index all events of a simulation.
+
+        Concurrent builds of the same sidecar (threads or worker processes) are
+        serialized by an immediate write transaction. A build that finds the
+        simulation already indexed returns the existing statistics, unless the
+        simulation was indexed while running and events were added since.
+
+        Args:
+            simulation_id: Simulation to index
+            rebuild: Drop and rebuild an existing index
+
+        Returns:
+            Dictionary with ``documents``, ``build_seconds``, ``built_at`` and
+            ``built_now`` (False when an existing index was kept)
+        """
+        # Taken before reading the events: events added during the build move
+        # the mark on, so the next search indexes them instead of missing them
+        watermark, completed = self._source_state(simulation_id)
+
+        with self._build_lock, closing(self._connect()) as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                existing = self._stored_index(connection, simulation_id)
+                if existing is not None and not rebuild and (
+                    existing[4] or existing[3] == watermark
+                ):
+                    if completed and not existing[4]:
+                        connection.execute(
+                            "UPDATE search_simulations SET completed = 1 WHERE simulation_id = ?",
+                            (simulation_id,),
+                        )
+                    connection.execute("COMMIT")
+                    return {
+                        "documents": existing[0],
+                        "build_seconds": existing[1],
+                        "built_at": existing[2],
+                        "built_now": False,
+                    }
+
+                start = time.perf_counter()
+                self._delete(connection, simulation_id)
+                documents = self._insert_events(connection, simulation_id)
+                elapsed = round(time.perf_counter() - start, 3)
+                built_at = datetime.now(timezone.utc).isoformat()
+                connection.execute(
+                    "INSERT INTO search_simulations VALUES (?, ?, ?, ?, ?, ?)",
+                    (simulation_id, documents, elapsed, built_at, watermark, int(completed)),
+                )
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+
+        logger.info(
+            "search_index_built",
+            simulation_id=simulation_id,
+            documents=documents,
+            seconds=elapsed,
+            index_path=self.index_path,
+        )
+        return {
+            "documents": documents,
+            "build_seconds": elapsed,
+            "built_at": built_at,
+            "built_now": True,
+        }
+
+    @staticmethod
+    def _delete(connection: sqlite3.Connection, simulation_id: str) -> None:
+        """Remove a simulation's documents from the sidecar."""
+        connection.execute(
+            "DELETE FROM search_text WHERE rowid IN "
+            "(SELECT doc_id FROM search_documents WHERE simulation_id = ?)",
+            (simulation_id,),
+        )
+        connection.execute("DELETE FROM search_documents WHERE simulation_id = ?", (simulation_id,))
+        connection.execute(
+            "DELETE FROM search_simulations WHERE simulation_id = ?", (simulation_id,)
+        )
+
+    def _insert_events(self, connection: sqlite3.Connection, simulation_id: str) -> int:
+        """Stream every source's events into the sidecar and return the count."""
+        next_id = connection.execute(
+            "SELECT COALESCE(MAX(doc_id), 0) + 1 FROM search_documents"
+        ).fetchone()[0]
+        documents = 0
+        for source, spec in _SEARCH_SOURCES.items():
+            model = spec["model"]
+            columns = [
+                spec["id"],
+                model.step_number,
+                spec["agent"],
+                spec["target"],
+                spec["type"],
+                model.details,
+                *spec["words"],
+            ]
+
+            def query_func(session, model=model, columns=columns, order=spec["id"]):
+                return (
+                    session.query(*columns)
+                    .filter(model.simulation_id == simulation_id)
+                    .order_by(order)
+                )
+
+            for chunk in self.db.stream_query(query_func, chunk_size=self.batch_size):
+                rows, texts = [], []
+                for event_id, step, agent, target, event_type, details, *words in chunk:
+                    text, paths = _document_text([event_type, *words], details)
+                    if details is not None and not isinstance(details, str):
+                        details = json.dumps(details, default=str)
+                    rows.append(
+                        (
+                            next_id,
+                            simulation_id,
+                            source,
+                            event_id,
+                            step,
+                            agent,
+                            target,
+                            event_type,
+                            details,
+                        )
+                    )
+                    texts.append((next_id, text, paths))
+                    next_id += 1
+                connection.executemany(
+                    "INSERT INTO search_documents VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+                )
+                connection.executemany(
+                    "INSERT INTO search_text (rowid, text, paths) VALUES (?, ?, ?)", texts
+                )
+                documents += len(rows)
+        return documents
+
+    def search(
+        self,
+        simulation_id: str,
+        query: Optional[str] = None,
+        sources: Iterable[str] = SEARCH_SOURCES,
+        event_type: Optional[str] = None,
+        json_path: Optional[str] = None,
+        json_value: Optional[str] = None,
+        start_step: Optional[int] = None,
+        end_step: Optional[int] = None,
+        limit: int = 50,
+        offset: int = 0,
+        rebuild: bool = False,
+    ) -> Dict[str, Any]:
+        """Search a simulation's events, building or refreshing its index first if needed.
+
+        Args:
+            simulation_id: Simulation to search
+            query: FTS5 query over event text (words, "phrases", AND/OR/NOT, prefix*)
+            sources: Event sources to include (subset of ``SEARCH_SOURCES``)
+            event_type: Only events of this action/interaction type
+            json_path: Dotted key path that must exist in the JSON details
+            json_value: Value (prefix) the ``json_path`` leaf must have
+            start_step: Start step (inclusive)
+            end_step: End step (inclusive)
+            limit: Maximum results
+            offset: Pagination offset
+            rebuild: Rebuild the simulation's index even if it is up to date
+
+        Returns:
+            Dictionary with ranked ``results`` (best first), ``total_count`` and
+            the index build statistics
+
+        Raises:
+            ValidationError: If no search term is given or the query is malformed
+        """
+        if not (query and query.strip()) and not json_path:
+            raise ValidationError("Pass a query, a json_path or both", {"query": query})
+        if json_value is not None and not json_path:
+            raise ValidationError("json_value requires json_path", {"json_value": json_value})
+
+        index = None if rebuild else self._current_index(simulation_id)
+        if index is None:
+            index = self.build(simulation_id, rebuild=rebuild)
+
+        terms = []
+        if query and query.strip():
+            terms.append(f"text : ({query})")
+        if json_path:
+            path_phrase = _phrase("jpath", json_path.replace(".", " "))
+            if json_value is not None:
+                path_phrase = _phrase("jpath", json_path.replace(".", " "), "jvalue", json_value)
+            terms.append(f"paths : {path_phrase}")
+        match = " AND ".join(terms)
+
+        sources = list(sources)
+        where = ["search_text MATCH ?", "d.simulation_id = ?"]
+        where.append(f"d.source IN ({', '.join('?' for _ in sources)})")
+        args: List[Any] = [match, simulation_id, *sources]
+        if event_type is not None:
+            where.append("d.event_type = ?")
+            args.append(event_type)
+        if start_step is not None:
+            where.append("d.step_number >= ?")
+            args.append(start_step)
+        if end_step is not None:
+            where.append("d.step_number <= ?")
+            args.append(end_step)
+        condition = " AND ".join(where)
+
+        # CROSS JOIN pins the full-text match as the outer loop; left to itself the
+        # planner walks every document of the simulation and probes the match per row
+        source = (
+            "FROM search_text CROSS JOIN search_documents d ON d.doc_id = search_text.rowid"
+        )
+        start = time.perf_counter()
+        try:
+            with closing(self._connect()) as connection:
+                total = connection.execute(
+                    f"SELECT COUNT(*) {source} WHERE {condition}", args
+                ).fetchone()[0]
+                rows = connection.execute(
+                    "SELECT d.source, d.event_id, d.step_number, d.agent_id, d.target_id, "
+                    "d.event_type, d.details, "
+                    "snippet(search_text, 0, '[', ']', '...', 12), bm25(search_text) "
+                    f"{source} "
+                    f"WHERE {condition} ORDER BY bm25(search_text), d.doc_id LIMIT ? OFFSET ?",
+                    [*args, limit, offset],
+                ).fetchall()
+        except sqlite3.OperationalError as exc:
+            raise ValidationError(
+                f"Invalid search query {query!r}: {exc}", {"query": query, "match": match}
+            ) from exc
+        elapsed_ms = round((time.perf_counter() - start) * 1000, 2)
+
+        results = [
+            {
+                "source": source,
+                "event_id": event_id,
+                "step_number": step,
+                "agent_id": agent,
+                "target_id": target,
+                "event_type": event_type_,
+                "details": _parse_details(details),
+                "snippet": snippet,
+                "score": round(-rank, 4),
+            }
+            for source, event_id, step, agent, target, event_type_, details, snippet, rank in rows
+        ]
+
+        return {
+            "results": results,
+            "total_count": total,
+            "returned_count": len(results),
+            "limit": limit,
+            "offset": offset,
+            "query_ms": elapsed_ms,
+            "index": index,
+        }
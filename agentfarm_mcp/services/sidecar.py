@@ -0,0 +1,43 @@
+"""Placement of sidecar SQLite files.
+
+Derived data (search indexes, rollups) is written to SQLite files next to the
+simulation database rather than into it: the database is opened read-only
+and may be a PostgreSQL server.
+"""
+
+import hashlib
+import os
+import tempfile
+from typing import Optional
+
+from ..config import DatabaseConfig
+
+
+def sidecar_path(config: DatabaseConfig, kind: str, configured: Optional[str] = None) -> str:
+    """Get the path of a sidecar file for a database.
+
+    A configured path wins. A SQLite file gets ``<file>.<kind>.db`` next to it
+    when that directory is writable; otherwise (read-only directories, server
+    databases) the sidecar goes to the temp directory, named after a hash of
+    the database location.
+
+    Args:
+        config: Configuration of the source database
+        kind: Sidecar name, e.g. ``"search"``
+        configured: Explicitly configured path, if any
+
+    Returns:
+        Absolute or configured sidecar path
+    """
+    if configured:
+        return configured
+
+    path = config.path
+    if path and "://" not in path:
+        directory = os.path.dirname(os.path.abspath(path))
+        if os.access(directory, os.W_OK):
+            return os.path.abspath(path) + f".{kind}.db"
+
+    identity = path or f"{config.host}:{config.port}/{config.database}"
+    digest = hashlib.sha1(identity.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(tempfile.gettempdir(), f"agentfarm_mcp_{kind}_{digest}.db")
@@ -5,6 +5,7 @@ from typing import Dict, List, Optional
 from pydantic import BaseModel, Field
 
 from ..models.database_models import AgentModel, ReproductionEventModel
+from ..utils.admission_control import Priority
 from .base import ToolBase
 from ..utils.exceptions import SimulationNotFoundError
 
@@ -22,6 +23,8 @@ class BuildAgentLineageParams(BaseModel):
 class BuildAgentLineageTool(ToolBase):
     """Build family tree for an agent."""
 
+    priority = Priority.LOW
+
     @property
     def name(self) -> str:
         return "build_agent_lineage"
@@ -189,6 +192,70 @@ class BuildAgentLineageTool(ToolBase):
         return descendants
 
 
+# Count key reported for each lifecycle history section
+_COUNT_KEYS = {
+    "states": "state_count",
+    "actions": "action_count",
+    "health_incidents": "health_incident_count",
+}
+
+
+def _agent_info(agent: AgentModel) -> Dict:
+    """Serialize basic agent information."""
+    return {
+        "agent_id": agent.agent_id,
+        "agent_type": agent.agent_type,
+        "generation": agent.generation,
+        "birth_time": agent.birth_time,
+        "death_time": agent.death_time,
+        "lifespan": (agent.death_time - agent.birth_time if agent.death_time else None),
+        "position": {"x": agent.position_x, "y": agent.position_y},
+        "initial_resources": agent.initial_resources,
+        "starting_health": agent.starting_health,
+        "genome_id": agent.genome_id,
+    }
+
+
+def _state_to_dict(s) -> Dict:
+    """Serialize an agent state row."""
+    return {
+        "step": s.step_number,
+        "position": {"x": s.position_x, "y": s.position_y, "z": s.position_z},
+        "resources": s.resource_level,
+        "health": s.current_health,
+        "age": s.age,
+        "reward": s.total_reward,
+    }
+
+
+def _action_to_dict(a) -> Dict:
+    """Serialize an action row."""
+    return {
+        "step": a.step_number,
+        "action_type": a.action_type,
+        "target": a.action_target_id,
+        "reward": a.reward,
+        "resources_change": (
+            a.resources_after - a.resources_before
+            if a.resources_after and a.resources_before
+            else None
+        ),
+    }
+
+
+def _incident_to_dict(h) -> Dict:
+    """Serialize a health incident row."""
+    return {
+        "step": h.step_number,
+        "cause": h.cause,
+        "health_before": h.health_before,
+        "health_after": h.health_after,
+        "damage": h.health_before - h.health_after
+        if h.health_before and h.health_after
+        else None,
+    }
+
+
 class GetAgentLifecycleParams(BaseModel):
     """Parameters for getting complete agent lifecycle."""
 
@@ -202,6 +269,9 @@ class GetAgentLifecycleParams(BaseModel):
 class GetAgentLifecycleTool(ToolBase):
     """Get complete agent lifecycle with all data."""
 
+    priority = Priority.LOW
+    streamable = True
+
     @property
     def name(self) -> str:
         return "get_agent_lifecycle"
@@ -229,120 +299,99 @@ class GetAgentLifecycleTool(ToolBase):
     def parameters_schema(self):
         return GetAgentLifecycleParams
 
+    @staticmethod
+    def _get_agent(session, params):
+        """Fetch the agent row for the requested simulation."""
+        return (
+            session.query(AgentModel)
+            .filter(
+                AgentModel.simulation_id == params["simulation_id"],
+                AgentModel.agent_id == params["agent_id"],
+            )
+            .first()
+        )
+
+    @staticmethod
+    def _history_queries(params):
+        """Build (section, query builder, serializer) for requested history sections."""
+        from ..models.database_models import ActionModel, AgentStateModel, HealthIncident
+
+        sections = []
+        if params.get("include_states"):
+            sections.append(
+                (
+                    "states",
+                    lambda session: session.query(AgentStateModel)
+                    .filter(AgentStateModel.agent_id == params["agent_id"])
+                    .order_by(AgentStateModel.step_number),
+                    _state_to_dict,
+                )
+            )
+        if params.get("include_actions"):
+            sections.append(
+                (
+                    "actions",
+                    lambda session: session.query(ActionModel)
+                    .filter(ActionModel.agent_id == params["agent_id"])
+                    .order_by(ActionModel.step_number),
+                    _action_to_dict,
+                )
+            )
+        if params.get("include_health"):
+            sections.append(
+                (
+                    "health_incidents",
+                    lambda session: session.query(HealthIncident)
+                    .filter(HealthIncident.agent_id == params["agent_id"])
+                    .order_by(HealthIncident.step_number),
+                    _incident_to_dict,
+                )
+            )
+        return sections
+
     def execute(self, **params):
         """Execute agent lifecycle retrieval."""
         if not self.db.validate_simulation_exists(params["simulation_id"]):
             raise SimulationNotFoundError(params["simulation_id"])
 
         def query_func(session):
-            from ..models.database_models import (
-                ActionModel,
-                AgentStateModel,
-                HealthIncident,
-            )
-
-            # Get agent
-            agent = (
-                session.query(AgentModel)
-                .filter(
-                    AgentModel.simulation_id == params["simulation_id"],
-                    AgentModel.agent_id == params["agent_id"],
-                )
-                .first()
-            )
+            agent = self._get_agent(session, params)
 
             if not agent:
                 return {"error": f"Agent {params['agent_id']} not found"}
 
-            result = {
-                "agent_info": {
-                    "agent_id": agent.agent_id,
-                    "agent_type": agent.agent_type,
-                    "generation": agent.generation,
-                    "birth_time": agent.birth_time,
-                    "death_time": agent.death_time,
-                    "lifespan": (
-                        agent.death_time - agent.birth_time
-                        if agent.death_time
-                        else None
-                    ),
-                    "position": {"x": agent.position_x, "y": agent.position_y},
-                    "initial_resources": agent.initial_resources,
-                    "starting_health": agent.starting_health,
-                    "genome_id": agent.genome_id,
-                }
-            }
+            result = {"agent_info": _agent_info(agent)}
 
-            # Get states if requested
-            if params.get("include_states"):
-                states = (
-                    session.query(AgentStateModel)
-                    .filter(AgentStateModel.agent_id == params["agent_id"])
-                    .order_by(AgentStateModel.step_number)
-                    .all()
-                )
+            for section, build_query, serialize in self._history_queries(params):
+                rows = build_query(session).all()
+                result[section] = [serialize(row) for row in rows]
+                result[_COUNT_KEYS[section]] = len(rows)
 
-                result["states"] = [
-                    {
-                        "step": s.step_number,
-                        "position": {"x": s.position_x, "y": s.position_y, "z": s.position_z},
-                        "resources": s.resource_level,
-                        "health": s.current_health,
-                        "age": s.age,
-                        "reward": s.total_reward,
-                    }
-                    for s in states
-                ]
-                result["state_count"] = len(states)
-
-            # Get actions if requested
-            if params.get("include_actions"):
-                actions = (
-                    session.query(ActionModel)
-                    .filter(ActionModel.agent_id == params["agent_id"])
-                    .order_by(ActionModel.step_number)
-                    .all()
-                )
+            return result
 
-                result["actions"] = [
-                    {
-                        "step": a.step_number,
-                        "action_type": a.action_type,
-                        "target": a.action_target_id,
-                        "reward": a.reward,
-                        "resources_change": (
-                            a.resources_after - a.resources_before
-                            if a.resources_after and a.resources_before
-                            else None
-                        ),
-                    }
-                    for a in actions
-                ]
-                result["action_count"] = len(actions)
-
-            # Get health incidents if requested
-            if params.get("include_health"):
-                incidents = (
-                    session.query(HealthIncident)
-                    .filter(HealthIncident.agent_id == params["agent_id"])
-                    .order_by(HealthIncident.step_number)
-                    .all()
-                )
+        return self.db.execute_query(query_func)
 
-                result["health_incidents"] = [
-                    {
-                        "step": h.step_number,
-                        "cause": h.cause,
-                        "health_before": h.health_before,
-                        "health_after": h.health_after,
-                        "damage": h.health_before - h.health_after
-                        if h.health_before and h.health_after
-                        else None,
-                    }
-                    for h in incidents
-                ]
-                result["health_incident_count"] = len(incidents)
+    def execute_stream(self, **params):
+        """Stream agent info, then each history section in bounded chunks."""
+        if not self.db.validate_simulation_exists(params["simulation_id"]):
+            raise SimulationNotFoundError(params["simulation_id"])
 
-            return result
+        def agent_info_func(session):
+            agent = self._get_agent(session, params)
+            return _agent_info(agent) if agent else None
+
+        agent_info = self.db.execute_query(agent_info_func)
+        if agent_info is None:
+            return {"error": f"Agent {params['agent_id']} not found"}
+
+        yield {"agent_info": agent_info}
+
+        counts = {}
+        for section, build_query, serialize in self._history_queries(params):
+            count = 0
+            for rows in self.db.stream_query(build_query, chunk_size=self.stream_chunk_size):
+                count += len(rows)
+                yield {section: [serialize(row) for row in rows]}
+            counts[_COUNT_KEYS[section]] = count
 
-        return self.db.execute_query(query_func)
\ No newline at end of file
+        return counts
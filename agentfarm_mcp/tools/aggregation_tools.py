@@ -0,0 +1,338 @@
+"""Server-side group-by aggregation over simulation tables."""
+
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
+
+from pydantic import BaseModel, Field, field_validator
+from sqlalchemy import Float, Integer, distinct, func, select
+
+from ..models.database_models import (
+    ActionModel,
+    AgentModel,
+    AgentStateModel,
+    InteractionModel,
+    ReproductionEventModel,
+    ResourceModel,
+    SimulationStepModel,
+)
+from ..utils.deadlines import current_deadline, deadline_scope
+from ..utils.exceptions import SimulationNotFoundError, ValidationError
+from .base import ToolBase
+
+# Aggregations run under this deadline unless the caller passes timeout_ms, so a
+# grouping over a huge table cannot hold a connection indefinitely
+AGGREGATE_TIMEOUT_MS = 10000
+
+MAX_GROUP_BY = 4
+MAX_AGGREGATES = 10
+
+
+def _numeric_columns(model, exclude: Tuple[str, ...] = ()) -> Tuple[str, ...]:
+    """Names of the Integer/Float columns of a model."""
+    return tuple(
+        column.name
+        for column in model.__table__.columns
+        if isinstance(column.type, (Integer, Float)) and column.name not in exclude
+    )
+
+
+# Aggregatable tables: the column used for step filters and buckets, the
+# columns that may be grouped on, and the numeric columns that may be summed
+_AGGREGATE_TABLES: Dict[str, Dict[str, Any]] = {
+    "agent_actions": {
+        "model": ActionModel,
+        "step": "step_number",
+        "group_by": ("step_number", "agent_id", "action_type", "action_target_id"),
+        "numeric": ("reward", "resources_before", "resources_after"),
+    },
+    "interactions": {
+        "model": InteractionModel,
+        "step": "step_number",
+        "group_by": (
+            "step_number",
+            "source_type",
+            "source_id",
+            "target_type",
+            "target_id",
+            "interaction_type",
+            "action_type",
+        ),
+        "numeric": (),
+    },
+    "agent_states": {
+        "model": AgentStateModel,
+        "step": "step_number",
+        "group_by": ("step_number", "agent_id", "is_defending", "age"),
+        "numeric": (
+            "resource_level",
+            "current_health",
+            "total_reward",
+            "age",
+            "starvation_counter",
+            "position_x",
+            "position_y",
+        ),
+    },
+    "agents": {
+        "model": AgentModel,
+        "step": "birth_time",
+        "group_by": ("agent_type", "generation", "birth_time", "death_time", "genome_id"),
+        "numeric": (
+            "initial_resources",
+            "starting_health",
+            "generation",
+            "birth_time",
+            "death_time",
+            "starvation_counter",
+        ),
+    },
+    "resource_states": {
+        "model": ResourceModel,
+        "step": "step_number",
+        "group_by": ("step_number", "resource_id"),
+        "numeric": ("amount", "position_x", "position_y"),
+    },
+    "reproduction_events": {
+        "model": ReproductionEventModel,
+        "step": "step_number",
+        "group_by": ("step_number", "parent_id", "success", "failure_reason", "parent_generation"),
+        "numeric": (
+            "parent_resources_before",
+            "parent_resources_after",
+            "offspring_initial_resources",
+            "parent_generation",
+            "offspring_generation",
+        ),
+    },
+    "simulation_steps": {
+        "model": SimulationStepModel,
+        "step": "step_number",
+        "group_by": ("step_number",),
+        "numeric": _numeric_columns(SimulationStepModel, exclude=("id", "step_number")),
+    },
+}
+
+# Aggregate function name -> builder taking the column (None for count)
+_AGGREGATE_FUNCTIONS = {
+    "count": lambda column: func.count(),
+    "count_distinct": lambda column: func.count(distinct(column)),
+    "sum": func.sum,
+    "avg": func.avg,
+    "min": func.min,
+    "max": func.max,
+}
+
+FilterValue = Union[str, int, float, bool]
+
+
+def _parse_aggregate(spec: str, table: Dict[str, Any]) -> Tuple[str, Optional[str], str]:
+    """Parse ``"fn"`` or ``"fn:column"`` into (function, column, output name).
+
+    Raises:
+        ValueError: If the function or column is not allowed for the table
+    """
+    function, _, column = spec.partition(":")
+    if function not in _AGGREGATE_FUNCTIONS:
+        raise ValueError(
+            f"Unknown aggregate function {function!r} in {spec!r}. "
+            f"Valid functions: {list(_AGGREGATE_FUNCTIONS)}"
+        )
+    if function == "count":
+        if column:
+            raise ValueError(
+                "'count' counts rows and takes no column; use 'count_distinct:<column>'"
+            )
+        return function, None, "count"
+
+    allowed = table["numeric"]
+    if function == "count_distinct":
+        allowed = tuple(dict.fromkeys(table["group_by"] + table["numeric"]))
+    if column not in allowed:
+        raise ValueError(
+            f"Invalid column for {function!r}: {column!r}. Valid columns: {list(allowed)}"
+        )
+    return function, column, f"{function}_{column}"
+
+
+class AggregateTableParams(BaseModel):
+    """Parameters for aggregate_table tool."""
+
+    simulation_id: str = Field(..., description="Simulation ID to query")
+    table: Literal[
+        "agent_actions",
+        "interactions",
+        "agent_states",
+        "agents",
+        "resource_states",
+        "reproduction_events",
+        "simulation_steps",
+    ] = Field(..., description="Table to aggregate")
+    group_by: List[str] = Field(
+        [],
+        description=f"Columns to group by (at most {MAX_GROUP_BY}); empty aggregates all rows",
+    )
+    step_bucket: Optional[int] = Field(
+        None,
+        ge=1,
+        description="Also group by step windows of this size (adds a 'step_bucket' key holding "
+        "each window's first step)",
+    )
+    aggregates: List[str] = Field(
+        ["count"],
+        description="Aggregates as 'count' or '<fn>:<column>' with fn in "
+        "count_distinct, sum, avg, min, max",
+    )
+    filters: Dict[str, FilterValue] = Field({}, description="Equality filters on groupable columns")
+    start_step: Optional[int] = Field(None, ge=0, description="Start step (inclusive)")
+    end_step: Optional[int] = Field(None, ge=0, description="End step (inclusive)")
+    order_by: Optional[str] = Field(
+        None, description="Output column to sort groups by (default: group keys)"
+    )
+    descending: bool = Field(False, description="Sort in descending order")
+    limit: int = Field(100, ge=1, le=1000, description="Maximum groups to return")
+
+    @field_validator("group_by")
+    @classmethod
+    def validate_group_by(cls, v: List[str], info) -> List[str]:
+        """Validate group-by columns against the table whitelist."""
+        table = _AGGREGATE_TABLES.get(info.data.get("table"))
+        if table is None:
+            return v
+        if len(v) > MAX_GROUP_BY:
+            raise ValueError(f"At most {MAX_GROUP_BY} group_by columns are allowed")
+        invalid = [column for column in v if column not in table["group_by"]]
+        if invalid:
+            raise ValueError(
+                f"Cannot group by {invalid}. Valid columns: {list(table['group_by'])}"
+            )
+        return list(dict.fromkeys(v))
+
+    @field_validator("aggregates")
+    @classmethod
+    def validate_aggregates(cls, v: List[str], info) -> List[str]:
+        """Validate aggregate specifications against the table whitelist."""
+        if not v:
+            raise ValueError("At least one aggregate is required")
+        if len(v) > MAX_AGGREGATES:
+            raise ValueError(f"At most {MAX_AGGREGATES} aggregates are allowed")
+        table = _AGGREGATE_TABLES.get(info.data.get("table"))
+        if table is not None:
+            for spec in v:
+                _parse_aggregate(spec, table)
+        return list(dict.fromkeys(v))
+
+    @field_validator("filters")
+    @classmethod
+    def validate_filters(cls, v: Dict[str, FilterValue], info) -> Dict[str, FilterValue]:
+        """Validate filter columns against the table whitelist."""
+        table = _AGGREGATE_TABLES.get(info.data.get("table"))
+        if table is None:
+            return v
+        invalid = [column for column in v if column not in table["group_by"]]
+        if invalid:
+            raise ValueError(
+                f"Cannot filter on {invalid}. Valid columns: {list(table['group_by'])}"
+            )
+        return v
+
+
+class AggregateTableTool(ToolBase):
+    """Group and aggregate table rows in the database."""
+
+    tabular_keys = ("groups",)
+
+    @property
+    def name(self) -> str:
+        return "aggregate_table"
+
+    @property
+    def description(self) -> str:
+        return """
+        Count, sum, average, min or max table rows per group, computed in the database.
+
+        Use this instead of paging through query_actions / query_interactions
+        when you only need totals, for example:
+        - Action types per 100-step window:
+          table='agent_actions', group_by=['action_type'], step_bucket=100
+        - Total reward per agent:
+          table='agent_actions', group_by=['agent_id'], aggregates=['sum:reward'],
+          order_by='sum_reward', descending=true
+        - Interactions by type: table='interactions', group_by=['interaction_type']
+
+        Aggregates are 'count' or '<fn>:<column>' (fn: count_distinct, sum, avg,
+        min, max) and appear in each group as 'count' or '<fn>_<column>'.
+        Returns at most `limit` groups; `truncated` is true when more exist.
+        """
+
+    @property
+    def parameters_schema(self):
+        return AggregateTableParams
+
+    def execute(self, **params):
+        """Execute aggregation."""
+        if not self.db.validate_simulation_exists(params["simulation_id"]):
+            raise SimulationNotFoundError(params["simulation_id"])
+
+        table_spec = _AGGREGATE_TABLES[params["table"]]
+        table = table_spec["model"].__table__
+        step = table.c[table_spec["step"]]
+
+        keys = [table.c[column].label(column) for column in params["group_by"]]
+        if params["step_bucket"]:
+            bucket = params["step_bucket"]
+            keys.append((step - step % bucket).label("step_bucket"))
+
+        aggregates = []
+        for spec in params["aggregates"]:
+            function, column, output_name = _parse_aggregate(spec, table_spec)
+            argument = table.c[column] if column else None
+            aggregates.append(_AGGREGATE_FUNCTIONS[function](argument).label(output_name))
+
+        outputs = {label.name: label for label in keys + aggregates}
+        if params["order_by"] is not None and params["order_by"] not in outputs:
+            raise ValidationError(
+                f"Cannot order by {params['order_by']!r}. Valid columns: {list(outputs)}",
+                {"order_by": params["order_by"]},
+            )
+
+        statement = select(*keys, *aggregates).where(
+            table.c.simulation_id == params["simulation_id"]
+        )
+        if params["start_step"] is not None:
+            statement = statement.where(step >= params["start_step"])
+        if params["end_step"] is not None:
+            statement = statement.where(step <= params["end_step"])
+        for column, value in params["filters"].items():
+            statement = statement.where(table.c[column] == value)
+        if keys:
+            statement = statement.group_by(*(key.element for key in keys))
+
+        if params["order_by"] is not None:
+            order = outputs[params["order_by"]]
+            statement = statement.order_by(order.desc() if params["descending"] else order)
+        elif keys:
+            statement = statement.order_by(
+                *(key.desc() if params["descending"] else key for key in keys)
+            )
+
+        # Fetch one extra group to detect truncation without counting all groups
+        statement = statement.limit(params["limit"] + 1)
+
+        def query_func(session):
+            return [dict(row._mapping) for row in session.execute(statement)]
+
+        timeout_ms = None if current_deadline() is not None else AGGREGATE_TIMEOUT_MS
+        with deadline_scope(timeout_ms):
+            groups = self.db.execute_query(query_func)
+
+        truncated = len(groups) > params["limit"]
+        groups = groups[: params["limit"]]
+
+        return {
+            "table": params["table"],
+            "group_by": [key.name for key in keys],
+            "aggregates": [aggregate.name for aggregate in aggregates],
+            "groups": groups,
+            "returned_count": len(groups),
+            "truncated": truncated,
+            "limit": params["limit"],
+        }
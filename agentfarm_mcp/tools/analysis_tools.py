@@ -1,23 +1,51 @@
 """Analysis tools for advanced simulation data analysis and insights."""
 
+from collections import Counter
 from typing import List, Optional
 
-import numpy as np
 from ..models.database_models import (
     AgentModel,
     ReproductionEventModel,
     SimulationStepModel,
     SocialInteractionModel,
 )
+from ..services.rollup_service import (
+    RollupService,
+    reproduction_rollup,
+    social_rollup,
+    step_bucket_statistics,
+)
+from ..utils.admission_control import Priority
+from ..utils.cohorts import cohort_statistics
+from ..utils.event_detection import (
+    DEFAULT_DETECTORS,
+    DETECTORS,
+    detect_events,
+    load_step_metrics,
+    required_columns,
+    resolve_detectors,
+    validate_step_columns,
+)
 from .base import ToolBase, requires_simulation
 from ..utils.exceptions import SimulationNotFoundError
 from pydantic import BaseModel, Field
 
 
-# Module-level constants for event detection and thresholds
-MASS_DEATH_THRESHOLD = 10  # >10 deaths in a single step = mass death event
-SEVERE_MASS_DEATH_THRESHOLD = 20  # >20 deaths = severe mass death event
-SEVERE_POPULATION_CHANGE_THRESHOLD = 30  # >30% change = high severity event
+class RollupReaderMixin:
+    """Give an analysis tool access to the rollups of completed simulations.
+
+    Tools answer from ``self.rollups`` when the simulation has a rollup and
+    from the raw tables otherwise, and report which in the ``source`` field.
+    """
+
+    _rollups: Optional[RollupService] = None
+
+    @property
+    def rollups(self) -> RollupService:
+        """Rollup store of this tool's database (created on first use)."""
+        if self._rollups is None:
+            self._rollups = RollupService(self.db)
+        return self._rollups
 
 
 class AnalyzePopulationDynamicsParams(BaseModel):
@@ -27,11 +55,19 @@ class AnalyzePopulationDynamicsParams(BaseModel):
     start_step: Optional[int] = Field(None, ge=0, description="Start step (inclusive)")
     end_step: Optional[int] = Field(None, ge=0, description="End step (inclusive)")
     include_chart: bool = Field(False, description="Include ASCII chart visualization")
+    bucket_size: Optional[int] = Field(
+        None,
+        ge=1,
+        description="Aggregate the population per bucket of this many steps "
+        "(buckets start at multiples of bucket_size) instead of returning every step",
+    )
 
 
-class AnalyzePopulationDynamicsTool(ToolBase):
+class AnalyzePopulationDynamicsTool(RollupReaderMixin, ToolBase):
     """Analyze population dynamics over time."""
 
+    priority = Priority.LOW
+
     # Chart configuration constants
     MAX_CHART_DATA_POINTS = 50
     CHART_HEIGHT = 10
@@ -58,6 +94,11 @@ class AnalyzePopulationDynamicsTool(ToolBase):
         - Identify population crashes or booms
         - Compare different agent types' success
         - Detect critical demographic events
+
+        Pass bucket_size for long runs: instead of the per-step time series the
+        result then lists `buckets` with the population min/mean/max, births
+        and deaths of each bucket of steps, read from the simulation's rollup
+        when it has one.
         """
 
     @property
@@ -67,6 +108,11 @@ class AnalyzePopulationDynamicsTool(ToolBase):
     @requires_simulation
     def execute(self, **params):
         """Execute population dynamics analysis."""
+        if params.get("bucket_size") is not None:
+            return self._bucketed(params)
+
+        import numpy as np
+
         def query_func(session):
             # Build query for simulation steps
             query = session.query(SimulationStepModel).filter(
@@ -162,6 +208,58 @@ class AnalyzePopulationDynamicsTool(ToolBase):
 
         return self.db.execute_query(query_func)
 
+    def _bucketed(self, params):
+        """Summarize the population per step bucket, from the rollup when possible."""
+        args = (
+            params["simulation_id"],
+            params["bucket_size"],
+            params.get("start_step"),
+            params.get("end_step"),
+        )
+        source = "rollup"
+        buckets = self.rollups.step_buckets(*args)
+        if buckets is None:
+            source = "raw"
+            buckets = self.db.execute_query(
+                lambda session: step_bucket_statistics(session, *args)
+            )
+
+        if not buckets:
+            return {"error": "No data found for specified range"}
+
+        # Bucket bounds are nominal; clip them to the requested range
+        start = max(buckets[0]["bucket_start"], params.get("start_step") or 0)
+        end = buckets[-1]["bucket_end"]
+        if params.get("end_step") is not None:
+            end = min(end, params["end_step"])
+        steps = sum(bucket["steps"] for bucket in buckets)
+        total_births = sum(bucket["births"] or 0 for bucket in buckets)
+        total_deaths = sum(bucket["deaths"] or 0 for bucket in buckets)
+        result = {
+            "source": source,
+            "bucket_size": params["bucket_size"],
+            "step_range": {"start": start, "end": end, "count": steps},
+            "population_summary": {
+                "peak_population": max(bucket["population_max"] or 0 for bucket in buckets),
+                "average_population": sum(
+                    (bucket["population_mean"] or 0) * bucket["steps"] for bucket in buckets
+                )
+                / steps,
+                "total_births": total_births,
+                "total_deaths": total_deaths,
+                "net_change": total_births - total_deaths,
+            },
+            "buckets": buckets,
+        }
+
+        if params.get("include_chart"):
+            result["chart"] = self._create_simple_chart(
+                [bucket["bucket_start"] for bucket in buckets],
+                [bucket["population_mean"] or 0 for bucket in buckets],
+            )
+
+        return result
+
     def _create_simple_chart(self, steps: List[int], values: List[int]) -> str:
         """Create a simple ASCII chart."""
         if not values:
@@ -205,9 +303,11 @@ class AnalyzeSurvivalRatesParams(BaseModel):
     group_by: str = Field("generation", description="Group by 'generation' or 'agent_type'")
 
 
-class AnalyzeSurvivalRatesTool(ToolBase):
+class AnalyzeSurvivalRatesTool(RollupReaderMixin, ToolBase):
     """Analyze agent survival rates by cohort."""
 
+    priority = Priority.LOW
+
     @property
     def name(self) -> str:
         return "analyze_survival_rates"
@@ -239,80 +339,54 @@ class AnalyzeSurvivalRatesTool(ToolBase):
         if not self.db.validate_simulation_exists(params["simulation_id"]):
             raise SimulationNotFoundError(params["simulation_id"])
 
-        def query_func(session):
-            # Get all agents
-            agents = (
-                session.query(AgentModel)
-                .filter(AgentModel.simulation_id == params["simulation_id"])
-                .all()
-            )
-
-            if not agents:
-                return {"error": "No agents found"}
-
-            # Group by specified field
-            group_field = params["group_by"]
-            groups = {}
-
-            for agent in agents:
-                if group_field == "generation":
-                    key = agent.generation
-                elif group_field == "agent_type":
-                    key = agent.agent_type
-                else:
-                    key = "all"
-
-                if key not in groups:
-                    groups[key] = {"alive": 0, "dead": 0, "lifespans": []}
-
-                if agent.death_time is None:
-                    groups[key]["alive"] += 1
-                else:
-                    groups[key]["dead"] += 1
-                    lifespan = agent.death_time - agent.birth_time
-                    groups[key]["lifespans"].append(lifespan)
-
-            # Calculate statistics for each group
-            results = {}
-            for key, data in groups.items():
-                total = data["alive"] + data["dead"]
-                survival_rate = (data["alive"] / total * 100) if total > 0 else 0
-
-                if data["lifespans"]:
-                    avg_lifespan = float(np.mean(data["lifespans"]))
-                    median_lifespan = float(np.median(data["lifespans"]))
-                    max_lifespan = max(data["lifespans"])
-                    min_lifespan = min(data["lifespans"])
-                else:
-                    avg_lifespan = median_lifespan = max_lifespan = min_lifespan = None
-
-                results[str(key)] = {
-                    "total_agents": total,
-                    "alive": data["alive"],
-                    "dead": data["dead"],
-                    "survival_rate_percent": round(survival_rate, 2),
-                    "average_lifespan": round(avg_lifespan, 2) if avg_lifespan else None,
-                    "median_lifespan": median_lifespan,
-                    "max_lifespan": max_lifespan,
-                    "min_lifespan": min_lifespan,
-                }
-
-            return {
-                "grouped_by": group_field,
-                "cohorts": results,
-                "summary": {
-                    "total_groups": len(results),
-                    "total_agents": sum(r["total_agents"] for r in results.values()),
-                    "overall_survival_rate": round(
-                        sum(r["alive"] for r in results.values())
-                        / sum(r["total_agents"] for r in results.values())
-                        * 100,
-                        2,
-                    ),
-                },
+        group_field = params["group_by"]
+        source = "rollup"
+        cohorts = self.rollups.cohorts(params["simulation_id"], group_field)
+        if cohorts is None:
+            source = "raw"
+
+            def query_func(session):
+                statistics = cohort_statistics(session, params["simulation_id"], group_field)
+                return {str(key): stats for key, stats in statistics.items()}
+
+            cohorts = self.db.execute_query(query_func)
+
+        if not cohorts:
+            return {"error": "No agents found"}
+
+        # Calculate statistics for each group
+        results = {}
+        for key, data in cohorts.items():
+            total = data["alive"] + data["dead"]
+            survival_rate = (data["alive"] / total * 100) if total > 0 else 0
+            avg_lifespan = data["lifespan_mean"]
+
+            results[key] = {
+                "total_agents": total,
+                "alive": data["alive"],
+                "dead": data["dead"],
+                "survival_rate_percent": round(survival_rate, 2),
+                "average_lifespan": round(avg_lifespan, 2) if avg_lifespan else None,
+                "median_lifespan": data["lifespan_median"],
+                "max_lifespan": data["lifespan_max"],
+                "min_lifespan": data["lifespan_min"],
             }
 
-        return self.db.execute_query(query_func)
+        return {
+            "grouped_by": group_field,
+            "source": source,
+            "cohorts": results,
+            "summary": {
+                "total_groups": len(results),
+                "total_agents": sum(r["total_agents"] for r in results.values()),
+                "overall_survival_rate": round(
+                    sum(r["alive"] for r in results.values())
+                    / sum(r["total_agents"] for r in results.values())
+                    * 100,
+                    2,
+                ),
+            },
+        }
 
 
 class AnalyzeResourceEfficiencyParams(BaseModel):
@@ -326,6 +400,8 @@ class AnalyzeResourceEfficiencyParams(BaseModel):
 class AnalyzeResourceEfficiencyTool(ToolBase):
     """Analyze resource utilization efficiency."""
 
+    priority = Priority.LOW
+
     @property
     def name(self) -> str:
         return "analyze_resource_efficiency"
@@ -354,6 +430,8 @@ class AnalyzeResourceEfficiencyTool(ToolBase):
 
     def execute(self, **params):
         """Execute resource efficiency analysis."""
+        import numpy as np
+
         if not self.db.validate_simulation_exists(params["simulation_id"]):
             raise SimulationNotFoundError(params["simulation_id"])
 
@@ -429,6 +507,8 @@ class AnalyzeAgentPerformanceParams(BaseModel):
 class AnalyzeAgentPerformanceTool(ToolBase):
     """Analyze individual agent performance."""
 
+    priority = Priority.LOW
+
     @property
     def name(self) -> str:
         return "analyze_agent_performance"
@@ -517,11 +597,29 @@ class IdentifyCriticalEventsParams(BaseModel):
     threshold_percent: float = Field(
         10.0, ge=0, le=100, description="Population change threshold percentage"
     )
+    detectors: List[str] = Field(
+        list(DEFAULT_DETECTORS),
+        description=f"Detectors to run, any of: {', '.join(DETECTORS)}",
+    )
+    anomaly_metric: str = Field(
+        "total_agents", description="Step metric the anomaly detector watches"
+    )
+    anomaly_window: int = Field(
+        20, ge=2, le=1000, description="Preceding steps the anomaly z-score is computed over"
+    )
+    anomaly_z_threshold: float = Field(
+        3.0, gt=0, description="Absolute z-score at which a step is anomalous"
+    )
+    depletion_percent: float = Field(
+        25.0, ge=0, le=100, description="Resource level (% of initial) that counts as depleted"
+    )
 
 
 class IdentifyCriticalEventsTool(ToolBase):
     """Identify critical events in simulation."""
 
+    priority = Priority.LOW
+
     @property
     def name(self) -> str:
         return "identify_critical_events"
@@ -534,9 +632,10 @@ class IdentifyCriticalEventsTool(ToolBase):
         Detects critical events such as:
         - Population crashes (>threshold% decline)
         - Population booms (>threshold% growth)
-        - Resource depletion events
         - Mass death events
         - Generation milestones
+        - Anomalies: steps far from the rolling mean (detectors=[..., "anomaly"])
+        - Resource depletion (detectors=[..., "resource_depletion"])
         
         Use this to:
         - Find turning points in simulation
@@ -554,86 +653,28 @@ class IdentifyCriticalEventsTool(ToolBase):
         if not self.db.validate_simulation_exists(params["simulation_id"]):
             raise SimulationNotFoundError(params["simulation_id"])
 
+        detectors = resolve_detectors(params["detectors"])
+        columns = required_columns(detectors, params)
+        validate_step_columns(columns)
+
         def query_func(session):
-            # Get simulation steps
-            steps = (
-                session.query(SimulationStepModel)
-                .filter(SimulationStepModel.simulation_id == params["simulation_id"])
-                .order_by(SimulationStepModel.step_number)
-                .all()
-            )
+            return load_step_metrics(session, params["simulation_id"], columns)
 
-            if len(steps) < 2:
-                return {"events": [], "summary": "Insufficient data"}
-
-            events = []
-            threshold = params["threshold_percent"]
-
-            # Detect population changes
-            for i in range(1, len(steps)):
-                prev_pop = steps[i - 1].total_agents
-                curr_pop = steps[i].total_agents
-
-                if prev_pop > 0:
-                    change_percent = ((curr_pop - prev_pop) / prev_pop) * 100
-
-                    if change_percent <= -threshold:
-                        events.append(
-                            {
-                                "type": "population_crash",
-                                "step": steps[i].step_number,
-                                "description": f"Population dropped {abs(change_percent):.1f}% ({prev_pop} → {curr_pop})",
-                                "severity": "high" if abs(change_percent) > SEVERE_POPULATION_CHANGE_THRESHOLD else "medium",
-                            }
-                        )
-                    elif change_percent >= threshold:
-                        events.append(
-                            {
-                                "type": "population_boom",
-                                "step": steps[i].step_number,
-                                "description": f"Population grew {change_percent:.1f}% ({prev_pop} → {curr_pop})",
-                                "severity": "medium",
-                            }
-                        )
-
-                # Detect mass death events
-                if steps[i].deaths > MASS_DEATH_THRESHOLD:
-                    events.append(
-                        {
-                            "type": "mass_death",
-                            "step": steps[i].step_number,
-                            "description": f"{steps[i].deaths} deaths in single step",
-                            "severity": "high" if steps[i].deaths > SEVERE_MASS_DEATH_THRESHOLD else "medium",
-                        }
-                    )
+        metrics = self.db.execute_query(query_func)
+        if len(metrics["step_number"]) < 2:
+            return {"events": [], "summary": "Insufficient data"}
 
-                # Detect generation milestones
-                if i > 0 and steps[i].current_max_generation > steps[i - 1].current_max_generation:
-                    events.append(
-                        {
-                            "type": "new_generation",
-                            "step": steps[i].step_number,
-                            "description": f"Generation {steps[i].current_max_generation} reached",
-                            "severity": "low",
-                        }
-                    )
+        events = detect_events(metrics, detectors, params)
 
-            return {
-                "events": events,
-                "summary": {
-                    "total_events": len(events),
-                    "by_type": {
-                        event_type: len([e for e in events if e["type"] == event_type])
-                        for event_type in set(e["type"] for e in events)
-                    },
-                    "by_severity": {
-                        severity: len([e for e in events if e["severity"] == severity])
-                        for severity in set(e["severity"] for e in events)
-                    },
-                },
-            }
-
-        return self.db.execute_query(query_func)
+        return {
+            "events": events,
+            "detectors": [detector.name for detector in detectors],
+            "summary": {
+                "total_events": len(events),
+                "by_type": dict(Counter(event["type"] for event in events)),
+                "by_severity": dict(Counter(event["severity"] for event in events)),
+            },
+        }
 
 
 class AnalyzeSocialPatternsParams(BaseModel):
@@ -643,9 +684,11 @@ class AnalyzeSocialPatternsParams(BaseModel):
     limit: int = Field(1000, ge=1, le=10000, description="Max interactions to analyze")
 
 
-class AnalyzeSocialPatternsTool(ToolBase):
+class AnalyzeSocialPatternsTool(RollupReaderMixin, ToolBase):
     """Analyze social interaction patterns."""
 
+    priority = Priority.LOW
+
     @property
     def name(self) -> str:
         return "analyze_social_patterns"
@@ -677,49 +720,42 @@ class AnalyzeSocialPatternsTool(ToolBase):
         if not self.db.validate_simulation_exists(params["simulation_id"]):
             raise SimulationNotFoundError(params["simulation_id"])
 
-        def query_func(session):
-            # Get social interactions
-            interactions = (
-                session.query(SocialInteractionModel)
-                .filter(SocialInteractionModel.simulation_id == params["simulation_id"])
-                .limit(params["limit"])
-                .all()
-            )
+        # The rollup counts every interaction, so it answers only when limit covers them all
+        source = "rollup"
+        stats = self.rollups.social(params["simulation_id"])
+        if stats is None or stats["interactions"] > params["limit"]:
+            source = "raw"
+
+            def query_func(session):
+                interactions = (
+                    session.query(
+                        SocialInteractionModel.interaction_type,
+                        SocialInteractionModel.outcome,
+                        SocialInteractionModel.resources_transferred,
+                    )
+                    .filter(SocialInteractionModel.simulation_id == params["simulation_id"])
+                    .limit(params["limit"])
+                )
+                return social_rollup(interactions)
 
-            if not interactions:
-                return {"message": "No social interactions found"}
-
-            # Analyze interaction types
-            type_counts = {}
-            outcome_counts = {}
-            total_resources_shared = 0
-
-            for interaction in interactions:
-                # Count interaction types
-                itype = interaction.interaction_type
-                type_counts[itype] = type_counts.get(itype, 0) + 1
-
-                # Count outcomes
-                outcome = interaction.outcome
-                outcome_counts[outcome] = outcome_counts.get(outcome, 0) + 1
-
-                # Sum resources transferred
-                if interaction.resources_transferred:
-                    total_resources_shared += interaction.resources_transferred
-
-            return {
-                "total_interactions": len(interactions),
-                "interaction_types": type_counts,
-                "outcomes": outcome_counts,
-                "resource_sharing": {
-                    "total_resources_transferred": round(total_resources_shared, 2),
-                    "average_per_interaction": (
-                        round(total_resources_shared / len(interactions), 2) if interactions else 0
-                    ),
-                },
-            }
+            stats = self.db.execute_query(query_func)
 
-        return self.db.execute_query(query_func)
+        if not stats["interactions"]:
+            return {"message": "No social interactions found"}
+
+        total_resources_shared = stats["resources_transferred"]
+        return {
+            "source": source,
+            "total_interactions": stats["interactions"],
+            "interaction_types": stats["interaction_types"],
+            "outcomes": stats["outcomes"],
+            "resource_sharing": {
+                "total_resources_transferred": round(total_resources_shared, 2),
+                "average_per_interaction": round(
+                    total_resources_shared / stats["interactions"], 2
+                ),
+            },
+        }
 
 
 class AnalyzeReproductionParams(BaseModel):
@@ -728,9 +764,11 @@ class AnalyzeReproductionParams(BaseModel):
     simulation_id: str = Field(..., description="Simulation ID to analyze")
 
 
-class AnalyzeReproductionTool(ToolBase):
+class AnalyzeReproductionTool(RollupReaderMixin, ToolBase):
     """Analyze reproduction success rates and patterns."""
 
+    priority = Priority.LOW
+
     @property
     def name(self) -> str:
         return "analyze_reproduction"
@@ -762,54 +800,43 @@ class AnalyzeReproductionTool(ToolBase):
         if not self.db.validate_simulation_exists(params["simulation_id"]):
             raise SimulationNotFoundError(params["simulation_id"])
 
-        def query_func(session):
-            # Get reproduction events
-            events = (
-                session.query(ReproductionEventModel)
-                .filter(ReproductionEventModel.simulation_id == params["simulation_id"])
-                .all()
-            )
-
-            if not events:
-                return {"message": "No reproduction events found"}
-
-            successful = [e for e in events if e.success]
-            failed = [e for e in events if not e.success]
-
-            # Analyze success rates
-            total_events = len(events)
-            success_rate = (len(successful) / total_events * 100) if total_events > 0 else 0
-
-            # Analyze resource costs
-            resource_costs = [
-                e.parent_resources_before - e.parent_resources_after for e in successful
-            ]
-            avg_cost = float(np.mean(resource_costs)) if resource_costs else 0
-
-            # Analyze failure reasons
-            failure_reasons = {}
-            for event in failed:
-                reason = event.failure_reason or "unknown"
-                failure_reasons[reason] = failure_reasons.get(reason, 0) + 1
-
-            return {
-                "total_attempts": total_events,
-                "successful": len(successful),
-                "failed": len(failed),
-                "success_rate_percent": round(success_rate, 2),
-                "resource_analysis": {
-                    "average_cost": round(avg_cost, 2),
-                    "min_cost": min(resource_costs) if resource_costs else None,
-                    "max_cost": max(resource_costs) if resource_costs else None,
-                },
-                "failure_reasons": failure_reasons,
-                "generation_progression": {
-                    "max_offspring_generation": (
-                        max(e.offspring_generation for e in successful if e.offspring_generation)
-                        if successful
-                        else None
-                    )
-                },
-            }
-
-        return self.db.execute_query(query_func)
+        source = "rollup"
+        stats = self.rollups.reproduction(params["simulation_id"])
+        if stats is None:
+            source = "raw"
+
+            def query_func(session):
+                events = session.query(
+                    ReproductionEventModel.success,
+                    ReproductionEventModel.parent_resources_before,
+                    ReproductionEventModel.parent_resources_after,
+                    ReproductionEventModel.failure_reason,
+                    ReproductionEventModel.offspring_generation,
+                ).filter(ReproductionEventModel.simulation_id == params["simulation_id"])
+                return reproduction_rollup(events)
+
+            stats = self.db.execute_query(query_func)
+
+        if not stats["attempts"]:
+            return {"message": "No reproduction events found"}
+
+        # Analyze success rates
+        total_events = stats["attempts"]
+        success_rate = stats["successful"] / total_events * 100
+
+        return {
+            "source": source,
+            "total_attempts": total_events,
+            "successful": stats["successful"],
+            "failed": stats["failed"],
+            "success_rate_percent": round(success_rate, 2),
+            "resource_analysis": {
+                "average_cost": round(stats["cost_mean"] or 0, 2),
+                "min_cost": stats["cost_min"],
+                "max_cost": stats["cost_max"],
+            },
+            "failure_reasons": stats["failure_reasons"],
+            "generation_progression": {
+                "max_offspring_generation": stats["max_offspring_generation"]
+            },
+        }
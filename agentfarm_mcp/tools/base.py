@@ -1,9 +1,11 @@
 """Base class for all MCP tools."""
 
+import time
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
 from datetime import datetime
 from functools import wraps
-from typing import Any, Callable
+from typing import Any, Callable, Generator, Iterator
 
 from pydantic import BaseModel
 from pydantic import ValidationError as PydanticValidationError
@@ -11,10 +13,38 @@ from structlog import get_logger
 
 from ..services.cache_service import CacheService
 from ..services.database_service import DatabaseService
-from ..utils.exceptions import DatabaseError, MCPException, SimulationNotFoundError
+from ..utils import metrics
+from ..utils.admission_control import AdmissionController, Priority
+from ..utils.columnar import to_columnar
+from ..utils.deadlines import Deadline, deadline_scope
+from ..utils.exceptions import ConnectionError as MCPConnectionError
+from ..utils.exceptions import PermissionError as MCPPermissionError
+from ..utils.exceptions import (
+    MCPException,
+    QueryTimeoutError,
+    SimulationNotFoundError,
+    ValidationError,
+)
+from ..utils.profiling import ToolProfiler
+from ..utils.query_stats import track_queries
+from ..utils.serialization import PreEncoded
 
 logger = get_logger(__name__)
 
+# Errors converted into structured error responses instead of propagating
+_HANDLED_ERRORS = (
+    PydanticValidationError,
+    MCPException,
+    ValueError,
+    TypeError,
+    AttributeError,
+    KeyError,
+    RuntimeError,
+)
+
+# Values accepted by the reserved ``format`` parameter of tabular tools
+RESPONSE_FORMATS = ("rows", "columnar")
+
 
 def requires_simulation(func: Callable) -> Callable:
     """Decorator to validate that simulation_id exists before executing tool.
@@ -53,18 +83,50 @@ class ToolBase(ABC):
     - Response formatting
     - Error handling
     - Caching integration
+    - Row or columnar output for tabular tools
+    - Admission control (load shedding)
+    - Per-call deadlines
+    - On-demand profiling
     - Logging
     """
 
-    def __init__(self, db_service: DatabaseService, cache_service: CacheService | Any) -> None:
+    # Priority class used by admission control; override in subclasses
+    priority: Priority = Priority.NORMAL
+
+    # Whether results may be served from / stored in the cache
+    cacheable: bool = True
+
+    # Whether the tool implements ``execute_stream`` with bounded chunks
+    streamable: bool = False
+
+    # Rows per chunk for streamable tools
+    stream_chunk_size: int = 500
+
+    # Result keys holding row lists; non-empty enables the ``format`` parameter
+    tabular_keys: tuple[str, ...] = ()
+
+    # Columns dictionary-encoded in columnar output
+    categorical_columns: tuple[str, ...] = ("agent_type", "action_type")
+
+    def __init__(
+        self,
+        db_service: DatabaseService,
+        cache_service: CacheService | Any,
+        admission_controller: AdmissionController | None = None,
+        profiler: ToolProfiler | None = None,
+    ) -> None:
         """Initialize tool with required services.
 
         Args:
             db_service: Database service instance
             cache_service: Cache service instance (CacheService or RedisCacheService)
+            admission_controller: Optional shared admission controller
+            profiler: Optional profiler for on-demand profiling
         """
         self.db = db_service
         self.cache = cache_service
+        self.admission = admission_controller
+        self.profiler = profiler
 
     # Abstract properties that subclasses must implement
 
@@ -102,60 +164,331 @@ class ToolBase(ABC):
         This is the main entry point for tool execution.
 
         Args:
-            **params: Raw parameters from MCP request
+            **params: Raw parameters from MCP request. The reserved ``_profile``
+                flag requests a profile report when the server allows it,
+                ``timeout_ms`` sets a deadline for the call, and tabular tools
+                accept ``format`` (``"rows"`` or ``"columnar"``).
 
         Returns:
             Structured response dictionary
         """
         start_time = datetime.now()
+        profile_requested = bool(params.pop("_profile", False))
+        timeout_ms = params.pop("timeout_ms", None)
+        response_format = params.pop("format", "rows") if self.tabular_keys else "rows"
 
         try:
+            if profile_requested and (self.profiler is None or not self.profiler.allow_per_call):
+                raise MCPPermissionError("Per-call profiling is disabled", operation="_profile")
+            self._check_timeout(timeout_ms)
+            self._check_format(response_format)
+
             # Validate parameters using Pydantic schema
             validated_params = self.parameters_schema(**params)
 
-            # Check cache if enabled
-            cache_key = self._get_cache_key(validated_params)
-            cached_result = self.cache.get(cache_key)
+            # Check cache if enabled (explicit profiling requests always execute)
+            cache_key = (
+                self._get_cache_key(validated_params, response_format) if self.cacheable else None
+            )
+            cached_result = (
+                self.cache.get(cache_key)
+                if cache_key is not None and not profile_requested
+                else None
+            )
 
             if cached_result is not None:
                 logger.info("tool_cache_hit", tool=self.name)
+                metrics.TOOL_CALLS.inc(tool=self.name, status="cache_hit")
                 return self._format_response(
                     data=cached_result, from_cache=True, execution_time_ms=0
                 )
 
-            # Execute tool
+            # Execute tool (admission control sheds load before touching the database)
             logger.info("tool_executing", tool=self.name, params=params)
-            result = self.execute(**validated_params.model_dump())
-
-            # Cache result
-            self.cache.set(cache_key, result)
+            profile = None
+            with self._track_queries() as stats, deadline_scope(timeout_ms) as deadline:
+                if profile_requested or (self.profiler is not None and self.profiler.always):
+                    result, profile = self.profiler.profile(
+                        self.name, lambda: self._execute_admitted(validated_params)
+                    )
+                else:
+                    result = self._execute_admitted(validated_params)
+
+            # The caller has given up; skip caching and serializing the result
+            self._raise_if_expired(deadline)
+
+            if response_format == "columnar":
+                result = self._to_columnar(result)
+
+            # Cache result; dicts memoize their JSON so cache hits skip re-encoding
+            if cache_key is not None:
+                if isinstance(result, dict):
+                    result = PreEncoded(result)
+                self.cache.set(cache_key, result)
 
             # Calculate execution time
             execution_time = (datetime.now() - start_time).total_seconds() * 1000
 
-            logger.info("tool_executed", tool=self.name, execution_time_ms=execution_time)
+            stats_dict = stats.as_dict() if stats is not None else None
+            logger.info(
+                "tool_executed",
+                tool=self.name,
+                execution_time_ms=execution_time,
+                query_stats=stats_dict,
+            )
+            metrics.TOOL_CALLS.inc(tool=self.name, status="success")
+            metrics.TOOL_LATENCY.observe(execution_time, tool=self.name)
             return self._format_response(
-                data=result, from_cache=False, execution_time_ms=execution_time
+                data=result,
+                from_cache=False,
+                execution_time_ms=execution_time,
+                query_stats=stats_dict,
+                profile=profile,
+            )
+
+        except _HANDLED_ERRORS as e:
+            return self._handle_error(e)
+
+    def stream(self, **params: Any) -> Iterator[dict[str, Any]]:
+        """Validate and execute tool, yielding results incrementally.
+
+        Streaming bypasses the cache and keeps peak memory bounded by the
+        chunk size. ``format`` applies to each chunk; ``timeout_ms`` is
+        checked between chunks. Each chunk is yielded as
+        ``{"type": "chunk", "index": n, "data": {...}}``. The final envelope
+        is a regular response (see ``_format_response``/``_format_error``)
+        with ``"type": "end"`` whose data is the tool's summary.
+
+        Args:
+            **params: Raw parameters from MCP request
+
+        Yields:
+            Chunk envelopes followed by one end envelope
+        """
+        start_time = datetime.now()
+        params.pop("_profile", None)  # profiling applies to materialized calls only
+        timeout_ms = params.pop("timeout_ms", None)
+        response_format = params.pop("format", "rows") if self.tabular_keys else "rows"
+        admitted = False
+        first_chunk_ms = None
+        congested = False
+
+        try:
+            self._check_timeout(timeout_ms)
+            self._check_format(response_format)
+            deadline = Deadline(timeout_ms) if timeout_ms is not None else None
+            validated_params = self.parameters_schema(**params)
+
+            if self.admission is not None:
+                self.admission.acquire(self.priority)
+                admitted = True
+
+            logger.info("tool_streaming", tool=self.name, params=params)
+            chunks = self.execute_stream(**validated_params.model_dump())
+            index = 0
+            while True:
+                try:
+                    chunk = next(chunks)
+                except StopIteration as stop:
+                    summary = stop.value
+                    break
+                if deadline is not None and deadline.expired:
+                    chunks.close()
+                    self._raise_if_expired(deadline)
+                if first_chunk_ms is None:
+                    first_chunk_ms = (datetime.now() - start_time).total_seconds() * 1000
+                if response_format == "columnar":
+                    chunk = self._to_columnar(chunk)
+                yield {"type": "chunk", "index": index, "data": chunk}
+                index += 1
+
+            execution_time = (datetime.now() - start_time).total_seconds() * 1000
+            logger.info(
+                "tool_streamed",
+                tool=self.name,
+                chunks=index,
+                first_chunk_ms=first_chunk_ms,
+                execution_time_ms=execution_time,
+            )
+            metrics.TOOL_CALLS.inc(tool=self.name, status="success")
+            metrics.TOOL_LATENCY.observe(execution_time, tool=self.name)
+            response = self._format_response(
+                data=summary, from_cache=False, execution_time_ms=execution_time
             )
+            response["metadata"]["chunks"] = index
+            response["metadata"]["first_chunk_ms"] = first_chunk_ms
+            yield {"type": "end", **response}
+
+        except _HANDLED_ERRORS as e:
+            congested = isinstance(e, (QueryTimeoutError, MCPConnectionError))
+            yield {"type": "end", **self._handle_error(e)}
+
+        finally:
+            if admitted:
+                # Streams are long-lived by design; judge congestion by time to first chunk
+                latency_ms = (
+                    first_chunk_ms
+                    if first_chunk_ms is not None
+                    else (datetime.now() - start_time).total_seconds() * 1000
+                )
+                self.admission.release(latency_ms, success=not congested, priority=self.priority)
 
-        except PydanticValidationError as e:
-            logger.warning("tool_validation_error", tool=self.name, error=str(e))
-            return self._format_error("ValidationError", str(e), e.errors())
+    def execute_stream(self, **params: Any) -> Generator[dict[str, Any], None, Any]:
+        """Execute the tool, yielding result chunks.
 
-        except MCPException as e:
-            logger.error("tool_mcp_error", tool=self.name, error=str(e), error_type=type(e).__name__)
-            return self._format_error(type(e).__name__, str(e), getattr(e, "details", None))
+        Streamable tools override this to yield bounded chunks and return a
+        summary. The default yields the complete result as a single chunk.
+
+        Args:
+            **params: Validated parameters from schema
+
+        Yields:
+            Result chunks
+
+        Returns:
+            Summary included in the final stream envelope
+        """
+        yield self.execute(**params)
+        return None
+
+    def _handle_error(self, error: Exception) -> dict[str, Any]:
+        """Log, record and format an error raised during a tool call.
+
+        Args:
+            error: Raised exception
+
+        Returns:
+            Formatted error response
+        """
+        if isinstance(error, PydanticValidationError):
+            logger.warning("tool_validation_error", tool=self.name, error=str(error))
+            self._record_error("ValidationError")
+            return self._format_error("ValidationError", str(error), error.errors())
 
-        except DatabaseError as e:
-            logger.error("tool_database_error", tool=self.name, error=str(e))
-            return self._format_error("DatabaseError", str(e), getattr(e, "details", None))
+        if isinstance(error, MCPException):
+            error_type = type(error).__name__
+            logger.error("tool_mcp_error", tool=self.name, error=str(error), error_type=error_type)
+            self._record_error(error_type)
+            return self._format_error(error_type, str(error), getattr(error, "details", None))
 
-        except (ValueError, TypeError, AttributeError, KeyError, RuntimeError) as e:
-            logger.error("tool_unexpected_error", tool=self.name, error=str(e), exc_info=e)
-            return self._format_error("UnknownError", str(e))
+        logger.error("tool_unexpected_error", tool=self.name, error=str(error), exc_info=error)
+        self._record_error("UnknownError")
+        return self._format_error("UnknownError", str(error))
+
+    def _check_timeout(self, timeout_ms: Any) -> None:
+        """Validate the requested deadline.
+
+        Args:
+            timeout_ms: Requested time budget in milliseconds, or None
+
+        Raises:
+            ValidationError: If the budget is not a positive number
+        """
+        if timeout_ms is None:
+            return
+        valid = isinstance(timeout_ms, (int, float)) and not isinstance(timeout_ms, bool)
+        if not valid or timeout_ms <= 0:
+            raise ValidationError(
+                f"Invalid timeout_ms: {timeout_ms!r}. Use a positive number of milliseconds",
+                details={"timeout_ms": timeout_ms},
+            )
+
+    def _raise_if_expired(self, deadline: Deadline | None) -> None:
+        """Abort a call whose deadline has passed.
+
+        Args:
+            deadline: Deadline for the call, if any
+
+        Raises:
+            QueryTimeoutError: If the deadline has passed
+        """
+        if deadline is not None and deadline.expired:
+            logger.warning("tool_deadline_exceeded", tool=self.name, timeout_ms=deadline.timeout_ms)
+            raise QueryTimeoutError(deadline.timeout_ms / 1000)
+
+    def _check_format(self, response_format: str) -> None:
+        """Validate the requested response format.
+
+        Args:
+            response_format: Requested format
+
+        Raises:
+            ValidationError: If the format is not supported
+        """
+        if response_format not in RESPONSE_FORMATS:
+            raise ValidationError(
+                f"Invalid format: {response_format!r}. Use one of: {', '.join(RESPONSE_FORMATS)}",
+                details={"format": response_format},
+            )
+
+    def _to_columnar(self, data: Any) -> Any:
+        """Convert the row lists of a result into columns.
+
+        Args:
+            data: Tool result (or stream chunk)
+
+        Returns:
+            Copy of the result with every list under ``tabular_keys`` in
+            columnar form; other results are returned unchanged
+        """
+        if not isinstance(data, dict):
+            return data
+
+        converted = dict(data)
+        for key in self.tabular_keys:
+            if isinstance(data.get(key), list):
+                converted[key] = to_columnar(data[key], self.categorical_columns)
+        return converted
+
+    def _record_error(self, error_type: str) -> None:
+        """Update error metrics for a failed call.
+
+        Args:
+            error_type: Error type reported in the response
+        """
+        metrics.TOOL_CALLS.inc(tool=self.name, status="error")
+        metrics.TOOL_ERRORS.inc(tool=self.name, error_type=error_type)
+
+    def _track_queries(self):
+        """Collect per-call SQL statistics when enabled in database config."""
+        if self.db.config.collect_query_stats:
+            return track_queries()
+        return nullcontext(None)
+
+    def _execute_admitted(self, validated_params: BaseModel) -> Any:
+        """Admit the call, run ``execute`` and report its outcome to admission control.
+
+        Args:
+            validated_params: Validated parameters
+
+        Returns:
+            Tool execution result
+
+        Raises:
+            OverloadedError: If admission control sheds the call
+        """
+        if self.admission is None:
+            return self.execute(**validated_params.model_dump())
+
+        self.admission.acquire(self.priority)
+        exec_start = time.perf_counter()
+        congested = False
+        try:
+            return self.execute(**validated_params.model_dump())
+        except (QueryTimeoutError, MCPConnectionError):
+            congested = True
+            raise
+        finally:
+            latency_ms = (time.perf_counter() - exec_start) * 1000
+            self.admission.release(latency_ms, success=not congested, priority=self.priority)
 
     def _format_response(
-        self, data: Any, from_cache: bool = False, execution_time_ms: float = 0
+        self,
+        data: Any,
+        from_cache: bool = False,
+        execution_time_ms: float = 0,
+        query_stats: dict[str, Any] | None = None,
+        profile: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Format successful response.
 
@@ -163,19 +496,27 @@ class ToolBase(ABC):
             data: Result data
             from_cache: Whether result came from cache
             execution_time_ms: Execution time in milliseconds
+            query_stats: Optional SQL statistics for this call
+            profile: Optional profile report for this call
 
         Returns:
             Formatted response dictionary
         """
+        metadata = {
+            "tool": self.name,
+            "timestamp": datetime.now().isoformat(),
+            "from_cache": from_cache,
+            "execution_time_ms": execution_time_ms,
+        }
+        if query_stats is not None:
+            metadata["query_stats"] = query_stats
+        if profile is not None:
+            metadata["profile"] = profile
+
         return {
             "success": True,
             "data": data,
-            "metadata": {
-                "tool": self.name,
-                "timestamp": datetime.now().isoformat(),
-                "from_cache": from_cache,
-                "execution_time_ms": execution_time_ms,
-            },
+            "metadata": metadata,
             "error": None,
         }
 
@@ -210,16 +551,20 @@ class ToolBase(ABC):
             "error": error_dict,
         }
 
-    def _get_cache_key(self, params: BaseModel) -> str:
+    def _get_cache_key(self, params: BaseModel, response_format: str = "rows") -> str:
         """Generate cache key from parameters.
 
         Args:
             params: Validated parameters
+            response_format: Response format (row results keep their historical keys)
 
         Returns:
             Cache key string
         """
-        return CacheService.generate_key(self.name, params.model_dump())
+        key_params = params.model_dump()
+        if response_format != "rows":
+            key_params["format"] = response_format
+        return CacheService.generate_key(self.name, key_params)
 
     def get_schema(self) -> dict[str, Any]:
         """Get tool schema for MCP registration.
@@ -1,11 +1,13 @@
 """Comparison tools for multi-simulation analysis and parameter impact studies."""
 
+from itertools import islice
 from typing import Dict, List, Optional
 
-import numpy as np
 from pydantic import BaseModel, Field
 
 from ..models.database_models import Simulation, SimulationStepModel
+from ..utils.admission_control import Priority
+from ..utils.cohorts import cohort_aggregates, cohort_statistics
 from .base import ToolBase
 from ..utils.exceptions import SimulationNotFoundError, ValidationError
 
@@ -25,6 +27,8 @@ class CompareSimulationsParams(BaseModel):
 class CompareSimulationsTool(ToolBase):
     """Compare metrics across multiple simulations."""
 
+    priority = Priority.LOW
+
     @property
     def name(self) -> str:
         return "compare_simulations"
@@ -53,6 +57,7 @@ class CompareSimulationsTool(ToolBase):
 
     def execute(self, **params):
         """Execute simulation comparison."""
+        import numpy as np
 
         def query_func(session):
             # Validate all simulations exist
@@ -198,6 +203,8 @@ class CompareParametersParams(BaseModel):
 class CompareParametersTool(ToolBase):
     """Analyze how a specific parameter impacts simulation outcomes."""
 
+    priority = Priority.LOW
+
     @property
     def name(self) -> str:
         return "compare_parameters"
@@ -226,6 +233,7 @@ class CompareParametersTool(ToolBase):
 
     def execute(self, **params):
         """Execute parameter comparison."""
+        import numpy as np
 
         def query_func(session):
             # Get simulations to compare
@@ -334,6 +342,8 @@ class RankConfigurationsParams(BaseModel):
 class RankConfigurationsTool(ToolBase):
     """Rank simulations by performance metrics."""
 
+    priority = Priority.LOW
+
     @property
     def name(self) -> str:
         return "rank_configurations"
@@ -362,6 +372,7 @@ class RankConfigurationsTool(ToolBase):
 
     def execute(self, **params):
         """Execute configuration ranking."""
+        import numpy as np
 
         def query_func(session):
             # Get simulations
@@ -465,6 +476,8 @@ class CompareGenerationsParams(BaseModel):
 class CompareGenerationsTool(ToolBase):
     """Compare performance across generations within a simulation."""
 
+    priority = Priority.LOW
+
     @property
     def name(self) -> str:
         return "compare_generations"
@@ -497,43 +510,21 @@ class CompareGenerationsTool(ToolBase):
             raise SimulationNotFoundError(params["simulation_id"])
 
         def query_func(session):
-            from ..models.database_models import AgentModel
-
-            # Get agents grouped by generation
-            agents = (
-                session.query(AgentModel)
-                .filter(AgentModel.simulation_id == params["simulation_id"])
-                .all()
-            )
+            # Counts and lifespan totals per generation, aggregated by the database
+            generations = cohort_aggregates(session, params["simulation_id"], "generation")
 
-            if not agents:
+            if not generations:
                 return {"message": "No agents found"}
 
-            # Group by generation
-            generations = {}
-            for agent in agents:
-                gen = agent.generation
-                if gen not in generations:
-                    generations[gen] = {
-                        "agents": [],
-                        "alive": 0,
-                        "dead": 0,
-                        "lifespans": [],
-                    }
-
-                generations[gen]["agents"].append(agent.agent_id)
-
-                if agent.death_time is None:
-                    generations[gen]["alive"] += 1
-                else:
-                    generations[gen]["dead"] += 1
-                    lifespan = agent.death_time - agent.birth_time
-                    generations[gen]["lifespans"].append(lifespan)
+            # Medians only for the generations reported
+            selected = dict(islice(generations.items(), params["max_generations"]))
+            statistics = cohort_statistics(
+                session, params["simulation_id"], "generation", aggregates=selected
+            )
 
             # Calculate statistics for each generation
             generation_stats = {}
-            for gen in sorted(generations.keys())[: params["max_generations"]]:
-                data = generations[gen]
+            for gen, data in statistics.items():
                 total = data["alive"] + data["dead"]
 
                 stats = {
@@ -546,12 +537,12 @@ class CompareGenerationsTool(ToolBase):
                     else 0,
                 }
 
-                if data["lifespans"]:
+                if data["lifespan_mean"] is not None:
                     stats["lifespan_stats"] = {
-                        "mean": round(float(np.mean(data["lifespans"])), 2),
-                        "median": float(np.median(data["lifespans"])),
-                        "min": min(data["lifespans"]),
-                        "max": max(data["lifespans"]),
+                        "mean": round(data["lifespan_mean"], 2),
+                        "median": data["lifespan_median"],
+                        "min": data["lifespan_min"],
+                        "max": data["lifespan_max"],
                     }
 
                 generation_stats[gen] = stats
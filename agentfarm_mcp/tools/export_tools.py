@@ -0,0 +1,94 @@
+"""Tools for exporting simulation data to files."""
+
+from typing import List, Literal
+
+from pydantic import BaseModel, Field, field_validator
+
+from ..services.export_service import (
+    DEFAULT_EXPORT_TABLES,
+    EXPORT_TABLES,
+    ExportService,
+    resolve_export_dir,
+)
+from ..utils.admission_control import Priority
+from ..utils.exceptions import SimulationNotFoundError
+from .base import ToolBase
+
+
+class ExportSimulationDataParams(BaseModel):
+    """Parameters for exporting simulation data."""
+
+    simulation_id: str = Field(..., description="Simulation ID to export")
+    tables: List[str] = Field(
+        list(DEFAULT_EXPORT_TABLES),
+        description=f"Tables to export (any of: {', '.join(EXPORT_TABLES)})",
+    )
+    format: Literal["parquet", "arrow", "csv"] = Field(
+        "parquet", description="File format: 'parquet', 'arrow' (Arrow IPC) or 'csv'"
+    )
+    output_dir: str = Field(
+        ".",
+        description="Directory under the server's export directory; "
+        "files go to <export_dir>/<output_dir>/<simulation_id>/",
+    )
+    chunk_size: int = Field(
+        50000, ge=1000, le=1000000, description="Rows fetched and written per chunk"
+    )
+
+    @field_validator("tables")
+    @classmethod
+    def validate_tables(cls, v: List[str]) -> List[str]:
+        """Validate table names."""
+        unknown = [name for name in v if name not in EXPORT_TABLES]
+        if not v or unknown:
+            raise ValueError(f"Unknown tables: {unknown}. Valid tables: {list(EXPORT_TABLES)}")
+        return list(dict.fromkeys(v))
+
+
+class ExportSimulationDataTool(ToolBase):
+    """Export full simulation tables to Parquet, Arrow IPC or CSV files."""
+
+    priority = Priority.LOW
+    cacheable = False
+
+    @property
+    def name(self) -> str:
+        return "export_simulation_data"
+
+    @property
+    def description(self) -> str:
+        return """
+        Export complete tables of a simulation to files on the server's local disk.
+
+        Streams each table in chunks (bounded memory, no pagination needed) to
+        <export_dir>/<output_dir>/<simulation_id>/<table>.<parquet|arrow|csv>, where
+        export_dir is configured on the server and output_dir cannot leave it.
+
+        Returns:
+        - Path, row count and size of each file
+        - Export throughput (rows per second)
+
+        Use this for:
+        - Feeding offline pipelines (pandas, Polars, Spark, DuckDB)
+        - Archiving full agent states, actions and interactions
+        - Moving data that is too large for query tools
+        """
+
+    @property
+    def parameters_schema(self):
+        return ExportSimulationDataParams
+
+    def execute(self, **params):
+        """Execute export."""
+        # Callers only choose a directory inside the configured export root
+        output_dir = resolve_export_dir(self.db.config.export_dir, params["output_dir"])
+        if not self.db.validate_simulation_exists(params["simulation_id"]):
+            raise SimulationNotFoundError(params["simulation_id"])
+
+        return ExportService(self.db).export(
+            params["simulation_id"],
+            str(output_dir),
+            tables=params["tables"],
+            export_format=params["format"],
+            chunk_size=params["chunk_size"],
+        )
@@ -2,10 +2,12 @@
 
 import time
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, Literal, Optional
 
 from pydantic import BaseModel, Field
 
+from ..utils import metrics
+from ..utils.admission_control import Priority
 from ..utils.exceptions import ConnectionError as MCPConnectionError
 from ..utils.exceptions import QueryExecutionError
 from .base import ToolBase
@@ -21,6 +23,8 @@ class HealthCheckParams(BaseModel):
 class HealthCheckTool(ToolBase):
     """Comprehensive health check for the MCP server."""
 
+    priority = Priority.CRITICAL
+
     @property
     def name(self) -> str:
         return "health_check"
@@ -34,6 +38,7 @@ class HealthCheckTool(ToolBase):
         - Database connectivity and responsiveness
         - Cache service functionality
         - Tool registry integrity
+        - Admission control (concurrency limit and load shedding)
         - Server configuration validity
         
         Use this for:
@@ -92,6 +97,16 @@ class HealthCheckTool(ToolBase):
         else:
             health_info["summary"]["failed_checks"] += 1
 
+        # Check admission control (only when the server wired a controller in)
+        if self.admission is not None:
+            admission_health = self._check_admission(include_details)
+            health_info["components"]["admission"] = admission_health
+            health_info["summary"]["total_checks"] += 1
+            if admission_health["status"] == "healthy":
+                health_info["summary"]["passed_checks"] += 1
+            else:
+                health_info["summary"]["warnings"] += 1
+
         # Determine overall status
         if health_info["summary"]["failed_checks"] > 0:
             health_info["status"] = "unhealthy"
@@ -231,6 +246,27 @@ class HealthCheckTool(ToolBase):
                 "error_type": "ToolRegistryError",
             }
 
+    def _check_admission(self, include_details: bool) -> Dict[str, Any]:
+        """Check admission control state."""
+        state = self.admission.get_state()
+
+        health = {
+            "status": "healthy",
+            "limit": state["limit"],
+            "in_flight": state["in_flight"],
+            "shed": state["shed"],
+        }
+
+        if include_details:
+            health["details"] = state
+
+        # Running at the limit means new normal-priority requests are being shed
+        if state["in_flight"] >= state["limit"]:
+            health["status"] = "warning"
+            health["warning"] = "Server at concurrency limit, shedding load"
+
+        return health
+
     def _get_uptime(self) -> float:
         """Get server uptime in seconds."""
         # This is a placeholder - in a real implementation, you'd track start time
@@ -259,6 +295,8 @@ class SystemInfoParams(BaseModel):
 class SystemInfoTool(ToolBase):
     """Get system information and performance metrics."""
 
+    priority = Priority.CRITICAL
+
     @property
     def name(self) -> str:
         return "system_info"
@@ -354,3 +392,104 @@ class SystemInfoTool(ToolBase):
                 ),
             },
         }
+
+
+class GetMetricsParams(BaseModel):
+    """Parameters for get_metrics tool."""
+
+    format: Literal["json", "prometheus"] = Field(
+        "json", description="Output format: 'json' summary or 'prometheus' text exposition"
+    )
+    tool: Optional[str] = Field(None, description="Restrict tool metrics to a single tool")
+
+
+class GetMetricsTool(ToolBase):
+    """Expose in-process metrics for tools, database and cache."""
+
+    priority = Priority.CRITICAL
+    cacheable = False
+
+    @property
+    def name(self) -> str:
+        return "get_metrics"
+
+    @property
+    def description(self) -> str:
+        return """
+        Get server metrics collected since startup.
+        
+        Returns metrics including:
+        - Tool call counts, error rates and cache hits per tool
+        - Tool latency percentiles (p50/p95/p99) per tool
+        - Database connection pool usage
+        - Cache hit ratio
+        
+        Use this for:
+        - Finding slow or failing tools
+        - Monitoring pool saturation
+        - Measuring cache effectiveness
+        - Exporting Prometheus text (format='prometheus')
+        """
+
+    @property
+    def parameters_schema(self):
+        return GetMetricsParams
+
+    def execute(self, **params):
+        """Execute metrics collection."""
+        if params.get("format") == "prometheus":
+            return {
+                "content_type": "text/plain; version=0.0.4",
+                "text": metrics.REGISTRY.render_prometheus(),
+            }
+
+        latency = metrics.tool_latency_summary(params.get("tool"))
+        calls = metrics.TOOL_CALLS.collect()
+        errors = metrics.TOOL_ERRORS.collect()
+
+        tool_names = set(latency) | {tool for tool, _ in calls}
+        if params.get("tool"):
+            tool_names = {params["tool"]}
+
+        tools = {}
+        for tool_name in sorted(tool_names):
+            by_status = {
+                status: int(count) for (tool, status), count in calls.items() if tool == tool_name
+            }
+            total = sum(by_status.values())
+            tools[tool_name] = {
+                "calls": total,
+                "by_status": by_status,
+                "error_rate": round(by_status.get("error", 0) / total, 4) if total else 0,
+                "cache_hit_ratio": round(by_status.get("cache_hit", 0) / total, 4) if total else 0,
+                "errors_by_type": {
+                    error_type: int(count)
+                    for (tool, error_type), count in errors.items()
+                    if tool == tool_name
+                },
+                "latency_ms": latency.get(tool_name) or metrics.TOOL_LATENCY.summary(tool=tool_name),
+            }
+
+        cache_requests = metrics.CACHE_REQUESTS.collect()
+        cache = {}
+        for backend in sorted({backend for backend, _ in cache_requests}):
+            hits = cache_requests.get((backend, "hit"), 0)
+            misses = cache_requests.get((backend, "miss"), 0)
+            cache[backend] = {
+                "hits": int(hits),
+                "misses": int(misses),
+                "hit_ratio": round(hits / (hits + misses), 4) if hits + misses else 0,
+                "sets": int(metrics.CACHE_SETS.get(backend=backend)),
+                "entries": int(metrics.CACHE_ENTRIES.get(backend=backend)),
+            }
+
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "tools": tools,
+            "database": {
+                "pool_size": int(metrics.DB_POOL_SIZE.get()),
+                "connections_in_use": int(metrics.DB_CONNECTIONS_IN_USE.get()),
+                "checkouts_total": int(metrics.DB_CHECKOUTS.get()),
+            },
+            "cache": cache,
+        }
@@ -0,0 +1,252 @@
+"""Run a query tool over several simulations and merge the results.
+
+Query tools accept ``simulation_ids`` or ``experiment_id`` in place of
+``simulation_id``. Each simulation is queried on its own, in parallel on a
+pool no larger than the database connection pool, and the per-simulation
+pages are merged on the tool's sort key. Ties keep simulation order, so the
+merged order is stable and a page can resume exactly where the previous one
+stopped: ``next_cursor`` records how many rows of each simulation have been
+returned so far.
+"""
+
+import base64
+import binascii
+import contextvars
+import heapq
+import json
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, Field, model_validator
+
+from ..models.database_models import ExperimentModel, Simulation
+from ..utils.exceptions import (
+    ExperimentNotFoundError,
+    SimulationNotFoundError,
+    ValidationError,
+)
+
+
+class SimulationScopeParams(BaseModel):
+    """Simulation selection shared by the multi-simulation query tools."""
+
+    simulation_id: Optional[str] = Field(None, description="Simulation ID to query")
+    simulation_ids: Optional[List[str]] = Field(
+        None, description="Query several simulations in one call; rows carry their simulation_id"
+    )
+    experiment_id: Optional[str] = Field(
+        None, description="Query every simulation of an experiment; rows carry their simulation_id"
+    )
+    cursor: Optional[str] = Field(
+        None, description="next_cursor of the previous page of a multi-simulation query"
+    )
+
+    @model_validator(mode="after")
+    def validate_scope(self) -> "SimulationScopeParams":
+        """Require exactly one way of selecting simulations."""
+        given = [
+            name
+            for name in ("simulation_id", "simulation_ids", "experiment_id")
+            if getattr(self, name) is not None
+        ]
+        if len(given) != 1:
+            raise ValueError("Pass exactly one of simulation_id, simulation_ids or experiment_id")
+        if self.simulation_ids is not None:
+            if not self.simulation_ids:
+                raise ValueError("simulation_ids must not be empty")
+            self.simulation_ids = list(dict.fromkeys(self.simulation_ids))
+        if self.cursor is not None:
+            if self.simulation_id is not None:
+                raise ValueError("cursor applies to simulation_ids and experiment_id queries")
+            if getattr(self, "offset", 0):
+                raise ValueError("Pass either cursor or offset, not both")
+        return self
+
+
+def encode_cursor(positions: Dict[str, int]) -> str:
+    """Encode per-simulation row positions as an opaque cursor."""
+    payload = json.dumps(positions, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode()
+
+
+def decode_cursor(cursor: str, simulation_ids: List[str]) -> Dict[str, int]:
+    """Decode a cursor produced by ``encode_cursor``.
+
+    Args:
+        cursor: Cursor returned as ``next_cursor``
+        simulation_ids: Simulations of the current query
+
+    Returns:
+        Rows already returned per simulation
+
+    Raises:
+        ValidationError: If the cursor is malformed or belongs to other simulations
+    """
+    try:
+        positions = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValidationError("Invalid cursor", {"cursor": cursor}) from None
+
+    valid = (
+        isinstance(positions, dict)
+        and set(positions) == set(simulation_ids)
+        and all(
+            isinstance(value, int) and not isinstance(value, bool) and value >= 0
+            for value in positions.values()
+        )
+    )
+    if not valid:
+        raise ValidationError(
+            "Cursor does not belong to this query; pass the same simulations as the first page",
+            {"cursor": cursor, "simulation_ids": simulation_ids},
+        )
+    return positions
+
+
+class MultiSimulationMixin:
+    """Fan a query tool's ``execute`` out over several simulations.
+
+    Tools list the row fields their query orders by in ``merge_key`` and call
+    ``fan_out`` from ``execute`` when no single ``simulation_id`` is given.
+    The rows to merge are read from the tool's first ``tabular_keys`` entry.
+    Tools whose order depends on the call override ``merge_order``; the
+    fields it returns must be present in every row.
+    """
+
+    # Row fields the per-simulation query orders by; () keeps simulation order
+    merge_key: Tuple[str, ...] = ()
+
+    def merge_order(self, params: Dict[str, Any]) -> Tuple[Tuple[str, ...], bool]:
+        """Get the row fields pages are merged on and whether they are descending."""
+        return self.merge_key, False
+
+    def fan_out(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Run the tool for every selected simulation and merge one page.
+
+        Args:
+            params: Validated parameters with ``simulation_ids`` or ``experiment_id``
+
+        Returns:
+            The tool's result shape with each row tagged by ``simulation_id``,
+            plus ``simulation_counts`` (matches per simulation) and
+            ``next_cursor`` (None on the last page)
+        """
+        simulation_ids = self._resolve_simulations(params)
+        rows_key = self.tabular_keys[0]
+        limit = params["limit"]
+        if params.get("cursor"):
+            starts = decode_cursor(params["cursor"], simulation_ids)
+            skip = 0
+        else:
+            starts = dict.fromkeys(simulation_ids, 0)
+            skip = params["offset"]
+
+        # The merge needs the sort fields even when the projection leaves them out
+        fields = params.get("fields")
+        hidden = [name for name in self.merge_key if fields is not None and name not in fields]
+        single = {
+            **params,
+            "simulation_ids": None,
+            "experiment_id": None,
+            "cursor": None,
+            "limit": skip + limit,
+        }
+        if hidden:
+            single["fields"] = [*fields, *hidden]
+
+        def query_one(simulation_id: str) -> Dict[str, Any]:
+            return self.execute(
+                **{**single, "simulation_id": simulation_id, "offset": starts[simulation_id]}
+            )
+
+        pages: List[Dict[str, Any]] = []
+        if simulation_ids:
+            workers = min(len(simulation_ids), self.db.config.pool_size)
+            with ThreadPoolExecutor(workers, thread_name_prefix=f"{self.name}-fan-out") as pool:
+                # Copy the context per task so the call's deadline and query stats apply
+                futures = [
+                    pool.submit(contextvars.copy_context().run, query_one, simulation_id)
+                    for simulation_id in simulation_ids
+                ]
+                pages = [future.result() for future in futures]
+
+        key_fields, descending = self.merge_order(params)
+
+        def sort_key(item: Tuple[str, Dict[str, Any]]) -> Tuple[Any, ...]:
+            # NULLs first ascending and last descending, as the queries order
+            # them (see query_tools._agent_ordering); with reverse=True the
+            # same flag sorts them last
+            return tuple((item[1][name] is not None, item[1][name]) for name in key_fields)
+
+        # heapq.merge is stable: equal keys come out in simulation order
+        streams = [
+            [(simulation_id, row) for row in page[rows_key]]
+            for simulation_id, page in zip(simulation_ids, pages)
+        ]
+        merged = heapq.merge(*streams, key=sort_key, reverse=descending)
+        taken = list(islice(merged, skip + limit))
+
+        positions = dict(starts)
+        for simulation_id, _ in taken:
+            positions[simulation_id] += 1
+
+        rows = [
+            {
+                "simulation_id": simulation_id,
+                **{name: value for name, value in row.items() if name not in hidden},
+            }
+            for simulation_id, row in taken[skip:]
+        ]
+        counts = {
+            simulation_id: page["total_count"]
+            for simulation_id, page in zip(simulation_ids, pages)
+        }
+        total = sum(counts.values())
+
+        return {
+            rows_key: rows,
+            "total_count": total,
+            "returned_count": len(rows),
+            "limit": limit,
+            "offset": skip,
+            "simulation_counts": counts,
+            "next_cursor": (
+                encode_cursor(positions) if sum(positions.values()) < total else None
+            ),
+        }
+
+    def _resolve_simulations(self, params: Dict[str, Any]) -> List[str]:
+        """Get the simulations a fan-out query covers, in merge order.
+
+        Raises:
+            SimulationNotFoundError: If a listed simulation does not exist
+            ExperimentNotFoundError: If the experiment does not exist
+        """
+        if params.get("simulation_ids") is not None:
+            missing = self.db.validate_simulations_exist_batch(params["simulation_ids"])
+            if missing:
+                raise SimulationNotFoundError(missing[0])
+            return params["simulation_ids"]
+
+        experiment_id = params["experiment_id"]
+
+        def query_func(session):
+            exists = (
+                session.query(ExperimentModel.experiment_id)
+                .filter(ExperimentModel.experiment_id == experiment_id)
+                .first()
+            )
+            if exists is None:
+                return None
+            return [
+                row.simulation_id
+                for row in session.query(Simulation.simulation_id)
+                .filter(Simulation.experiment_id == experiment_id)
+                .order_by(Simulation.simulation_id)
+            ]
+
+        simulation_ids = self.db.execute_query(query_func)
+        if simulation_ids is None:
+            raise ExperimentNotFoundError(experiment_id)
+        return simulation_ids
@@ -1,8 +1,11 @@
 """Query tools for retrieving simulation data with flexible filtering."""
 
-from typing import Optional
+import math
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+from sqlalchemy import Boolean, Float, Integer, and_, asc, desc, func
+from sqlalchemy.orm import aliased
 
 from ..models.database_models import (
     ActionModel,
@@ -13,23 +16,282 @@ from ..models.database_models import (
     SimulationStepModel,
 )
 from .base import ToolBase
-from ..utils.exceptions import SimulationNotFoundError
+from .multi_simulation import MultiSimulationMixin, SimulationScopeParams
+from ..utils.downsampling import lttb_indices
+from ..utils.exceptions import SimulationNotFoundError, ValidationError
+from ..utils.trajectory import encode_runs
+
+# Output fields of the projectable query tools mapped to the model columns they
+# are read from. Dict values produce nested objects (e.g. ``position``).
+_AGENT_FIELDS = {
+    "agent_id": AgentModel.agent_id,
+    "agent_type": AgentModel.agent_type,
+    "generation": AgentModel.generation,
+    "birth_time": AgentModel.birth_time,
+    "death_time": AgentModel.death_time,
+    "position": {"x": AgentModel.position_x, "y": AgentModel.position_y},
+    "initial_resources": AgentModel.initial_resources,
+    "starting_health": AgentModel.starting_health,
+    "starvation_counter": AgentModel.starvation_counter,
+    "genome_id": AgentModel.genome_id,
+}
+
+_ACTION_FIELDS = {
+    "action_id": ActionModel.action_id,
+    "step_number": ActionModel.step_number,
+    "agent_id": ActionModel.agent_id,
+    "action_type": ActionModel.action_type,
+    "action_target_id": ActionModel.action_target_id,
+    "resources_before": ActionModel.resources_before,
+    "resources_after": ActionModel.resources_after,
+    "reward": ActionModel.reward,
+    "details": ActionModel.details,
+}
+
+_STATE_FIELDS = {
+    "agent_id": AgentStateModel.agent_id,
+    "step_number": AgentStateModel.step_number,
+    "position": {
+        "x": AgentStateModel.position_x,
+        "y": AgentStateModel.position_y,
+        "z": AgentStateModel.position_z,
+    },
+    "resource_level": AgentStateModel.resource_level,
+    "current_health": AgentStateModel.current_health,
+    "starting_health": AgentStateModel.starting_health,
+    "starvation_counter": AgentStateModel.starvation_counter,
+    "is_defending": AgentStateModel.is_defending,
+    "total_reward": AgentStateModel.total_reward,
+    "age": AgentStateModel.age,
+}
+
+_STEP_FIELDS = {
+    name: getattr(SimulationStepModel, name)
+    for name in (
+        "step_number",
+        "total_agents",
+        "system_agents",
+        "independent_agents",
+        "control_agents",
+        "total_resources",
+        "average_agent_resources",
+        "births",
+        "deaths",
+        "current_max_generation",
+        "resource_efficiency",
+        "resource_distribution_entropy",
+        "average_agent_health",
+        "average_agent_age",
+        "average_reward",
+        "combat_encounters",
+        "successful_attacks",
+        "resources_shared",
+        "genetic_diversity",
+        "dominant_genome_ratio",
+        "resources_consumed",
+    )
+}
+
+
+# Agent columns query_agents can sort by. Derived metrics come on top:
+# lifespan (death step, or the last step for living agents, minus birth step)
+# and total_reward (cumulative reward of the agent's last state)
+_AGENT_SORT_COLUMNS = {
+    name: getattr(AgentModel, name)
+    for name in (
+        "agent_id",
+        "agent_type",
+        "generation",
+        "birth_time",
+        "death_time",
+        "initial_resources",
+        "starting_health",
+        "starvation_counter",
+    )
+}
+
+AgentSortField = Literal[
+    "agent_id",
+    "agent_type",
+    "generation",
+    "birth_time",
+    "death_time",
+    "initial_resources",
+    "starting_health",
+    "starvation_counter",
+    "lifespan",
+    "total_reward",
+]
+
+TopAgentMetric = Literal[
+    "lifespan", "total_reward", "generation", "initial_resources", "starting_health", "birth_time"
+]
+
+# Largest ID list get_agents_bulk accepts
+MAX_BULK_AGENT_IDS = 10000
+
+# IDs per IN (...) query; with the simulation ID this stays under SQLite's
+# historical limit of 999 bound parameters per statement
+BULK_LOOKUP_CHUNK_SIZE = 900
+
+
+def _validate_fields(
+    fields: Optional[List[str]], field_map: Dict[str, Any]
+) -> Optional[List[str]]:
+    """Validate a field projection against a tool's field map.
+
+    Args:
+        fields: Requested fields, or None for all fields
+        field_map: Output field to column mapping
+
+    Returns:
+        Requested fields without duplicates, or None
+
+    Raises:
+        ValueError: If the projection is empty or names unknown fields
+    """
+    if fields is None:
+        return None
+    if not fields:
+        raise ValueError("fields must not be empty; omit it to return all fields")
+
+    unknown = [field for field in fields if field not in field_map]
+    if unknown:
+        raise ValueError(
+            f"Unknown fields: {', '.join(unknown)}. Available fields: {', '.join(field_map)}"
+        )
+    return list(dict.fromkeys(fields))
+
+
+def _projection(
+    field_map: Dict[str, Any], fields: Optional[List[str]]
+) -> Tuple[List[Any], Callable[[Any], dict]]:
+    """Resolve a projection into columns to select and a row serializer.
+
+    Args:
+        field_map: Output field to column mapping
+        fields: Requested fields, or None for all fields
+
+    Returns:
+        Tuple of (columns to pass to ``session.query``, row to dict function)
+    """
+    columns = []
+    plan = []
+    for field in fields or field_map:
+        source = field_map[field]
+        if isinstance(source, dict):
+            columns.extend(source.values())
+            plan.append((field, {name: column.key for name, column in source.items()}))
+        else:
+            columns.append(source)
+            plan.append((field, source.key))
+
+    def serialize(row: Any) -> dict:
+        result = {}
+        for field, key in plan:
+            if isinstance(key, dict):
+                result[field] = {name: getattr(row, attr) for name, attr in key.items()}
+            else:
+                result[field] = getattr(row, key)
+        return result
+
+    return columns, serialize
+
+
+def _agent_sort_expression(session, simulation_id: str, metric: str) -> Tuple[Any, Any]:
+    """Resolve an agent sort field or metric to a SQL expression.
+
+    Args:
+        session: Database session
+        simulation_id: Simulation the agents belong to
+        metric: Entry of ``AgentSortField``
+
+    Returns:
+        Tuple of (expression, subquery to outer-join on ``agent_id`` or None)
+    """
+    if metric == "lifespan":
+        last_step = (
+            session.query(func.max(SimulationStepModel.step_number))
+            .filter(SimulationStepModel.simulation_id == simulation_id)
+            .scalar()
+        )
+        end = (
+            AgentModel.death_time
+            if last_step is None
+            else func.coalesce(AgentModel.death_time, last_step)
+        )
+        return end - AgentModel.birth_time, None
+
+    if metric == "total_reward":
+        last_state = (
+            session.query(
+                AgentStateModel.agent_id,
+                func.max(AgentStateModel.step_number).label("step_number"),
+            )
+            .filter(AgentStateModel.simulation_id == simulation_id)
+            .group_by(AgentStateModel.agent_id)
+            .subquery()
+        )
+        final = (
+            session.query(AgentStateModel.agent_id, AgentStateModel.total_reward)
+            .join(
+                last_state,
+                and_(
+                    AgentStateModel.agent_id == last_state.c.agent_id,
+                    AgentStateModel.step_number == last_state.c.step_number,
+                ),
+            )
+            .subquery()
+        )
+        return final.c.total_reward, final
+
+    return _AGENT_SORT_COLUMNS[metric], None
+
+
+def _agent_ordering(expression: Any, order: str) -> List[Any]:
+    """ORDER BY terms for an agent metric.
+
+    Ties are broken by agent ID in the same direction, so for indexed columns
+    a (simulation_id, column, agent_id) index serves the whole ORDER BY and
+    ``LIMIT k`` stops after k index entries. NULLs come last when descending;
+    ascending keeps the database's NULL order (first on SQLite), since
+    ``NULLS LAST`` there cannot be read from the index.
+    """
+    if order == "desc":
+        return [desc(expression).nulls_last(), desc(AgentModel.agent_id)]
+    return [asc(expression), asc(AgentModel.agent_id)]
 
 
-class QueryAgentsParams(BaseModel):
+class QueryAgentsParams(SimulationScopeParams):
     """Parameters for query_agents tool."""
 
-    simulation_id: str = Field(..., description="Simulation ID to query")
     agent_type: Optional[str] = Field(None, description="Filter by agent type")
     generation: Optional[int] = Field(None, ge=0, description="Filter by generation number")
     alive_only: bool = Field(False, description="Return only living agents")
     limit: int = Field(100, ge=1, le=1000, description="Maximum results to return")
     offset: int = Field(0, ge=0, description="Pagination offset")
+    fields: Optional[List[str]] = Field(
+        None, description=f"Fields to return (default: all). One of: {', '.join(_AGENT_FIELDS)}"
+    )
+    sort_by: Optional[AgentSortField] = Field(
+        None,
+        description="Sort by this field or by lifespan / total_reward; "
+        "each row then includes the sort value (default: storage order)",
+    )
+    order: Literal["asc", "desc"] = Field("asc", description="Sort direction for sort_by")
+
+    @field_validator("fields")
+    @classmethod
+    def validate_fields(cls, v: Optional[List[str]]) -> Optional[List[str]]:
+        """Validate requested fields against the agent model."""
+        return _validate_fields(v, _AGENT_FIELDS)
 
 
-class QueryAgentsTool(ToolBase):
+class QueryAgentsTool(MultiSimulationMixin, ToolBase):
     """Query agents with flexible filtering options."""
 
+    tabular_keys = ("agents",)
+
     @property
     def name(self) -> str:
         return "query_agents"
@@ -50,21 +312,41 @@ class QueryAgentsTool(ToolBase):
         - Find agents of specific types or generations
         - Identify living vs. dead agents
         - Get agent details for further analysis
+        
+        Pass `fields` to return only the fields you need (smaller, faster responses).
+
+        Pass sort_by (e.g. 'generation', 'lifespan', 'total_reward') and order
+        to sort in the database; use top_agents for a ranked top-k list.
+
+        Pass simulation_ids or experiment_id instead of simulation_id to query
+        several simulations in one call: rows carry their simulation_id and
+        next_cursor fetches the following page of the merged result.
         """
 
     @property
     def parameters_schema(self):
         return QueryAgentsParams
 
+    def merge_order(self, params: Dict[str, Any]) -> Tuple[Tuple[str, ...], bool]:
+        """Merge fan-out pages on the sort value when sorting."""
+        if params.get("sort_by"):
+            return (params["sort_by"],), params["order"] == "desc"
+        return super().merge_order(params)
+
     def execute(self, **params):
         """Execute agent query."""
+        if params["simulation_id"] is None:
+            return self.fan_out(params)
+
         # Validate simulation exists
         if not self.db.validate_simulation_exists(params["simulation_id"]):
             raise SimulationNotFoundError(params["simulation_id"])
 
+        columns, serialize = _projection(_AGENT_FIELDS, params.get("fields"))
+
         def query_func(session):
-            # Build query
-            query = session.query(AgentModel).filter(
+            # Build query selecting only the projected columns
+            query = session.query(*columns).filter(
                 AgentModel.simulation_id == params["simulation_id"]
             )
 
@@ -81,26 +363,27 @@ class QueryAgentsTool(ToolBase):
             # Get total count
             total = query.count()
 
+            # Sort in the database so a page of the top agents reads only that page
+            sort_by = params.get("sort_by")
+            if sort_by:
+                expression, joined = _agent_sort_expression(
+                    session, params["simulation_id"], sort_by
+                )
+                query = query.add_columns(expression.label("sort_value"))
+                if joined is not None:
+                    query = query.outerjoin(joined, joined.c.agent_id == AgentModel.agent_id)
+                query = query.order_by(*_agent_ordering(expression, params["order"]))
+
             # Apply pagination
             query = query.limit(params["limit"]).offset(params["offset"])
 
             # Execute and serialize
-            agents = query.all()
-            results = [
-                {
-                    "agent_id": a.agent_id,
-                    "agent_type": a.agent_type,
-                    "generation": a.generation,
-                    "birth_time": a.birth_time,
-                    "death_time": a.death_time,
-                    "position": {"x": a.position_x, "y": a.position_y},
-                    "initial_resources": a.initial_resources,
-                    "starting_health": a.starting_health,
-                    "starvation_counter": a.starvation_counter,
-                    "genome_id": a.genome_id,
-                }
-                for a in agents
-            ]
+            results = []
+            for row in query.all():
+                result = serialize(row)
+                if sort_by:
+                    result[sort_by] = row.sort_value
+                results.append(result)
 
             return {
                 "agents": results,
@@ -113,21 +396,264 @@ class QueryAgentsTool(ToolBase):
         return self.db.execute_query(query_func)
 
 
-class QueryActionsParams(BaseModel):
-    """Parameters for query_actions tool."""
+class GetAgentsBulkParams(BaseModel):
+    """Parameters for get_agents_bulk tool."""
+
+    simulation_id: str = Field(..., description="Simulation ID to query")
+    agent_ids: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BULK_AGENT_IDS,
+        description=f"Agent IDs to look up (at most {MAX_BULK_AGENT_IDS})",
+    )
+    fields: Optional[List[str]] = Field(
+        None, description=f"Fields to return (default: all). One of: {', '.join(_AGENT_FIELDS)}"
+    )
+    include_lifespan: bool = Field(
+        False,
+        description="Add status ('alive' or 'dead') and lifespan in steps, "
+        "as analyze_agent_performance reports them",
+    )
+
+    @field_validator("agent_ids")
+    @classmethod
+    def validate_agent_ids(cls, v: List[str]) -> List[str]:
+        """Drop duplicate IDs, keeping the first occurrence."""
+        return list(dict.fromkeys(v))
+
+    @field_validator("fields")
+    @classmethod
+    def validate_fields(cls, v: Optional[List[str]]) -> Optional[List[str]]:
+        """Validate requested fields against the agent model."""
+        return _validate_fields(v, _AGENT_FIELDS)
+
+
+class GetAgentsBulkTool(ToolBase):
+    """Look up many agents by ID in a few queries."""
+
+    @property
+    def name(self) -> str:
+        return "get_agents_bulk"
+
+    @property
+    def description(self) -> str:
+        return f"""
+        Get many agents of one simulation by ID in a single call.
+
+        Pass the agent IDs produced by lineage, interaction or search results
+        (up to {MAX_BULK_AGENT_IDS}) instead of calling query_agents or
+        analyze_agent_performance once per agent.
+
+        Returns `agents` as an object keyed by agent ID, in request order,
+        plus `missing` for IDs that do not exist in the simulation.
+        Pass `fields` to return only the fields you need and
+        include_lifespan=true to add each agent's status and lifespan.
+        """
+
+    @property
+    def parameters_schema(self):
+        return GetAgentsBulkParams
+
+    def execute(self, **params):
+        """Execute bulk agent lookup."""
+        simulation_id = params["simulation_id"]
+        if not self.db.validate_simulation_exists(simulation_id):
+            raise SimulationNotFoundError(simulation_id)
+
+        agent_ids = params["agent_ids"]
+        fields = params.get("fields") or list(_AGENT_FIELDS)
+        include_lifespan = params["include_lifespan"]
+
+        # Key and lifespan columns are read even when the projection leaves them out
+        needed = ["agent_id"] + (["birth_time", "death_time"] if include_lifespan else [])
+        columns, serialize = _projection(_AGENT_FIELDS, list(dict.fromkeys(fields + needed)))
+        chunks = [
+            agent_ids[i : i + BULK_LOOKUP_CHUNK_SIZE]
+            for i in range(0, len(agent_ids), BULK_LOOKUP_CHUNK_SIZE)
+        ]
+
+        def query_func(session):
+            rows = []
+            for chunk in chunks:
+                rows.extend(
+                    session.query(*columns)
+                    .filter(
+                        AgentModel.simulation_id == simulation_id,
+                        AgentModel.agent_id.in_(chunk),
+                    )
+                    .all()
+                )
+            last_step = None
+            if include_lifespan:
+                last_step = (
+                    session.query(func.max(SimulationStepModel.step_number))
+                    .filter(SimulationStepModel.simulation_id == simulation_id)
+                    .scalar()
+                )
+            return rows, last_step
+
+        rows, last_step = self.db.execute_query(query_func)
+
+        found = {}
+        for row in rows:
+            record = serialize(row)
+            agent = {field: record[field] for field in fields}
+            if include_lifespan:
+                agent.update(_lifespan(record["birth_time"], record["death_time"], last_step))
+            found[record["agent_id"]] = agent
+
+        agents = {agent_id: found[agent_id] for agent_id in agent_ids if agent_id in found}
+        return {
+            "simulation_id": simulation_id,
+            "agents": agents,
+            "found_count": len(agents),
+            "missing": [agent_id for agent_id in agent_ids if agent_id not in found],
+            "queries": len(chunks),
+        }
+
+
+def _lifespan(
+    birth_time: Optional[int], death_time: Optional[int], last_step: Optional[int]
+) -> Dict[str, Any]:
+    """Status and lifespan of an agent, counting living agents up to the last step."""
+    if death_time is not None:
+        status, end = "dead", death_time
+    else:
+        status, end = "alive", last_step
+    if birth_time is None:
+        lifespan = None
+    elif end is None:
+        lifespan = 0
+    else:
+        lifespan = end - birth_time
+    return {"status": status, "lifespan": lifespan}
+
+
+class TopAgentsParams(BaseModel):
+    """Parameters for top_agents tool."""
 
     simulation_id: str = Field(..., description="Simulation ID to query")
+    metric: TopAgentMetric = Field(..., description="Metric to rank agents by")
+    k: int = Field(10, ge=1, le=1000, description="Number of agents to return")
+    order: Literal["asc", "desc"] = Field(
+        "desc", description="'desc' for the highest values, 'asc' for the lowest"
+    )
+    agent_type: Optional[str] = Field(None, description="Only rank agents of this type")
+    alive_only: bool = Field(False, description="Only rank living agents")
+
+
+class TopAgentsTool(ToolBase):
+    """Rank agents by a metric in the database."""
+
+    tabular_keys = ("agents",)
+
+    @property
+    def name(self) -> str:
+        return "top_agents"
+
+    @property
+    def description(self) -> str:
+        return """
+        Get the top-k agents of a simulation by one metric.
+
+        Metrics:
+        - lifespan: steps lived (living agents count up to the last step)
+        - total_reward: cumulative reward at the agent's last recorded state
+        - generation, initial_resources, starting_health, birth_time
+
+        Use this to:
+        - Find the longest-lived or highest-reward agents
+        - Find the latest generations or best-endowed agents
+        - Pick agents for get_agent_lifecycle or build_agent_lineage
+
+        Returns agents ranked from 1 with their ID, type, generation, birth
+        and death times and the metric value. Agents without a value (e.g. no
+        recorded state for total_reward) are not ranked.
+        """
+
+    @property
+    def parameters_schema(self):
+        return TopAgentsParams
+
+    def execute(self, **params):
+        """Execute top-k agent ranking."""
+        simulation_id = params["simulation_id"]
+        if not self.db.validate_simulation_exists(simulation_id):
+            raise SimulationNotFoundError(simulation_id)
+
+        def query_func(session):
+            expression, joined = _agent_sort_expression(session, simulation_id, params["metric"])
+            query = session.query(
+                AgentModel.agent_id,
+                AgentModel.agent_type,
+                AgentModel.generation,
+                AgentModel.birth_time,
+                AgentModel.death_time,
+                expression.label("value"),
+            ).filter(AgentModel.simulation_id == simulation_id)
+            if joined is not None:
+                query = query.outerjoin(joined, joined.c.agent_id == AgentModel.agent_id)
+            if params.get("agent_type"):
+                query = query.filter(AgentModel.agent_type == params["agent_type"])
+            if params.get("alive_only"):
+                query = query.filter(AgentModel.death_time.is_(None))
+            # Agents without a value are not ranked in either direction
+            query = query.filter(expression.isnot(None))
+            return (
+                query.order_by(*_agent_ordering(expression, params["order"]))
+                .limit(params["k"])
+                .all()
+            )
+
+        rows = self.db.execute_query(query_func)
+
+        agents = [
+            {
+                "rank": rank,
+                "agent_id": row.agent_id,
+                "agent_type": row.agent_type,
+                "generation": row.generation,
+                "birth_time": row.birth_time,
+                "death_time": row.death_time,
+                "value": row.value,
+            }
+            for rank, row in enumerate(rows, start=1)
+        ]
+        return {
+            "simulation_id": simulation_id,
+            "metric": params["metric"],
+            "order": params["order"],
+            "agents": agents,
+            "returned_count": len(agents),
+        }
+
+
+class QueryActionsParams(SimulationScopeParams):
+    """Parameters for query_actions tool."""
+
     agent_id: Optional[str] = Field(None, description="Filter by agent ID")
     action_type: Optional[str] = Field(None, description="Filter by action type")
     start_step: Optional[int] = Field(None, ge=0, description="Start step (inclusive)")
     end_step: Optional[int] = Field(None, ge=0, description="End step (inclusive)")
     limit: int = Field(100, ge=1, le=1000, description="Maximum results to return")
     offset: int = Field(0, ge=0, description="Pagination offset")
+    fields: Optional[List[str]] = Field(
+        None, description=f"Fields to return (default: all). One of: {', '.join(_ACTION_FIELDS)}"
+    )
+
+    @field_validator("fields")
+    @classmethod
+    def validate_fields(cls, v: Optional[List[str]]) -> Optional[List[str]]:
+        """Validate requested fields against the action model."""
+        return _validate_fields(v, _ACTION_FIELDS)
 
 
-class QueryActionsTool(ToolBase):
+class QueryActionsTool(MultiSimulationMixin, ToolBase):
     """Query agent actions with filtering options."""
 
+    tabular_keys = ("actions",)
+    merge_key = ("step_number",)
+
     @property
     def name(self) -> str:
         return "query_actions"
@@ -149,6 +675,12 @@ class QueryActionsTool(ToolBase):
         - Track specific action types
         - Study resource changes
         - Examine rewards and outcomes
+        
+        Pass `fields` to return only the fields you need (smaller, faster responses).
+
+        Pass simulation_ids or experiment_id instead of simulation_id to query
+        several simulations in one call: rows carry their simulation_id and
+        next_cursor fetches the following page of the merged result.
         """
 
     @property
@@ -157,13 +689,18 @@ class QueryActionsTool(ToolBase):
 
     def execute(self, **params):
         """Execute action query."""
+        if params["simulation_id"] is None:
+            return self.fan_out(params)
+
         # Validate simulation exists
         if not self.db.validate_simulation_exists(params["simulation_id"]):
             raise SimulationNotFoundError(params["simulation_id"])
 
+        columns, serialize = _projection(_ACTION_FIELDS, params.get("fields"))
+
         def query_func(session):
-            # Build query
-            query = session.query(ActionModel).filter(
+            # Build query selecting only the projected columns
+            query = session.query(*columns).filter(
                 ActionModel.simulation_id == params["simulation_id"]
             )
 
@@ -190,21 +727,7 @@ class QueryActionsTool(ToolBase):
             query = query.limit(params["limit"]).offset(params["offset"])
 
             # Execute and serialize
-            actions = query.all()
-            results = [
-                {
-                    "action_id": a.action_id,
-                    "step_number": a.step_number,
-                    "agent_id": a.agent_id,
-                    "action_type": a.action_type,
-                    "action_target_id": a.action_target_id,
-                    "resources_before": a.resources_before,
-                    "resources_after": a.resources_after,
-                    "reward": a.reward,
-                    "details": a.details,
-                }
-                for a in actions
-            ]
+            results = [serialize(row) for row in query.all()]
 
             return {
                 "actions": results,
@@ -217,20 +740,248 @@ class QueryActionsTool(ToolBase):
         return self.db.execute_query(query_func)
 
 
-class QueryStatesParams(BaseModel):
-    """Parameters for query_states tool."""
+# State fields joined onto actions by default (agent_id repeats the action's)
+_ACTION_STATE_FIELDS = [field for field in _STATE_FIELDS if field != "agent_id"]
+
+ActionStatePart = Literal["before", "after", "delta"]
+
+
+def _state_columns(fields: List[str]) -> List[Tuple[Tuple[str, ...], str]]:
+    """Flatten state fields into (output path, AgentStateModel attribute) pairs."""
+    flat = []
+    for field in fields:
+        source = _STATE_FIELDS[field]
+        if isinstance(source, dict):
+            flat.extend(((field, name), column.key) for name, column in source.items())
+        else:
+            flat.append(((field,), source.key))
+    return flat
+
+
+def _is_numeric(attribute: str) -> bool:
+    """Whether an AgentStateModel column has a meaningful difference."""
+    column_type = AgentStateModel.__table__.c[attribute].type
+    return isinstance(column_type, (Integer, Float)) and not isinstance(column_type, Boolean)
+
+
+class QueryActionsWithStatesParams(BaseModel):
+    """Parameters for query_actions_with_states tool."""
 
     simulation_id: str = Field(..., description="Simulation ID to query")
+    agent_id: Optional[str] = Field(None, description="Filter by agent ID")
+    action_type: Optional[str] = Field(None, description="Filter by action type")
+    start_step: Optional[int] = Field(None, ge=0, description="Start step (inclusive)")
+    end_step: Optional[int] = Field(None, ge=0, description="End step (inclusive)")
+    limit: int = Field(100, ge=1, le=1000, description="Maximum results to return")
+    offset: int = Field(0, ge=0, description="Pagination offset")
+    fields: Optional[List[str]] = Field(
+        None,
+        description=f"Action fields to return (default: all). One of: {', '.join(_ACTION_FIELDS)}",
+    )
+    state_fields: Optional[List[str]] = Field(
+        None,
+        description="State fields to return before/after the action (default: all but "
+        f"agent_id). One of: {', '.join(_STATE_FIELDS)}",
+    )
+    include: List[ActionStatePart] = Field(
+        ["before", "after", "delta"],
+        description="Parts to return: the state before, the state after and/or the "
+        "numeric delta (after - before)",
+    )
+
+    @field_validator("fields")
+    @classmethod
+    def validate_fields(cls, v: Optional[List[str]]) -> Optional[List[str]]:
+        """Validate requested fields against the action model."""
+        return _validate_fields(v, _ACTION_FIELDS)
+
+    @field_validator("state_fields")
+    @classmethod
+    def validate_state_fields(cls, v: Optional[List[str]]) -> Optional[List[str]]:
+        """Validate requested state fields against the agent state model."""
+        return _validate_fields(v, _STATE_FIELDS)
+
+    @field_validator("include")
+    @classmethod
+    def validate_include(cls, v: List[str]) -> List[str]:
+        """Require at least one part."""
+        if not v:
+            raise ValueError("include must name at least one of 'before', 'after', 'delta'")
+        return list(dict.fromkeys(v))
+
+
+class QueryActionsWithStatesTool(ToolBase):
+    """Query actions joined with the agent states before and after them."""
+
+    tabular_keys = ("actions",)
+
+    @property
+    def name(self) -> str:
+        return "query_actions_with_states"
+
+    @property
+    def description(self) -> str:
+        return """
+        Get actions together with the acting agent's state before and after
+        each action, and what the action changed, in one call.
+
+        Each action row gets:
+        - state_before: the agent's state before the action
+        - state_after: the agent's state after the action
+        - delta: after - before for numeric fields (resource_level,
+          current_health, total_reward, position, age, ...)
+        States are null when the action has no linked state.
+
+        Use this to:
+        - See what actions actually did to the agent
+        - Compare the effect of action types (e.g. health lost per attack)
+        - Replace one query_states call per action
+
+        Filters and pagination match query_actions. Pass `fields` and
+        `state_fields` to limit the columns, and `include` to return only
+        the parts you need (e.g. include=['delta']).
+        """
+
+    @property
+    def parameters_schema(self):
+        return QueryActionsWithStatesParams
+
+    def execute(self, **params):
+        """Execute action query joined with agent states."""
+        if not self.db.validate_simulation_exists(params["simulation_id"]):
+            raise SimulationNotFoundError(params["simulation_id"])
+
+        columns, serialize = _projection(_ACTION_FIELDS, params.get("fields"))
+        state_columns = _state_columns(params.get("state_fields") or _ACTION_STATE_FIELDS)
+        include = params["include"]
+
+        before = aliased(AgentStateModel, name="state_before")
+        after = aliased(AgentStateModel, name="state_after")
+
+        # Every part is computed in the SELECT; the state IDs tell a missing state
+        # apart from a state whose fields are NULL
+        selected = [before.id.label("before__id"), after.id.label("after__id")]
+        for part in ("before", "after"):
+            if part in include:
+                alias = before if part == "before" else after
+                selected.extend(
+                    getattr(alias, attribute).label(f"{part}__{attribute}")
+                    for _, attribute in state_columns
+                )
+        delta_columns = [item for item in state_columns if _is_numeric(item[1])]
+        if "delta" in include:
+            selected.extend(
+                (getattr(after, attribute) - getattr(before, attribute)).label(
+                    f"delta__{attribute}"
+                )
+                for _, attribute in delta_columns
+            )
+
+        def query_func(session):
+            query = session.query(*columns).filter(
+                ActionModel.simulation_id == params["simulation_id"]
+            )
+
+            if params.get("agent_id"):
+                query = query.filter(ActionModel.agent_id == params["agent_id"])
+
+            if params.get("action_type"):
+                query = query.filter(ActionModel.action_type == params["action_type"])
+
+            if params.get("start_step") is not None:
+                query = query.filter(ActionModel.step_number >= params["start_step"])
+
+            if params.get("end_step") is not None:
+                query = query.filter(ActionModel.step_number <= params["end_step"])
+
+            # Count before joining; the joins are primary-key lookups per returned row
+            total = query.count()
+
+            query = (
+                query.add_columns(*selected)
+                .outerjoin(before, before.id == ActionModel.state_before_id)
+                .outerjoin(after, after.id == ActionModel.state_after_id)
+                .order_by(ActionModel.step_number, ActionModel.action_id)
+                .limit(params["limit"])
+                .offset(params["offset"])
+            )
+
+            results = []
+            for row in query.all():
+                result = serialize(row)
+                mapping = row._mapping
+                has_before = mapping["before__id"] is not None
+                has_after = mapping["after__id"] is not None
+                if "before" in include:
+                    result["state_before"] = (
+                        _nest(mapping, "before", state_columns) if has_before else None
+                    )
+                if "after" in include:
+                    result["state_after"] = (
+                        _nest(mapping, "after", state_columns) if has_after else None
+                    )
+                if "delta" in include:
+                    result["delta"] = (
+                        _nest(mapping, "delta", delta_columns)
+                        if has_before and has_after
+                        else None
+                    )
+                results.append(result)
+
+            return {
+                "actions": results,
+                "total_count": total,
+                "returned_count": len(results),
+                "limit": params["limit"],
+                "offset": params["offset"],
+            }
+
+        return self.db.execute_query(query_func)
+
+
+def _nest(
+    mapping: Any, part: str, state_columns: List[Tuple[Tuple[str, ...], str]]
+) -> Dict[str, Any]:
+    """Build one part's (nested) state dictionary from labeled result columns."""
+    state: Dict[str, Any] = {}
+    for path, attribute in state_columns:
+        target = state
+        for name in path[:-1]:
+            target = target.setdefault(name, {})
+        target[path[-1]] = mapping[f"{part}__{attribute}"]
+    return state
+
+
+class QueryStatesParams(SimulationScopeParams):
+    """Parameters for query_states tool."""
+
     agent_id: Optional[str] = Field(None, description="Filter by agent ID")
     start_step: Optional[int] = Field(None, ge=0, description="Start step (inclusive)")
     end_step: Optional[int] = Field(None, ge=0, description="End step (inclusive)")
     limit: int = Field(100, ge=1, le=1000, description="Maximum results to return")
     offset: int = Field(0, ge=0, description="Pagination offset")
+    fields: Optional[List[str]] = Field(
+        None, description=f"Fields to return (default: all). One of: {', '.join(_STATE_FIELDS)}"
+    )
+    trajectory: bool = Field(
+        False,
+        description="Return the agent's whole trajectory as run-length encoded columns "
+        "(requires agent_id; limit and offset are ignored)",
+    )
+
+    @field_validator("fields")
+    @classmethod
+    def validate_fields(cls, v: Optional[List[str]]) -> Optional[List[str]]:
+        """Validate requested fields against the agent state model."""
+        return _validate_fields(v, _STATE_FIELDS)
 
 
-class QueryStatesTool(ToolBase):
+class QueryStatesTool(MultiSimulationMixin, ToolBase):
     """Query agent states over time."""
 
+    tabular_keys = ("states",)
+    merge_key = ("step_number",)
+
     @property
     def name(self) -> str:
         return "query_states"
@@ -253,6 +1004,18 @@ class QueryStatesTool(ToolBase):
         - Monitor resource accumulation
         - Analyze health changes
         - Study agent lifecycle progression
+        
+        Pass `fields` to return only the fields you need (smaller, faster responses).
+
+        Pass simulation_ids or experiment_id instead of simulation_id to query
+        several simulations in one call: rows carry their simulation_id and
+        next_cursor fetches the following page of the merged result.
+
+        For movement analysis of one agent, pass agent_id and trajectory=true.
+        The whole trajectory comes back as columns of [start, delta, count]
+        runs: value i of a run is start + i * delta, so stretches where a value
+        is constant or changes at a constant rate cost one run. Decode with
+        agentfarm_mcp.utils.trajectory.decode_trajectory.
         """
 
     @property
@@ -261,13 +1024,29 @@ class QueryStatesTool(ToolBase):
 
     def execute(self, **params):
         """Execute state query."""
+        if params["trajectory"] and not params.get("agent_id"):
+            raise ValidationError(
+                "trajectory=true requires agent_id", {"trajectory": True, "agent_id": None}
+            )
+        if params["trajectory"] and params["simulation_id"] is None:
+            raise ValidationError(
+                "trajectory=true takes a single simulation_id", {"trajectory": True}
+            )
+        if params["simulation_id"] is None:
+            return self.fan_out(params)
+
         # Validate simulation exists
         if not self.db.validate_simulation_exists(params["simulation_id"]):
             raise SimulationNotFoundError(params["simulation_id"])
 
+        if params["trajectory"]:
+            return self._trajectory(params)
+
+        columns, serialize = _projection(_STATE_FIELDS, params.get("fields"))
+
         def query_func(session):
-            # Build query
-            query = session.query(AgentStateModel).filter(
+            # Build query selecting only the projected columns
+            query = session.query(*columns).filter(
                 AgentStateModel.simulation_id == params["simulation_id"]
             )
 
@@ -291,22 +1070,7 @@ class QueryStatesTool(ToolBase):
             query = query.limit(params["limit"]).offset(params["offset"])
 
             # Execute and serialize
-            states = query.all()
-            results = [
-                {
-                    "agent_id": s.agent_id,
-                    "step_number": s.step_number,
-                    "position": {"x": s.position_x, "y": s.position_y, "z": s.position_z},
-                    "resource_level": s.resource_level,
-                    "current_health": s.current_health,
-                    "starting_health": s.starting_health,
-                    "starvation_counter": s.starvation_counter,
-                    "is_defending": s.is_defending,
-                    "total_reward": s.total_reward,
-                    "age": s.age,
-                }
-                for s in states
-            ]
+            results = [serialize(row) for row in query.all()]
 
             return {
                 "states": results,
@@ -318,11 +1082,50 @@ class QueryStatesTool(ToolBase):
 
         return self.db.execute_query(query_func)
 
+    def _trajectory(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Fetch one agent's states and encode every field as runs."""
+        # The step axis is always included so decoded states can be placed in time
+        fields = list(dict.fromkeys(["step_number", *(params.get("fields") or _STATE_FIELDS)]))
+        columns, _ = _projection(_STATE_FIELDS, fields)
+
+        def query_func(session):
+            query = session.query(*columns).filter(
+                AgentStateModel.simulation_id == params["simulation_id"],
+                AgentStateModel.agent_id == params["agent_id"],
+            )
+            if params.get("start_step") is not None:
+                query = query.filter(AgentStateModel.step_number >= params["start_step"])
+            if params.get("end_step") is not None:
+                query = query.filter(AgentStateModel.step_number <= params["end_step"])
+            return query.order_by(AgentStateModel.step_number).all()
 
-class QueryResourcesParams(BaseModel):
+        rows = self.db.execute_query(query_func)
+
+        values = list(zip(*rows)) if rows else [() for _ in columns]
+        runs = {
+            column.key: encode_runs(list(column_values))
+            for column, column_values in zip(columns, values)
+        }
+
+        trajectory: Dict[str, Any] = {}
+        for field in fields:
+            source = _STATE_FIELDS[field]
+            if isinstance(source, dict):
+                trajectory[field] = {name: runs[column.key] for name, column in source.items()}
+            else:
+                trajectory[field] = runs[source.key]
+
+        return {
+            "agent_id": params["agent_id"],
+            "trajectory": trajectory,
+            "total_count": len(rows),
+            "encoding": "runs",
+        }
+
+
+class QueryResourcesParams(SimulationScopeParams):
     """Parameters for query_resources tool."""
 
-    simulation_id: str = Field(..., description="Simulation ID to query")
     step_number: Optional[int] = Field(None, ge=0, description="Filter by specific step")
     start_step: Optional[int] = Field(None, ge=0, description="Start step (inclusive)")
     end_step: Optional[int] = Field(None, ge=0, description="End step (inclusive)")
@@ -330,9 +1133,12 @@ class QueryResourcesParams(BaseModel):
     offset: int = Field(0, ge=0, description="Pagination offset")
 
 
-class QueryResourcesTool(ToolBase):
+class QueryResourcesTool(MultiSimulationMixin, ToolBase):
     """Query resource states in the environment."""
 
+    tabular_keys = ("resources",)
+    merge_key = ("step_number",)
+
     @property
     def name(self) -> str:
         return "query_resources"
@@ -352,6 +1158,10 @@ class QueryResourcesTool(ToolBase):
         - Monitor resource depletion
         - Analyze resource positioning
         - Study resource-agent interactions
+
+        Pass simulation_ids or experiment_id instead of simulation_id to query
+        several simulations in one call: rows carry their simulation_id and
+        next_cursor fetches the following page of the merged result.
         """
 
     @property
@@ -360,6 +1170,9 @@ class QueryResourcesTool(ToolBase):
 
     def execute(self, **params):
         """Execute resource query."""
+        if params["simulation_id"] is None:
+            return self.fan_out(params)
+
         # Validate simulation exists
         if not self.db.validate_simulation_exists(params["simulation_id"]):
             raise SimulationNotFoundError(params["simulation_id"])
@@ -412,10 +1225,9 @@ class QueryResourcesTool(ToolBase):
         return self.db.execute_query(query_func)
 
 
-class QueryInteractionsParams(BaseModel):
+class QueryInteractionsParams(SimulationScopeParams):
     """Parameters for query_interactions tool."""
 
-    simulation_id: str = Field(..., description="Simulation ID to query")
     interaction_type: Optional[str] = Field(
         None, description="Filter by interaction type (e.g., 'share', 'attack')"
     )
@@ -427,9 +1239,12 @@ class QueryInteractionsParams(BaseModel):
     offset: int = Field(0, ge=0, description="Pagination offset")
 
 
-class QueryInteractionsTool(ToolBase):
+class QueryInteractionsTool(MultiSimulationMixin, ToolBase):
     """Query interaction data between entities."""
 
+    tabular_keys = ("interactions",)
+    merge_key = ("step_number",)
+
     @property
     def name(self) -> str:
         return "query_interactions"
@@ -450,6 +1265,10 @@ class QueryInteractionsTool(ToolBase):
         - Study agent-resource interactions
         - Track interaction patterns
         - Examine social behaviors
+
+        Pass simulation_ids or experiment_id instead of simulation_id to query
+        several simulations in one call: rows carry their simulation_id and
+        next_cursor fetches the following page of the merged result.
         """
 
     @property
@@ -458,6 +1277,9 @@ class QueryInteractionsTool(ToolBase):
 
     def execute(self, **params):
         """Execute interaction query."""
+        if params["simulation_id"] is None:
+            return self.fan_out(params)
+
         # Validate simulation exists
         if not self.db.validate_simulation_exists(params["simulation_id"]):
             raise SimulationNotFoundError(params["simulation_id"])
@@ -532,11 +1354,58 @@ class GetSimulationMetricsParams(BaseModel):
     end_step: Optional[int] = Field(None, ge=0, description="End step (inclusive)")
     limit: int = Field(1000, ge=1, le=10000, description="Maximum results to return")
     offset: int = Field(0, ge=0, description="Pagination offset")
+    fields: Optional[List[str]] = Field(
+        None, description=f"Fields to return (default: all). One of: {', '.join(_STEP_FIELDS)}"
+    )
+    max_points: Optional[int] = Field(
+        None,
+        ge=3,
+        le=10000,
+        description="Downsample the whole step range to at most this many points "
+        "(limit/offset are ignored)",
+    )
+    resolution: Optional[int] = Field(
+        None,
+        ge=1,
+        description="Downsample to one point per this many steps (limit/offset are ignored)",
+    )
+    downsample: Literal["buckets", "lttb"] = Field(
+        "buckets",
+        description="'buckets': min/mean/max of each field per step bucket, computed in SQL; "
+        "'lttb': keep the original rows that best preserve the shape of lttb_field",
+    )
+    lttb_field: str = Field("total_agents", description="Field whose shape LTTB preserves")
+
+    @field_validator("fields")
+    @classmethod
+    def validate_fields(cls, v: Optional[List[str]]) -> Optional[List[str]]:
+        """Validate requested fields against the simulation step model."""
+        return _validate_fields(v, _STEP_FIELDS)
+
+    @field_validator("resolution")
+    @classmethod
+    def validate_resolution(cls, v: Optional[int], info) -> Optional[int]:
+        """Allow only one of max_points and resolution."""
+        if v is not None and info.data.get("max_points") is not None:
+            raise ValueError("Pass either max_points or resolution, not both")
+        return v
+
+    @field_validator("lttb_field")
+    @classmethod
+    def validate_lttb_field(cls, v: str) -> str:
+        """Validate the LTTB field against the numeric step fields."""
+        if v not in _STEP_FIELDS or v == "step_number":
+            valid = [name for name in _STEP_FIELDS if name != "step_number"]
+            raise ValueError(f"Invalid lttb_field: {v!r}. Valid fields: {valid}")
+        return v
 
 
 class GetSimulationMetricsTool(ToolBase):
     """Get step-level simulation metrics."""
 
+    streamable = True
+    tabular_keys = ("metrics",)
+
     @property
     def name(self) -> str:
         return "get_simulation_metrics"
@@ -560,33 +1429,145 @@ class GetSimulationMetricsTool(ToolBase):
         - Monitor resource usage
         - Study emergent behaviors
         - Generate time-series data
+        
+        Pass `fields` to return only the fields you need (smaller, faster responses).
+        
+        To plot a whole run in one call, pass `max_points` (or `resolution` in
+        steps): each point then holds min/mean/max of every field over a step
+        bucket, or with downsample='lttb' the original rows that best preserve
+        the shape of `lttb_field`.
         """
 
     @property
     def parameters_schema(self):
         return GetSimulationMetricsParams
 
+    @staticmethod
+    def _apply_filters(query, params):
+        """Restrict a query to the simulation and step range."""
+        query = query.filter(SimulationStepModel.simulation_id == params["simulation_id"])
+
+        if params.get("start_step") is not None:
+            query = query.filter(SimulationStepModel.step_number >= params["start_step"])
+
+        if params.get("end_step") is not None:
+            query = query.filter(SimulationStepModel.step_number <= params["end_step"])
+
+        return query
+
+    @classmethod
+    def _build_query(cls, session, params, columns):
+        """Build the filtered, ordered step query over the projected columns."""
+        query = cls._apply_filters(session.query(*columns), params)
+        return query.order_by(SimulationStepModel.step_number)
+
+    def _downsampled(self, params):
+        """Get the step range reduced to ``max_points`` or one point per ``resolution`` steps."""
+        step = SimulationStepModel.step_number
+
+        def query_func(session):
+            first, last, total = self._apply_filters(
+                session.query(func.min(step), func.max(step), func.count()), params
+            ).one()
+            if not total:
+                return [], total, params["resolution"] or 1
+
+            span = last - first + 1
+            if params["max_points"] is not None:
+                resolution = math.ceil(span / params["max_points"])
+                max_points = params["max_points"]
+            else:
+                resolution = params["resolution"]
+                max_points = max(3, math.ceil(span / resolution))
+
+            if params["downsample"] == "lttb":
+                points = self._lttb_points(session, params, max_points)
+            else:
+                points = self._bucket_points(session, params, first, resolution)
+            return points, total, resolution
+
+        points, total, resolution = self.db.execute_query(query_func)
+        return {
+            "metrics": points,
+            "total_count": total,
+            "returned_count": len(points),
+            "downsample": {
+                "method": params["downsample"],
+                "resolution": resolution,
+                "source_points": total,
+            },
+        }
+
+    def _bucket_points(self, session, params, first, resolution):
+        """Aggregate each field to min/mean/max per step bucket in SQL."""
+        step = SimulationStepModel.step_number
+        fields = [name for name in params.get("fields") or _STEP_FIELDS if name != "step_number"]
+
+        bucket = step - (step - first) % resolution
+        aggregates = []
+        for name in fields:
+            column = _STEP_FIELDS[name]
+            aggregates += [
+                func.min(column).label(f"{name}__min"),
+                func.avg(column).label(f"{name}__mean"),
+                func.max(column).label(f"{name}__max"),
+            ]
+
+        query = self._apply_filters(
+            session.query(
+                bucket.label("step_number"),
+                func.max(step).label("step_end"),
+                func.count().label("samples"),
+                *aggregates,
+            ),
+            params,
+        )
+        rows = query.group_by(bucket).order_by(bucket).all()
+
+        return [
+            {
+                "step_number": row.step_number,
+                "step_end": row.step_end,
+                "samples": row.samples,
+                **{
+                    name: {stat: getattr(row, f"{name}__{stat}") for stat in ("min", "mean", "max")}
+                    for name in fields
+                },
+            }
+            for row in rows
+        ]
+
+    def _lttb_points(self, session, params, max_points):
+        """Select the original rows that best preserve the shape of ``lttb_field``."""
+        columns, serialize = _projection(_STEP_FIELDS, params.get("fields"))
+        rows = self._build_query(
+            session,
+            params,
+            columns
+            + [
+                SimulationStepModel.step_number.label("lttb_x"),
+                _STEP_FIELDS[params["lttb_field"]].label("lttb_y"),
+            ],
+        ).all()
+
+        keep = lttb_indices(
+            [row.lttb_x for row in rows], [row.lttb_y for row in rows], max_points
+        )
+        return [serialize(rows[index]) for index in keep]
+
     def execute(self, **params):
         """Execute metrics query."""
         # Validate simulation exists
         if not self.db.validate_simulation_exists(params["simulation_id"]):
             raise SimulationNotFoundError(params["simulation_id"])
 
-        def query_func(session):
-            # Build query
-            query = session.query(SimulationStepModel).filter(
-                SimulationStepModel.simulation_id == params["simulation_id"]
-            )
-
-            # Apply filters
-            if params.get("start_step") is not None:
-                query = query.filter(SimulationStepModel.step_number >= params["start_step"])
+        if params["max_points"] is not None or params["resolution"] is not None:
+            return self._downsampled(params)
 
-            if params.get("end_step") is not None:
-                query = query.filter(SimulationStepModel.step_number <= params["end_step"])
+        columns, serialize = _projection(_STEP_FIELDS, params.get("fields"))
 
-            # Order by step number
-            query = query.order_by(SimulationStepModel.step_number)
+        def query_func(session):
+            query = self._build_query(session, params, columns)
 
             # Get total count
             total = query.count()
@@ -595,33 +1576,7 @@ class GetSimulationMetricsTool(ToolBase):
             query = query.limit(params["limit"]).offset(params["offset"])
 
             # Execute and serialize
-            steps = query.all()
-            results = [
-                {
-                    "step_number": s.step_number,
-                    "total_agents": s.total_agents,
-                    "system_agents": s.system_agents,
-                    "independent_agents": s.independent_agents,
-                    "control_agents": s.control_agents,
-                    "total_resources": s.total_resources,
-                    "average_agent_resources": s.average_agent_resources,
-                    "births": s.births,
-                    "deaths": s.deaths,
-                    "current_max_generation": s.current_max_generation,
-                    "resource_efficiency": s.resource_efficiency,
-                    "resource_distribution_entropy": s.resource_distribution_entropy,
-                    "average_agent_health": s.average_agent_health,
-                    "average_agent_age": s.average_agent_age,
-                    "average_reward": s.average_reward,
-                    "combat_encounters": s.combat_encounters,
-                    "successful_attacks": s.successful_attacks,
-                    "resources_shared": s.resources_shared,
-                    "genetic_diversity": s.genetic_diversity,
-                    "dominant_genome_ratio": s.dominant_genome_ratio,
-                    "resources_consumed": s.resources_consumed,
-                }
-                for s in steps
-            ]
+            results = [serialize(row) for row in query.all()]
 
             return {
                 "metrics": results,
@@ -631,4 +1586,36 @@ class GetSimulationMetricsTool(ToolBase):
                 "offset": params["offset"],
             }
 
-        return self.db.execute_query(query_func)
\ No newline at end of file
+        return self.db.execute_query(query_func)
+
+    def execute_stream(self, **params):
+        """Stream metrics in chunks of ``stream_chunk_size`` steps."""
+        if not self.db.validate_simulation_exists(params["simulation_id"]):
+            raise SimulationNotFoundError(params["simulation_id"])
+
+        # Downsampled results are small; deliver them as a single chunk
+        if params["max_points"] is not None or params["resolution"] is not None:
+            result = self._downsampled(params)
+            yield {"metrics": result.pop("metrics")}
+            return result
+
+        columns, serialize = _projection(_STEP_FIELDS, params.get("fields"))
+        total = self.db.execute_query(
+            lambda session: self._build_query(session, params, columns).count()
+        )
+
+        def query_func(session):
+            query = self._build_query(session, params, columns)
+            return query.limit(params["limit"]).offset(params["offset"])
+
+        returned = 0
+        for steps in self.db.stream_query(query_func, chunk_size=self.stream_chunk_size):
+            returned += len(steps)
+            yield {"metrics": [serialize(row) for row in steps]}
+
+        return {
+            "total_count": total,
+            "returned_count": returned,
+            "limit": params["limit"],
+            "offset": params["offset"],
+        }
\ No newline at end of file
@@ -0,0 +1,170 @@
+"""Catalog of MCP tools.
+
+Tools are listed by module and class name in ``TOOL_CATALOG``. What MCP
+clients see of a tool (name, description and parameter JSON schema) is kept
+in ``catalog.json`` next to this module, generated from the tool classes. The
+server registers tools from that file and imports a tool's module only when
+the tool is first called, and ``--list-tools`` reads it without importing any
+tool module.
+
+Regenerate the file after adding a tool or changing a description or
+parameter schema::
+
+    python -m agentfarm_mcp.tools.registry
+"""
+
+import inspect
+import json
+from dataclasses import dataclass
+from importlib import import_module
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .base import ToolBase
+
+# (module, class name) in registration order
+TOOL_CATALOG: list[tuple[str, str]] = [
+    # Metadata tools
+    ("metadata_tools", "GetSimulationInfoTool"),
+    ("metadata_tools", "ListSimulationsTool"),
+    ("metadata_tools", "GetExperimentInfoTool"),
+    ("metadata_tools", "ListExperimentsTool"),
+    # Query tools
+    ("query_tools", "QueryAgentsTool"),
+    ("query_tools", "GetAgentsBulkTool"),
+    ("query_tools", "TopAgentsTool"),
+    ("query_tools", "QueryActionsTool"),
+    ("query_tools", "QueryActionsWithStatesTool"),
+    ("query_tools", "QueryStatesTool"),
+    ("query_tools", "QueryResourcesTool"),
+    ("query_tools", "QueryInteractionsTool"),
+    ("query_tools", "GetSimulationMetricsTool"),
+    ("aggregation_tools", "AggregateTableTool"),
+    ("spatial_tools", "QuerySpatialTool"),
+    ("snapshot_tools", "GetWorldSnapshotTool"),
+    ("search_tools", "SearchEventsTool"),
+    # Analysis tools
+    ("analysis_tools", "AnalyzePopulationDynamicsTool"),
+    ("analysis_tools", "AnalyzeSurvivalRatesTool"),
+    ("analysis_tools", "AnalyzeResourceEfficiencyTool"),
+    ("analysis_tools", "AnalyzeAgentPerformanceTool"),
+    ("analysis_tools", "IdentifyCriticalEventsTool"),
+    ("analysis_tools", "AnalyzeSocialPatternsTool"),
+    ("analysis_tools", "AnalyzeReproductionTool"),
+    # Comparison tools
+    ("comparison_tools", "CompareSimulationsTool"),
+    ("comparison_tools", "CompareParametersTool"),
+    ("comparison_tools", "RankConfigurationsTool"),
+    ("comparison_tools", "CompareGenerationsTool"),
+    # Advanced tools
+    ("advanced_tools", "BuildAgentLineageTool"),
+    ("advanced_tools", "GetAgentLifecycleTool"),
+    # Export tools
+    ("export_tools", "ExportSimulationDataTool"),
+    # Health and monitoring tools
+    ("health_tools", "HealthCheckTool"),
+    ("health_tools", "SystemInfoTool"),
+    ("health_tools", "GetMetricsTool"),
+]
+
+# Generated tool metadata, see ``write_catalog``
+CATALOG_PATH = Path(__file__).with_name("catalog.json")
+
+
+@dataclass(frozen=True)
+class ToolSpec:
+    """Static metadata of a tool, as stored in the catalog file."""
+
+    name: str
+    module: str
+    class_name: str
+    description: str
+    parameters: dict[str, Any]
+    tabular: bool = False
+    streamable: bool = False
+
+
+def load_tool_class(module: str, class_name: str) -> "type[ToolBase]":
+    """Import a tool module and return one of its tool classes.
+
+    Args:
+        module: Module name within ``agentfarm_mcp.tools``
+        class_name: Tool class name
+
+    Returns:
+        ToolBase subclass
+    """
+    return getattr(import_module(f".{module}", __package__), class_name)
+
+
+def load_tool_classes() -> "list[type[ToolBase]]":
+    """Import and return all tool classes in registration order.
+
+    Returns:
+        List of ToolBase subclasses
+    """
+    return [load_tool_class(module, class_name) for module, class_name in TOOL_CATALOG]
+
+
+def build_catalog() -> list[dict[str, Any]]:
+    """Build the catalog entries from the tool classes.
+
+    Tool metadata does not depend on services, so tools are instantiated
+    without them.
+
+    Returns:
+        One ``ToolSpec``-shaped dictionary per tool, in registration order
+    """
+    entries = []
+    for module, class_name in TOOL_CATALOG:
+        tool = load_tool_class(module, class_name)(None, None)
+        entries.append(
+            {
+                "name": tool.name,
+                "module": module,
+                "class_name": class_name,
+                "description": inspect.cleandoc(tool.description),
+                "parameters": tool.parameters_schema.model_json_schema(),
+                "tabular": bool(tool.tabular_keys),
+                "streamable": tool.streamable,
+            }
+        )
+    return entries
+
+
+def write_catalog(path: Path = CATALOG_PATH) -> None:
+    """Regenerate the catalog file from the tool classes.
+
+    Args:
+        path: File to write
+    """
+    text = json.dumps(build_catalog(), indent=2, ensure_ascii=False, sort_keys=True)
+    path.write_text(text + "\n", encoding="utf-8")
+
+
+def load_catalog(path: Path = CATALOG_PATH) -> list[ToolSpec]:
+    """Read tool metadata without importing any tool module.
+
+    Args:
+        path: Catalog file
+
+    Returns:
+        Tool specs in registration order
+    """
+    with open(path, encoding="utf-8") as f:
+        return [ToolSpec(**entry) for entry in json.load(f)]
+
+
+def describe_tools() -> list[dict[str, Any]]:
+    """Describe all tools without creating database or cache services.
+
+    Returns:
+        List of dictionaries with ``name`` and ``description``
+    """
+    return [{"name": spec.name, "description": spec.description} for spec in load_catalog()]
+
+
+if __name__ == "__main__":
+    write_catalog()
+    print(f"Wrote {len(TOOL_CATALOG)} tools to {CATALOG_PATH}")
@@ -0,0 +1,108 @@
+"""Full-text search over simulation events."""
+
+import threading
+from typing import Any, List, Literal, Optional
+
+from pydantic import BaseModel, Field, field_validator
+
+from ..services.search_service import SEARCH_SOURCES, EventSearchService
+from ..utils.exceptions import SimulationNotFoundError
+from .base import ToolBase
+
+
+class SearchEventsParams(BaseModel):
+    """Parameters for search_events tool."""
+
+    simulation_id: str = Field(..., description="Simulation ID to search")
+    query: Optional[str] = Field(
+        None,
+        description="Full-text query over event types and details: words (all must match), "
+        '"exact phrases", OR, NOT, prefix* (FTS5 syntax)',
+    )
+    sources: List[Literal["actions", "interactions", "social_interactions"]] = Field(
+        list(SEARCH_SOURCES), description="Event tables to search"
+    )
+    event_type: Optional[str] = Field(
+        None, description="Only events of this action/interaction type (e.g. 'attack')"
+    )
+    json_path: Optional[str] = Field(
+        None, description="Dotted key path that must exist in the JSON details (e.g. 'target.kind')"
+    )
+    json_value: Optional[str] = Field(
+        None, description="Value the json_path leaf must start with (requires json_path)"
+    )
+    start_step: Optional[int] = Field(None, ge=0, description="Start step (inclusive)")
+    end_step: Optional[int] = Field(None, ge=0, description="End step (inclusive)")
+    limit: int = Field(50, ge=1, le=500, description="Maximum results to return")
+    offset: int = Field(0, ge=0, description="Pagination offset")
+    rebuild: bool = Field(
+        False, description="Rebuild the simulation's index before searching, even if up to date"
+    )
+
+    @field_validator("sources")
+    @classmethod
+    def validate_sources(cls, v: List[str]) -> List[str]:
+        """Require at least one source."""
+        if not v:
+            raise ValueError(f"sources must name at least one of {list(SEARCH_SOURCES)}")
+        return list(dict.fromkeys(v))
+
+
+class SearchEventsTool(ToolBase):
+    """Ranked full-text search over action and interaction details."""
+
+    tabular_keys = ("results",)
+    categorical_columns = ("source", "event_type")
+    # The sidecar index is the cache; caching results as well would keep
+    # serving searches of a running simulation from before its index refreshed
+    cacheable = False
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._search: Optional[EventSearchService] = None
+        self._search_lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        return "search_events"
+
+    @property
+    def description(self) -> str:
+        return """
+        Search actions, interactions and social interactions by the text of
+        their type and details, best matches first.
+
+        Examples:
+        - Attacks mentioning fleeing: query='flee*', event_type='attack'
+          (words are matched exactly, so use prefix* for other word forms)
+        - Either word: query='fled OR retreated'
+        - Exact phrase: query='"low health"'
+        - JSON details with a key: json_path='target.kind'
+        - JSON details with a value: json_path='target.kind', json_value='food'
+
+        The first search of a simulation builds its full-text index (reported
+        under `index`). The index of a simulation that is still running is
+        rebuilt when events have been added since; rebuild=True forces it.
+        Each result has the event source and ID, step, agent and target IDs,
+        type, parsed details, a highlighted snippet and a relevance score.
+        """
+
+    @property
+    def parameters_schema(self):
+        return SearchEventsParams
+
+    @property
+    def search_service(self) -> EventSearchService:
+        """Search service over this tool's database (created on first use)."""
+        with self._search_lock:
+            if self._search is None:
+                self._search = EventSearchService(self.db)
+            return self._search
+
+    def execute(self, **params):
+        """Execute event search."""
+        if not self.db.validate_simulation_exists(params["simulation_id"]):
+            raise SimulationNotFoundError(params["simulation_id"])
+
+        result = self.search_service.search(**params)
+        return {"simulation_id": params["simulation_id"], "query": params["query"], **result}
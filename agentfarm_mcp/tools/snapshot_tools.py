@@ -0,0 +1,157 @@
+"""World-state snapshot of a single simulation step."""
+
+from typing import Any, Dict, List, Literal, Tuple
+
+from pydantic import BaseModel, Field, field_validator
+
+from ..models.database_models import AgentModel, AgentStateModel, ResourceModel
+from ..utils.columnar import dictionary_encode
+from ..utils.exceptions import SimulationNotFoundError
+from .base import ToolBase
+
+# Snapshot columns; dict values become nested column groups (e.g. ``position``)
+_SNAPSHOT_AGENT_FIELDS = {
+    "agent_id": AgentStateModel.agent_id,
+    "agent_type": AgentModel.agent_type,
+    "position": {"x": AgentStateModel.position_x, "y": AgentStateModel.position_y},
+    "resource_level": AgentStateModel.resource_level,
+    "current_health": AgentStateModel.current_health,
+    "starting_health": AgentStateModel.starting_health,
+    "starvation_counter": AgentStateModel.starvation_counter,
+    "is_defending": AgentStateModel.is_defending,
+    "total_reward": AgentStateModel.total_reward,
+    "age": AgentStateModel.age,
+}
+
+_SNAPSHOT_RESOURCE_FIELDS = {
+    "resource_id": ResourceModel.resource_id,
+    "amount": ResourceModel.amount,
+    "position": {"x": ResourceModel.position_x, "y": ResourceModel.position_y},
+}
+
+# Dictionary-encoded snapshot columns
+_SNAPSHOT_CATEGORICAL = frozenset({"agent_type"})
+
+
+def _flatten(
+    field_map: Dict[str, Any], prefix: Tuple[str, ...] = ()
+) -> List[Tuple[Tuple[str, ...], Any]]:
+    """Flatten a (nested) field map into (output path, column) pairs."""
+    flat = []
+    for name, column in field_map.items():
+        if isinstance(column, dict):
+            flat.extend(_flatten(column, prefix + (name,)))
+        else:
+            flat.append((prefix + (name,), column))
+    return flat
+
+
+def _to_columns(paths: List[Tuple[str, ...]], rows: List[Any]) -> Dict[str, Any]:
+    """Transpose result rows into (nested) columns without building row dicts."""
+    values = list(zip(*rows)) if rows else [() for _ in paths]
+    columns: Dict[str, Any] = {}
+    for path, column_values in zip(paths, values):
+        target = columns
+        for name in path[:-1]:
+            target = target.setdefault(name, {})
+        column_values = list(column_values)
+        if path[-1] in _SNAPSHOT_CATEGORICAL:
+            target[path[-1]] = dictionary_encode(column_values)
+        else:
+            target[path[-1]] = column_values
+    return columns
+
+
+class GetWorldSnapshotParams(BaseModel):
+    """Parameters for get_world_snapshot tool."""
+
+    simulation_id: str = Field(..., description="Simulation ID to query")
+    step_number: int = Field(..., ge=0, description="Step to reconstruct")
+    include: List[Literal["agents", "resources"]] = Field(
+        ["agents", "resources"], description="Parts of the world to return"
+    )
+
+    @field_validator("include")
+    @classmethod
+    def validate_include(cls, v: List[str]) -> List[str]:
+        """Require at least one part."""
+        if not v:
+            raise ValueError("include must name 'agents', 'resources' or both")
+        return list(dict.fromkeys(v))
+
+
+class GetWorldSnapshotTool(ToolBase):
+    """Return every agent state and resource of one step in columnar form."""
+
+    @property
+    def name(self) -> str:
+        return "get_world_snapshot"
+
+    @property
+    def description(self) -> str:
+        return """
+        Get the complete world state at one step in a single call.
+
+        Returns all agent states (with agent type) and all resources present at
+        the step, without pagination. The data is columnar: each field is one
+        list, positions are grouped as position.x / position.y, and agent_type
+        is dictionary-encoded as {"dictionary": [...], "codes": [...]}.
+
+        Use this to:
+        - Render or inspect the world at a given moment
+        - Compare the world before and after a critical event
+        - Feed a full step into spatial or statistical analysis
+
+        Prefer query_states / query_resources for ranges of steps.
+        """
+
+    @property
+    def parameters_schema(self):
+        return GetWorldSnapshotParams
+
+    def execute(self, **params):
+        """Execute world snapshot."""
+        simulation_id = params["simulation_id"]
+        step_number = params["step_number"]
+        if not self.db.validate_simulation_exists(simulation_id):
+            raise SimulationNotFoundError(simulation_id)
+
+        agent_paths, agent_columns = zip(*_flatten(_SNAPSHOT_AGENT_FIELDS))
+        resource_paths, resource_columns = zip(*_flatten(_SNAPSHOT_RESOURCE_FIELDS))
+
+        def query_func(session):
+            snapshot = {}
+            # Both filters are equalities, so (simulation_id, step_number) is one index range
+            if "agents" in params["include"]:
+                snapshot["agents"] = (
+                    session.query(*agent_columns)
+                    .outerjoin(AgentModel, AgentModel.agent_id == AgentStateModel.agent_id)
+                    .filter(
+                        AgentStateModel.simulation_id == simulation_id,
+                        AgentStateModel.step_number == step_number,
+                    )
+                    .order_by(AgentStateModel.agent_id)
+                    .all()
+                )
+            if "resources" in params["include"]:
+                snapshot["resources"] = (
+                    session.query(*resource_columns)
+                    .filter(
+                        ResourceModel.simulation_id == simulation_id,
+                        ResourceModel.step_number == step_number,
+                    )
+                    .order_by(ResourceModel.resource_id)
+                    .all()
+                )
+            return snapshot
+
+        snapshot = self.db.execute_query(query_func)
+
+        result: Dict[str, Any] = {"simulation_id": simulation_id, "step_number": step_number}
+        if "agents" in snapshot:
+            result["agents"] = _to_columns(list(agent_paths), snapshot["agents"])
+            result["agent_count"] = len(snapshot["agents"])
+        if "resources" in snapshot:
+            result["resources"] = _to_columns(list(resource_paths), snapshot["resources"])
+            result["resource_count"] = len(snapshot["resources"])
+        return result
@@ -0,0 +1,182 @@
+"""Spatial queries over agent and resource positions."""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Literal, Optional, Tuple
+
+from pydantic import BaseModel, Field, field_validator
+
+from ..models.database_models import AgentStateModel, ResourceModel
+from ..utils.exceptions import SimulationNotFoundError, ValidationError
+from ..utils.spatial_index import GridIndex
+from .base import ToolBase
+
+# Step indexes kept per tool instance (one per simulation/entity/step)
+SPATIAL_INDEX_CACHE_SIZE = 32
+
+# Entity -> (model, id column, extra columns returned per point)
+_SPATIAL_ENTITIES: Dict[str, Tuple[Any, str, Tuple[str, ...]]] = {
+    "agents": (
+        AgentStateModel,
+        "agent_id",
+        ("resource_level", "current_health", "is_defending", "age"),
+    ),
+    "resources": (ResourceModel, "resource_id", ("amount",)),
+}
+
+
+class QuerySpatialParams(BaseModel):
+    """Parameters for query_spatial tool."""
+
+    simulation_id: str = Field(..., description="Simulation ID to query")
+    step_number: int = Field(..., ge=0, description="Step whose positions are searched")
+    shape: Literal["bbox", "radius", "nearest"] = Field(
+        ..., description="'bbox' (needs bbox), 'radius' (needs x, y, radius) or 'nearest' (x, y, k)"
+    )
+    entity: Literal["agents", "resources"] = Field("agents", description="What to search")
+    bbox: Optional[List[float]] = Field(
+        None, description="Bounding box as [min_x, min_y, max_x, max_y] (edges included)"
+    )
+    x: Optional[float] = Field(None, description="Query point X for 'radius' and 'nearest'")
+    y: Optional[float] = Field(None, description="Query point Y for 'radius' and 'nearest'")
+    radius: Optional[float] = Field(None, gt=0, description="Search radius for 'radius'")
+    k: int = Field(10, ge=1, le=1000, description="Number of neighbours for 'nearest'")
+    limit: int = Field(100, ge=1, le=1000, description="Maximum points to return")
+
+    @field_validator("bbox")
+    @classmethod
+    def validate_bbox(cls, v: Optional[List[float]]) -> Optional[List[float]]:
+        """Validate the bounding box corners."""
+        if v is None:
+            return v
+        if len(v) != 4:
+            raise ValueError("bbox must be [min_x, min_y, max_x, max_y]")
+        if v[0] > v[2] or v[1] > v[3]:
+            raise ValueError("bbox minimum corner must not exceed the maximum corner")
+        return v
+
+
+class QuerySpatialTool(ToolBase):
+    """Find agents or resources by position at one step."""
+
+    tabular_keys = ("results",)
+    # The per-step grid index is the cache; lookups on it are cheap enough
+    # that caching every shape/point combination would only evict other tools
+    cacheable = False
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._indexes: "OrderedDict[Tuple[str, str, int], Tuple[GridIndex, List[tuple]]]" = (
+            OrderedDict()
+        )
+        self._indexes_lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        return "query_spatial"
+
+    @property
+    def description(self) -> str:
+        return """
+        Find agents or resources near a point or inside a region at one step.
+
+        Shapes:
+        - bbox: everything inside [min_x, min_y, max_x, max_y]
+        - radius: everything within `radius` of (x, y), nearest first
+        - nearest: the `k` points closest to (x, y), nearest first
+
+        Positions of the step are loaded once into a grid index that is reused
+        by later queries on the same step, so repeated region lookups do not
+        rescan the step.
+
+        Use this to:
+        - See who was around a resource or an event location
+        - Measure local crowding or competition
+        - Find the nearest resources to an agent
+        """
+
+    @property
+    def parameters_schema(self):
+        return QuerySpatialParams
+
+    def execute(self, **params):
+        """Execute spatial query."""
+        shape = params["shape"]
+        required = {"bbox": ("bbox",), "radius": ("x", "y", "radius"), "nearest": ("x", "y")}
+        missing = [name for name in required[shape] if params.get(name) is None]
+        if missing:
+            raise ValidationError(
+                f"shape={shape!r} requires {list(required[shape])}; missing {missing}",
+                {"shape": shape, "missing": missing},
+            )
+
+        if not self.db.validate_simulation_exists(params["simulation_id"]):
+            raise SimulationNotFoundError(params["simulation_id"])
+
+        index, rows = self._get_index(
+            params["simulation_id"], params["entity"], params["step_number"]
+        )
+
+        distances = None
+        if shape == "bbox":
+            matches = index.bbox(*params["bbox"])
+        elif shape == "radius":
+            matches, distances = index.radius(params["x"], params["y"], params["radius"])
+        else:
+            matches, distances = index.nearest(params["x"], params["y"], params["k"])
+
+        limit = params["limit"]
+        _, id_column, extra_columns = _SPATIAL_ENTITIES[params["entity"]]
+        results = []
+        for position, row_index in enumerate(matches[:limit].tolist()):
+            point_id, x, y, *extra = rows[row_index]
+            result = {id_column: point_id, "position": {"x": x, "y": y}}
+            result.update(zip(extra_columns, extra))
+            if distances is not None:
+                result["distance"] = float(distances[position])
+            results.append(result)
+
+        return {
+            "simulation_id": params["simulation_id"],
+            "step_number": params["step_number"],
+            "entity": params["entity"],
+            "shape": shape,
+            "results": results,
+            "total_matches": len(matches),
+            "returned_count": len(results),
+            "truncated": len(matches) > limit,
+            "indexed_points": len(index),
+        }
+
+    def _get_index(
+        self, simulation_id: str, entity: str, step_number: int
+    ) -> Tuple[GridIndex, List[tuple]]:
+        """Get the grid index and rows of a step, building and caching them on a miss."""
+        key = (simulation_id, entity, step_number)
+        with self._indexes_lock:
+            if key in self._indexes:
+                self._indexes.move_to_end(key)
+                return self._indexes[key]
+
+        model, id_column, extra_columns = _SPATIAL_ENTITIES[entity]
+        columns = [
+            getattr(model, name) for name in (id_column, "position_x", "position_y", *extra_columns)
+        ]
+
+        def query_func(session):
+            return [
+                tuple(row)
+                for row in session.query(*columns)
+                .filter(model.simulation_id == simulation_id, model.step_number == step_number)
+                .order_by(getattr(model, id_column))
+            ]
+
+        rows = self.db.execute_query(query_func)
+        index = GridIndex([row[1] for row in rows], [row[2] for row in rows])
+
+        with self._indexes_lock:
+            self._indexes[key] = (index, rows)
+            self._indexes.move_to_end(key)
+            while len(self._indexes) > SPATIAL_INDEX_CACHE_SIZE:
+                self._indexes.popitem(last=False)
+        return index, rows
@@ -0,0 +1,222 @@
+"""Adaptive admission control for tool execution."""
+
+import threading
+import time
+from enum import Enum
+from typing import Any
+
+from structlog import get_logger
+
+from .exceptions import OverloadedError
+
+logger = get_logger(__name__)
+
+
+class Priority(Enum):
+    """Request priority classes used when shedding load."""
+
+    LOW = "low"  # Shed first (expensive analysis and comparison tools)
+    NORMAL = "normal"  # Shed once the concurrency limit is reached
+    CRITICAL = "critical"  # Never shed (health and monitoring tools)
+
+
+class AdmissionController:
+    """Adaptive concurrency limiter placed in front of tool execution.
+
+    The controller tracks in-flight work and recent latency and adjusts its
+    concurrency limit with an AIMD (additive increase, multiplicative decrease)
+    policy:
+
+    - Every call that completes under the latency threshold grows the limit by
+      ``1 / limit`` (roughly +1 per full window of successful calls).
+    - A slow or failed call shrinks the limit by ``backoff_ratio``, at most once
+      per ``decrease_cooldown_seconds`` so a single burst doesn't collapse it.
+
+    Low-priority requests are shed once in-flight work reaches
+    ``low_priority_ratio * limit``, normal requests at the full limit, and
+    critical requests are always admitted. Critical requests (health and
+    monitoring) are not counted as in-flight work and do not adapt the
+    limit, so the tools reporting load don't count themselves in it.
+
+    This implementation is **thread-safe** using threading.RLock().
+
+    Example:
+        >>> controller = AdmissionController(initial_limit=32)
+        >>> controller.acquire(Priority.NORMAL)
+        >>> try:
+        ...     run_query()
+        ... finally:
+        ...     controller.release(latency_ms=12.5, success=True)
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 32,
+        min_limit: int = 4,
+        max_limit: int = 256,
+        latency_threshold_ms: float = 2000.0,
+        backoff_ratio: float = 0.9,
+        low_priority_ratio: float = 0.75,
+        decrease_cooldown_seconds: float = 1.0,
+        min_retry_after_ms: int = 100,
+        name: str = "default",
+    ):
+        """Initialize admission controller.
+
+        Args:
+            initial_limit: Starting concurrency limit
+            min_limit: Lower bound for the adaptive limit
+            max_limit: Upper bound for the adaptive limit
+            latency_threshold_ms: Latency above which a call counts as congested
+            backoff_ratio: Multiplicative factor applied to the limit on congestion
+            low_priority_ratio: Fraction of the limit available to low-priority calls
+            decrease_cooldown_seconds: Minimum time between two limit decreases
+            min_retry_after_ms: Lower bound for the retry hint given to shed callers
+            name: Name for logging and identification
+        """
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_threshold_ms = latency_threshold_ms
+        self.backoff_ratio = backoff_ratio
+        self.low_priority_ratio = low_priority_ratio
+        self.decrease_cooldown_seconds = decrease_cooldown_seconds
+        self.min_retry_after_ms = min_retry_after_ms
+        self.name = name
+
+        # Thread-safe state management
+        self._lock = threading.RLock()
+        self._limit = float(max(min_limit, min(initial_limit, max_limit)))
+        self.in_flight = 0
+        self.latency_ewma_ms: float | None = None
+        self.admitted_count = 0
+        self.shed_count = 0
+        self.last_decrease_time: float | None = None
+
+        logger.info(
+            "admission_controller_initialized",
+            name=name,
+            initial_limit=self.limit,
+            min_limit=min_limit,
+            max_limit=max_limit,
+        )
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit (rounded down)."""
+        return int(self._limit)
+
+    def acquire(self, priority: Priority = Priority.NORMAL) -> None:
+        """Admit a request or shed it.
+
+        Every successful ``acquire`` must be paired with a ``release`` of the
+        same priority.
+
+        Args:
+            priority: Priority class of the request
+
+        Raises:
+            OverloadedError: If the request is shed
+        """
+        with self._lock:
+            if priority is Priority.CRITICAL:
+                self.admitted_count += 1
+                return
+
+            capacity = self._limit
+            if priority is Priority.LOW:
+                capacity = max(1.0, self._limit * self.low_priority_ratio)
+
+            if self.in_flight >= int(capacity):
+                self.shed_count += 1
+                retry_after_ms = self._retry_after_ms()
+                logger.warning(
+                    "admission_request_shed",
+                    name=self.name,
+                    priority=priority.value,
+                    in_flight=self.in_flight,
+                    limit=self.limit,
+                    retry_after_ms=retry_after_ms,
+                )
+                raise OverloadedError(
+                    retry_after_ms=retry_after_ms,
+                    in_flight=self.in_flight,
+                    limit=self.limit,
+                    priority=priority.value,
+                )
+
+            self.in_flight += 1
+            self.admitted_count += 1
+
+    def release(
+        self, latency_ms: float, success: bool = True, priority: Priority = Priority.NORMAL
+    ) -> None:
+        """Release an admitted request and adapt the limit.
+
+        Args:
+            latency_ms: Observed execution latency in milliseconds
+            success: Whether the call completed without an infrastructure error
+            priority: Priority class the request was admitted with
+        """
+        if priority is Priority.CRITICAL:
+            return
+
+        with self._lock:
+            self.in_flight = max(0, self.in_flight - 1)
+
+            if self.latency_ewma_ms is None:
+                self.latency_ewma_ms = latency_ms
+            else:
+                self.latency_ewma_ms = 0.8 * self.latency_ewma_ms + 0.2 * latency_ms
+
+            if success and latency_ms <= self.latency_threshold_ms:
+                self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+                return
+
+            now = time.time()
+            if (
+                self.last_decrease_time is not None
+                and now - self.last_decrease_time < self.decrease_cooldown_seconds
+            ):
+                return
+
+            previous = self.limit
+            self._limit = max(float(self.min_limit), self._limit * self.backoff_ratio)
+            self.last_decrease_time = now
+            logger.info(
+                "admission_limit_decreased",
+                name=self.name,
+                previous_limit=previous,
+                limit=self.limit,
+                latency_ms=round(latency_ms, 2),
+                success=success,
+            )
+
+    def _retry_after_ms(self) -> int:
+        """Estimate how long a shed caller should wait before retrying."""
+        if self.latency_ewma_ms is None:
+            return self.min_retry_after_ms
+        return max(self.min_retry_after_ms, int(self.latency_ewma_ms))
+
+    def get_state(self) -> dict[str, Any]:
+        """Get current admission controller state (thread-safe).
+
+        Returns:
+            Dictionary with state information
+        """
+        with self._lock:
+            total = self.admitted_count + self.shed_count
+            return {
+                "name": self.name,
+                "limit": self.limit,
+                "min_limit": self.min_limit,
+                "max_limit": self.max_limit,
+                "in_flight": self.in_flight,
+                "utilization": round(self.in_flight / self._limit, 3),
+                "latency_ewma_ms": (
+                    round(self.latency_ewma_ms, 2) if self.latency_ewma_ms is not None else None
+                ),
+                "latency_threshold_ms": self.latency_threshold_ms,
+                "admitted": self.admitted_count,
+                "shed": self.shed_count,
+                "shed_rate": round(self.shed_count / total, 4) if total > 0 else 0,
+            }
@@ -46,6 +46,7 @@ class CircuitBreaker:
         timeout: int = 60,
         success_threshold: int = 2,
         name: str = "default",
+        ignored_exceptions: tuple[type[BaseException], ...] = (),
     ):
         """Initialize circuit breaker.
         
@@ -54,11 +55,14 @@ class CircuitBreaker:
             timeout: Seconds to wait before attempting half-open state
             success_threshold: Successful calls needed in half-open to close circuit
             name: Name for logging and identification
+            ignored_exceptions: Exceptions re-raised without counting as a
+                success or a failure
         """
         self.failure_threshold = failure_threshold
         self.timeout = timeout
         self.success_threshold = success_threshold
         self.name = name
+        self.ignored_exceptions = ignored_exceptions
         
         # Thread-safe state management
         self._lock = threading.RLock()
@@ -107,6 +111,8 @@ class CircuitBreaker:
             result = func()
             self._on_success()
             return result
+        except self.ignored_exceptions:
+            raise
         except Exception as e:
             self._on_failure()
             raise
@@ -0,0 +1,155 @@
+"""Survival statistics of agent cohorts, aggregated by the database.
+
+Counting alive and dead agents and their lifespans per generation or agent
+type used to load every agent row into Python. Here the counts, lifespan sum,
+minimum and maximum come from one ``GROUP BY`` query, and only medians need
+the lifespans themselves: they are fetched one cohort at a time as a single
+column, streamed into a preallocated NumPy array. Memory is bounded by the
+largest cohort's lifespans (8 bytes each), not by the number of agents.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from ..models.database_models import AgentModel
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Rows per fetch while streaming lifespans
+LIFESPAN_FETCH_SIZE = 10000
+
+_GROUP_COLUMNS = {
+    "generation": AgentModel.generation,
+    "agent_type": AgentModel.agent_type,
+}
+
+_LIFESPAN = AgentModel.death_time - AgentModel.birth_time
+
+
+def _cohort_filter(simulation_id: str, group_by: str, key: Any) -> list:
+    """Build the WHERE clauses selecting one cohort's agents."""
+    clauses = [AgentModel.simulation_id == simulation_id]
+    column = _GROUP_COLUMNS.get(group_by)
+    if column is not None:
+        clauses.append(column.is_(None) if key is None else column == key)
+    return clauses
+
+
+def cohort_aggregates(
+    session: Session, simulation_id: str, group_by: str
+) -> Dict[Any, Dict[str, Any]]:
+    """Count agents and sum lifespans per cohort in one query.
+
+    Args:
+        session: Database session
+        simulation_id: Simulation whose agents are grouped
+        group_by: ``"generation"`` or ``"agent_type"``; anything else puts
+            every agent in one ``"all"`` cohort
+
+    Returns:
+        Cohort key (NULL keys first, then ascending) to ``alive``, ``dead``,
+        ``lifespan_count``, ``lifespan_sum``, ``lifespan_min`` and
+        ``lifespan_max``; empty when the simulation has no agents
+    """
+    column = _GROUP_COLUMNS.get(group_by)
+    aggregates = [
+        func.count(),
+        func.count(AgentModel.death_time),
+        func.count(_LIFESPAN),
+        func.sum(_LIFESPAN),
+        func.min(_LIFESPAN),
+        func.max(_LIFESPAN),
+    ]
+    query = session.query(*aggregates).filter(AgentModel.simulation_id == simulation_id)
+    if column is None:
+        rows = [("all", *row) for row in query.all() if row[0]]
+    else:
+        rows = (
+            session.query(column, *aggregates)
+            .filter(AgentModel.simulation_id == simulation_id)
+            .group_by(column)
+            .order_by(column.asc().nulls_first())
+            .all()
+        )
+
+    return {
+        key: {
+            "alive": total - dead,
+            "dead": dead,
+            "lifespan_count": count,
+            "lifespan_sum": total_lifespan,
+            "lifespan_min": minimum,
+            "lifespan_max": maximum,
+        }
+        for key, total, dead, count, total_lifespan, minimum, maximum in rows
+    }
+
+
+def cohort_lifespans(
+    session: Session, simulation_id: str, group_by: str, key: Any, count: int
+) -> "np.ndarray":
+    """Fetch one cohort's lifespans into a NumPy array.
+
+    Args:
+        session: Database session
+        simulation_id: Simulation of the cohort
+        group_by: Grouping of ``cohort_aggregates``
+        key: Cohort key
+        count: Number of lifespans (``lifespan_count`` of the cohort)
+
+    Returns:
+        Float array of the lifespans of the cohort's dead agents
+    """
+    import numpy as np
+
+    statement = (
+        select(_LIFESPAN)
+        .where(*_cohort_filter(simulation_id, group_by, key), _LIFESPAN.is_not(None))
+        .execution_options(yield_per=LIFESPAN_FETCH_SIZE)
+    )
+    return np.fromiter(session.execute(statement).scalars(), dtype=np.float64, count=count)
+
+
+def cohort_statistics(
+    session: Session,
+    simulation_id: str,
+    group_by: str,
+    aggregates: Optional[Dict[Any, Dict[str, Any]]] = None,
+) -> Dict[Any, Dict[str, Any]]:
+    """Get survival and lifespan statistics per cohort.
+
+    Args:
+        session: Database session
+        simulation_id: Simulation whose agents are grouped
+        group_by: Grouping of ``cohort_aggregates``
+        aggregates: Cohorts to describe, as returned by ``cohort_aggregates``
+            (default: all cohorts)
+
+    Returns:
+        Cohort key to ``alive``, ``dead`` and ``lifespan_mean``/``_median``/
+        ``_max``/``_min`` (None for cohorts without dead agents)
+    """
+    import numpy as np
+
+    if aggregates is None:
+        aggregates = cohort_aggregates(session, simulation_id, group_by)
+
+    statistics = {}
+    for key, cohort in aggregates.items():
+        count = cohort["lifespan_count"]
+        median = None
+        if count:
+            lifespans = cohort_lifespans(session, simulation_id, group_by, key, count)
+            median = float(np.median(lifespans))
+        statistics[key] = {
+            "alive": cohort["alive"],
+            "dead": cohort["dead"],
+            "lifespan_mean": cohort["lifespan_sum"] / count if count else None,
+            "lifespan_median": median,
+            "lifespan_max": cohort["lifespan_max"],
+            "lifespan_min": cohort["lifespan_min"],
+        }
+    return statistics
@@ -0,0 +1,76 @@
+"""Columnar encoding of tabular tool results.
+
+Row lists such as ``[{"step_number": 0, "births": 1}, ...]`` repeat every key
+per row. The columnar form stores each column once::
+
+    {"step_number": [0, 1, ...], "births": [1, 0, ...]}
+
+Nested objects (e.g. ``position``) become nested column groups, and
+categorical columns are dictionary-encoded as
+``{"dictionary": [distinct values], "codes": [index per row]}``.
+"""
+
+from typing import Any, Dict, Iterable, List
+
+
+def to_columnar(rows: List[Dict[str, Any]], categorical: Iterable[str] = ()) -> Dict[str, Any]:
+    """Convert a list of row dictionaries into columns.
+
+    Args:
+        rows: Row dictionaries (missing keys become None)
+        categorical: Column names to dictionary-encode
+
+    Returns:
+        Dictionary mapping column name to values, nested column groups or
+        dictionary-encoded columns
+    """
+    categorical = frozenset(categorical)
+    names = list(dict.fromkeys(key for row in rows for key in row))
+
+    columns: Dict[str, Any] = {}
+    for name in names:
+        values = [row.get(name) for row in rows]
+        if name in categorical:
+            columns[name] = dictionary_encode(values)
+        elif any(isinstance(value, dict) for value in values):
+            columns[name] = to_columnar([value or {} for value in values], categorical)
+        else:
+            columns[name] = values
+    return columns
+
+
+def dictionary_encode(values: List[Any]) -> Dict[str, List[Any]]:
+    """Dictionary-encode a column.
+
+    Args:
+        values: Column values (must be hashable)
+
+    Returns:
+        ``{"dictionary": distinct values in first-seen order, "codes": indexes}``
+    """
+    index: Dict[Any, int] = {}
+    codes = [index.setdefault(value, len(index)) for value in values]
+    return {"dictionary": list(index), "codes": codes}
+
+
+def from_columnar(columns: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Convert columns produced by ``to_columnar`` back into rows.
+
+    Args:
+        columns: Columnar data
+
+    Returns:
+        List of row dictionaries
+    """
+    expanded = {}
+    for name, column in columns.items():
+        if isinstance(column, dict) and set(column) == {"dictionary", "codes"}:
+            dictionary = column["dictionary"]
+            expanded[name] = [dictionary[code] for code in column["codes"]]
+        elif isinstance(column, dict):
+            expanded[name] = from_columnar(column)
+        else:
+            expanded[name] = column
+
+    length = max((len(values) for values in expanded.values()), default=0)
+    return [{name: values[i] for name, values in expanded.items()} for i in range(length)]
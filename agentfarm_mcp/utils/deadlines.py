@@ -0,0 +1,64 @@
+"""Per-call request deadlines.
+
+A ``Deadline`` is bound to the current context for the duration of a tool
+call. ``DatabaseService`` reads it to refuse work that can no longer finish
+in time and to interrupt statements still running when it passes, so
+abandoned calls stop consuming database time.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+_current_deadline: ContextVar[Optional["Deadline"]] = ContextVar("deadline", default=None)
+
+
+class Deadline:
+    """Point in time by which a tool call must finish."""
+
+    def __init__(self, timeout_ms: float) -> None:
+        """Initialize deadline.
+
+        Args:
+            timeout_ms: Time budget from now, in milliseconds
+        """
+        self.timeout_ms = timeout_ms
+        self.expires_at = time.monotonic() + timeout_ms / 1000
+
+    def remaining_ms(self) -> float:
+        """Get the remaining budget in milliseconds (never negative)."""
+        return max(0.0, (self.expires_at - time.monotonic()) * 1000)
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        return time.monotonic() >= self.expires_at
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Get the deadline bound to the current context, if any."""
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline_scope(timeout_ms: Optional[float]) -> Iterator[Optional[Deadline]]:
+    """Bind a deadline to the current context.
+
+    Args:
+        timeout_ms: Time budget in milliseconds, or None for no deadline
+
+    Example:
+        >>> with deadline_scope(500) as deadline:
+        ...     db_service.execute_query(my_query)
+    """
+    if timeout_ms is None:
+        yield None
+        return
+
+    deadline = Deadline(timeout_ms)
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
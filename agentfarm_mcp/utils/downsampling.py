@@ -0,0 +1,64 @@
+"""Time-series downsampling.
+
+Largest-Triangle-Three-Buckets (LTTB, Steinarsson 2013) keeps the points that
+preserve the visual shape of a series: the first and last points are kept and
+each bucket in between contributes the point forming the largest triangle
+with the previously selected point and the average of the next bucket. Peaks
+and troughs survive, unlike with plain striding or averaging.
+"""
+
+from typing import TYPE_CHECKING, Sequence
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def lttb_indices(x: Sequence[float], y: Sequence[float], max_points: int) -> "np.ndarray":
+    """Select the indexes of the points to keep with LTTB.
+
+    Args:
+        x: Monotonically increasing x values (e.g. step numbers)
+        y: Values to preserve the shape of; None/NaN are treated as 0
+        max_points: Number of points to keep (at least 3)
+
+    Returns:
+        Sorted array of indexes into ``x``/``y``; all indexes when the series
+        already has at most ``max_points`` points
+
+    Example:
+        >>> steps = list(range(100_000))
+        >>> keep = lttb_indices(steps, population, 1000)
+        >>> downsampled = [rows[i] for i in keep]
+    """
+    import numpy as np
+
+    n = len(x)
+    if max_points >= n or max_points < 3:
+        return np.arange(n)
+
+    xs = np.asarray(x, dtype=float)
+    ys = np.nan_to_num(np.asarray(y, dtype=float), nan=0.0)
+
+    # Bucket b covers interior points [bounds[b], bounds[b + 1])
+    bounds = np.arange(max_points - 1, dtype=np.int64) * (n - 2) // (max_points - 2) + 1
+
+    selected = np.empty(max_points, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    previous = 0
+    for bucket in range(max_points - 2):
+        start, end = bounds[bucket], bounds[bucket + 1]
+        next_end = bounds[bucket + 2] if bucket + 2 < len(bounds) else n
+        next_x = xs[end:next_end].mean()
+        next_y = ys[end:next_end].mean()
+
+        # Twice the triangle area; the constant factor does not change the argmax
+        area = np.abs(
+            (xs[previous] - next_x) * (ys[start:end] - ys[previous])
+            - (xs[previous] - xs[start:end]) * (next_y - ys[previous])
+        )
+        previous = start + int(np.argmax(area))
+        selected[bucket + 1] = previous
+
+    return selected
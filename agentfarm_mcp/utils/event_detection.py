@@ -0,0 +1,357 @@
+"""Vectorized detection of critical events in per-step simulation metrics.
+
+Step metrics are loaded once as NumPy arrays (one float array per column,
+NaN for NULL) and handed to *detectors*: small classes that find their events
+with array operations instead of a Python loop over steps. Detectors are
+plugins: subclass ``EventDetector``, declare the metric columns it reads and
+decorate it with ``register_detector``; ``identify_critical_events`` can
+then run it by name.
+
+Every event has the same schema::
+
+    {"type": "population_crash", "step": 105,
+     "description": "Population dropped 11.8% (102 → 90)", "severity": "medium"}
+
+``detect_events`` returns events ordered by step, and by detector order
+within a step.
+"""
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Sequence, Tuple, Type
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ..models.database_models import SimulationStepModel
+from .exceptions import ValidationError
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Module-level constants for event detection and thresholds
+MASS_DEATH_THRESHOLD = 10  # >10 deaths in a single step = mass death event
+SEVERE_MASS_DEATH_THRESHOLD = 20  # >20 deaths = severe mass death event
+SEVERE_POPULATION_CHANGE_THRESHOLD = 30  # >30% change = high severity event
+
+# Detectors run when none are requested (the original event set)
+DEFAULT_DETECTORS = ("population_change", "mass_death", "generation_milestone")
+
+StepMetrics = Dict[str, "np.ndarray"]
+
+
+class EventDetector(ABC):
+    """Base class of event detectors.
+
+    Subclasses set ``name`` (the ID callers select it by) and ``columns``
+    (the ``SimulationStepModel`` columns ``detect`` reads) and implement
+    ``detect``. ``metrics["step_number"]`` is always loaded.
+    """
+
+    name: str = ""
+    columns: Tuple[str, ...] = ()
+
+    def required_columns(self, options: Dict[str, Any]) -> Tuple[str, ...]:
+        """Get the metric columns ``detect`` reads for these options."""
+        return self.columns
+
+    @abstractmethod
+    def detect(self, metrics: StepMetrics, options: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Find events.
+
+        Args:
+            metrics: Column name to float array, one entry per step in step order
+            options: Detection options of the call (thresholds, windows)
+
+        Returns:
+            Events with ``type``, ``step``, ``description`` and ``severity``
+        """
+
+
+DETECTORS: Dict[str, EventDetector] = {}
+
+
+def register_detector(cls: Type[EventDetector]) -> Type[EventDetector]:
+    """Class decorator registering a detector under its ``name``."""
+    if not cls.name:
+        raise ValueError(f"{cls.__name__} must set a name")
+    DETECTORS[cls.name] = cls()
+    return cls
+
+
+def _events(
+    indices: "np.ndarray",
+    steps: "np.ndarray",
+    event_type: str,
+    describe: Callable[[int], str],
+    severity: Callable[[int], str],
+) -> List[Dict[str, Any]]:
+    """Build events for the rows at ``indices``."""
+    return [
+        {
+            "type": event_type,
+            "step": int(steps[i]),
+            "description": describe(i),
+            "severity": severity(i),
+        }
+        for i in indices.tolist()
+    ]
+
+
+@register_detector
+class PopulationChangeDetector(EventDetector):
+    """Step-over-step population changes of at least ``threshold_percent``."""
+
+    name = "population_change"
+    columns = ("total_agents",)
+
+    def detect(self, metrics: StepMetrics, options: Dict[str, Any]) -> List[Dict[str, Any]]:
+        import numpy as np
+
+        population = metrics["total_agents"]
+        previous, current = population[:-1], population[1:]
+        change = np.full(current.shape, np.nan)
+        np.divide(current - previous, previous, out=change, where=previous > 0)
+        change *= 100
+        threshold = options["threshold_percent"]
+        steps = metrics["step_number"]
+
+        # Position i in ``change`` is the change into row i + 1
+        crashed = change <= -threshold
+        crashes = np.flatnonzero(crashed)
+        booms = np.flatnonzero((change >= threshold) & ~crashed)
+        events = _events(
+            crashes + 1,
+            steps,
+            "population_crash",
+            lambda i: (
+                f"Population dropped {abs(change[i - 1]):.1f}% "
+                f"({int(population[i - 1])} → {int(population[i])})"
+            ),
+            lambda i: (
+                "high" if abs(change[i - 1]) > SEVERE_POPULATION_CHANGE_THRESHOLD else "medium"
+            ),
+        )
+        events += _events(
+            booms + 1,
+            steps,
+            "population_boom",
+            lambda i: (
+                f"Population grew {change[i - 1]:.1f}% "
+                f"({int(population[i - 1])} → {int(population[i])})"
+            ),
+            lambda i: "medium",
+        )
+        return events
+
+
+@register_detector
+class MassDeathDetector(EventDetector):
+    """Steps with more than ``MASS_DEATH_THRESHOLD`` deaths."""
+
+    name = "mass_death"
+    columns = ("deaths",)
+
+    def detect(self, metrics: StepMetrics, options: Dict[str, Any]) -> List[Dict[str, Any]]:
+        import numpy as np
+
+        deaths = metrics["deaths"]
+        # The first step has no predecessor and is not reported
+        indices = np.flatnonzero(deaths[1:] > MASS_DEATH_THRESHOLD) + 1
+        return _events(
+            indices,
+            metrics["step_number"],
+            "mass_death",
+            lambda i: f"{int(deaths[i])} deaths in single step",
+            lambda i: "high" if deaths[i] > SEVERE_MASS_DEATH_THRESHOLD else "medium",
+        )
+
+
+@register_detector
+class GenerationMilestoneDetector(EventDetector):
+    """Steps where the highest generation increases."""
+
+    name = "generation_milestone"
+    columns = ("current_max_generation",)
+
+    def detect(self, metrics: StepMetrics, options: Dict[str, Any]) -> List[Dict[str, Any]]:
+        import numpy as np
+
+        generation = metrics["current_max_generation"]
+        indices = np.flatnonzero(generation[1:] > generation[:-1]) + 1
+        return _events(
+            indices,
+            metrics["step_number"],
+            "new_generation",
+            lambda i: f"Generation {int(generation[i])} reached",
+            lambda i: "low",
+        )
+
+
+@register_detector
+class AnomalyDetector(EventDetector):
+    """Values far from the rolling mean of the preceding steps.
+
+    A step is anomalous when its ``anomaly_metric`` value lies at least
+    ``anomaly_z_threshold`` standard deviations from the mean of the previous
+    ``anomaly_window`` steps. Constant windows (zero deviation) are skipped.
+    """
+
+    name = "anomaly"
+
+    def required_columns(self, options: Dict[str, Any]) -> Tuple[str, ...]:
+        return (options["anomaly_metric"],)
+
+    def detect(self, metrics: StepMetrics, options: Dict[str, Any]) -> List[Dict[str, Any]]:
+        import numpy as np
+        from numpy.lib.stride_tricks import sliding_window_view
+
+        metric = options["anomaly_metric"]
+        values = metrics[metric]
+        window = options["anomaly_window"]
+        if len(values) <= window:
+            return []
+
+        history = sliding_window_view(values[:-1], window)
+        mean = history.mean(axis=1)
+        std = history.std(axis=1)
+        z = np.full(mean.shape, np.nan)
+        np.divide(values[window:] - mean, std, out=z, where=std > 0)
+        threshold = options["anomaly_z_threshold"]
+
+        # Position i in ``z`` scores row i + window
+        indices = np.flatnonzero(np.abs(z) >= threshold) + window
+        return _events(
+            indices,
+            metrics["step_number"],
+            "anomaly",
+            lambda i: (
+                f"{metric} {values[i]:g} is {z[i - window]:+.1f} standard deviations "
+                f"from the previous {window} steps (mean {mean[i - window]:.1f})"
+            ),
+            lambda i: "high" if abs(z[i - window]) >= 2 * threshold else "medium",
+        )
+
+
+@register_detector
+class ResourceDepletionDetector(EventDetector):
+    """Steps where total resources fall to ``depletion_percent`` of the initial amount.
+
+    Reported when the level is crossed, not for every step below it; a
+    recovery above the level arms the detector again.
+    """
+
+    name = "resource_depletion"
+    columns = ("total_resources",)
+
+    def detect(self, metrics: StepMetrics, options: Dict[str, Any]) -> List[Dict[str, Any]]:
+        import numpy as np
+
+        resources = metrics["total_resources"]
+        initial = resources[0]
+        if not initial > 0:
+            return []
+
+        level = initial * options["depletion_percent"] / 100
+        below = resources <= level
+        indices = np.flatnonzero(below[1:] & ~below[:-1]) + 1
+        return _events(
+            indices,
+            metrics["step_number"],
+            "resource_depletion",
+            lambda i: (
+                f"Total resources fell to {resources[i]:.1f} "
+                f"({resources[i] / initial * 100:.1f}% of initial {initial:.1f})"
+            ),
+            lambda i: "high" if resources[i] <= 0 else "medium",
+        )
+
+
+def resolve_detectors(names: Iterable[str]) -> List[EventDetector]:
+    """Look up registered detectors by name.
+
+    Raises:
+        ValidationError: If a name is not registered
+    """
+    names = list(dict.fromkeys(names))
+    unknown = [name for name in names if name not in DETECTORS]
+    if unknown:
+        raise ValidationError(
+            f"Unknown detectors {unknown}; available: {sorted(DETECTORS)}",
+            {"detectors": names},
+        )
+    return [DETECTORS[name] for name in names]
+
+
+def validate_step_columns(columns: Iterable[str]) -> None:
+    """Check that names are numeric ``SimulationStepModel`` columns.
+
+    Raises:
+        ValidationError: If a column does not exist or is not numeric
+    """
+    table_columns = SimulationStepModel.__table__.columns
+    unknown = [
+        name
+        for name in columns
+        if name not in table_columns
+        or table_columns[name].type.python_type not in (int, float)
+    ]
+    if unknown:
+        raise ValidationError(f"Unknown numeric step metrics {unknown}", {"columns": unknown})
+
+
+def load_step_metrics(session: Session, simulation_id: str, columns: Sequence[str]) -> StepMetrics:
+    """Load per-step metric columns of a simulation as float arrays.
+
+    Args:
+        session: Database session
+        simulation_id: Simulation whose steps are loaded
+        columns: Numeric ``SimulationStepModel`` column names (see
+            ``validate_step_columns``)
+
+    Returns:
+        Column name to array in step order, with ``step_number`` always included
+        and NULL values as NaN
+    """
+    import numpy as np
+
+    names = list(dict.fromkeys(["step_number", *columns]))
+    table_columns = SimulationStepModel.__table__.columns
+    result = session.execute(
+        select(*(table_columns[name] for name in names))
+        .where(SimulationStepModel.simulation_id == simulation_id)
+        .order_by(SimulationStepModel.step_number)
+    )
+    # Plain tuples: NumPy probes Row objects for array protocols one by one
+    rows = [tuple(row) for row in result]
+    data = np.array(rows, dtype=np.float64).reshape(len(rows), len(names))
+    return {name: data[:, i] for i, name in enumerate(names)}
+
+
+def required_columns(
+    detectors: Sequence[EventDetector], options: Dict[str, Any]
+) -> List[str]:
+    """Get the metric columns a set of detectors reads, without duplicates."""
+    return list(
+        dict.fromkeys(
+            column for detector in detectors for column in detector.required_columns(options)
+        )
+    )
+
+
+def detect_events(
+    metrics: StepMetrics, detectors: Sequence[EventDetector], options: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """Run detectors and merge their events by step.
+
+    Args:
+        metrics: Arrays from ``load_step_metrics``
+        detectors: Detectors to run, in reporting order within a step
+        options: Detection options passed to every detector
+
+    Returns:
+        Events ordered by step, then detector order
+    """
+    events = [event for detector in detectors for event in detector.detect(metrics, options)]
+    # sort is stable, so events of one step keep detector order
+    events.sort(key=lambda event: event["step"])
+    return events
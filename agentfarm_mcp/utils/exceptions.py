@@ -146,6 +146,13 @@ class ConfigurationError(MCPException):
     """
 
 
+class ExportError(MCPException):
+    """File export errors.
+
+    Raised when exported data cannot be written to the output directory.
+    """
+
+
 class AgentNotFoundError(DatabaseError):
     """Requested agent does not exist.
 
@@ -271,3 +278,38 @@ class ResourceLimitError(MCPException):
             details["limit_value"] = limit_value
             message = f"{message} (Limit: {limit_type}={limit_value})"
         super().__init__(message, details)
+
+
+class OverloadedError(MCPException):
+    """Server overloaded errors.
+
+    Raised by admission control when a request is shed because the server
+    is at its adaptive concurrency limit. Clients should retry after the
+    suggested delay.
+    """
+
+    def __init__(
+        self,
+        retry_after_ms: int,
+        in_flight: int = None,
+        limit: int = None,
+        priority: str = None,
+    ):
+        """Initialize with load shedding details.
+
+        Args:
+            retry_after_ms: Suggested delay before retrying, in milliseconds
+            in_flight: Number of requests in flight when the request was shed
+            limit: Concurrency limit at the time the request was shed
+            priority: Priority class of the shed request
+        """
+        self.retry_after_ms = retry_after_ms
+        message = f"Server overloaded, retry after {retry_after_ms}ms"
+        details: Dict[str, Any] = {"retry_after_ms": retry_after_ms}
+        if in_flight is not None:
+            details["in_flight"] = in_flight
+        if limit is not None:
+            details["limit"] = limit
+        if priority:
+            details["priority"] = priority
+        super().__init__(message, details)
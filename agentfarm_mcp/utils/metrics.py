@@ -0,0 +1,390 @@
+"""In-process metrics registry with Prometheus text exposition.
+
+Metrics are kept in memory and updated on every tool call, database
+connection checkout and cache operation. They can be exported in the
+Prometheus text format (``/metrics`` endpoint) or as a JSON snapshot
+(``get_metrics`` tool).
+"""
+
+import bisect
+import math
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+# Default latency buckets in milliseconds
+DEFAULT_LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Number of recent observations kept per label set for quantile estimation
+DEFAULT_RESERVOIR_SIZE = 2048
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_labels(label_names: Sequence[str], label_values: Sequence[str], **extra: str) -> str:
+    """Render a Prometheus label set (``{a="x",b="y"}``)."""
+    pairs = list(zip(label_names, label_values)) + list(extra.items())
+    if not pairs:
+        return ""
+    rendered = ",".join(
+        '{}="{}"'.format(k, str(v).replace("\\", "\\\\").replace('"', '\\"')) for k, v in pairs
+    )
+    return "{" + rendered + "}"
+
+
+def _format_value(value: float) -> str:
+    """Render a sample value."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """Base class for labelled metrics."""
+
+    metric_type = "untyped"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> LabelValues:
+        """Build the label-value key, validating label names."""
+        if set(labels) != set(self.label_names):
+            raise ValueError(
+                f"Metric {self.name} expects labels {list(self.label_names)}, got {sorted(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def _header(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.metric_type}",
+        ]
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter."""
+
+    metric_type = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        super().__init__(name, documentation, label_names)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        """Increment the counter."""
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, **labels: Any) -> float:
+        """Get the current value for a label set."""
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def collect(self) -> Dict[LabelValues, float]:
+        """Return a copy of all values."""
+        with self._lock:
+            return dict(self._values)
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        for key, value in sorted(self.collect().items()):
+            lines.append(f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}")
+        return lines
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    metric_type = "gauge"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        super().__init__(name, documentation, label_names)
+        self._values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: Any) -> None:
+        """Set the gauge value."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        """Increment the gauge."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        """Decrement the gauge."""
+        self.inc(-amount, **labels)
+
+    def get(self, **labels: Any) -> float:
+        """Get the current value for a label set."""
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def collect(self) -> Dict[LabelValues, float]:
+        """Return a copy of all values."""
+        with self._lock:
+            return dict(self._values)
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        for key, value in sorted(self.collect().items()):
+            lines.append(f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}")
+        return lines
+
+
+class _HistogramSeries:
+    """Bucket counts and a reservoir of recent samples for one label set."""
+
+    def __init__(self, bucket_count: int, reservoir_size: int):
+        self.bucket_counts = [0] * bucket_count
+        self.count = 0
+        self.sum = 0.0
+        self.recent: Deque[float] = deque(maxlen=reservoir_size)
+
+
+class Histogram(_Metric):
+    """Distribution of observations with cumulative buckets and quantiles.
+
+    Buckets follow Prometheus semantics. Quantiles (p50/p95/p99) are computed
+    from a bounded reservoir of the most recent observations, so they reflect
+    recent behaviour rather than the whole process lifetime.
+    """
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS_MS,
+        reservoir_size: int = DEFAULT_RESERVOIR_SIZE,
+    ):
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+        self.reservoir_size = reservoir_size
+        self._series: Dict[LabelValues, _HistogramSeries] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        """Record an observation."""
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = _HistogramSeries(len(self.buckets), self.reservoir_size)
+                self._series[key] = series
+            index = bisect.bisect_left(self.buckets, value)
+            if index < len(self.buckets):
+                series.bucket_counts[index] += 1
+            series.count += 1
+            series.sum += value
+            series.recent.append(value)
+
+    def quantiles(
+        self, qs: Sequence[float] = (0.5, 0.95, 0.99), **labels: Any
+    ) -> Dict[str, Optional[float]]:
+        """Compute quantiles over recent observations (nearest-rank).
+
+        Returns:
+            Mapping like ``{"p50": 1.2, "p95": 8.0, "p99": 12.5}``
+        """
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            samples = sorted(series.recent) if series else []
+        return {f"p{int(q * 100)}": _nearest_rank(samples, q) for q in qs}
+
+    def summary(self, **labels: Any) -> Dict[str, Any]:
+        """Get count, sum, mean and p50/p95/p99 for a label set."""
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                return {"count": 0, "sum": 0.0, "mean": None, "p50": None, "p95": None, "p99": None}
+            count, total = series.count, series.sum
+            samples = sorted(series.recent)
+        result: Dict[str, Any] = {
+            "count": count,
+            "sum": round(total, 3),
+            "mean": round(total / count, 3) if count else None,
+        }
+        for q in (0.5, 0.95, 0.99):
+            value = _nearest_rank(samples, q)
+            result[f"p{int(q * 100)}"] = round(value, 3) if value is not None else None
+        return result
+
+    def label_sets(self) -> List[Dict[str, str]]:
+        """List the label sets that have observations."""
+        with self._lock:
+            keys = list(self._series.keys())
+        return [dict(zip(self.label_names, key)) for key in keys]
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        with self._lock:
+            items = sorted(
+                (key, list(s.bucket_counts), s.count, s.sum) for key, s in self._series.items()
+            )
+        for key, bucket_counts, count, total in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, bucket_counts):
+                cumulative += bucket_count
+                labels = _format_labels(self.label_names, key, le=_format_value(bound))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.label_names, key, le="+Inf")
+            lines.append(f"{self.name}_bucket{labels} {count}")
+            plain = _format_labels(self.label_names, key)
+            lines.append(f"{self.name}_sum{plain} {_format_value(total)}")
+            lines.append(f"{self.name}_count{plain} {count}")
+        return lines
+
+
+def _nearest_rank(sorted_samples: List[float], q: float) -> Optional[float]:
+    """Nearest-rank quantile of an already sorted list."""
+    if not sorted_samples:
+        return None
+    rank = max(1, math.ceil(q * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+class MetricsRegistry:
+    """Collection of named metrics.
+
+    Metric constructors are idempotent: asking for an existing name returns
+    the registered instance, so modules can declare their metrics at import
+    time without coordinating.
+
+    Example:
+        >>> registry = MetricsRegistry()
+        >>> calls = registry.counter("calls_total", "Calls", ["tool"])
+        >>> calls.inc(tool="query_agents")
+        >>> print(registry.render_prometheus())
+    """
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls: type, name: str, *args: Any, **kwargs: Any) -> Any:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = cls(name, *args, **kwargs)
+                self._metrics[name] = metric
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric {name} already registered as {metric.metric_type}")
+            return metric
+
+    def counter(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Counter:
+        """Get or create a counter."""
+        return self._get_or_create(Counter, name, documentation, label_names)
+
+    def gauge(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Gauge:
+        """Get or create a gauge."""
+        return self._get_or_create(Gauge, name, documentation, label_names)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS_MS,
+    ) -> Histogram:
+        """Get or create a histogram."""
+        return self._get_or_create(Histogram, name, documentation, label_names, buckets=buckets)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        """Look up a metric by name."""
+        with self._lock:
+            return self._metrics.get(name)
+
+    def render_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        with self._lock:
+            metrics = [self._metrics[name] for name in sorted(self._metrics)]
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return all metrics as a JSON-serializable dictionary.
+
+        Counters and gauges map label values to numbers; histograms map label
+        values to count/sum/mean/p50/p95/p99 summaries.
+        """
+        with self._lock:
+            metrics = dict(self._metrics)
+
+        result: Dict[str, Any] = {}
+        for name, metric in sorted(metrics.items()):
+            if isinstance(metric, Histogram):
+                result[name] = {
+                    ",".join(labels.values()) or "_": metric.summary(**labels)
+                    for labels in metric.label_sets()
+                }
+            else:
+                result[name] = {
+                    ",".join(key) or "_": value for key, value in metric.collect().items()
+                }
+        return result
+
+    def clear(self) -> None:
+        """Remove all registered metrics (mainly for tests)."""
+        with self._lock:
+            self._metrics.clear()
+
+
+# Process-wide default registry
+REGISTRY = MetricsRegistry()
+
+# Tool metrics
+TOOL_CALLS = REGISTRY.counter(
+    "mcp_tool_calls_total", "Tool invocations by outcome", ["tool", "status"]
+)
+TOOL_ERRORS = REGISTRY.counter(
+    "mcp_tool_errors_total", "Tool errors by error type", ["tool", "error_type"]
+)
+TOOL_LATENCY = REGISTRY.histogram(
+    "mcp_tool_duration_ms", "Tool execution latency in milliseconds (cache misses)", ["tool"]
+)
+
+# Database metrics
+DB_CHECKOUTS = REGISTRY.counter(
+    "mcp_db_connection_checkouts_total", "Connections checked out of the pool"
+)
+DB_CONNECTIONS_IN_USE = REGISTRY.gauge(
+    "mcp_db_connections_in_use", "Connections currently checked out of the pool"
+)
+DB_POOL_SIZE = REGISTRY.gauge("mcp_db_pool_size", "Configured connection pool size")
+
+# Cache metrics
+CACHE_REQUESTS = REGISTRY.counter(
+    "mcp_cache_requests_total", "Cache lookups by result", ["backend", "result"]
+)
+CACHE_SETS = REGISTRY.counter("mcp_cache_sets_total", "Cache writes", ["backend"])
+CACHE_ENTRIES = REGISTRY.gauge("mcp_cache_entries", "Entries in the cache", ["backend"])
+
+
+def tool_latency_summary(tool: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """Per-tool latency summaries (count, mean, p50/p95/p99).
+
+    Args:
+        tool: Optional tool name to restrict the summary to
+
+    Returns:
+        Mapping of tool name to latency summary
+    """
+    tools = [tool] if tool else sorted(labels["tool"] for labels in TOOL_LATENCY.label_sets())
+    return {name: TOOL_LATENCY.summary(tool=name) for name in tools}
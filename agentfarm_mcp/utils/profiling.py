@@ -0,0 +1,170 @@
+"""On-demand profiling of tool executions.
+
+Profiling wraps a tool's ``execute`` in ``cProfile`` and reduces the raw
+statistics to a compact report: the top hotspots plus the self time split
+into SQL, ORM materialization, NumPy/pandas computation, serialization,
+tool code and everything else.
+"""
+
+import cProfile
+import pstats
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from structlog import get_logger
+
+from . import serialization
+
+logger = get_logger(__name__)
+
+CATEGORIES = ("sql", "orm", "numpy", "serialization", "tool", "other")
+
+# Ordered (category, substrings) rules matched against "<file> <function>".
+# Order matters: driver-level SQLAlchemy modules are SQL time, the rest of
+# SQLAlchemy (ORM loading, statement compilation) is materialization.
+_CATEGORY_RULES: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    (
+        "sql",
+        (
+            "sqlite3",
+            "psycopg",
+            "sqlalchemy/engine/",
+            "sqlalchemy/pool/",
+            "sqlalchemy/dialects/",
+        ),
+    ),
+    ("orm", ("sqlalchemy/",)),
+    ("numpy", ("numpy", "pandas/")),
+    ("serialization", ("/json/", "_json", "orjson", "pydantic")),
+    ("tool", ("agentfarm_mcp/",)),
+)
+
+
+def categorize(filename: str, function: str) -> str:
+    """Assign a profiled function to a time category.
+
+    Args:
+        filename: Source file reported by cProfile (``~`` for builtins)
+        function: Function name reported by cProfile
+
+    Returns:
+        One of ``CATEGORIES``
+    """
+    location = filename.replace("\\", "/") + " " + function
+    for category, needles in _CATEGORY_RULES:
+        if any(needle in location for needle in needles):
+            return category
+    return "other"
+
+
+class ToolProfiler:
+    """Deterministic profiler producing hotspot reports for tool calls."""
+
+    def __init__(
+        self,
+        always: bool = False,
+        allow_per_call: bool = False,
+        top_n: int = 15,
+        output_dir: Optional[str] = None,
+    ):
+        """Initialize profiler.
+
+        Args:
+            always: Profile every executed (non-cached) tool call
+            allow_per_call: Honour the ``_profile`` call parameter
+            top_n: Number of hotspots to report
+            output_dir: Optional directory where raw ``.prof`` files are stored
+        """
+        self.always = always
+        self.allow_per_call = allow_per_call
+        self.top_n = top_n
+        self.output_dir = Path(output_dir) if output_dir else None
+
+    def profile(self, tool_name: str, func: Callable[[], Any]) -> Tuple[Any, Dict[str, Any]]:
+        """Run ``func`` under the profiler.
+
+        The result is also serialized to JSON inside the profiled region so
+        that serialization cost shows up in the report.
+
+        Args:
+            tool_name: Tool being profiled (used for stored file names)
+            func: Zero-argument callable to profile
+
+        Returns:
+            Tuple of (func result, profile report)
+        """
+        profiler = cProfile.Profile()
+        start = time.perf_counter()
+        profiler.enable()
+        try:
+            result = func()
+            serialization.dumps(result)
+        finally:
+            profiler.disable()
+        total_ms = (time.perf_counter() - start) * 1000
+
+        stats = pstats.Stats(profiler)
+        report = self._build_report(stats, total_ms)
+
+        if self.output_dir is not None:
+            report["profile_path"] = self._store(stats, tool_name)
+
+        logger.info(
+            "tool_profiled",
+            tool=tool_name,
+            total_ms=report["total_ms"],
+            breakdown_ms=report["breakdown_ms"],
+        )
+        return result, report
+
+    def _build_report(self, stats: pstats.Stats, total_ms: float) -> Dict[str, Any]:
+        """Reduce raw profiler statistics to a report.
+
+        Args:
+            stats: Collected statistics
+            total_ms: Wall time of the profiled region
+
+        Returns:
+            Report with total time, per-category breakdown and hotspots
+        """
+        breakdown = dict.fromkeys(CATEGORIES, 0.0)
+        entries: List[Dict[str, Any]] = []
+
+        for (filename, lineno, function), (_, ncalls, tottime, cumtime, _) in stats.stats.items():
+            category = categorize(filename, function)
+            breakdown[category] += tottime * 1000
+            entries.append(
+                {
+                    "function": pstats.func_std_string((filename, lineno, function)),
+                    "category": category,
+                    "calls": ncalls,
+                    "self_ms": round(tottime * 1000, 3),
+                    "cumulative_ms": round(cumtime * 1000, 3),
+                }
+            )
+
+        entries.sort(key=lambda entry: entry["self_ms"], reverse=True)
+
+        return {
+            "total_ms": round(total_ms, 3),
+            "breakdown_ms": {category: round(ms, 3) for category, ms in breakdown.items()},
+            "hotspots": entries[: self.top_n],
+        }
+
+    def _store(self, stats: pstats.Stats, tool_name: str) -> str:
+        """Dump raw statistics for offline analysis (e.g. snakeviz).
+
+        Args:
+            stats: Collected statistics
+            tool_name: Tool being profiled
+
+        Returns:
+            Path of the written file
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%dT%H%M%S%f")
+        path = self.output_dir / f"{tool_name}-{timestamp}.prof"
+        stats.dump_stats(str(path))
+        return str(path)
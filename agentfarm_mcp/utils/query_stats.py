@@ -0,0 +1,79 @@
+"""Per-invocation SQL statistics.
+
+A ``QueryStats`` collector is bound to the current context for the duration
+of a tool call. SQLAlchemy event listeners registered by ``DatabaseService``
+record every statement, its duration and the rows it returned into the
+active collector, which makes N+1 query patterns visible in tool responses.
+"""
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional
+
+_current_stats: ContextVar[Optional["QueryStats"]] = ContextVar("query_stats", default=None)
+
+
+class QueryStats:
+    """Statement count, rows fetched and database time for one tool call."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.statements = 0
+        self.rows_fetched = 0
+        self.db_time_ms = 0.0
+        self.slow_statements = 0
+
+    def record_statement(self, duration_ms: float, slow: bool = False) -> None:
+        """Record one executed statement.
+
+        Args:
+            duration_ms: Time spent in the database driver, in milliseconds
+            slow: Whether the statement exceeded the slow query threshold
+        """
+        with self._lock:
+            self.statements += 1
+            self.db_time_ms += duration_ms
+            if slow:
+                self.slow_statements += 1
+
+    def record_rows(self, count: int) -> None:
+        """Record rows returned by a statement.
+
+        Args:
+            count: Number of rows fetched
+        """
+        with self._lock:
+            self.rows_fetched += count
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Convert statistics to a response-friendly dictionary."""
+        with self._lock:
+            return {
+                "statements": self.statements,
+                "rows_fetched": self.rows_fetched,
+                "db_time_ms": round(self.db_time_ms, 3),
+                "slow_statements": self.slow_statements,
+            }
+
+
+def current_stats() -> Optional[QueryStats]:
+    """Get the collector bound to the current context, if any."""
+    return _current_stats.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Bind a fresh ``QueryStats`` collector to the current context.
+
+    Example:
+        >>> with track_queries() as stats:
+        ...     db_service.execute_query(my_query)
+        >>> print(stats.statements)
+    """
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
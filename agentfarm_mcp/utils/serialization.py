@@ -0,0 +1,115 @@
+"""Fast JSON serialization helpers.
+
+Uses ``orjson`` when it is installed (``pip install mcp-simulation-server[fast]``)
+and falls back to the standard library otherwise. Output is compact UTF-8
+JSON in both cases; values the encoder does not know are converted with
+``str``, matching the previous ``json.dumps(..., default=str)`` behaviour.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson installed
+    orjson = None
+
+if orjson is not None:
+    _DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    _KEY_OPTIONS = _DUMPS_OPTIONS | orjson.OPT_SORT_KEYS
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode an object as compact JSON.
+
+    Args:
+        obj: Object to encode
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if isinstance(obj, PreEncoded):
+        return obj.encoded()
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=_DUMPS_OPTIONS)
+    return json.dumps(obj, default=str, separators=(",", ":")).encode()
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode JSON.
+
+    Args:
+        data: JSON bytes or text
+
+    Returns:
+        Decoded object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def hash_key(tool_name: str, params: Dict[str, Any]) -> str:
+    """Build a stable cache key from a tool name and its parameters.
+
+    Args:
+        tool_name: Name of the tool
+        params: Tool parameters (order-insensitive)
+
+    Returns:
+        Cache key ``"<tool_name>:<hex digest>"``
+    """
+    if orjson is not None:
+        payload = orjson.dumps(params, default=str, option=_KEY_OPTIONS)
+    else:
+        payload = json.dumps(params, sort_keys=True, default=str).encode()
+    return f"{tool_name}:{hashlib.blake2b(payload, digest_size=16).hexdigest()}"
+
+
+class PreEncoded(dict):
+    """Dictionary that memoizes its own JSON encoding.
+
+    Cached tool results are wrapped in this type so that the JSON text is
+    produced once and reused for every cache hit. Instances must be treated
+    as immutable once encoded.
+    """
+
+    __slots__ = ("_encoded",)
+
+    def __init__(self, *args: Any, encoded: Optional[bytes] = None, **kwargs: Any) -> None:
+        """Initialize dictionary.
+
+        Args:
+            *args: Positional arguments for ``dict``
+            encoded: Known JSON encoding of the contents, if any
+            **kwargs: Keyword arguments for ``dict``
+        """
+        super().__init__(*args, **kwargs)
+        self._encoded = encoded
+
+    def encoded(self) -> bytes:
+        """Get the JSON encoding, computing it on first use."""
+        if self._encoded is None:
+            if orjson is not None:
+                self._encoded = orjson.dumps(self, default=str, option=_DUMPS_OPTIONS)
+            else:
+                self._encoded = json.dumps(self, default=str, separators=(",", ":")).encode()
+        return self._encoded
+
+
+def encode_response(response: Dict[str, Any]) -> bytes:
+    """Encode a tool response, splicing in pre-encoded data without re-encoding.
+
+    Args:
+        response: Response produced by ``ToolBase``
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    data = response.get("data")
+    if not isinstance(data, PreEncoded) or len(response) < 2:
+        return dumps(response)
+
+    envelope = dumps({key: value for key, value in response.items() if key != "data"})
+    return b'{"data":' + data.encoded() + b"," + envelope[1:]
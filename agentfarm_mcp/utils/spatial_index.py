@@ -0,0 +1,188 @@
+"""Uniform-grid spatial index over 2D points.
+
+Points are bucketed into square cells and sorted by row-major cell id, so all
+cells of one grid row in a query window form a single contiguous slice of the
+sorted points. Bounding-box and radius queries only look at the points of the
+covered cells; k-nearest queries grow a square window of cells around the
+query point until the k-th distance found is inside the searched area.
+
+Building the index is one ``argsort`` (O(n log n)); queries cost
+O(cells in window + candidates) instead of a scan over every point.
+"""
+
+import math
+from typing import TYPE_CHECKING, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Cells are sized so that each holds about this many points on average
+POINTS_PER_CELL = 4
+
+
+class GridIndex:
+    """Static spatial index over (x, y) points.
+
+    Query results are indexes into the ``x``/``y`` sequences the index was
+    built from. Points with a missing (None/NaN) coordinate are never returned.
+
+    Example:
+        >>> index = GridIndex(xs, ys)
+        >>> inside = index.bbox(0, 0, 10, 10)
+        >>> nearby, distances = index.radius(5.0, 5.0, 2.5)
+        >>> closest, distances = index.nearest(5.0, 5.0, k=3)
+    """
+
+    def __init__(
+        self, x: Sequence[float], y: Sequence[float], cell_size: Optional[float] = None
+    ) -> None:
+        """Build the index.
+
+        Args:
+            x: X coordinates
+            y: Y coordinates
+            cell_size: Cell edge length (default: sized for ``POINTS_PER_CELL``)
+        """
+        import numpy as np
+
+        xs = np.asarray(x, dtype=float)
+        ys = np.asarray(y, dtype=float)
+        valid = np.flatnonzero(~(np.isnan(xs) | np.isnan(ys)))
+        self.size = len(xs)
+        self._ids = valid
+        self._xs = xs[valid]
+        self._ys = ys[valid]
+
+        if len(valid) == 0:
+            self.min_x = self.min_y = 0.0
+            self.cell_size = cell_size or 1.0
+            self.columns = self.rows = 1
+            self._keys = np.empty(0, dtype=np.int64)
+            return
+
+        self.min_x, self.min_y = float(self._xs.min()), float(self._ys.min())
+        width = float(self._xs.max()) - self.min_x
+        height = float(self._ys.max()) - self.min_y
+        if cell_size is None:
+            area = max(width, 1e-9) * max(height, 1e-9)
+            cell_size = math.sqrt(area * POINTS_PER_CELL / len(valid))
+            cell_size = max(cell_size, max(width, height) / 4096, 1e-9)
+        self.cell_size = float(cell_size)
+        self.columns = int(width // self.cell_size) + 1
+        self.rows = int(height // self.cell_size) + 1
+
+        cx, cy = self._cell_coords(self._xs, self._ys)
+        keys = cy * self.columns + cx
+        order = np.argsort(keys, kind="stable")
+        self._keys = keys[order]
+        self._ids = self._ids[order]
+        self._xs = self._xs[order]
+        self._ys = self._ys[order]
+
+    def __len__(self) -> int:
+        """Number of indexed (non-missing) points."""
+        return len(self._keys)
+
+    def bbox(self, min_x: float, min_y: float, max_x: float, max_y: float) -> "np.ndarray":
+        """Find the points inside a bounding box (edges included).
+
+        Returns:
+            Point indexes in ascending order
+        """
+        import numpy as np
+
+        candidates = self._window(
+            *self._cell_coords(min_x, min_y), *self._cell_coords(max_x, max_y)
+        )
+        xs, ys = self._xs[candidates], self._ys[candidates]
+        inside = (xs >= min_x) & (xs <= max_x) & (ys >= min_y) & (ys <= max_y)
+        return np.sort(self._ids[candidates[inside]])
+
+    def radius(self, x: float, y: float, radius: float) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Find the points within ``radius`` of (x, y).
+
+        Returns:
+            (point indexes, distances), nearest first
+        """
+        import numpy as np
+
+        candidates = self._window(
+            *self._cell_coords(x - radius, y - radius), *self._cell_coords(x + radius, y + radius)
+        )
+        distances = np.hypot(self._xs[candidates] - x, self._ys[candidates] - y)
+        inside = distances <= radius
+        return self._by_distance(candidates[inside], distances[inside])
+
+    def nearest(self, x: float, y: float, k: int) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Find the ``k`` points nearest to (x, y).
+
+        Returns:
+            (point indexes, distances), nearest first; fewer than ``k`` when
+            the index holds fewer points
+        """
+        import numpy as np
+
+        k = min(k, len(self))
+        if k <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+
+        cx, cy = self._cell_coords(x, y)
+        ring = 0
+        while True:
+            x0, x1 = max(cx - ring, 0), min(cx + ring, self.columns - 1)
+            y0, y1 = max(cy - ring, 0), min(cy + ring, self.rows - 1)
+            candidates = self._window(x0, y0, x1, y1)
+            whole_grid = x0 == 0 and y0 == 0 and x1 == self.columns - 1 and y1 == self.rows - 1
+            if len(candidates) >= k:
+                distances = np.hypot(self._xs[candidates] - x, self._ys[candidates] - y)
+                kth = np.partition(distances, k - 1)[k - 1]
+                # Points outside the window are at least `covered` away
+                if whole_grid or kth <= self._covered_distance(x, y, x0, y0, x1, y1):
+                    nearest = np.argsort(distances, kind="stable")[:k]
+                    return self._ids[candidates[nearest]], distances[nearest]
+            ring += 1
+
+    def _cell_coords(self, x, y):
+        """Clamped cell column/row of coordinates (scalars or arrays)."""
+        import numpy as np
+
+        cx = np.clip(np.floor((np.asarray(x) - self.min_x) / self.cell_size), 0, self.columns - 1)
+        cy = np.clip(np.floor((np.asarray(y) - self.min_y) / self.cell_size), 0, self.rows - 1)
+        if np.ndim(cx) == 0:
+            return int(cx), int(cy)
+        return cx.astype(np.int64), cy.astype(np.int64)
+
+    def _window(self, x0: int, y0: int, x1: int, y1: int) -> "np.ndarray":
+        """Sorted-array positions of the points in cells [x0, x1] x [y0, y1]."""
+        import numpy as np
+
+        if not len(self) or x0 > x1 or y0 > y1:
+            return np.empty(0, dtype=np.int64)
+        row_starts = np.arange(y0, y1 + 1, dtype=np.int64) * self.columns
+        lo = np.searchsorted(self._keys, row_starts + x0, side="left")
+        hi = np.searchsorted(self._keys, row_starts + x1, side="right")
+        if len(lo) == 1:
+            return np.arange(lo[0], hi[0])
+        return np.concatenate([np.arange(start, end) for start, end in zip(lo, hi)])
+
+    def _covered_distance(self, x: float, y: float, x0: int, y0: int, x1: int, y1: int) -> float:
+        """Distance from (x, y) to the nearest window edge that has cells beyond it."""
+        edges = []
+        if x0 > 0:
+            edges.append(x - (self.min_x + x0 * self.cell_size))
+        if x1 < self.columns - 1:
+            edges.append(self.min_x + (x1 + 1) * self.cell_size - x)
+        if y0 > 0:
+            edges.append(y - (self.min_y + y0 * self.cell_size))
+        if y1 < self.rows - 1:
+            edges.append(self.min_y + (y1 + 1) * self.cell_size - y)
+        return min(edges) if edges else math.inf
+
+    def _by_distance(
+        self, positions: "np.ndarray", distances: "np.ndarray"
+    ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Point indexes and distances ordered nearest first."""
+        import numpy as np
+
+        order = np.argsort(distances, kind="stable")
+        return self._ids[positions[order]], distances[order]
@@ -0,0 +1,123 @@
+"""Run-length encoding of trajectory columns.
+
+Agent trajectories change slowly: positions stay put or move at a constant
+speed, counters grow by one per step and flags rarely flip. Each column is
+stored as runs of ``[start, delta, count]`` meaning the values
+``start, start + delta, ..., start + (count - 1) * delta``, so a constant or
+linearly changing stretch costs three numbers regardless of its length::
+
+    [5.0, 5.0, 5.0, 6.0, 7.0, 8.0]  ->  [[5.0, 0, 3], [6.0, 1.0, 3]]
+
+Encoding is lossless: a value joins a run only if ``start + i * delta``
+reproduces it exactly. Non-numeric values (strings, booleans, None) only form
+constant runs (``delta`` 0).
+"""
+
+import math
+from typing import Any, Dict, List
+
+from .columnar import from_columnar
+
+
+def _is_number(value: Any) -> bool:
+    """Whether a value can be part of a linear run."""
+    return (
+        isinstance(value, (int, float))
+        and not isinstance(value, bool)
+        and math.isfinite(value)
+    )
+
+
+def _same(value: Any, expected: Any) -> bool:
+    """Exact equality that does not conflate True/1/1.0."""
+    return type(value) is type(expected) and value == expected
+
+
+def encode_runs(values: List[Any]) -> List[List[Any]]:
+    """Encode a column as ``[start, delta, count]`` runs.
+
+    Args:
+        values: Column values
+
+    Returns:
+        List of runs; ``decode_runs`` restores the exact values
+
+    Example:
+        >>> encode_runs([0, 10, 20, 30, 30, 30])
+        [[0, 10, 4], [30, 0, 2]]
+    """
+    runs: List[List[Any]] = []
+    i, n = 0, len(values)
+    while i < n:
+        start = values[i]
+        delta: Any = 0
+        if (
+            i + 1 < n
+            and _is_number(start)
+            and _is_number(values[i + 1])
+            and type(start) is type(values[i + 1])
+        ):
+            candidate = values[i + 1] - start
+            if candidate and _same(values[i + 1], start + candidate):
+                delta = candidate
+
+        count = 1
+        if delta:
+            while i + count < n and _same(values[i + count], start + count * delta):
+                count += 1
+        else:
+            while i + count < n and _same(values[i + count], start):
+                count += 1
+
+        # A two-value linear run is no smaller than two constant runs; keep the
+        # second value free to start a longer run
+        if delta and count == 2:
+            count = 1
+            delta = 0
+        runs.append([start, delta, count])
+        i += count
+    return runs
+
+
+def decode_runs(runs: List[List[Any]]) -> List[Any]:
+    """Decode runs produced by ``encode_runs``.
+
+    Args:
+        runs: ``[start, delta, count]`` runs
+
+    Returns:
+        Column values
+    """
+    values: List[Any] = []
+    for start, delta, count in runs:
+        if delta:
+            values.extend(start + i * delta for i in range(count))
+        else:
+            values.extend([start] * count)
+    return values
+
+
+def decode_trajectory(trajectory: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Decode a run-encoded trajectory into row dictionaries.
+
+    Args:
+        trajectory: Columns of runs as returned by ``query_states`` with
+            ``trajectory=True``; nested groups such as ``position`` are allowed
+
+    Returns:
+        One dictionary per state, in step order
+
+    Example:
+        >>> result = query_states(simulation_id="sim_001", agent_id="agent_7", trajectory=True)
+        >>> states = decode_trajectory(result["data"]["trajectory"])
+        >>> states[0]["position"]["x"]
+        12.5
+    """
+
+    def decode(columns: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            name: decode(column) if isinstance(column, dict) else decode_runs(column)
+            for name, column in columns.items()
+        }
+
+    return from_columnar(decode(trajectory))
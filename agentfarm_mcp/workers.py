@@ -0,0 +1,187 @@
+"""Pre-forked multi-process serving for the HTTP transport.
+
+A single process is bounded by one core for CPU-heavy work (NumPy analysis,
+JSON encoding). ``serve_workers`` builds the server once in a supervisor
+process (imports, tool registration, service construction), binds the
+listening socket and then forks worker processes that share that warmed-up
+memory copy-on-write and accept connections from the same socket.
+
+Workers run the streamable HTTP transport in stateless mode, so any worker
+can serve any request. SSE sessions are bound to the process that opened
+them and are therefore limited to a single worker. Caches are only shared
+between workers with the Redis backend; the in-memory cache is per worker.
+"""
+
+import gc
+import os
+import signal
+import socket
+import time
+from typing import TYPE_CHECKING
+
+from structlog import get_logger
+
+if TYPE_CHECKING:
+    from .server import SimulationMCPServer
+
+logger = get_logger(__name__)
+
+# Transports that can be served by several processes
+MULTI_WORKER_TRANSPORTS = ("http", "streamable-http")
+
+# Workers dying sooner than this after start are treated as a startup failure
+MIN_WORKER_UPTIME_S = 1.0
+
+
+def bind_socket(host: str, port: int, backlog: int = 2048) -> socket.socket:
+    """Bind the listening socket shared by all workers.
+
+    Args:
+        host: Bind host
+        port: Bind port
+        backlog: Listen backlog
+
+    Returns:
+        Bound, listening, inheritable socket
+    """
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def serve_workers(
+    server: "SimulationMCPServer",
+    workers: int,
+    transport: str = "http",
+    host: str = "127.0.0.1",
+    port: int = 8000,
+) -> None:
+    """Serve the MCP server from pre-forked worker processes.
+
+    Blocks until SIGINT/SIGTERM, which is forwarded to the workers. Workers
+    that exit unexpectedly are restarted.
+
+    Args:
+        server: Fully constructed server (warm-up happens before forking)
+        workers: Number of worker processes
+        transport: MCP transport; must be one of ``MULTI_WORKER_TRANSPORTS``
+        host: Bind host
+        port: Bind port
+
+    Raises:
+        ValueError: If the transport cannot be served by several processes
+        RuntimeError: If the platform does not support ``fork``
+    """
+    if transport not in MULTI_WORKER_TRANSPORTS:
+        raise ValueError(
+            f"Transport {transport!r} cannot run with multiple workers; use 'http' "
+            "(SSE sessions are bound to the process that opened them)"
+        )
+    if not hasattr(os, "fork"):
+        raise RuntimeError("Multiple workers require a platform with os.fork()")
+
+    cache = server.config.cache
+    if cache.enabled and cache.backend != "redis":
+        logger.warning(
+            "workers_cache_not_shared",
+            backend=cache.backend,
+            hint="use the redis cache backend to share cached results between workers",
+        )
+
+    sock = bind_socket(host, port)
+
+    # Tools load on first call; load them all once here so workers share the modules
+    server.load_tools()
+
+    # Forked children must not reuse the parent's pooled database connections
+    server.db_service.reset_pool()
+    # Keep objects created during warm-up out of GC passes so their pages stay shared
+    gc.freeze()
+
+    children: dict[int, tuple[int, float]] = {}
+    stopping = False
+
+    def spawn(index: int) -> None:
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 0
+            try:
+                _run_worker(server, sock, transport, index)
+            except BaseException as exc:  # noqa: BLE001 - the child must always exit here
+                logger.error("worker_failed", worker=index, error=str(exc), exc_info=exc)
+                exit_code = 1
+            finally:
+                os._exit(exit_code)
+        children[pid] = (index, time.monotonic())
+
+    def stop(signum, frame) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    previous_handlers = {
+        signum: signal.signal(signum, stop) for signum in (signal.SIGINT, signal.SIGTERM)
+    }
+
+    logger.info("workers_starting", workers=workers, transport=transport, host=host, port=port)
+    try:
+        for index in range(workers):
+            spawn(index)
+
+        while children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+
+            index, started = children.pop(pid, (None, 0.0))
+            if index is None or stopping:
+                continue
+
+            exit_code = os.waitstatus_to_exitcode(status)
+            if time.monotonic() - started < MIN_WORKER_UPTIME_S:
+                logger.error("worker_startup_failed", worker=index, exit_code=exit_code)
+                stop(signal.SIGTERM, None)
+                continue
+
+            logger.warning("worker_restarting", worker=index, exit_code=exit_code)
+            spawn(index)
+    finally:
+        for signum, handler in previous_handlers.items():
+            signal.signal(signum, handler)
+        sock.close()
+        logger.info("workers_stopped")
+
+
+def _run_worker(
+    server: "SimulationMCPServer", sock: socket.socket, transport: str, index: int
+) -> None:
+    """Run one worker's HTTP server on the shared socket.
+
+    Args:
+        server: Server inherited from the supervisor
+        sock: Shared listening socket
+        transport: MCP transport
+        index: Worker index (for logging)
+    """
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, signal.SIG_DFL)
+
+    host, port = sock.getsockname()[:2]
+    logger.info("worker_started", worker=index, pid=os.getpid())
+    server.run(
+        transport=transport,
+        host=host,
+        port=port,
+        sockets=[sock],
+        stateless_http=True,
+        show_banner=False,
+    )
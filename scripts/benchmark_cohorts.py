@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Benchmark cohort survival statistics.
+
+Compares the database-side aggregation of ``utils.cohorts`` (one GROUP BY
+plus a streamed lifespan column per cohort) against loading every agent row
+and grouping in Python, as analyze_survival_rates and compare_generations
+used to. Reports wall time and peak Python memory (tracemalloc) of each.
+Pass ``--generate N`` to run against a synthetic database with N agents.
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Tuple
+
+import numpy as np
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from agentfarm_mcp.config import DatabaseConfig
+from agentfarm_mcp.models.database_models import AgentModel, Base, Simulation
+from agentfarm_mcp.services.database_service import DatabaseService
+from agentfarm_mcp.utils.cohorts import cohort_statistics
+
+
+def generate_database(path: str, simulation_id: str, agents: int) -> None:
+    """Write a synthetic database with ``agents`` agents over 50 generations.
+
+    Args:
+        path: SQLite file to create
+        simulation_id: Simulation ID of the generated agents
+        agents: Number of agents to generate
+    """
+    rng = random.Random(42)
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(
+        Simulation(
+            simulation_id=simulation_id,
+            status="completed",
+            parameters={},
+            simulation_db_path=path,
+        )
+    )
+    session.commit()
+
+    for start in range(0, agents, 50000):
+        rows = []
+        for i in range(start, min(start + 50000, agents)):
+            birth = rng.randrange(10000)
+            rows.append(
+                {
+                    "simulation_id": simulation_id,
+                    "agent_id": f"agent_{i:08d}",
+                    "agent_type": rng.choice(["system", "independent", "control"]),
+                    "generation": i * 50 // agents,
+                    "birth_time": birth,
+                    "death_time": birth + rng.randrange(1, 500) if rng.random() < 0.8 else None,
+                }
+            )
+        session.execute(insert(AgentModel), rows)
+        session.commit()
+    session.close()
+    engine.dispose()
+
+
+def load_all_rows(session, simulation_id: str, group_by: str) -> Dict[Any, Dict[str, Any]]:
+    """Group agents the way the tools did before: every row loaded into Python."""
+    groups: Dict[Any, Dict[str, Any]] = {}
+    agents = session.query(AgentModel).filter(AgentModel.simulation_id == simulation_id).all()
+    for agent in agents:
+        key = getattr(agent, group_by)
+        group = groups.setdefault(key, {"alive": 0, "dead": 0, "lifespans": []})
+        if agent.death_time is None:
+            group["alive"] += 1
+        else:
+            group["dead"] += 1
+            group["lifespans"].append(agent.death_time - agent.birth_time)
+    return {
+        key: {
+            "alive": group["alive"],
+            "dead": group["dead"],
+            "lifespan_mean": float(np.mean(group["lifespans"])) if group["lifespans"] else None,
+            "lifespan_median": (
+                float(np.median(group["lifespans"])) if group["lifespans"] else None
+            ),
+        }
+        for key, group in groups.items()
+    }
+
+
+def measure(
+    db_service: DatabaseService, func: Callable[[Any], Any]
+) -> Tuple[Any, float, float]:
+    """Run ``func`` in a session; return its result, seconds and peak MB.
+
+    Time and memory come from separate runs, as tracing slows allocation down.
+    """
+    db_service.execute_query(func)  # warm the page cache
+    start = time.perf_counter()
+    result = db_service.execute_query(func)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    db_service.execute_query(func)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / 1e6
+
+
+def main() -> None:
+    """Main benchmark execution."""
+    parser = argparse.ArgumentParser(description="Benchmark cohort survival statistics")
+    parser.add_argument("--db", help="Database path (omit with --generate)")
+    parser.add_argument("--simulation-id", default="bench_sim", help="Simulation to analyze")
+    parser.add_argument(
+        "--generate", type=int, metavar="N", help="Generate a synthetic database with N agents"
+    )
+    parser.add_argument(
+        "--group-by", choices=["generation", "agent_type"], default="generation"
+    )
+    args = parser.parse_args()
+
+    db_path = args.db
+    if args.generate:
+        db_path = os.path.join(tempfile.mkdtemp(prefix="cohort_bench_"), "bench.db")
+        print(f"Generating {args.generate} agents in {db_path} ...")
+        generate_database(db_path, args.simulation_id, args.generate)
+    if not db_path:
+        parser.error("pass --db or --generate")
+
+    db_service = DatabaseService(DatabaseConfig(path=db_path, read_only=True))
+    sql_result, sql_seconds, sql_mb = measure(
+        db_service, lambda session: cohort_statistics(session, args.simulation_id, args.group_by)
+    )
+    rows_result, rows_seconds, rows_mb = measure(
+        db_service, lambda session: load_all_rows(session, args.simulation_id, args.group_by)
+    )
+
+    same = all(
+        sql_result[key]["alive"] == cohort["alive"]
+        and sql_result[key]["lifespan_median"] == cohort["lifespan_median"]
+        for key, cohort in rows_result.items()
+    ) and len(sql_result) == len(rows_result)
+
+    print(f"\n{'method':<22} {'seconds':>9} {'peak MB':>9}")
+    print(f"{'load every row':<22} {rows_seconds:>9.2f} {rows_mb:>9.1f}")
+    print(f"{'GROUP BY + lifespans':<22} {sql_seconds:>9.2f} {sql_mb:>9.1f}")
+    print(f"\n{len(sql_result)} cohorts, results identical: {same}")
+
+    db_service.close()
+
+
+if __name__ == "__main__":
+    main()
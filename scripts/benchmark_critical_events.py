@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""Benchmark critical-event detection.
+
+Compares the vectorized detectors of ``utils.event_detection`` against the
+per-step loop over ORM rows that identify_critical_events used to run, on the
+default detector set, and checks both find the same events. Pass
+``--generate N`` to run against a synthetic database with N steps.
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from typing import Any, Dict, List
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from agentfarm_mcp.config import DatabaseConfig
+from agentfarm_mcp.models.database_models import Base, Simulation, SimulationStepModel
+from agentfarm_mcp.services.database_service import DatabaseService
+from agentfarm_mcp.utils.event_detection import (
+    DEFAULT_DETECTORS,
+    MASS_DEATH_THRESHOLD,
+    SEVERE_MASS_DEATH_THRESHOLD,
+    SEVERE_POPULATION_CHANGE_THRESHOLD,
+    detect_events,
+    load_step_metrics,
+    required_columns,
+    resolve_detectors,
+)
+
+
+def generate_database(path: str, simulation_id: str, steps: int) -> None:
+    """Write a synthetic database with ``steps`` steps of a fluctuating population.
+
+    Args:
+        path: SQLite file to create
+        simulation_id: Simulation ID of the generated steps
+        steps: Number of steps to generate
+    """
+    rng = random.Random(42)
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(
+        Simulation(
+            simulation_id=simulation_id,
+            status="completed",
+            parameters={},
+            simulation_db_path=path,
+        )
+    )
+    session.commit()
+
+    population, generation = 100, 0
+    for start in range(0, steps, 50000):
+        rows = []
+        for step in range(start, min(start + 50000, steps)):
+            births = rng.randrange(15)
+            deaths = rng.randrange(25) if rng.random() < 0.05 else rng.randrange(10)
+            population = max(1, population + births - deaths)
+            generation += rng.random() < 0.01
+            rows.append(
+                {
+                    "simulation_id": simulation_id,
+                    "step_number": step,
+                    "total_agents": population,
+                    "births": births,
+                    "deaths": deaths,
+                    "current_max_generation": generation,
+                    "total_resources": 1000.0 - step * 1000.0 / steps,
+                }
+            )
+        session.execute(insert(SimulationStepModel), rows)
+        session.commit()
+    session.close()
+    engine.dispose()
+
+
+def loop_events(session, simulation_id: str, threshold: float) -> List[Dict[str, Any]]:
+    """Detect events the way the tool did before: a loop over ORM rows."""
+    steps = (
+        session.query(SimulationStepModel)
+        .filter(SimulationStepModel.simulation_id == simulation_id)
+        .order_by(SimulationStepModel.step_number)
+        .all()
+    )
+    events = []
+    for i in range(1, len(steps)):
+        prev_pop, curr_pop = steps[i - 1].total_agents, steps[i].total_agents
+        if prev_pop > 0:
+            change = ((curr_pop - prev_pop) / prev_pop) * 100
+            if change <= -threshold:
+                severe = abs(change) > SEVERE_POPULATION_CHANGE_THRESHOLD
+                events.append(
+                    {
+                        "type": "population_crash",
+                        "step": steps[i].step_number,
+                        "description": f"Population dropped {abs(change):.1f}% "
+                        f"({prev_pop} → {curr_pop})",
+                        "severity": "high" if severe else "medium",
+                    }
+                )
+            elif change >= threshold:
+                events.append(
+                    {
+                        "type": "population_boom",
+                        "step": steps[i].step_number,
+                        "description": f"Population grew {change:.1f}% ({prev_pop} → {curr_pop})",
+                        "severity": "medium",
+                    }
+                )
+        if steps[i].deaths > MASS_DEATH_THRESHOLD:
+            events.append(
+                {
+                    "type": "mass_death",
+                    "step": steps[i].step_number,
+                    "description": f"{steps[i].deaths} deaths in single step",
+                    "severity": (
+                        "high" if steps[i].deaths > SEVERE_MASS_DEATH_THRESHOLD else "medium"
+                    ),
+                }
+            )
+        if steps[i].current_max_generation > steps[i - 1].current_max_generation:
+            events.append(
+                {
+                    "type": "new_generation",
+                    "step": steps[i].step_number,
+                    "description": f"Generation {steps[i].current_max_generation} reached",
+                    "severity": "low",
+                }
+            )
+    return events
+
+
+def main() -> None:
+    """Main benchmark execution."""
+    parser = argparse.ArgumentParser(description="Benchmark critical-event detection")
+    parser.add_argument("--db", help="Database path (omit with --generate)")
+    parser.add_argument("--simulation-id", default="bench_sim", help="Simulation to analyze")
+    parser.add_argument(
+        "--generate", type=int, metavar="N", help="Generate a synthetic database with N steps"
+    )
+    parser.add_argument("--threshold", type=float, default=10.0, help="threshold_percent")
+    args = parser.parse_args()
+
+    db_path = args.db
+    if args.generate:
+        db_path = os.path.join(tempfile.mkdtemp(prefix="events_bench_"), "bench.db")
+        print(f"Generating {args.generate} steps in {db_path} ...")
+        generate_database(db_path, args.simulation_id, args.generate)
+    if not db_path:
+        parser.error("pass --db or --generate")
+
+    db_service = DatabaseService(DatabaseConfig(path=db_path, read_only=True))
+    detectors = resolve_detectors(DEFAULT_DETECTORS)
+    options = {"threshold_percent": args.threshold}
+
+    def vectorized(session):
+        metrics = load_step_metrics(
+            session, args.simulation_id, required_columns(detectors, options)
+        )
+        loaded = time.perf_counter()
+        return metrics, loaded, detect_events(metrics, detectors, options)
+
+    db_service.execute_query(vectorized)  # warm the page cache
+    start = time.perf_counter()
+    _, loaded, events = db_service.execute_query(vectorized)
+    detected = time.perf_counter()
+
+    loop_start = time.perf_counter()
+    expected = db_service.execute_query(
+        lambda session: loop_events(session, args.simulation_id, args.threshold)
+    )
+    loop_seconds = time.perf_counter() - loop_start
+
+    print(f"\n{'method':<24} {'seconds':>9}")
+    print(f"{'loop over ORM rows':<24} {loop_seconds:>9.2f}")
+    print(
+        f"{'vectorized detectors':<24} {detected - start:>9.2f}  "
+        f"(load {loaded - start:.2f}, detect {detected - loaded:.2f})"
+    )
+    print(f"\n{len(events)} events, identical: {events == expected}")
+
+    db_service.close()
+
+
+if __name__ == "__main__":
+    main()
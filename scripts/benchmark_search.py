@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Benchmark the full-text event search index.
+
+Measures how long indexing one simulation takes and compares search latency
+against the scan it replaces (``details LIKE '%word%'`` over the action and
+interaction tables). Pass ``--generate N`` to run against a synthetic
+database with N actions and N interactions instead of an existing one.
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+from sqlalchemy import create_engine, or_
+from sqlalchemy.orm import sessionmaker
+
+from agentfarm_mcp.config import DatabaseConfig
+from agentfarm_mcp.models.database_models import (
+    ActionModel,
+    AgentModel,
+    Base,
+    InteractionModel,
+    Simulation,
+)
+from agentfarm_mcp.services.database_service import DatabaseService
+from agentfarm_mcp.services.search_service import EventSearchService
+
+WORDS = ["flee", "chase", "hide", "forage", "share", "guard", "rest", "scout", "swarm", "ambush"]
+
+
+def generate_database(path: str, simulation_id: str, events: int) -> None:
+    """Write a synthetic database with ``events`` actions and interactions.
+
+    Args:
+        path: SQLite file to create
+        simulation_id: Simulation ID of the generated rows
+        events: Number of actions (and of interactions) to generate
+    """
+    rng = random.Random(42)
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(
+        Simulation(
+            simulation_id=simulation_id,
+            status="completed",
+            parameters={},
+            simulation_db_path=path,
+        )
+    )
+    agents = [f"agent_{i:04d}" for i in range(200)]
+    session.add_all(
+        AgentModel(simulation_id=simulation_id, agent_id=agent_id, agent_type="system")
+        for agent_id in agents
+    )
+    session.commit()
+
+    for start in range(0, events, 10000):
+        batch = range(start, min(start + 10000, events))
+        session.add_all(
+            ActionModel(
+                simulation_id=simulation_id,
+                step_number=i // 10,
+                agent_id=rng.choice(agents),
+                action_type=rng.choice(["move", "gather", "attack", "share"]),
+                details=" ".join(rng.choices(WORDS, k=4)),
+            )
+            for i in batch
+        )
+        session.add_all(
+            InteractionModel(
+                simulation_id=simulation_id,
+                step_number=i // 10,
+                source_type="agent",
+                source_id=rng.choice(agents),
+                target_type="resource",
+                target_id=f"resource_{rng.randrange(50)}",
+                interaction_type="gather",
+                details={"amount": rng.randrange(10), "mood": rng.choice(WORDS)},
+            )
+            for i in batch
+        )
+        session.commit()
+    session.close()
+    engine.dispose()
+
+
+def timed(func: Callable[[], object], iterations: int) -> Dict[str, float]:
+    """Run ``func`` repeatedly and return latency percentiles in milliseconds."""
+    times: List[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    times.sort()
+    return {
+        "p50": statistics.median(times),
+        "p95": times[min(len(times) - 1, int(len(times) * 0.95))],
+    }
+
+
+def like_scan(db_service: DatabaseService, simulation_id: str, word: str) -> int:
+    """Count matching events the way it is done without an index."""
+
+    def query_func(session):
+        pattern = f"%{word}%"
+        actions = (
+            session.query(ActionModel.action_id)
+            .filter(ActionModel.simulation_id == simulation_id)
+            .filter(or_(ActionModel.details.like(pattern), ActionModel.action_type == word))
+            .count()
+        )
+        interactions = (
+            session.query(InteractionModel.interaction_id)
+            .filter(InteractionModel.simulation_id == simulation_id)
+            .filter(InteractionModel.details.like(pattern))
+            .count()
+        )
+        return actions + interactions
+
+    return db_service.execute_query(query_func)
+
+
+def main() -> None:
+    """Main benchmark execution."""
+    parser = argparse.ArgumentParser(description="Benchmark full-text event search")
+    parser.add_argument("--db", help="Database path (omit with --generate)")
+    parser.add_argument("--simulation-id", default="bench_sim", help="Simulation to index")
+    parser.add_argument(
+        "--generate",
+        type=int,
+        metavar="N",
+        help="Generate a synthetic database with N actions and N interactions",
+    )
+    parser.add_argument(
+        "--queries",
+        nargs="+",
+        default=["flee", "ambush AND hide", '"chase forage"'],
+        help="Search queries to time",
+    )
+    parser.add_argument("--iterations", type=int, default=50, help="Runs per query")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="search_bench_")
+    db_path = args.db
+    if args.generate:
+        db_path = os.path.join(workdir, "bench.db")
+        print(f"Generating {args.generate} actions and interactions in {db_path} ...")
+        generate_database(db_path, args.simulation_id, args.generate)
+    if not db_path:
+        parser.error("pass --db or --generate")
+
+    db_service = DatabaseService(DatabaseConfig(path=db_path, read_only=True))
+    search = EventSearchService(db_service, index_path=os.path.join(workdir, "search.db"))
+
+    build = search.build(args.simulation_id, rebuild=True)
+    print(
+        f"\nIndex build: {build['documents']} documents in {build['build_seconds']:.2f} s "
+        f"({build['documents'] / max(build['build_seconds'], 1e-9):,.0f} documents/s), "
+        f"sidecar {os.path.getsize(search.index_path) / 1e6:.1f} MB"
+    )
+
+    print(f"\n{'query':<24} {'matches':>9} {'fts p50':>10} {'fts p95':>10} {'scan p50':>10}")
+    for query in args.queries:
+        matches = search.search(args.simulation_id, query=query, limit=50)["total_count"]
+        fts = timed(
+            lambda: search.search(args.simulation_id, query=query, limit=50), args.iterations
+        )
+        first_word = query.strip('"').split()[0]
+        scan = timed(lambda: like_scan(db_service, args.simulation_id, first_word), 5)
+        print(
+            f"{query:<24} {matches:>9} {fts['p50']:>8.2f}ms {fts['p95']:>8.2f}ms "
+            f"{scan['p50']:>8.2f}ms"
+        )
+
+    json_query = timed(
+        lambda: search.search(args.simulation_id, json_path="mood", json_value="flee"),
+        args.iterations,
+    )
+    print(f"\njson_path='mood', json_value='flee': p50 {json_query['p50']:.2f} ms")
+    print(json.dumps({"workdir": workdir}))
+
+    db_service.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""Benchmark script for response encoding.
+
+Runs a representative set of tools once against a real database and then
+times only the encoding of each response with:
+
+- ``json``: ``json.dumps(response, default=str)`` (previous behaviour)
+- ``pydantic``: ``pydantic_core.to_json`` (FastMCP's default conversion)
+- ``fast``: ``serialization.dumps`` (orjson when installed)
+- ``cached``: ``serialization.encode_response`` on a cache hit, where the
+  data has already been encoded once and is spliced in as-is
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pydantic_core
+
+from agentfarm_mcp.config import MCPConfig
+from agentfarm_mcp.server import SimulationMCPServer
+from agentfarm_mcp.utils import serialization
+from agentfarm_mcp.utils.serialization import PreEncoded
+
+ENCODERS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "json": lambda response: json.dumps(response, default=str),
+    "pydantic": lambda response: pydantic_core.to_json(response, fallback=str),
+    "fast": serialization.dumps,
+    "cached": serialization.encode_response,
+}
+
+
+def representative_calls(simulation_id: str, agent_id: str) -> List[Tuple[str, Dict[str, Any]]]:
+    """Build the tool calls whose responses are encoded.
+
+    Args:
+        simulation_id: Simulation to query
+        agent_id: Agent used by the per-agent tools
+
+    Returns:
+        List of (tool name, parameters)
+    """
+    return [
+        ("query_agents", {"simulation_id": simulation_id, "limit": 1000}),
+        ("query_states", {"simulation_id": simulation_id, "limit": 1000}),
+        ("query_actions", {"simulation_id": simulation_id, "limit": 1000}),
+        ("get_simulation_metrics", {"simulation_id": simulation_id, "limit": 1000}),
+        ("analyze_population_dynamics", {"simulation_id": simulation_id}),
+        ("get_agent_lifecycle", {"simulation_id": simulation_id, "agent_id": agent_id}),
+    ]
+
+
+def time_encoder(
+    encoder: Callable[[Dict[str, Any]], Any], response: Dict[str, Any], iterations: int
+) -> Dict[str, float]:
+    """Time an encoder on one response.
+
+    Args:
+        encoder: Encoding function
+        response: Tool response
+        iterations: Number of iterations
+
+    Returns:
+        Dictionary with timing statistics in milliseconds and output size
+    """
+    times = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        encoded = encoder(response)
+        times.append((time.perf_counter() - start) * 1000)
+
+    return {"median": statistics.median(times), "min": min(times), "bytes": len(encoded)}
+
+
+def benchmark_tool(
+    server: SimulationMCPServer, tool_name: str, params: Dict[str, Any], iterations: int
+) -> Optional[Dict[str, Dict[str, float]]]:
+    """Run a tool once and time every encoder on its response.
+
+    Args:
+        server: Server instance
+        tool_name: Tool to run
+        params: Tool parameters
+        iterations: Encoding iterations per encoder
+
+    Returns:
+        Timing statistics per encoder, or None if the tool call failed
+    """
+    response = server.get_tool(tool_name)(**params)
+    if not response["success"]:
+        print(f"  ⚠️  {tool_name} failed: {response['error']['message']}")
+        return None
+
+    # Cache hits return data whose encoding has already been memoized
+    response["data"] = PreEncoded(response["data"])
+    response["data"].encoded()
+
+    return {
+        encoder_name: time_encoder(encoder, response, iterations)
+        for encoder_name, encoder in ENCODERS.items()
+    }
+
+
+def print_results(results: Dict[str, Dict[str, Dict[str, float]]]) -> None:
+    """Print benchmark results in a formatted table.
+
+    Args:
+        results: Timing statistics per tool and encoder
+    """
+    print("\n" + "=" * 90)
+    print("SERIALIZATION BENCHMARK RESULTS (median ms per response)")
+    print("=" * 90)
+    print(f"\n{'tool':32}{'size':>10}" + "".join(f"{name:>12}" for name in ENCODERS))
+
+    for tool_name, stats in results.items():
+        size_kb = stats["json"]["bytes"] / 1024
+        timings = "".join(f"{stats[name]['median']:12.3f}" for name in ENCODERS)
+        print(f"{tool_name:32}{size_kb:8.1f}KB{timings}")
+
+    print(f"\norjson available: {serialization.orjson is not None}")
+    print("=" * 90)
+
+
+def main() -> Optional[int]:
+    """Main benchmark execution."""
+    parser = argparse.ArgumentParser(description="Benchmark response encoding per tool")
+    parser.add_argument(
+        "--db",
+        default="simulation.db",
+        help="Path to simulation database (default: simulation.db)",
+    )
+    parser.add_argument(
+        "--simulation-id",
+        default=None,
+        help="Simulation to query (default: first simulation in the database)",
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=50,
+        help="Encoding iterations per tool and encoder (default: 50)",
+    )
+
+    args = parser.parse_args()
+
+    config = MCPConfig.from_db_path(args.db)
+    config.cache.enabled = False
+    server = SimulationMCPServer(config)
+
+    try:
+        simulation_id = args.simulation_id
+        if simulation_id is None:
+            simulations = server.get_tool("list_simulations")(limit=1)
+            simulation_id = simulations["data"]["simulations"][0]["simulation_id"]
+
+        agents = server.get_tool("query_agents")(simulation_id=simulation_id, limit=1)
+        agent_id = agents["data"]["agents"][0]["agent_id"]
+
+        print(f"\n🔍 Benchmarking encoders on {simulation_id} ({args.iterations} iterations)...")
+
+        results = {}
+        for tool_name, params in representative_calls(simulation_id, agent_id):
+            print(f"  Running {tool_name}...")
+            stats = benchmark_tool(server, tool_name, params, args.iterations)
+            if stats is not None:
+                results[tool_name] = stats
+
+        print_results(results)
+    finally:
+        server.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
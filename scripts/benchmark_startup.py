@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Benchmark script for server cold start.
+
+Each phase runs in a fresh interpreter so nothing is shared between runs:
+
+- ``import``: ``import agentfarm_mcp.server``
+- ``list_tools``: ``python -m agentfarm_mcp --list-tools`` (no database)
+- ``server``: import and construct ``SimulationMCPServer`` (needs --db)
+
+The slowest modules are reported from a ``python -X importtime`` breakdown,
+and the script exits non-zero when the median exceeds ``--budget-ms``.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+SERVER_SNIPPET = """
+from agentfarm_mcp.config import MCPConfig
+from agentfarm_mcp.server import SimulationMCPServer
+SimulationMCPServer(MCPConfig.from_db_path({db!r})).close()
+"""
+
+
+def run_phase(args: List[str], runs: int) -> Dict[str, float]:
+    """Time a command in fresh interpreters.
+
+    Args:
+        args: Arguments passed to the Python interpreter
+        runs: Number of runs
+
+    Returns:
+        Dictionary with timing statistics in milliseconds
+    """
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], check=True, capture_output=True)
+        times.append((time.perf_counter() - start) * 1000)
+
+    return {
+        "min": min(times),
+        "median": statistics.median(times),
+        "max": max(times),
+    }
+
+
+def import_breakdown(args: List[str], top: int) -> List[Tuple[str, float, float]]:
+    """Collect the slowest imports via ``python -X importtime``.
+
+    Args:
+        args: Arguments passed to the Python interpreter
+        top: Number of modules to return
+
+    Returns:
+        List of (module, self ms, cumulative ms) sorted by cumulative time
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args], check=True, capture_output=True, text=True
+    )
+
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line[len("import time:") :].split("|")
+        try:
+            self_us, cumulative_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue  # header line
+        entries.append((parts[2].strip(), self_us / 1000, cumulative_us / 1000))
+
+    entries.sort(key=lambda entry: entry[2], reverse=True)
+    return entries[:top]
+
+
+def print_results(
+    phases: Dict[str, Dict[str, float]], breakdown: List[Tuple[str, float, float]]
+) -> None:
+    """Print benchmark results in a formatted table.
+
+    Args:
+        phases: Timing statistics per phase
+        breakdown: Slowest imports
+    """
+    print("\n" + "=" * 70)
+    print("STARTUP BENCHMARK RESULTS")
+    print("=" * 70)
+
+    for phase, stats in phases.items():
+        print(f"\n{phase}:")
+        print(f"  Min:    {stats['min']:.1f} ms")
+        print(f"  Median: {stats['median']:.1f} ms")
+        print(f"  Max:    {stats['max']:.1f} ms")
+
+    print("\nSlowest imports (cumulative):")
+    for module, self_ms, cumulative_ms in breakdown:
+        print(f"  {cumulative_ms:8.1f} ms  (self {self_ms:6.1f} ms)  {module}")
+
+    print("\n" + "=" * 70)
+
+
+def main() -> Optional[int]:
+    """Main benchmark execution."""
+    parser = argparse.ArgumentParser(description="Benchmark server cold start")
+    parser.add_argument(
+        "--db",
+        default=None,
+        help="Database path; enables the server construction phase",
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=5,
+        help="Fresh interpreter runs per phase (default: 5)",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=15,
+        help="Number of slowest imports to show (default: 15)",
+    )
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=None,
+        help="Fail if the median of the slowest phase exceeds this budget",
+    )
+
+    args = parser.parse_args()
+
+    print(f"\n🔍 Benchmarking cold start over {args.runs} runs per phase...")
+
+    phases = {
+        "import": ["-c", "import agentfarm_mcp.server"],
+        "list_tools": ["-m", "agentfarm_mcp", "--list-tools"],
+    }
+    if args.db:
+        phases["server"] = ["-c", SERVER_SNIPPET.format(db=args.db)]
+
+    results = {phase: run_phase(phase_args, args.runs) for phase, phase_args in phases.items()}
+    breakdown = import_breakdown(phases["server" if args.db else "import"], args.top)
+
+    print_results(results, breakdown)
+
+    if args.budget_ms is not None:
+        slowest = max(stats["median"] for stats in results.values())
+        if slowest > args.budget_ms:
+            print(f"\n❌ Startup budget exceeded: {slowest:.1f} ms > {args.budget_ms:.1f} ms")
+            return 1
+        print(f"\n✅ Within startup budget: {slowest:.1f} ms <= {args.budget_ms:.1f} ms")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
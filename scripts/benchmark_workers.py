@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""Benchmark throughput scaling of the multi-worker HTTP mode.
+
+For each worker count the server is started with
+``python -m agentfarm_mcp --transport http --workers N`` and hammered by
+concurrent clients issuing the same ``tools/call`` request over stateless
+HTTP (one worker serves stateful HTTP and gets a session). Caching is disabled so every request does the full database,
+computation and encoding work. Throughput and latency percentiles are
+reported per worker count together with the speedup over one worker.
+"""
+
+import argparse
+import itertools
+import json
+import os
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+# JSON-RPC ids must be unique per session or concurrent responses get mixed up
+_request_ids = itertools.count(1)
+
+
+def free_port() -> int:
+    """Get an unused local TCP port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_until_ready(port: int, timeout: float = 60.0) -> None:
+    """Wait for the server's ``/metrics`` endpoint to answer.
+
+    Args:
+        port: Server port
+        timeout: Seconds to wait
+
+    Raises:
+        TimeoutError: If the server does not come up in time
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=1).read()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise TimeoutError(f"Server on port {port} did not start within {timeout}s")
+
+
+def post(port: int, message: Dict[str, Any], headers: Dict[str, str]) -> Any:
+    """POST a JSON-RPC message to the MCP endpoint.
+
+    Args:
+        port: Server port
+        message: JSON-RPC message
+        headers: Extra request headers
+
+    Returns:
+        Open HTTP response
+    """
+    request = urllib.request.Request(
+        f"http://127.0.0.1:{port}/mcp",
+        data=json.dumps(message).encode(),
+        headers={
+            "Content-Type": "application/json",
+            "Accept": "application/json, text/event-stream",
+            **headers,
+        },
+    )
+    return urllib.request.urlopen(request, timeout=120)
+
+
+def open_session(port: int) -> Dict[str, str]:
+    """Perform the MCP initialize handshake.
+
+    A single worker serves stateful HTTP and requires a session; stateless
+    workers accept the handshake but do not issue a session ID.
+
+    Args:
+        port: Server port
+
+    Returns:
+        Headers to send with subsequent requests
+    """
+    initialize = {
+        "jsonrpc": "2.0",
+        "id": 0,
+        "method": "initialize",
+        "params": {
+            "protocolVersion": "2025-03-26",
+            "capabilities": {},
+            "clientInfo": {"name": "benchmark_workers", "version": "1.0"},
+        },
+    }
+    with post(port, initialize, {}) as response:
+        response.read()
+        session_id = response.headers.get("mcp-session-id")
+
+    headers = {"mcp-session-id": session_id} if session_id else {}
+    with post(port, {"jsonrpc": "2.0", "method": "notifications/initialized"}, headers) as r:
+        r.read()
+    return headers
+
+
+def call_tool(port: int, tool: str, arguments: Dict[str, Any], headers: Dict[str, str]) -> float:
+    """Call a tool over HTTP.
+
+    Args:
+        port: Server port
+        tool: Tool name
+        arguments: Tool arguments
+        headers: Session headers from ``open_session``
+
+    Returns:
+        Request latency in milliseconds
+    """
+    message = {
+        "jsonrpc": "2.0",
+        "id": next(_request_ids),
+        "method": "tools/call",
+        "params": {"name": tool, "arguments": arguments},
+    }
+    start = time.perf_counter()
+    with post(port, message, headers) as response:
+        payload = response.read()
+    elapsed = (time.perf_counter() - start) * 1000
+
+    if b'"isError":true' in payload or b'"success\\":false' in payload:
+        raise RuntimeError(f"Tool call failed: {payload[:300]!r}")
+    return elapsed
+
+
+def run_load(
+    port: int, tool: str, arguments: Dict[str, Any], requests: int, concurrency: int
+) -> Dict[str, float]:
+    """Issue requests concurrently and measure throughput.
+
+    Args:
+        port: Server port
+        tool: Tool name
+        arguments: Tool arguments
+        requests: Total number of requests
+        concurrency: Number of concurrent clients
+
+    Returns:
+        Dictionary with throughput and latency statistics
+    """
+    headers = open_session(port)
+
+    def call(_: int) -> float:
+        return call_tool(port, tool, arguments, headers)
+
+    # Warm every worker before measuring
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(call, range(concurrency * 2)))
+
+        start = time.perf_counter()
+        latencies = list(pool.map(call, range(requests)))
+        wall = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "rps": requests / wall,
+        "p50": statistics.median(latencies),
+        "p95": latencies[int(len(latencies) * 0.95) - 1],
+    }
+
+
+def benchmark_workers(
+    db: str, workers: int, tool: str, arguments: Dict[str, Any], requests: int, concurrency: int
+) -> Dict[str, float]:
+    """Start a server with ``workers`` processes and load it.
+
+    Args:
+        db: Database path
+        workers: Number of worker processes
+        tool: Tool name
+        arguments: Tool arguments
+        requests: Total number of requests
+        concurrency: Number of concurrent clients
+
+    Returns:
+        Dictionary with throughput and latency statistics
+    """
+    port = free_port()
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "agentfarm_mcp",
+            "--db-path",
+            db,
+            "--transport",
+            "http",
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+            "--no-cache",
+            "--log-level",
+            "WARNING",
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_until_ready(port)
+        return run_load(port, tool, arguments, requests, concurrency)
+    finally:
+        process.send_signal(signal.SIGTERM)
+        process.wait(timeout=30)
+
+
+def print_results(results: Dict[int, Dict[str, float]]) -> None:
+    """Print benchmark results in a formatted table.
+
+    Args:
+        results: Statistics per worker count
+    """
+    baseline = results[min(results)]["rps"]
+
+    print("\n" + "=" * 70)
+    print("WORKER SCALING BENCHMARK RESULTS")
+    print("=" * 70)
+    print(f"\n{'workers':>8}{'req/s':>12}{'speedup':>10}{'p50 ms':>12}{'p95 ms':>12}")
+    for workers, stats in sorted(results.items()):
+        print(
+            f"{workers:>8}{stats['rps']:12.1f}{stats['rps'] / baseline:9.2f}x"
+            f"{stats['p50']:12.1f}{stats['p95']:12.1f}"
+        )
+    print(f"\nCPU cores available: {os.cpu_count()}")
+    print("=" * 70)
+
+
+def main() -> Optional[int]:
+    """Main benchmark execution."""
+    parser = argparse.ArgumentParser(description="Benchmark multi-worker HTTP throughput")
+    parser.add_argument(
+        "--db",
+        default="simulation.db",
+        help="Path to simulation database (default: simulation.db)",
+    )
+    parser.add_argument("--simulation-id", required=True, help="Simulation to query")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4],
+        help="Worker counts to compare (default: 1 2 4)",
+    )
+    parser.add_argument(
+        "--tool",
+        default="get_simulation_metrics",
+        help="Tool to call (default: get_simulation_metrics)",
+    )
+    parser.add_argument(
+        "--arguments",
+        default=None,
+        help='Extra tool arguments as JSON (default: {"limit": 1000})',
+    )
+    parser.add_argument(
+        "--requests", type=int, default=200, help="Requests per worker count (default: 200)"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=16, help="Concurrent clients (default: 16)"
+    )
+
+    args = parser.parse_args()
+
+    arguments = json.loads(args.arguments) if args.arguments else {"limit": 1000}
+    arguments["simulation_id"] = args.simulation_id
+
+    results: Dict[int, Dict[str, float]] = {}
+    for workers in args.workers:
+        print(f"\n🔍 Benchmarking {workers} worker(s)...")
+        results[workers] = benchmark_workers(
+            args.db, workers, args.tool, arguments, args.requests, args.concurrency
+        )
+
+    print_results(results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
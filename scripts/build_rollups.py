@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Build analysis rollups of completed simulations.
+
+Computes survival cohorts, reproduction and social counts and step-bucket
+population aggregates for each completed simulation and stores them in the
+rollup sidecar, where analyze_survival_rates, analyze_reproduction and
+analyze_social_patterns read them instead of the raw tables. Simulations
+that already have a rollup are skipped unless ``--rebuild`` is given.
+"""
+
+import argparse
+import json
+
+from agentfarm_mcp.config import DatabaseConfig
+from agentfarm_mcp.services.database_service import DatabaseService
+from agentfarm_mcp.services.rollup_service import DEFAULT_BUCKET_SIZE, RollupService
+
+
+def main() -> None:
+    """Main rollup build execution."""
+    parser = argparse.ArgumentParser(description="Build analysis rollups")
+    parser.add_argument("--db", required=True, help="Database path or connection string")
+    parser.add_argument(
+        "--simulation-id",
+        action="append",
+        dest="simulation_ids",
+        help="Simulation to roll up (repeatable; default: every completed simulation)",
+    )
+    parser.add_argument("--rollup-path", help="Sidecar file (default: <db>.rollups.db)")
+    parser.add_argument(
+        "--bucket-size", type=int, default=DEFAULT_BUCKET_SIZE, help="Steps per step bucket"
+    )
+    parser.add_argument("--rebuild", action="store_true", help="Replace existing rollups")
+    args = parser.parse_args()
+
+    db_service = DatabaseService(
+        DatabaseConfig(path=args.db, read_only=True, rollup_path=args.rollup_path)
+    )
+    rollups = RollupService(db_service)
+    simulation_ids = args.simulation_ids or rollups.completed_simulations()
+
+    print(f"Rolling up {len(simulation_ids)} simulations into {rollups.rollup_path}")
+    for simulation_id in simulation_ids:
+        result = rollups.build(simulation_id, rebuild=args.rebuild, bucket_size=args.bucket_size)
+        state = "built" if result["built_now"] else "kept"
+        print(
+            f"  {simulation_id}: {state}, {result['agents']} agents, "
+            f"{result['build_seconds']:.2f} s"
+        )
+    print(json.dumps({"rollup_path": rollups.rollup_path}))
+
+    db_service.close()
+
+
+if __name__ == "__main__":
+    main()
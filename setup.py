@@ -4,6 +4,7 @@ setup(
     name="mcp-simulation-server",
     version="0.1.0",
     packages=find_packages(),
+    package_data={"agentfarm_mcp": ["tools/catalog.json"]},
     install_requires=[
         "fastmcp>=0.1.0",
         "sqlalchemy>=2.0.0",
@@ -117,11 +117,27 @@ def test_db_with_data(test_db_path):
                     # Add actions for first 3 agents
                     if j < 3:
                         for step in range(0, 50, 5):
+                            # Actions on recorded steps link the states before and after
+                            linked = step % 10 == 0
                             action = ActionModel(
                                 simulation_id=sim.simulation_id,
                                 agent_id=agent.agent_id,
                                 step_number=step,
                                 action_type=["move", "gather", "attack"][step % 3],
+                                state_before_id=(
+                                    AgentStateModel.generate_id(
+                                        agent.agent_id, step, sim.simulation_id
+                                    )
+                                    if linked
+                                    else None
+                                ),
+                                state_after_id=(
+                                    AgentStateModel.generate_id(
+                                        agent.agent_id, step + 10, sim.simulation_id
+                                    )
+                                    if linked
+                                    else None
+                                ),
                                 resources_before=50.0,
                                 resources_after=55.0,
                                 reward=10.0,
@@ -194,3 +194,36 @@ def test_cache_persistence_across_tools(mcp_config, test_simulation_id):
     assert final_stats["size"] > 0
 
     server.close()
+
+
+def test_streaming_over_mcp_progress(server, test_simulation_id):
+    """Test that stream=True delivers chunks as MCP progress notifications."""
+    import asyncio
+    import json
+
+    from fastmcp import Client
+
+    server.get_tool("get_simulation_metrics").stream_chunk_size = 40
+    messages = []
+
+    async def on_progress(progress, total, message):
+        messages.append(json.loads(message))
+
+    async def call(stream):
+        async with Client(server.mcp, progress_handler=on_progress) as client:
+            return await client.call_tool(
+                "get_simulation_metrics",
+                {"simulation_id": test_simulation_id, "limit": 100, "stream": stream},
+            )
+
+    result = asyncio.run(call(stream=True))
+
+    assert [len(m["data"]["metrics"]) for m in messages] == [40, 40, 20]
+    assert result.data["type"] == "end"
+    assert result.data["data"]["returned_count"] == 100
+
+    # Without stream the full result is returned as before
+    messages.clear()
+    result = asyncio.run(call(stream=False))
+    assert messages == []
+    assert len(result.data["data"]["metrics"]) == 100
@@ -0,0 +1,146 @@
+"""Integration tests for multi-worker HTTP serving."""
+
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+import psutil
+import pytest
+
+from agentfarm_mcp.server import SimulationMCPServer
+from agentfarm_mcp.workers import serve_workers
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork()")
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_until_ready(port, process, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        assert process.poll() is None, "server exited during startup"
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=1).read()
+            return
+        except OSError:
+            time.sleep(0.2)
+    pytest.fail("server did not start")
+
+
+def _call_tool(port, name, arguments):
+    request = urllib.request.Request(
+        f"http://127.0.0.1:{port}/mcp",
+        data=json.dumps(
+            {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "tools/call",
+                "params": {"name": name, "arguments": arguments},
+            }
+        ).encode(),
+        headers={
+            "Content-Type": "application/json",
+            "Accept": "application/json, text/event-stream",
+        },
+    )
+    with urllib.request.urlopen(request, timeout=30) as response:
+        body = response.read().decode()
+
+    data = next(line[len("data: ") :] for line in body.splitlines() if line.startswith("data: "))
+    return json.loads(data)["result"]["structuredContent"]
+
+
+@pytest.fixture
+def worker_server(test_db_with_data):
+    """Start the server with two workers and yield (process, port)."""
+    port = _free_port()
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "agentfarm_mcp",
+            "--db-path",
+            str(test_db_with_data),
+            "--transport",
+            "http",
+            "--port",
+            str(port),
+            "--workers",
+            "2",
+            "--no-cache",
+            "--log-level",
+            "WARNING",
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        _wait_until_ready(port, process)
+        yield process, port
+    finally:
+        if process.poll() is None:
+            process.send_signal(signal.SIGTERM)
+            process.wait(timeout=30)
+
+
+def test_workers_serve_stateless_requests(worker_server, test_simulation_id):
+    """Test that workers answer tool calls without a session."""
+    process, port = worker_server
+
+    assert len(psutil.Process(process.pid).children()) == 2
+
+    for _ in range(4):
+        result = _call_tool(port, "query_agents", {"simulation_id": test_simulation_id})
+        assert result["success"] is True
+        assert result["data"]["total_count"] == 20
+
+
+def test_workers_restart_after_crash(worker_server):
+    """Test that a crashed worker is replaced."""
+    process, port = worker_server
+    supervisor = psutil.Process(process.pid)
+    time.sleep(1.5)  # outlive the startup-failure window
+
+    crashed = supervisor.children()[0]
+    crashed.kill()
+    crashed.wait(timeout=10)
+
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        children = supervisor.children()
+        if len(children) == 2 and crashed.pid not in {child.pid for child in children}:
+            break
+        time.sleep(0.2)
+    else:
+        pytest.fail("crashed worker was not restarted")
+
+
+def test_workers_shutdown_on_sigterm(worker_server):
+    """Test that SIGTERM stops the supervisor and all workers."""
+    process, _ = worker_server
+    children = psutil.Process(process.pid).children()
+
+    process.send_signal(signal.SIGTERM)
+
+    assert process.wait(timeout=30) == 0
+    _, alive = psutil.wait_procs(children, timeout=10)
+    assert alive == []
+
+
+def test_serve_workers_rejects_sse(mcp_config):
+    """Test that SSE cannot be served by several processes."""
+    server = SimulationMCPServer(mcp_config)
+    try:
+        with pytest.raises(ValueError, match="multiple workers"):
+            serve_workers(server, 2, transport="sse")
+    finally:
+        server.close()
@@ -179,3 +179,103 @@ def test_database_service_writable_mode(test_db_with_data):
         assert result is not None
 
     service.close()
+
+
+def test_database_service_collects_query_stats(db_service, test_simulation_id):
+    """Test that statements, rows and DB time are recorded per tracked call."""
+    from agentfarm_mcp.utils.query_stats import track_queries
+
+    def list_agents(session):
+        return session.query(AgentModel).filter_by(simulation_id=test_simulation_id).all()
+
+    with track_queries() as stats:
+        agents = db_service.execute_query(list_agents)
+        db_service.validate_simulation_exists(test_simulation_id)
+
+    assert stats.statements >= 2
+    assert stats.rows_fetched >= len(agents) > 0
+    assert stats.db_time_ms > 0
+
+    # Nothing is recorded outside a tracked block
+    recorded = stats.statements
+    db_service.execute_query(list_agents)
+    assert stats.statements == recorded
+
+
+def test_database_service_logs_slow_queries(test_db_with_data):
+    """Test that statements over the threshold are logged with parameters."""
+    from structlog.testing import capture_logs
+
+    from agentfarm_mcp.utils.query_stats import track_queries
+
+    config = DatabaseConfig(path=str(test_db_with_data), slow_query_threshold_ms=0)
+    service = DatabaseService(config)
+
+    try:
+        with capture_logs() as logs, track_queries() as stats:
+            service.validate_simulation_exists("test_sim_000")
+    finally:
+        service.close()
+
+    slow = [entry for entry in logs if entry["event"] == "slow_query"]
+    assert slow
+    assert "SELECT" in slow[0]["statement"]
+    assert "test_sim_000" in str(slow[0]["parameters"])
+    assert stats.slow_statements == stats.statements
+
+
+def test_database_service_stream_query(db_service, test_simulation_id):
+    """Test chunked streaming of query results."""
+
+    def agents(session):
+        return (
+            session.query(AgentModel)
+            .filter_by(simulation_id=test_simulation_id)
+            .order_by(AgentModel.agent_id)
+        )
+
+    chunks = list(db_service.stream_query(agents, chunk_size=6))
+
+    assert [len(chunk) for chunk in chunks] == [6, 6, 6, 2]
+    assert chunks[0][0].agent_id == "agent_000"
+
+
+def test_database_service_deadline_interrupts_query(db_service):
+    """Test that a running statement is interrupted when the deadline passes."""
+    import time
+
+    from sqlalchemy import text
+
+    from agentfarm_mcp.utils.deadlines import deadline_scope
+    from agentfarm_mcp.utils.exceptions import QueryTimeoutError
+
+    slow_sql = text(
+        "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c WHERE x < 100000000) "
+        "SELECT count(*) FROM c"
+    )
+
+    start = time.perf_counter()
+    with deadline_scope(50), pytest.raises(QueryTimeoutError):
+        db_service.execute_query(lambda session: session.execute(slow_sql).scalar())
+
+    assert time.perf_counter() - start < 2
+    assert db_service.get_circuit_breaker_state()["failure_count"] == 0
+
+    # The connection is usable again afterwards
+    assert db_service.execute_query(lambda session: session.execute(text("SELECT 1")).scalar()) == 1
+
+
+def test_database_service_refuses_expired_deadline(db_service):
+    """Test that no work starts once the deadline has passed."""
+    import time
+
+    from agentfarm_mcp.utils.deadlines import deadline_scope
+    from agentfarm_mcp.utils.exceptions import QueryTimeoutError
+
+    calls = []
+    with deadline_scope(1):
+        time.sleep(0.01)
+        with pytest.raises(QueryTimeoutError):
+            db_service.execute_query(calls.append)
+
+    assert calls == []
@@ -0,0 +1,96 @@
+"""Unit tests for export service."""
+
+import csv
+import json
+
+import pytest
+
+from agentfarm_mcp.services.export_service import ExportService
+from agentfarm_mcp.utils.exceptions import ExportError, ValidationError
+
+
+@pytest.fixture
+def export_service(db_service):
+    """Create ExportService instance."""
+    return ExportService(db_service)
+
+
+def test_export_csv(export_service, test_simulation_id, tmp_path):
+    """Test exporting tables to CSV in several chunks."""
+    result = export_service.export(
+        test_simulation_id,
+        str(tmp_path),
+        tables=["agents", "interactions"],
+        export_format="csv",
+        chunk_size=7,
+    )
+
+    assert result["total_rows"] == 30
+    assert [file["table"] for file in result["files"]] == ["agents", "interactions"]
+    assert result["rows_per_second"] > 0
+
+    with open(result["files"][0]["path"], newline="") as f:
+        agents = list(csv.DictReader(f))
+    assert len(agents) == 20
+    assert agents[0]["agent_id"] == "agent_000"
+
+    with open(result["files"][1]["path"], newline="") as f:
+        interaction = next(csv.DictReader(f))
+    assert json.loads(interaction["details"]) == {"amount": 5.0}
+
+    # Only completed files are left behind
+    assert sorted(p.name for p in (tmp_path / test_simulation_id).iterdir()) == [
+        "agents.csv",
+        "interactions.csv",
+    ]
+
+
+@pytest.mark.parametrize("export_format", ["parquet", "arrow"])
+def test_export_arrow_formats(export_service, test_simulation_id, tmp_path, export_format):
+    """Test Parquet and Arrow IPC exports keep column types and write one batch per chunk."""
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+
+    result = export_service.export(
+        test_simulation_id,
+        str(tmp_path),
+        tables=["agent_states"],
+        export_format=export_format,
+        chunk_size=20,
+    )
+    path = result["files"][0]["path"]
+    assert path.endswith(f"agent_states.{export_format}")
+
+    if export_format == "parquet":
+        table = pq.read_table(path)
+        batches = pq.ParquetFile(path).num_row_groups
+    else:
+        reader = pa.ipc.open_file(path)
+        table = reader.read_all()
+        batches = reader.num_record_batches
+
+    assert table.num_rows == result["files"][0]["rows"] == 50
+    assert batches == 3
+    assert table.schema.field("step_number").type == pa.int64()
+    assert table.schema.field("is_defending").type == pa.bool_()
+
+
+def test_export_unknown_table(export_service, test_simulation_id, tmp_path):
+    """Test that unknown tables are rejected."""
+    with pytest.raises(ValidationError, match="Unknown tables"):
+        export_service.export(test_simulation_id, str(tmp_path), tables=["sqlite_master"])
+
+
+def test_export_rejects_path_like_simulation_id(export_service, tmp_path):
+    """Test that simulation IDs cannot escape the output directory."""
+    with pytest.raises(ValidationError, match="directory name"):
+        export_service.export("../outside", str(tmp_path), export_format="csv")
+
+
+def test_export_unwritable_directory(export_service, test_simulation_id, tmp_path):
+    """Test that write failures raise ExportError."""
+    blocker = tmp_path / "file"
+    blocker.write_text("not a directory")
+
+    with pytest.raises(ExportError):
+        export_service.export(test_simulation_id, str(blocker), export_format="csv")
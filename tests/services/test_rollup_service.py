@@ -0,0 +1,182 @@
+"""Unit tests for the rollup service."""
+
+import sqlite3
+from contextlib import closing
+
+import pytest
+
+from agentfarm_mcp.config import DatabaseConfig
+from agentfarm_mcp.services.rollup_service import (
+    RollupService,
+    default_rollup_path,
+    reproduction_rollup,
+)
+from agentfarm_mcp.utils.cohorts import cohort_statistics
+from agentfarm_mcp.utils.exceptions import SimulationNotFoundError, ValidationError
+
+
+@pytest.fixture
+def rollup_service(db_service, tmp_path):
+    """Create RollupService with a private sidecar."""
+    return RollupService(db_service, rollup_path=str(tmp_path / "rollups.db"), batch_size=7)
+
+
+def test_build_stores_rollup_once(rollup_service, test_simulation_id):
+    """Test that a completed simulation is rolled up once."""
+    assert rollup_service.info(test_simulation_id) is None
+
+    first = rollup_service.build(test_simulation_id, bucket_size=25)
+    second = rollup_service.build(test_simulation_id)
+
+    assert first["built_now"] is True
+    assert first["agents"] == 20
+    assert second["built_now"] is False
+    assert second["bucket_size"] == 25
+
+
+def test_build_rejects_unfinished_simulations(rollup_service):
+    """Test that running and unknown simulations are not rolled up."""
+    with pytest.raises(ValidationError):
+        rollup_service.build("test_sim_001")
+    with pytest.raises(SimulationNotFoundError):
+        rollup_service.build("missing")
+    with pytest.raises(ValidationError):
+        rollup_service.build("test_sim_000", bucket_size=0)
+
+
+def test_build_all_covers_completed(rollup_service):
+    """Test that build_all rolls up exactly the completed simulations."""
+    built = rollup_service.build_all()
+
+    assert sorted(built) == ["test_sim_000", "test_sim_002", "test_sim_004"]
+    assert rollup_service.info("test_sim_001") is None
+
+
+def test_cohorts_match_raw_aggregation(rollup_service, db_service, test_simulation_id):
+    """Test that stored cohorts equal the aggregation over raw agents."""
+    rollup_service.build(test_simulation_id)
+
+    for group_by in ("generation", "agent_type"):
+        raw = db_service.execute_query(
+            lambda session: cohort_statistics(session, test_simulation_id, group_by)
+        )
+        assert rollup_service.cohorts(test_simulation_id, group_by) == {
+            str(key): stats for key, stats in raw.items()
+        }
+    assert rollup_service.cohorts(test_simulation_id, "all") is None
+
+
+def test_reproduction_and_social(rollup_service, test_simulation_id):
+    """Test reproduction and social rollups."""
+    rollup_service.build(test_simulation_id)
+
+    reproduction = rollup_service.reproduction(test_simulation_id)
+    assert reproduction["attempts"] == reproduction["successful"] == 1
+    assert reproduction["cost_mean"] == 20.0
+    assert reproduction["max_offspring_generation"] == 1
+    assert reproduction["failure_reasons"] == {}
+
+    social = rollup_service.social(test_simulation_id)
+    assert social["interactions"] == 1
+    assert social["interaction_types"] == {"cooperation": 1}
+    assert social["outcomes"] == {"successful": 1}
+    assert social["resources_transferred"] == 5.0
+
+
+def test_step_buckets(rollup_service, test_simulation_id):
+    """Test per-bucket population aggregates."""
+    rollup_service.build(test_simulation_id, bucket_size=25)
+
+    buckets = rollup_service.step_buckets(test_simulation_id)
+
+    assert [(b["bucket_start"], b["bucket_end"], b["steps"]) for b in buckets] == [
+        (0, 24, 25),
+        (25, 49, 25),
+        (50, 74, 25),
+        (75, 99, 25),
+    ]
+    assert buckets[0]["population_max"] == 20
+    assert buckets[-1]["population_min"] == 16
+
+
+def test_step_buckets_only_for_matching_buckets(rollup_service, test_simulation_id):
+    """Test that stored buckets answer only whole buckets of the stored size."""
+    rollup_service.build(test_simulation_id, bucket_size=25)
+
+    ranged = rollup_service.step_buckets(test_simulation_id, 25, start_step=25, end_step=74)
+
+    assert [b["bucket_start"] for b in ranged] == [25, 50]
+    assert rollup_service.step_buckets(test_simulation_id, 50) is None
+    assert rollup_service.step_buckets(test_simulation_id, 25, start_step=10) is None
+    assert rollup_service.step_buckets(test_simulation_id, 25, end_step=60) is None
+
+
+def test_rebuild_replaces_rows(rollup_service, test_simulation_id):
+    """Test that rebuilding with another bucket size does not keep old rows."""
+    rollup_service.build(test_simulation_id, bucket_size=25)
+    rollup_service.build(test_simulation_id, rebuild=True, bucket_size=50)
+
+    assert len(rollup_service.step_buckets(test_simulation_id)) == 2
+    assert len(rollup_service.cohorts(test_simulation_id, "agent_type")) == 2
+
+
+def test_missing_sidecar_reads_empty(db_service, tmp_path, test_simulation_id):
+    """Test that lookups without a sidecar neither fail nor create the file."""
+    path = tmp_path / "never_built.db"
+    service = RollupService(db_service, rollup_path=str(path))
+
+    assert service.cohorts(test_simulation_id, "generation") is None
+    assert service.reproduction(test_simulation_id) is None
+    assert service.social(test_simulation_id) is None
+    assert not path.exists()
+
+
+def test_reads_leave_sidecar_untouched(db_service, tmp_path, test_simulation_id):
+    """Test that a sidecar without rollup tables reads as empty and stays empty."""
+    path = tmp_path / "empty.db"
+    sqlite3.connect(path).close()
+    service = RollupService(db_service, rollup_path=str(path))
+
+    assert service.info(test_simulation_id) is None
+    assert service.social(test_simulation_id) is None
+
+    with closing(sqlite3.connect(path)) as connection:
+        assert connection.execute("SELECT name FROM sqlite_master").fetchall() == []
+        assert connection.execute("PRAGMA journal_mode").fetchone() == ("delete",)
+
+
+def test_reads_use_read_only_connection(rollup_service, test_simulation_id, monkeypatch):
+    """Test that reads after a build open the sidecar read-only."""
+    rollup_service.build(test_simulation_id)
+    fresh = RollupService(rollup_service.db, rollup_path=rollup_service.rollup_path)
+    monkeypatch.setattr(fresh, "_connect", lambda: pytest.fail("read opened a write connection"))
+
+    assert fresh.info(test_simulation_id)["agents"] == 20
+    assert fresh.reproduction(test_simulation_id) is not None
+
+
+def test_reproduction_rollup_failures():
+    """Test failure reasons and generations of the shared aggregation."""
+    stats = reproduction_rollup(
+        [
+            (True, 50.0, 30.0, None, 2),
+            (True, 40.0, 30.0, None, 0),
+            (False, 10.0, 10.0, None, None),
+            (False, 10.0, 10.0, "no_space", None),
+        ]
+    )
+
+    assert stats["successful"] == 2
+    assert stats["cost_mean"] == 15.0
+    assert stats["max_offspring_generation"] == 2
+    assert stats["failure_reasons"] == {"unknown": 1, "no_space": 1}
+
+
+def test_default_rollup_path(tmp_path):
+    """Test sidecar placement next to SQLite files unless configured."""
+    db_file = tmp_path / "sim.db"
+    db_file.write_bytes(b"SQLite format 3\x00")
+    assert default_rollup_path(DatabaseConfig(path=str(db_file))) == f"{db_file}.rollups.db"
+
+    explicit = DatabaseConfig(path=str(db_file), rollup_path="/data/rollups.db")
+    assert default_rollup_path(explicit) == "/data/rollups.db"
@@ -0,0 +1,198 @@
+"""Unit tests for the event search service."""
+
+import shutil
+import sqlite3
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from agentfarm_mcp.config import DatabaseConfig
+from agentfarm_mcp.models.database_models import ActionModel, Simulation
+from agentfarm_mcp.services.database_service import DatabaseService
+from agentfarm_mcp.services.search_service import EventSearchService, default_index_path
+from agentfarm_mcp.utils.exceptions import ValidationError
+
+
+@pytest.fixture
+def search_service(db_service, tmp_path):
+    """Create EventSearchService with a private sidecar."""
+    return EventSearchService(db_service, index_path=str(tmp_path / "search.db"), batch_size=7)
+
+
+@pytest.fixture
+def growing_db(test_db_with_data, tmp_path):
+    """Copy the test database so events can be added to its simulations."""
+    db_path = tmp_path / "growing.db"
+    shutil.copyfile(test_db_with_data, db_path)
+    service = DatabaseService(DatabaseConfig(path=str(db_path)))
+    engine = create_engine(f"sqlite:///{db_path}")
+    yield service, sessionmaker(bind=engine)
+    service.close()
+    engine.dispose()
+
+
+def add_action(session_factory, simulation_id, details):
+    """Add an action with the given details to a simulation."""
+    with session_factory() as session:
+        session.add(
+            ActionModel(
+                simulation_id=simulation_id,
+                agent_id="agent_000",
+                step_number=999,
+                action_type="flee",
+                details=details,
+            )
+        )
+        session.commit()
+
+
+def set_status(session_factory, simulation_id, status):
+    """Set the status of a simulation."""
+    with session_factory() as session:
+        session.get(Simulation, simulation_id).status = status
+        session.commit()
+
+
+def test_build_indexes_all_sources(search_service, test_simulation_id):
+    """Test that building streams every event into the sidecar once."""
+    first = search_service.build(test_simulation_id)
+    second = search_service.build(test_simulation_id)
+
+    assert first["built_now"] is True
+    assert first["documents"] == 41  # 30 actions, 10 interactions, 1 social interaction
+    assert second["built_now"] is False
+    assert second["documents"] == 41
+    assert search_service.index_info(test_simulation_id)["documents"] == 41
+
+
+def test_rebuild_replaces_documents(search_service, test_simulation_id):
+    """Test that rebuilding does not duplicate documents."""
+    search_service.build(test_simulation_id)
+    rebuilt = search_service.build(test_simulation_id, rebuild=True)
+
+    assert rebuilt["built_now"] is True
+    assert search_service.search(test_simulation_id, query="test")["total_count"] == 30
+
+
+def test_search_refreshes_running_simulation(growing_db, tmp_path, test_simulation_id):
+    """Test that events added after the first build of a running simulation are found."""
+    db_service, session_factory = growing_db
+    search = EventSearchService(db_service, index_path=str(tmp_path / "search.db"))
+    set_status(session_factory, test_simulation_id, "running")
+
+    first = search.search(test_simulation_id, query="stampede")
+    unchanged = search.search(test_simulation_id, query="test")
+    add_action(session_factory, test_simulation_id, "stampede toward the river")
+    refreshed = search.search(test_simulation_id, query="stampede")
+
+    assert first["total_count"] == 0
+    assert first["index"]["built_now"] is True
+    assert unchanged["index"]["built_now"] is False
+    assert refreshed["index"]["built_now"] is True
+    assert refreshed["index"]["documents"] == 42
+    assert refreshed["results"][0]["step_number"] == 999
+
+
+def test_search_trusts_completed_index_until_rebuild(growing_db, tmp_path, test_simulation_id):
+    """Test that indexes of completed simulations are only rebuilt on request."""
+    db_service, session_factory = growing_db
+    search = EventSearchService(db_service, index_path=str(tmp_path / "search.db"))
+    search.build(test_simulation_id)  # the test simulation is completed
+
+    add_action(session_factory, test_simulation_id, "stampede toward the river")
+    kept = search.search(test_simulation_id, query="stampede")
+    rebuilt = search.search(test_simulation_id, query="stampede", rebuild=True)
+
+    assert kept["total_count"] == 0
+    assert kept["index"]["built_now"] is False
+    assert rebuilt["total_count"] == 1
+    assert rebuilt["index"]["built_now"] is True
+
+
+def test_sidecar_without_watermark_is_rebuilt(search_service, test_simulation_id):
+    """Test that a sidecar from before indexes had a high-water mark is replaced."""
+    with sqlite3.connect(search_service.index_path) as connection:
+        connection.execute(
+            "CREATE TABLE search_simulations (simulation_id TEXT PRIMARY KEY, "
+            "documents INTEGER NOT NULL, build_seconds REAL NOT NULL, built_at TEXT NOT NULL)"
+        )
+        connection.execute(
+            "INSERT INTO search_simulations VALUES (?, 0, 0.0, '')", (test_simulation_id,)
+        )
+    connection.close()
+
+    result = search_service.search(test_simulation_id, query="test")
+
+    assert result["index"]["built_now"] is True
+    assert result["total_count"] == 30
+
+
+def test_search_ranks_and_filters(search_service, test_simulation_id):
+    """Test text search with type and step filters."""
+    result = search_service.search(
+        test_simulation_id, query="attack", event_type="attack", end_step=50
+    )
+
+    assert result["total_count"] > 0
+    assert all(row["event_type"] == "attack" for row in result["results"])
+    assert all(row["step_number"] <= 50 for row in result["results"])
+    assert "[attack]" in result["results"][0]["snippet"]
+    scores = [row["score"] for row in result["results"]]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_search_json_path(search_service, test_simulation_id):
+    """Test JSON path and value search over interaction details."""
+    by_path = search_service.search(test_simulation_id, json_path="amount")
+    by_value = search_service.search(test_simulation_id, json_path="amount", json_value="5.0")
+    wrong_value = search_service.search(test_simulation_id, json_path="amount", json_value="7")
+
+    assert by_path["total_count"] == 10
+    assert by_path["results"][0]["details"] == {"amount": 5.0}
+    assert by_value["total_count"] == 10
+    assert wrong_value["total_count"] == 0
+
+
+def test_search_social_interactions(search_service, test_simulation_id):
+    """Test that social interaction subtypes and outcomes are searchable."""
+    result = search_service.search(test_simulation_id, query="sharing AND successful")
+
+    assert result["total_count"] == 1
+    assert result["results"][0]["source"] == "social_interactions"
+    assert result["results"][0]["agent_id"] == "agent_000"
+
+
+def test_search_pagination(search_service, test_simulation_id):
+    """Test that pages are disjoint and cover all matches."""
+    pages = [
+        search_service.search(test_simulation_id, query="test", limit=12, offset=offset)
+        for offset in (0, 12, 24)
+    ]
+
+    ids = [row["event_id"] for page in pages for row in page["results"]]
+    assert len(ids) == len(set(ids)) == 30
+
+
+@pytest.mark.parametrize(
+    "params",
+    [{}, {"query": "   "}, {"json_value": "5"}, {"query": '"unterminated'}],
+)
+def test_search_invalid(search_service, test_simulation_id, params):
+    """Test that missing or malformed search terms are rejected."""
+    with pytest.raises(ValidationError):
+        search_service.search(test_simulation_id, **params)
+
+
+def test_default_index_path(tmp_path):
+    """Test sidecar placement next to SQLite files and in the temp directory otherwise."""
+    db_file = tmp_path / "sim.db"
+    db_file.write_bytes(b"SQLite format 3\x00")
+    assert default_index_path(DatabaseConfig(path=str(db_file))) == f"{db_file}.search.db"
+
+    explicit = DatabaseConfig(path=str(db_file), search_index_path="/data/idx.db")
+    assert default_index_path(explicit) == "/data/idx.db"
+
+    server = default_index_path(DatabaseConfig(path="postgresql://u:p@db:5432/sims"))
+    assert "agentfarm_mcp_search_" in server
+    assert "u:p" not in server
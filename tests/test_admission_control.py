@@ -0,0 +1,190 @@
+"""Tests for adaptive admission control."""
+
+import pytest
+
+from agentfarm_mcp.utils.admission_control import AdmissionController, Priority
+from agentfarm_mcp.utils.exceptions import MCPException, OverloadedError
+
+
+def test_admits_until_limit():
+    """Test that normal requests are admitted up to the limit."""
+    controller = AdmissionController(initial_limit=4, min_limit=1)
+
+    for _ in range(4):
+        controller.acquire(Priority.NORMAL)
+
+    assert controller.in_flight == 4
+
+    with pytest.raises(OverloadedError) as exc_info:
+        controller.acquire(Priority.NORMAL)
+
+    assert exc_info.value.details["limit"] == 4
+    assert exc_info.value.details["in_flight"] == 4
+    assert exc_info.value.details["retry_after_ms"] >= controller.min_retry_after_ms
+
+
+def test_low_priority_shed_first():
+    """Test that low-priority requests are shed before normal ones."""
+    controller = AdmissionController(initial_limit=4, min_limit=1, low_priority_ratio=0.5)
+
+    controller.acquire(Priority.LOW)
+    controller.acquire(Priority.LOW)
+
+    with pytest.raises(OverloadedError):
+        controller.acquire(Priority.LOW)
+
+    # Normal requests still have headroom
+    controller.acquire(Priority.NORMAL)
+    assert controller.in_flight == 3
+
+
+def test_critical_never_shed():
+    """Test that critical requests bypass the limit and are not counted in flight."""
+    controller = AdmissionController(initial_limit=1, min_limit=1)
+    controller.acquire(Priority.NORMAL)
+
+    controller.acquire(Priority.CRITICAL)
+
+    assert controller.in_flight == 1
+    assert controller.admitted_count == 2
+
+    controller.release(latency_ms=10000, success=False, priority=Priority.CRITICAL)
+    assert controller.in_flight == 1
+    assert controller.limit == 1
+    assert controller.last_decrease_time is None
+
+
+def test_additive_increase_on_fast_calls():
+    """Test that fast successful calls grow the limit."""
+    controller = AdmissionController(initial_limit=4, min_limit=1, latency_threshold_ms=100)
+
+    for _ in range(20):
+        controller.acquire()
+        controller.release(latency_ms=5, success=True)
+
+    assert controller.limit > 4
+    assert controller.in_flight == 0
+
+
+def test_multiplicative_decrease_on_slow_calls():
+    """Test that slow calls shrink the limit, bounded by min_limit."""
+    controller = AdmissionController(
+        initial_limit=20,
+        min_limit=5,
+        latency_threshold_ms=100,
+        backoff_ratio=0.5,
+        decrease_cooldown_seconds=0,
+    )
+
+    controller.acquire()
+    controller.release(latency_ms=500, success=True)
+    assert controller.limit == 10
+
+    for _ in range(5):
+        controller.acquire()
+        controller.release(latency_ms=500, success=True)
+
+    assert controller.limit == 5
+
+
+def test_decrease_cooldown():
+    """Test that one congested burst only decreases the limit once."""
+    controller = AdmissionController(
+        initial_limit=20, min_limit=1, backoff_ratio=0.5, decrease_cooldown_seconds=60
+    )
+
+    for _ in range(3):
+        controller.acquire()
+        controller.release(latency_ms=1, success=False)
+
+    assert controller.limit == 10
+
+
+def test_get_state():
+    """Test state reporting."""
+    controller = AdmissionController(initial_limit=1, min_limit=1, name="test")
+    controller.acquire()
+    with pytest.raises(OverloadedError):
+        controller.acquire()
+
+    state = controller.get_state()
+
+    assert state["name"] == "test"
+    assert state["in_flight"] == 1
+    assert state["admitted"] == 1
+    assert state["shed"] == 1
+    assert state["shed_rate"] == 0.5
+
+
+def test_overloaded_error_is_mcp_exception():
+    """Test that OverloadedError is handled as a structured MCP error."""
+    exc = OverloadedError(retry_after_ms=250, in_flight=8, limit=8, priority="low")
+
+    assert isinstance(exc, MCPException)
+    assert "250ms" in str(exc)
+    assert exc.details == {"retry_after_ms": 250, "in_flight": 8, "limit": 8, "priority": "low"}
+
+
+def test_tool_returns_overloaded_error(services):
+    """Test that a shed tool call returns a structured error response."""
+    from tests.tools.test_base import TestTool
+
+    db_service, cache_service = services
+    cache_service.enabled = False
+    controller = AdmissionController(initial_limit=1, min_limit=1)
+    tool = TestTool(db_service, cache_service, controller)
+
+    # Occupy the only slot
+    controller.acquire()
+    result = tool(value=1, name="test")
+
+    assert result["success"] is False
+    assert result["error"]["type"] == "OverloadedError"
+    assert result["error"]["details"]["retry_after_ms"] > 0
+
+    # Slot is released after an admitted call completes
+    controller.release(latency_ms=1)
+    result = tool(value=1, name="test")
+    assert result["success"] is True
+    assert controller.in_flight == 0
+
+
+def test_server_health_check_includes_admission(server):
+    """Test that the server health check reports admission state."""
+    health = server.health_check()
+
+    assert "admission" in health["components"]
+    assert health["components"]["admission"]["in_flight"] == 0
+
+
+def test_tool_releases_slot_on_early_error(services, monkeypatch):
+    """Test that a call failing before execute does not leak an admission slot."""
+    from tests.tools.test_base import TestTool
+
+    db_service, cache_service = services
+    cache_service.enabled = False
+    controller = AdmissionController(initial_limit=1, min_limit=1)
+    tool = TestTool(db_service, cache_service, controller)
+
+    def broken_tracking():
+        raise RuntimeError("tracking unavailable")
+
+    monkeypatch.setattr(tool, "_track_queries", broken_tracking)
+    result = tool(value=1, name="test")
+
+    assert result["success"] is False
+    assert controller.in_flight == 0
+
+
+def test_health_tools_not_counted_in_flight(services):
+    """Test that monitoring tools do not count themselves in the load they report."""
+    from agentfarm_mcp.tools.health_tools import HealthCheckTool
+
+    db_service, cache_service = services
+    controller = AdmissionController(initial_limit=4, min_limit=1)
+    tool = HealthCheckTool(db_service, cache_service, controller)
+
+    result = tool()
+
+    assert result["data"]["components"]["admission"]["in_flight"] == 0
+    assert controller.in_flight == 0
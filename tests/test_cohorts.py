@@ -0,0 +1,81 @@
+"""Tests for database-side cohort statistics."""
+
+import numpy as np
+import pytest
+
+from agentfarm_mcp.models.database_models import AgentModel
+from agentfarm_mcp.utils import cohorts
+from agentfarm_mcp.utils.cohorts import cohort_aggregates, cohort_statistics
+
+
+def _reference(agents, group_by):
+    """Group agents in Python the way the analysis tools used to."""
+    groups = {}
+    for agent in agents:
+        key = getattr(agent, group_by) if group_by in ("generation", "agent_type") else "all"
+        group = groups.setdefault(key, {"alive": 0, "dead": 0, "lifespans": []})
+        if agent.death_time is None:
+            group["alive"] += 1
+        else:
+            group["dead"] += 1
+            group["lifespans"].append(agent.death_time - agent.birth_time)
+    return {
+        key: {
+            "alive": group["alive"],
+            "dead": group["dead"],
+            "lifespan_mean": float(np.mean(group["lifespans"])) if group["lifespans"] else None,
+            "lifespan_median": (
+                float(np.median(group["lifespans"])) if group["lifespans"] else None
+            ),
+            "lifespan_max": max(group["lifespans"]) if group["lifespans"] else None,
+            "lifespan_min": min(group["lifespans"]) if group["lifespans"] else None,
+        }
+        for key, group in groups.items()
+    }
+
+
+@pytest.mark.parametrize("group_by", ["generation", "agent_type", "all"])
+def test_cohort_statistics_match_python(db_service, test_simulation_id, group_by, monkeypatch):
+    """Test the SQL aggregation reproduces the per-agent Python loop."""
+    monkeypatch.setattr(cohorts, "LIFESPAN_FETCH_SIZE", 2)
+
+    def query_func(session):
+        agents = session.query(AgentModel).filter(
+            AgentModel.simulation_id == test_simulation_id
+        ).all()
+        return _reference(agents, group_by), cohort_statistics(
+            session, test_simulation_id, group_by
+        )
+
+    expected, actual = db_service.execute_query(query_func)
+
+    assert actual == expected
+    assert list(actual) == sorted(actual)
+
+
+def test_cohort_aggregates_counts(db_service, test_simulation_id):
+    """Test per-generation counts and lifespan totals."""
+    generations = db_service.execute_query(
+        lambda session: cohort_aggregates(session, test_simulation_id, "generation")
+    )
+
+    # Five agents per generation, agent j dies at 50 + 10j when j is even
+    assert list(generations) == [0, 1, 2, 3]
+    assert generations[0] == {
+        "alive": 2,
+        "dead": 3,
+        "lifespan_count": 3,
+        "lifespan_sum": 50 + 70 + 90,
+        "lifespan_min": 50,
+        "lifespan_max": 90,
+    }
+
+
+def test_cohort_statistics_without_agents(db_service):
+    """Test a simulation without agents has no cohorts."""
+    assert db_service.execute_query(
+        lambda session: cohort_statistics(session, "test_sim_004", "generation")
+    ) == {}
+    assert db_service.execute_query(
+        lambda session: cohort_statistics(session, "test_sim_004", "all")
+    ) == {}
@@ -0,0 +1,38 @@
+"""Tests for columnar encoding of tabular results."""
+
+from agentfarm_mcp.utils.columnar import dictionary_encode, from_columnar, to_columnar
+
+
+def test_to_columnar():
+    """Test column extraction with nested objects and missing keys."""
+    rows = [
+        {"step_number": 0, "position": {"x": 1.0, "y": 2.0}},
+        {"step_number": 1, "position": {"x": 3.0, "y": 4.0}, "reward": 0.5},
+    ]
+
+    assert to_columnar(rows) == {
+        "step_number": [0, 1],
+        "position": {"x": [1.0, 3.0], "y": [2.0, 4.0]},
+        "reward": [None, 0.5],
+    }
+    assert to_columnar([]) == {}
+
+
+def test_dictionary_encode():
+    """Test that codes index distinct values in first-seen order."""
+    encoded = dictionary_encode(["move", "gather", "move", None, "gather"])
+
+    assert encoded == {"dictionary": ["move", "gather", None], "codes": [0, 1, 0, 2, 1]}
+
+
+def test_columnar_roundtrip():
+    """Test that from_columnar restores the original rows."""
+    rows = [
+        {"agent_id": f"agent_{i}", "action_type": ["move", "attack"][i % 2], "position": {"x": i}}
+        for i in range(5)
+    ]
+
+    columns = to_columnar(rows, categorical=["action_type"])
+
+    assert columns["action_type"]["dictionary"] == ["move", "attack"]
+    assert from_columnar(columns) == rows
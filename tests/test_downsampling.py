@@ -0,0 +1,44 @@
+"""Tests for time-series downsampling."""
+
+import numpy as np
+
+from agentfarm_mcp.utils.downsampling import lttb_indices
+
+
+def test_lttb_keeps_endpoints_and_count():
+    """Test that LTTB keeps the first and last points and returns max_points indexes."""
+    x = np.arange(1000)
+    keep = lttb_indices(x, np.sin(x / 50), 100)
+
+    assert len(keep) == 100
+    assert keep[0] == 0
+    assert keep[-1] == 999
+    assert np.all(np.diff(keep) > 0)
+
+
+def test_lttb_preserves_spikes():
+    """Test that isolated extremes survive downsampling."""
+    x = np.arange(10000)
+    y = np.zeros(10000)
+    y[1234] = 50.0
+    y[8765] = -50.0
+
+    keep = lttb_indices(x, y, 50)
+
+    assert 1234 in keep
+    assert 8765 in keep
+
+
+def test_lttb_short_series_unchanged():
+    """Test that series at or below max_points are returned whole."""
+    assert list(lttb_indices([0, 1, 2], [5, 6, 7], 3)) == [0, 1, 2]
+    assert list(lttb_indices([0, 1], [5, 6], 10)) == [0, 1]
+    assert list(lttb_indices([], [], 10)) == []
+
+
+def test_lttb_tolerates_missing_values():
+    """Test that None values do not break selection."""
+    keep = lttb_indices(list(range(10)), [None, 1, None, 3, 4, None, 6, 7, None, 9], 4)
+
+    assert len(keep) == 4
+    assert keep[0] == 0 and keep[-1] == 9
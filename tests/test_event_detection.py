@@ -0,0 +1,198 @@
+"""Tests for vectorized critical-event detection."""
+
+import numpy as np
+import pytest
+
+from agentfarm_mcp.utils import event_detection
+from agentfarm_mcp.utils.event_detection import (
+    DEFAULT_DETECTORS,
+    EventDetector,
+    detect_events,
+    load_step_metrics,
+    register_detector,
+    resolve_detectors,
+    validate_step_columns,
+)
+from agentfarm_mcp.utils.exceptions import ValidationError
+
+OPTIONS = {
+    "threshold_percent": 10.0,
+    "anomaly_metric": "total_agents",
+    "anomaly_window": 5,
+    "anomaly_z_threshold": 3.0,
+    "depletion_percent": 25.0,
+}
+
+
+def _reference(steps, population, deaths, generation, threshold):
+    """Detect events with the per-step loop the tool used to run."""
+    events = []
+    for i in range(1, len(steps)):
+        prev_pop, curr_pop = population[i - 1], population[i]
+        if prev_pop > 0:
+            change_percent = ((curr_pop - prev_pop) / prev_pop) * 100
+            if change_percent <= -threshold:
+                events.append(
+                    {
+                        "type": "population_crash",
+                        "step": steps[i],
+                        "description": f"Population dropped {abs(change_percent):.1f}% "
+                        f"({prev_pop} → {curr_pop})",
+                        "severity": "high" if abs(change_percent) > 30 else "medium",
+                    }
+                )
+            elif change_percent >= threshold:
+                events.append(
+                    {
+                        "type": "population_boom",
+                        "step": steps[i],
+                        "description": f"Population grew {change_percent:.1f}% "
+                        f"({prev_pop} → {curr_pop})",
+                        "severity": "medium",
+                    }
+                )
+        if deaths[i] > 10:
+            events.append(
+                {
+                    "type": "mass_death",
+                    "step": steps[i],
+                    "description": f"{deaths[i]} deaths in single step",
+                    "severity": "high" if deaths[i] > 20 else "medium",
+                }
+            )
+        if generation[i] > generation[i - 1]:
+            events.append(
+                {
+                    "type": "new_generation",
+                    "step": steps[i],
+                    "description": f"Generation {generation[i]} reached",
+                    "severity": "low",
+                }
+            )
+    return events
+
+
+def _metrics(**columns):
+    """Build float metric arrays with consecutive step numbers."""
+    length = len(next(iter(columns.values())))
+    metrics = {"step_number": np.arange(length, dtype=np.float64)}
+    metrics.update({name: np.asarray(values, dtype=np.float64) for name, values in columns.items()})
+    return metrics
+
+
+@pytest.mark.parametrize("threshold", [0.0, 5.0, 10.0, 40.0])
+def test_default_detectors_match_loop(threshold):
+    """Test the vectorized detectors reproduce the per-step loop exactly."""
+    rng = np.random.default_rng(7)
+    population = rng.integers(0, 60, 500).tolist()
+    deaths = rng.integers(0, 25, 500).tolist()
+    generation = np.maximum.accumulate(rng.integers(0, 3, 500)).cumsum().tolist()
+    steps = list(range(500))
+
+    events = detect_events(
+        _metrics(total_agents=population, deaths=deaths, current_max_generation=generation),
+        resolve_detectors(DEFAULT_DETECTORS),
+        {**OPTIONS, "threshold_percent": threshold},
+    )
+
+    assert events == _reference(steps, population, deaths, generation, threshold)
+
+
+def test_anomaly_detector():
+    """Test a spike after a noisy plateau is flagged by its z-score."""
+    population = [100, 101, 99, 100, 101, 99, 100, 150, 100]
+    metrics = _metrics(total_agents=population)
+
+    events = detect_events(metrics, resolve_detectors(["anomaly"]), OPTIONS)
+
+    assert [event["step"] for event in events] == [7]
+    assert events[0]["type"] == "anomaly"
+    assert events[0]["severity"] == "high"
+    assert "total_agents 150" in events[0]["description"]
+
+
+def test_anomaly_detector_skips_constant_windows():
+    """Test a constant history has no deviation and raises no anomaly."""
+    metrics = _metrics(total_agents=[5] * 10 + [50])
+
+    assert detect_events(metrics, resolve_detectors(["anomaly"]), OPTIONS) == []
+
+
+def test_resource_depletion_reports_crossings():
+    """Test depletion fires when the level is crossed, and again after recovery."""
+    metrics = _metrics(total_resources=[100, 60, 20, 10, 40, 0])
+
+    events = detect_events(metrics, resolve_detectors(["resource_depletion"]), OPTIONS)
+
+    assert [(event["step"], event["severity"]) for event in events] == [
+        (2, "medium"),
+        (5, "high"),
+    ]
+    assert events[0]["description"] == "Total resources fell to 20.0 (20.0% of initial 100.0)"
+
+
+def test_register_custom_detector(monkeypatch):
+    """Test plugins registered by name run alongside the built-in detectors."""
+    monkeypatch.setattr(event_detection, "DETECTORS", dict(event_detection.DETECTORS))
+
+    @register_detector
+    class ExtinctionDetector(EventDetector):
+        name = "extinction"
+        columns = ("total_agents",)
+
+        def detect(self, metrics, options):
+            steps = metrics["step_number"][metrics["total_agents"] == 0]
+            return [
+                {"type": "extinction", "step": int(step), "description": "", "severity": "high"}
+                for step in steps
+            ]
+
+    events = detect_events(
+        _metrics(total_agents=[10, 8, 0], deaths=[0, 0, 0]),
+        resolve_detectors(["mass_death", "extinction", "population_change"]),
+        OPTIONS,
+    )
+
+    # Same step: detector order decides
+    assert [event["type"] for event in events] == [
+        "population_crash",
+        "extinction",
+        "population_crash",
+    ]
+
+
+def test_detector_must_implement_detect(monkeypatch):
+    """Test detectors without detect fail at registration, not when they run."""
+    monkeypatch.setattr(event_detection, "DETECTORS", dict(event_detection.DETECTORS))
+
+    class IncompleteDetector(EventDetector):
+        name = "incomplete"
+
+    with pytest.raises(TypeError, match="detect"):
+        register_detector(IncompleteDetector)
+    assert "incomplete" not in event_detection.DETECTORS
+
+
+def test_resolve_unknown_detector():
+    """Test unknown detector names are rejected with the available ones."""
+    with pytest.raises(ValidationError, match="available"):
+        resolve_detectors(["population_change", "nope"])
+
+
+def test_load_step_metrics(db_service, test_simulation_id):
+    """Test metrics load as float arrays in step order."""
+    metrics = db_service.execute_query(
+        lambda session: load_step_metrics(session, test_simulation_id, ["total_resources"])
+    )
+
+    assert metrics["step_number"].tolist() == list(range(100))
+    assert metrics["total_resources"][:3].tolist() == [1000.0, 995.0, 990.0]
+
+
+@pytest.mark.parametrize("column", ["simulation_id", "missing"])
+def test_validate_step_columns(column):
+    """Test non-numeric and unknown metric columns are rejected."""
+    validate_step_columns(["total_agents", "average_reward"])
+
+    with pytest.raises(ValidationError):
+        validate_step_columns(["total_agents", column])
@@ -0,0 +1,165 @@
+"""Tests for the in-process metrics registry."""
+
+import asyncio
+
+import pytest
+
+from agentfarm_mcp.utils import metrics
+from agentfarm_mcp.utils.metrics import MetricsRegistry
+
+
+@pytest.fixture
+def registry():
+    """Create an isolated registry."""
+    return MetricsRegistry()
+
+
+def test_counter_inc_and_labels(registry):
+    """Test counter increments per label set."""
+    calls = registry.counter("calls_total", "Calls", ["tool"])
+    calls.inc(tool="a")
+    calls.inc(2, tool="a")
+    calls.inc(tool="b")
+
+    assert calls.get(tool="a") == 3
+    assert calls.get(tool="b") == 1
+    assert calls.get(tool="c") == 0
+
+
+def test_counter_rejects_bad_labels_and_negative(registry):
+    """Test counter validation."""
+    calls = registry.counter("calls_total", "Calls", ["tool"])
+
+    with pytest.raises(ValueError):
+        calls.inc(other="x")
+    with pytest.raises(ValueError):
+        calls.inc(-1, tool="a")
+
+
+def test_registry_is_idempotent(registry):
+    """Test that re-registering returns the same metric."""
+    first = registry.counter("calls_total", "Calls", ["tool"])
+    second = registry.counter("calls_total", "Calls", ["tool"])
+
+    assert first is second
+    with pytest.raises(ValueError):
+        registry.gauge("calls_total", "Calls")
+
+
+def test_gauge(registry):
+    """Test gauge set/inc/dec."""
+    in_use = registry.gauge("in_use", "In use")
+    in_use.inc()
+    in_use.inc()
+    in_use.dec()
+    assert in_use.get() == 1
+
+    in_use.set(7)
+    assert in_use.get() == 7
+
+
+def test_histogram_quantiles(registry):
+    """Test histogram percentiles over observations."""
+    latency = registry.histogram("latency_ms", "Latency", ["tool"])
+    for value in range(1, 101):
+        latency.observe(value, tool="a")
+
+    summary = latency.summary(tool="a")
+
+    assert summary["count"] == 100
+    assert summary["mean"] == 50.5
+    assert summary["p50"] == 50
+    assert summary["p95"] == 95
+    assert summary["p99"] == 99
+    assert latency.summary(tool="missing")["p50"] is None
+
+
+def test_prometheus_rendering(registry):
+    """Test Prometheus text exposition output."""
+    calls = registry.counter("calls_total", "Calls", ["tool"])
+    calls.inc(tool="a")
+    latency = registry.histogram("latency_ms", "Latency", ["tool"], buckets=(10, 100))
+    latency.observe(5, tool="a")
+    latency.observe(50, tool="a")
+    latency.observe(500, tool="a")
+
+    text = registry.render_prometheus()
+
+    assert "# TYPE calls_total counter" in text
+    assert 'calls_total{tool="a"} 1' in text
+    assert "# TYPE latency_ms histogram" in text
+    assert 'latency_ms_bucket{tool="a",le="10"} 1' in text
+    assert 'latency_ms_bucket{tool="a",le="100"} 2' in text
+    assert 'latency_ms_bucket{tool="a",le="+Inf"} 3' in text
+    assert 'latency_ms_count{tool="a"} 3' in text
+
+
+def test_snapshot(registry):
+    """Test JSON snapshot output."""
+    registry.counter("calls_total", "Calls", ["tool"]).inc(tool="a")
+    registry.histogram("latency_ms", "Latency", ["tool"]).observe(3, tool="a")
+
+    snapshot = registry.snapshot()
+
+    assert snapshot["calls_total"] == {"a": 1}
+    assert snapshot["latency_ms"]["a"]["count"] == 1
+
+
+def test_tool_calls_update_metrics(server, test_simulation_id):
+    """Test that tool calls, DB checkouts and cache lookups are recorded."""
+    server.clear_cache()
+    before_calls = metrics.TOOL_CALLS.get(tool="query_agents", status="success")
+    before_hits = metrics.TOOL_CALLS.get(tool="query_agents", status="cache_hit")
+    before_checkouts = metrics.DB_CHECKOUTS.get()
+
+    tool = server.get_tool("query_agents")
+    tool(simulation_id=test_simulation_id, limit=5)
+    tool(simulation_id=test_simulation_id, limit=5)
+
+    assert metrics.TOOL_CALLS.get(tool="query_agents", status="success") == before_calls + 1
+    assert metrics.TOOL_CALLS.get(tool="query_agents", status="cache_hit") == before_hits + 1
+    assert metrics.DB_CHECKOUTS.get() > before_checkouts
+    assert metrics.TOOL_LATENCY.summary(tool="query_agents")["p99"] is not None
+
+
+def test_get_metrics_tool(server, test_simulation_id):
+    """Test the get_metrics tool JSON and Prometheus outputs."""
+    server.get_tool("query_agents")(simulation_id=test_simulation_id, limit=3)
+    server.get_tool("query_agents")(simulation_id="missing_sim", limit=3)
+
+    result = server.get_tool("get_metrics")(tool="query_agents")
+
+    assert result["success"] is True
+    assert result["metadata"]["from_cache"] is False
+    tool_metrics = result["data"]["tools"]["query_agents"]
+    assert tool_metrics["by_status"]["error"] >= 1
+    assert "SimulationNotFoundError" in tool_metrics["errors_by_type"]
+    assert set(tool_metrics["latency_ms"]) >= {"p50", "p95", "p99"}
+    assert "connections_in_use" in result["data"]["database"]
+
+    text_result = server.get_tool("get_metrics")(format="prometheus")
+    assert "mcp_tool_calls_total" in text_result["data"]["text"]
+
+
+def test_metrics_http_route(server):
+    """Test that the /metrics route renders Prometheus text."""
+    route = next(r for r in server.mcp._additional_http_routes if r.path == "/metrics")
+
+    response = asyncio.run(route.endpoint(None))
+
+    assert response.status_code == 200
+    assert b"mcp_tool_calls_total" in response.body or b"# TYPE" in response.body
+
+
+def test_server_health_check_counts_catalog_tools(server):
+    """Test that the health check compares registered tools with the catalog."""
+    from agentfarm_mcp.tools.registry import TOOL_CATALOG
+
+    tools = server.health_check()["components"]["tools"]
+
+    assert tools["registered"] == tools["expected"] == len(TOOL_CATALOG)
+
+    server._catalog.pop("get_metrics")
+    health = server.health_check()
+    assert health["components"]["tools"]["registered"] == len(TOOL_CATALOG) - 1
+    assert health["status"] == "degraded"
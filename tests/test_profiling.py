@@ -0,0 +1,75 @@
+"""Tests for on-demand tool profiling."""
+
+from agentfarm_mcp.config import MCPConfig, ProfilingConfig
+from agentfarm_mcp.server import SimulationMCPServer
+from agentfarm_mcp.utils.profiling import CATEGORIES, ToolProfiler, categorize
+
+
+def test_categorize():
+    """Test that profiled functions are assigned to time categories."""
+    assert categorize("~", "<method 'execute' of 'sqlite3.Cursor' objects>") == "sql"
+    assert categorize("/site-packages/sqlalchemy/engine/base.py", "_execute_context") == "sql"
+    assert categorize("/site-packages/sqlalchemy/orm/loading.py", "instances") == "orm"
+    assert categorize("/site-packages/numpy/core/fromnumeric.py", "mean") == "numpy"
+    assert categorize("/usr/lib/python3.11/json/encoder.py", "iterencode") == "serialization"
+    assert categorize("/repo/agentfarm_mcp/tools/query_tools.py", "execute") == "tool"
+    assert categorize("/usr/lib/python3.11/datetime.py", "now") == "other"
+
+
+def test_profiler_report(tmp_path):
+    """Test report structure and stored profile output."""
+    profiler = ToolProfiler(top_n=3, output_dir=str(tmp_path))
+
+    def work():
+        return {"values": sorted(range(10000), key=lambda v: -v)}
+
+    result, report = profiler.profile("work", work)
+
+    assert result["values"][0] == 9999
+    assert set(report["breakdown_ms"]) == set(CATEGORIES)
+    assert len(report["hotspots"]) == 3
+    assert report["hotspots"][0]["self_ms"] >= report["hotspots"][-1]["self_ms"]
+    assert report["breakdown_ms"]["serialization"] > 0
+    assert report["profile_path"].startswith(str(tmp_path))
+
+
+def _server_with(db_config, **profiling):
+    """Create a server with a given profiling config."""
+    config = MCPConfig(database=db_config, profiling=ProfilingConfig(**profiling))
+    return SimulationMCPServer(config)
+
+
+def test_per_call_profile_rejected_by_default(server, test_simulation_id):
+    """Test that _profile is refused unless the operator enables it."""
+    result = server.get_tool("query_agents")(simulation_id=test_simulation_id, _profile=True)
+
+    assert result["success"] is False
+    assert result["error"]["type"] == "PermissionError"
+
+
+def test_per_call_profile(db_config, test_simulation_id):
+    """Test that _profile attaches a report and bypasses the cache."""
+    server = _server_with(db_config, allow_per_call=True)
+    try:
+        tool = server.get_tool("query_agents")
+        plain = tool(simulation_id=test_simulation_id, limit=5)
+        assert "profile" not in plain["metadata"]
+
+        profiled = tool(simulation_id=test_simulation_id, limit=5, _profile=True)
+
+        assert profiled["metadata"]["from_cache"] is False
+        profile = profiled["metadata"]["profile"]
+        assert profile["breakdown_ms"]["sql"] > 0
+        assert profile["hotspots"]
+    finally:
+        server.close()
+
+
+def test_always_profile(db_config, test_simulation_id):
+    """Test profiling every executed call via config."""
+    server = _server_with(db_config, enabled=True)
+    try:
+        result = server.get_tool("get_simulation_info")(simulation_id=test_simulation_id)
+        assert "profile" in result["metadata"]
+    finally:
+        server.close()
@@ -0,0 +1,92 @@
+"""Tests for fast JSON serialization helpers."""
+
+import json
+from datetime import datetime
+
+import numpy as np
+
+from agentfarm_mcp.server import to_tool_result
+from agentfarm_mcp.utils import serialization
+from agentfarm_mcp.utils.serialization import PreEncoded, encode_response, hash_key
+
+
+def test_dumps_roundtrip():
+    """Test compact encoding of common payload types."""
+    timestamp = datetime(2024, 1, 1, 12, 30)
+    payload = {"rows": [{"id": 1, "value": 0.5}], "created": timestamp, 3: "int key"}
+
+    encoded = serialization.dumps(payload)
+
+    assert isinstance(encoded, bytes)
+    assert b" " not in encoded.replace(b"int key", b"")
+    decoded = serialization.loads(encoded)
+    assert decoded["rows"] == [{"id": 1, "value": 0.5}]
+    assert decoded["created"].startswith("2024-01-01")
+    assert decoded["3"] == "int key"
+
+
+def test_dumps_numpy_values():
+    """Test that NumPy arrays and scalars are encoded."""
+    decoded = serialization.loads(
+        serialization.dumps({"array": np.arange(3), "mean": np.float64(1.5)})
+    )
+
+    assert decoded["array"] == [0, 1, 2]
+    assert float(decoded["mean"]) == 1.5
+
+
+def test_hash_key():
+    """Test that keys are stable, order-insensitive and namespaced by tool."""
+    key = hash_key("query_agents", {"simulation_id": "sim_001", "limit": 100})
+
+    assert key == hash_key("query_agents", {"limit": 100, "simulation_id": "sim_001"})
+    assert key != hash_key("query_agents", {"simulation_id": "sim_001", "limit": 101})
+    assert key != hash_key("query_states", {"simulation_id": "sim_001", "limit": 100})
+    assert key.startswith("query_agents:")
+
+
+def test_pre_encoded_memoizes():
+    """Test that the encoding is computed once and reused."""
+    data = PreEncoded({"agents": [{"agent_id": "a"}], "total_count": 1})
+
+    first = data.encoded()
+
+    assert data.encoded() is first
+    assert serialization.dumps(data) is first
+    assert json.loads(first) == data
+    assert PreEncoded({"a": 1}, encoded=b'{"a":1}').encoded() == b'{"a":1}'
+
+
+def test_encode_response_splices_pre_encoded_data():
+    """Test that responses with pre-encoded data match a full encode."""
+    data = {"agents": [{"agent_id": "a", "birth_time": 0}], "total_count": 1}
+    response = {
+        "success": True,
+        "data": PreEncoded(data),
+        "metadata": {"tool": "query_agents", "from_cache": True},
+        "error": None,
+    }
+
+    assert json.loads(encode_response(response)) == json.loads(
+        serialization.dumps({**response, "data": data})
+    )
+    assert json.loads(encode_response({"success": False, "data": None})) == {
+        "success": False,
+        "data": None,
+    }
+
+
+def test_cached_results_are_pre_encoded(server, test_simulation_id):
+    """Test that cache hits return data with a memoized encoding."""
+    tool = server.get_tool("query_agents")
+
+    first = tool(simulation_id=test_simulation_id, limit=5)
+    cached = tool(simulation_id=test_simulation_id, limit=5)
+
+    assert cached["metadata"]["from_cache"] is True
+    assert isinstance(cached["data"], PreEncoded)
+    assert cached["data"] is first["data"]
+
+    result = to_tool_result(cached)
+    assert json.loads(result.content[0].text)["data"] == json.loads(cached["data"].encoded())
+    assert result.structured_content["data"]["returned_count"] == 5
@@ -5,6 +5,7 @@ import sys
 
 from agentfarm_mcp.config import MCPConfig
 from agentfarm_mcp.server import SimulationMCPServer
+from agentfarm_mcp.tools.registry import TOOL_CATALOG
 
 
 def test_server():
@@ -18,8 +19,8 @@ def test_server():
     server = SimulationMCPServer(config)
     print(f"   ✓ Server initialized with {len(server.list_tools())} tools")
 
-    # Verify we have the expected number of tools (25)
-    expected_tool_count = 25
+    # Verify every tool in the catalog was registered
+    expected_tool_count = len(TOOL_CATALOG)
     actual_tool_count = len(server.list_tools())
     if actual_tool_count == expected_tool_count:
         print(f"   ✓ Tool count correct: {actual_tool_count}")
@@ -0,0 +1,67 @@
+"""Tests for the grid spatial index."""
+
+import numpy as np
+import pytest
+
+from agentfarm_mcp.utils.spatial_index import GridIndex
+
+
+@pytest.fixture
+def points():
+    """Clustered random points with a few far outliers."""
+    rng = np.random.default_rng(7)
+    xs = np.concatenate([rng.normal(50, 5, 2000), rng.uniform(0, 1000, 200), [5000.0]])
+    ys = np.concatenate([rng.normal(50, 5, 2000), rng.uniform(0, 1000, 200), [-3000.0]])
+    return xs, ys
+
+
+def test_bbox_matches_brute_force(points):
+    """Test that bounding-box results equal a full scan."""
+    xs, ys = points
+    index = GridIndex(xs, ys)
+
+    for box in [(40, 40, 55, 60), (0, 0, 1000, 1000), (-10, -10, -5, -5), (4999, -3001, 6000, 0)]:
+        expected = np.flatnonzero(
+            (xs >= box[0]) & (xs <= box[2]) & (ys >= box[1]) & (ys <= box[3])
+        )
+        assert list(index.bbox(*box)) == list(expected)
+
+
+def test_radius_matches_brute_force(points):
+    """Test that radius results equal a full scan, nearest first."""
+    xs, ys = points
+    index = GridIndex(xs, ys)
+
+    for x, y, radius in [(50, 50, 3), (500, 500, 120), (-100, -100, 50)]:
+        found, distances = index.radius(x, y, radius)
+        expected = np.flatnonzero(np.hypot(xs - x, ys - y) <= radius)
+        assert sorted(found) == list(expected)
+        assert np.all(np.diff(distances) >= 0)
+
+
+def test_nearest_matches_brute_force(points):
+    """Test that k-nearest results equal a full scan, including far query points."""
+    xs, ys = points
+    index = GridIndex(xs, ys)
+
+    for x, y, k in [(50, 50, 10), (700, 300, 5), (5000, -2000, 3), (-1e6, 1e6, 1)]:
+        found, distances = index.nearest(x, y, k)
+        brute = np.sort(np.hypot(xs - x, ys - y))[:k]
+        assert len(found) == k
+        np.testing.assert_allclose(distances, brute)
+        np.testing.assert_allclose(np.hypot(xs[found] - x, ys[found] - y), distances)
+
+
+def test_missing_coordinates_and_empty_index():
+    """Test that missing coordinates are skipped and empty indexes answer nothing."""
+    index = GridIndex([0.0, None, 2.0, np.nan], [0.0, 1.0, 2.0, 3.0])
+
+    assert len(index) == 2
+    assert list(index.bbox(-1, -1, 5, 5)) == [0, 2]
+    assert list(index.nearest(0, 0, 10)[0]) == [0, 2]
+
+    empty = GridIndex([], [])
+    assert len(empty) == 0
+    assert list(empty.bbox(0, 0, 1, 1)) == []
+    assert list(empty.nearest(0, 0, 3)[0]) == []
+    assert list(empty.radius(0, 0, 3)[0]) == []
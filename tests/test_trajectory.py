@@ -0,0 +1,52 @@
+"""Tests for trajectory run-length encoding."""
+
+import math
+import random
+
+from agentfarm_mcp.utils.trajectory import decode_runs, decode_trajectory, encode_runs
+
+
+def test_constant_and_linear_runs():
+    """Test that constant and constant-rate stretches collapse into single runs."""
+    assert encode_runs([7, 7, 7, 7]) == [[7, 0, 4]]
+    assert encode_runs(list(range(0, 1000, 10))) == [[0, 10, 100]]
+    assert encode_runs([1.5, 1.5, 2.0, 2.5, 3.0]) == [[1.5, 0, 2], [2.0, 0.5, 3]]
+    assert encode_runs([]) == []
+
+
+def test_round_trip_is_exact():
+    """Test that decoding restores values exactly, including awkward floats."""
+    rng = random.Random(3)
+    columns = [
+        [0.1 * step for step in range(500)],
+        [rng.choice([1.0, 1.0, 2.5]) for _ in range(500)],
+        [rng.random() for _ in range(100)],
+        [None, None, 3, 4, 5, None, True, True, False, 1, 1.0, "a", "a"],
+    ]
+    for values in columns:
+        decoded = decode_runs(encode_runs(values))
+        assert decoded == values
+        assert [type(value) for value in decoded] == [type(value) for value in values]
+
+
+def test_non_finite_values():
+    """Test that NaN and infinities never start linear runs."""
+    values = [1.0, math.inf, math.inf, 2.0]
+    assert decode_runs(encode_runs(values)) == values
+
+    decoded = decode_runs(encode_runs([math.nan, 1.0]))
+    assert math.isnan(decoded[0]) and decoded[1] == 1.0
+
+
+def test_decode_trajectory_nested_columns():
+    """Test decoding of nested column groups into rows."""
+    trajectory = {
+        "step_number": [[0, 1, 3]],
+        "position": {"x": [[0.0, 0.5, 3]], "y": [[2.0, 0, 3]]},
+    }
+
+    assert decode_trajectory(trajectory) == [
+        {"step_number": 0, "position": {"x": 0.0, "y": 2.0}},
+        {"step_number": 1, "position": {"x": 0.5, "y": 2.0}},
+        {"step_number": 2, "position": {"x": 1.0, "y": 2.0}},
+    ]
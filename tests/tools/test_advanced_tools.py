@@ -95,6 +95,27 @@ def test_get_lifecycle_basic(get_lifecycle_tool, test_simulation_id, test_agent_
     assert "agent_info" in result["data"]
 
 
+def test_get_lifecycle_stream(get_lifecycle_tool, test_simulation_id, test_agent_id):
+    """Test that streaming delivers the same lifecycle in sections."""
+    get_lifecycle_tool.stream_chunk_size = 2
+    full = get_lifecycle_tool(simulation_id=test_simulation_id, agent_id=test_agent_id)["data"]
+
+    envelopes = list(
+        get_lifecycle_tool.stream(simulation_id=test_simulation_id, agent_id=test_agent_id)
+    )
+    chunks, end = [e["data"] for e in envelopes[:-1]], envelopes[-1]
+
+    assert chunks[0] == {"agent_info": full["agent_info"]}
+    for section in ("states", "actions", "health_incidents"):
+        parts = [c[section] for c in chunks if section in c]
+        assert all(len(part) <= 2 for part in parts)
+        assert [row for part in parts for row in part] == full[section]
+
+    assert end["success"] is True
+    assert end["data"]["state_count"] == full["state_count"]
+    assert end["data"]["action_count"] == full["action_count"]
+
+
 def test_get_lifecycle_agent_info(get_lifecycle_tool, test_simulation_id, test_agent_id):
     """Test agent info in lifecycle."""
     result = get_lifecycle_tool(
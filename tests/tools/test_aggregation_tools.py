@@ -0,0 +1,168 @@
+"""Unit tests for aggregation tools."""
+
+import pytest
+from sqlalchemy import event
+
+from agentfarm_mcp.tools.aggregation_tools import AGGREGATE_TIMEOUT_MS, AggregateTableTool
+from agentfarm_mcp.utils.deadlines import current_deadline
+
+
+@pytest.fixture
+def aggregate_tool(services):
+    """Create AggregateTableTool instance."""
+    db_service, cache_service = services
+    return AggregateTableTool(db_service, cache_service)
+
+
+def test_aggregate_count_by_column(aggregate_tool, test_simulation_id):
+    """Test counting rows per group."""
+    result = aggregate_tool(
+        simulation_id=test_simulation_id, table="agents", group_by=["agent_type"]
+    )
+
+    assert result["success"] is True
+    data = result["data"]
+    assert data["group_by"] == ["agent_type"]
+    assert data["aggregates"] == ["count"]
+    assert sum(group["count"] for group in data["groups"]) == 20
+    assert [group["agent_type"] for group in data["groups"]] == sorted(
+        group["agent_type"] for group in data["groups"]
+    )
+    assert data["truncated"] is False
+
+
+def test_aggregate_step_buckets(aggregate_tool, test_simulation_id):
+    """Test grouping by step windows."""
+    result = aggregate_tool(
+        simulation_id=test_simulation_id,
+        table="simulation_steps",
+        step_bucket=25,
+        aggregates=["count", "sum:births", "max:total_agents"],
+    )
+
+    assert result["success"] is True
+    groups = result["data"]["groups"]
+    assert [group["step_bucket"] for group in groups] == [0, 25, 50, 75]
+    assert all(group["count"] == 25 for group in groups)
+    assert set(groups[0]) == {"step_bucket", "count", "sum_births", "max_total_agents"}
+
+
+def test_aggregate_order_and_limit(aggregate_tool, test_simulation_id):
+    """Test ordering by an aggregate and truncation."""
+    result = aggregate_tool(
+        simulation_id=test_simulation_id,
+        table="agent_actions",
+        group_by=["agent_id"],
+        aggregates=["sum:reward", "avg:reward"],
+        order_by="sum_reward",
+        descending=True,
+        limit=2,
+    )
+
+    assert result["success"] is True
+    data = result["data"]
+    assert data["returned_count"] == 2
+    assert data["truncated"] is True
+    assert data["groups"][0]["sum_reward"] >= data["groups"][1]["sum_reward"]
+
+
+def test_aggregate_filters_and_step_range(aggregate_tool, test_simulation_id):
+    """Test equality filters and step ranges."""
+    result = aggregate_tool(
+        simulation_id=test_simulation_id,
+        table="simulation_steps",
+        aggregates=["count"],
+        start_step=10,
+        end_step=19,
+    )
+    assert result["data"]["groups"] == [{"count": 10}]
+
+    result = aggregate_tool(
+        simulation_id=test_simulation_id,
+        table="agents",
+        aggregates=["count"],
+        filters={"agent_type": "system"},
+    )
+    assert 0 < result["data"]["groups"][0]["count"] < 20
+
+
+def test_aggregate_runs_single_group_by_query(aggregate_tool, db_service, test_simulation_id):
+    """Test that aggregation is compiled to a GROUP BY in the database."""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db_service._engine, "before_cursor_execute", capture)
+    try:
+        aggregate_tool(
+            simulation_id=test_simulation_id,
+            table="agent_actions",
+            group_by=["action_type"],
+            step_bucket=10,
+        )
+    finally:
+        event.remove(db_service._engine, "before_cursor_execute", capture)
+
+    grouped = [statement for statement in statements if "GROUP BY" in statement]
+    assert len(grouped) == 1
+    assert "LIMIT" in grouped[0]
+
+
+@pytest.mark.parametrize("timeout_ms, expected", [(None, AGGREGATE_TIMEOUT_MS), (500, 500)])
+def test_aggregate_runs_under_deadline(
+    aggregate_tool, test_simulation_id, monkeypatch, timeout_ms, expected
+):
+    """Test that aggregations always run under a deadline, the caller's if given."""
+    deadlines = []
+    execute_query = aggregate_tool.db.execute_query
+
+    def spy(query_func):
+        deadlines.append(current_deadline())
+        return execute_query(query_func)
+
+    monkeypatch.setattr(aggregate_tool.db, "execute_query", spy)
+    aggregate_tool(simulation_id=test_simulation_id, table="agents", timeout_ms=timeout_ms)
+
+    assert deadlines[-1].timeout_ms == expected
+
+
+def test_aggregate_columnar_format(aggregate_tool, test_simulation_id):
+    """Test columnar output for groups."""
+    result = aggregate_tool(
+        simulation_id=test_simulation_id,
+        table="agents",
+        group_by=["agent_type"],
+        format="columnar",
+    )
+
+    assert result["success"] is True
+    assert set(result["data"]["groups"]) == {"agent_type", "count"}
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"table": "simulations"},
+        {"table": "agents", "group_by": ["position_x"]},
+        {"table": "agent_actions", "aggregates": ["sum:details"]},
+        {"table": "agent_actions", "aggregates": ["median:reward"]},
+        {"table": "agent_actions", "aggregates": ["count:reward"]},
+        {"table": "agent_actions", "filters": {"details": "x"}},
+        {"table": "agent_actions", "group_by": ["agent_id"], "order_by": "reward"},
+    ],
+)
+def test_aggregate_rejects_unlisted_columns(aggregate_tool, test_simulation_id, params):
+    """Test that only whitelisted tables, columns and functions are accepted."""
+    result = aggregate_tool(simulation_id=test_simulation_id, **params)
+
+    assert result["success"] is False
+    assert result["error"]["type"] == "ValidationError"
+
+
+def test_aggregate_nonexistent_simulation(aggregate_tool):
+    """Test aggregating a simulation that does not exist."""
+    result = aggregate_tool(simulation_id="nonexistent_sim", table="agents")
+
+    assert result["success"] is False
+    assert result["error"]["type"] == "SimulationNotFoundError"
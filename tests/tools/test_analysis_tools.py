@@ -2,6 +2,10 @@
 
 import pytest
 
+from agentfarm_mcp.config import CacheConfig, DatabaseConfig
+from agentfarm_mcp.services.cache_service import CacheService
+from agentfarm_mcp.services.database_service import DatabaseService
+from agentfarm_mcp.services.rollup_service import RollupService
 from agentfarm_mcp.tools.analysis_tools import (
     AnalyzeAgentPerformanceTool,
     AnalyzePopulationDynamicsTool,
@@ -290,6 +294,39 @@ def test_identify_critical_events_structure(identify_events_tool, test_simulatio
         assert "severity" in event
 
 
+def test_identify_events_optional_detectors(identify_events_tool, test_simulation_id):
+    """Test opt-in detectors run alongside the defaults."""
+    result = identify_events_tool(
+        simulation_id=test_simulation_id,
+        detectors=["resource_depletion", "anomaly"],
+        depletion_percent=60.0,
+    )
+
+    data = result["data"]
+    assert data["detectors"] == ["resource_depletion", "anomaly"]
+    # Resources fall by 5 per step from 1000, reaching 600 at step 80; the
+    # population steps down every 20 steps, first seen against a varying window at 21
+    assert [(e["type"], e["step"]) for e in data["events"]] == [
+        ("anomaly", 21),
+        ("anomaly", 41),
+        ("anomaly", 61),
+        ("resource_depletion", 80),
+        ("anomaly", 81),
+    ]
+
+
+@pytest.mark.parametrize(
+    "params",
+    [{"detectors": ["no_such_detector"]}, {"detectors": ["anomaly"], "anomaly_metric": "x"}],
+)
+def test_identify_events_invalid_detector(identify_events_tool, test_simulation_id, params):
+    """Test unknown detectors and metrics are rejected."""
+    result = identify_events_tool(simulation_id=test_simulation_id, **params)
+
+    assert result["success"] is False
+    assert result["error"]["type"] == "ValidationError"
+
+
 # AnalyzeSocialPatternsTool Tests
 
 
@@ -374,4 +411,71 @@ def test_identify_events_summary_structure(identify_events_tool, test_simulation
 
     assert "summary" in result["data"]
     summary = result["data"]["summary"]
-    assert "total_events" in summary
\ No newline at end of file
+    assert "total_events" in summary
+
+
+# Rollup-backed analysis
+
+
+@pytest.fixture
+def rollup_services(test_db_with_data, tmp_path):
+    """Uncached services whose rollup sidecar holds test_sim_000."""
+    config = DatabaseConfig(
+        path=str(test_db_with_data), rollup_path=str(tmp_path / "rollups.db")
+    )
+    db_service = DatabaseService(config)
+    RollupService(db_service).build("test_sim_000")
+    yield db_service, CacheService(CacheConfig(enabled=False))
+    db_service.close()
+
+
+@pytest.mark.parametrize(
+    "tool_class, params",
+    [
+        (AnalyzeSurvivalRatesTool, {"group_by": "generation"}),
+        (AnalyzeSurvivalRatesTool, {"group_by": "agent_type"}),
+        (AnalyzeReproductionTool, {}),
+        (AnalyzeSocialPatternsTool, {"limit": 100}),
+        (AnalyzePopulationDynamicsTool, {"bucket_size": 100, "include_chart": True}),
+        (AnalyzePopulationDynamicsTool, {"bucket_size": 100, "start_step": 0, "end_step": 99}),
+    ],
+)
+def test_rollup_matches_raw(db_service, rollup_services, tool_class, params):
+    """Test tools answer from the rollup exactly as from the raw tables."""
+    raw = tool_class(db_service, rollup_services[1])(simulation_id="test_sim_000", **params)
+    rolled = tool_class(*rollup_services)(simulation_id="test_sim_000", **params)
+
+    assert raw["data"]["source"] == "raw"
+    assert rolled["data"]["source"] == "rollup"
+    assert {**rolled["data"], "source": "raw"} == raw["data"]
+
+
+def test_rollup_falls_back_to_raw(rollup_services):
+    """Test groupings without a rollup read the raw tables."""
+    survival = AnalyzeSurvivalRatesTool(*rollup_services)
+
+    assert survival(simulation_id="test_sim_000", group_by="all")["data"]["source"] == "raw"
+
+
+def test_social_rollup_respects_limit(rollup_services):
+    """Test the rollup serves social analysis only when the limit covers it."""
+    social = AnalyzeSocialPatternsTool(*rollup_services)
+
+    # test_sim_000 has one social interaction, which any limit covers
+    assert social(simulation_id="test_sim_000", limit=1)["data"]["source"] == "rollup"
+
+
+def test_population_buckets_fall_back_to_raw(rollup_services):
+    """Test bucket sizes and step ranges the rollup cannot answer read the raw steps."""
+    population = AnalyzePopulationDynamicsTool(*rollup_services)
+
+    other_size = population(simulation_id="test_sim_000", bucket_size=25)["data"]
+    unaligned = population(
+        simulation_id="test_sim_000", bucket_size=100, start_step=10, end_step=59
+    )["data"]
+
+    assert other_size["source"] == "raw"
+    assert [b["bucket_start"] for b in other_size["buckets"]] == [0, 25, 50, 75]
+    assert unaligned["source"] == "raw"
+    assert unaligned["step_range"] == {"start": 10, "end": 59, "count": 50}
+    assert [b["steps"] for b in unaligned["buckets"]] == [50]
@@ -56,6 +56,24 @@ class FailingTool(ToolBase):
         raise DatabaseError("Test database error")
 
 
+class TabularTool(TestTool):
+    """Tool returning a row list (for testing response formats)."""
+
+    tabular_keys = ("rows",)
+
+    @property
+    def name(self) -> str:
+        return "tabular_tool"
+
+    def execute(self, **params):
+        """Return rows with a categorical and a nested column."""
+        rows = [
+            {"agent_type": "system", "value": i, "position": {"x": i, "y": -i}}
+            for i in range(params["value"])
+        ]
+        return {"rows": rows, "returned_count": len(rows)}
+
+
 @pytest.fixture
 def test_tool(services):
     """Create test tool instance."""
@@ -353,4 +371,135 @@ def test_tool_all_abstract_properties_defined(test_tool):
     assert isinstance(test_tool.name, str)
     assert isinstance(test_tool.description, str)
     assert test_tool.parameters_schema is not None
-    assert callable(test_tool.execute)
\ No newline at end of file
+    assert callable(test_tool.execute)
+
+def test_tool_query_stats_metadata(server, test_simulation_id):
+    """Test that SQL statistics are attached to metadata only when enabled."""
+    server.clear_cache()
+    tool = server.get_tool("query_agents")
+
+    result = tool(simulation_id=test_simulation_id, limit=5)
+    assert "query_stats" not in result["metadata"]
+
+    server.clear_cache()
+    server.db_service.config.collect_query_stats = True
+    result = tool(simulation_id=test_simulation_id, limit=5)
+
+    stats = result["metadata"]["query_stats"]
+    assert stats["statements"] >= 2
+    assert stats["rows_fetched"] >= result["data"]["returned_count"]
+    assert stats["db_time_ms"] > 0
+
+
+def test_tool_stream_default_single_chunk(test_tool):
+    """Test that non-streamable tools stream their result as one chunk."""
+    envelopes = list(test_tool.stream(value=5, name="test"))
+
+    assert envelopes[0] == {
+        "type": "chunk",
+        "index": 0,
+        "data": {"result": "Executed with value=5, name=test"},
+    }
+    assert envelopes[1]["type"] == "end"
+    assert envelopes[1]["success"] is True
+
+
+def test_tool_stream_validation_error(test_tool):
+    """Test that invalid stream parameters produce an error envelope."""
+    envelopes = list(test_tool.stream(value=-1, name="test"))
+
+    assert len(envelopes) == 1
+    assert envelopes[0]["error"]["type"] == "ValidationError"
+
+
+def test_tool_columnar_format(services):
+    """Test that tabular tools return dictionary-encoded columns on request."""
+    tool = TabularTool(*services)
+
+    rows = tool(value=3, name="test")
+    columnar = tool(value=3, name="test", format="columnar")
+
+    assert rows["data"]["rows"][0] == {
+        "agent_type": "system",
+        "value": 0,
+        "position": {"x": 0, "y": 0},
+    }
+    assert columnar["metadata"]["from_cache"] is False
+    assert columnar["data"]["returned_count"] == 3
+    assert columnar["data"]["rows"] == {
+        "agent_type": {"dictionary": ["system"], "codes": [0, 0, 0]},
+        "value": [0, 1, 2],
+        "position": {"x": [0, 1, 2], "y": [0, -1, -2]},
+    }
+
+    cached = tool(value=3, name="test", format="columnar")
+    assert cached["metadata"]["from_cache"] is True
+    assert cached["data"] == columnar["data"]
+
+
+def test_tool_invalid_format(services):
+    """Test that unknown formats are rejected and non-tabular tools ignore format."""
+    result = TabularTool(*services)(value=3, name="test", format="csv")
+
+    assert result["success"] is False
+    assert result["error"]["type"] == "ValidationError"
+
+    envelopes = list(TabularTool(*services).stream(value=3, name="test", format="csv"))
+    assert envelopes[-1]["error"]["type"] == "ValidationError"
+
+
+class SlowTool(TestTool):
+    """Tool whose execution outlives short deadlines."""
+
+    @property
+    def name(self) -> str:
+        return "slow_tool"
+
+    def execute(self, **params):
+        """Sleep, then return a result."""
+        import time
+
+        time.sleep(0.05)
+        return super().execute(**params)
+
+
+def test_tool_deadline_exceeded_skips_cache(services):
+    """Test that results of calls past their deadline are dropped, not cached."""
+    tool = SlowTool(*services)
+
+    result = tool(value=5, name="test", timeout_ms=10)
+
+    assert result["success"] is False
+    assert result["error"]["type"] == "QueryTimeoutError"
+    assert tool.cache.get(tool._get_cache_key(tool.parameters_schema(value=5, name="test"))) is None
+
+    result = tool(value=5, name="test", timeout_ms=5000)
+    assert result["success"] is True
+    assert result["metadata"]["from_cache"] is False
+
+
+def test_tool_invalid_timeout(test_tool):
+    """Test that non-positive deadlines are rejected."""
+    for timeout_ms in (0, -5, "fast", True):
+        result = test_tool(value=5, name="test", timeout_ms=timeout_ms)
+
+        assert result["success"] is False
+        assert result["error"]["type"] == "ValidationError"
+
+
+def test_tool_stream_deadline(services):
+    """Test that streams stop with an error envelope once the deadline passes."""
+
+    class SlowStreamTool(TestTool):
+        def execute_stream(self, **params):
+            import time
+
+            for index in range(10):
+                time.sleep(0.02)
+                yield {"index": index}
+
+    envelopes = list(SlowStreamTool(*services).stream(value=5, name="test", timeout_ms=30))
+
+    assert 0 < len(envelopes) < 10
+    assert envelopes[-1]["type"] == "end"
+    assert envelopes[-1]["error"]["type"] == "QueryTimeoutError"
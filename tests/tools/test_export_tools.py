@@ -0,0 +1,88 @@
+"""Unit tests for export tools."""
+
+import pytest
+
+from agentfarm_mcp.tools.export_tools import ExportSimulationDataTool
+
+
+@pytest.fixture
+def export_tool(services, tmp_path):
+    """Create ExportSimulationDataTool instance exporting under tmp_path."""
+    db_service, cache_service = services
+    db_service.config.export_dir = str(tmp_path)
+    return ExportSimulationDataTool(db_service, cache_service)
+
+
+def test_export_simulation_data(export_tool, test_simulation_id, tmp_path):
+    """Test exporting the default tables to CSV."""
+    result = export_tool(simulation_id=test_simulation_id, format="csv", output_dir="runs")
+
+    assert result["success"] is True
+    data = result["data"]
+    assert [file["table"] for file in data["files"]] == [
+        "agent_states",
+        "agent_actions",
+        "interactions",
+    ]
+    assert data["total_rows"] == sum(file["rows"] for file in data["files"])
+    for file in data["files"]:
+        assert (tmp_path / "runs" / test_simulation_id / f"{file['table']}.csv").exists()
+
+
+def test_export_simulation_data_default_dir(export_tool, test_simulation_id, tmp_path):
+    """Test that exports go to the export directory by default."""
+    result = export_tool(simulation_id=test_simulation_id, tables=["agents"], format="csv")
+
+    assert result["success"] is True
+    assert result["data"]["output_dir"] == str((tmp_path / test_simulation_id).resolve())
+
+
+@pytest.mark.parametrize("output_dir", ["..", "runs/../../elsewhere", "/tmp"])
+def test_export_simulation_data_outside_export_dir(
+    export_tool, test_simulation_id, tmp_path, output_dir
+):
+    """Test that output directories outside the export directory are rejected."""
+    result = export_tool(simulation_id=test_simulation_id, format="csv", output_dir=output_dir)
+
+    assert result["success"] is False
+    assert result["error"]["type"] == "ValidationError"
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_export_simulation_data_symlink_escape(export_tool, test_simulation_id, tmp_path):
+    """Test that a symlink inside the export directory cannot lead out of it."""
+    outside = tmp_path.parent / f"{tmp_path.name}_outside"
+    outside.mkdir()
+    (tmp_path / "link").symlink_to(outside)
+
+    result = export_tool(simulation_id=test_simulation_id, format="csv", output_dir="link")
+
+    assert result["success"] is False
+    assert result["error"]["type"] == "ValidationError"
+    assert list(outside.iterdir()) == []
+
+
+def test_export_simulation_data_not_cached(export_tool, test_simulation_id):
+    """Test that exports run every time instead of being served from cache."""
+    params = dict(simulation_id=test_simulation_id, format="csv")
+
+    export_tool(**params)
+    result = export_tool(**params)
+
+    assert result["metadata"]["from_cache"] is False
+
+
+def test_export_simulation_data_nonexistent(export_tool):
+    """Test exporting a simulation that does not exist."""
+    result = export_tool(simulation_id="nonexistent_sim")
+
+    assert result["success"] is False
+    assert result["error"]["type"] == "SimulationNotFoundError"
+
+
+def test_export_simulation_data_invalid_table(export_tool, test_simulation_id):
+    """Test that unknown table names fail validation."""
+    result = export_tool(simulation_id=test_simulation_id, tables=["simulations"])
+
+    assert result["success"] is False
+    assert result["error"]["type"] == "ValidationError"
@@ -0,0 +1,281 @@
+"""Tests for multi-simulation fan-out of the query tools."""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from agentfarm_mcp.config import CacheConfig, DatabaseConfig
+from agentfarm_mcp.models.database_models import (
+    ActionModel,
+    AgentModel,
+    Base,
+    ExperimentModel,
+    Simulation,
+)
+from agentfarm_mcp.services.cache_service import CacheService
+from agentfarm_mcp.services.database_service import DatabaseService
+from agentfarm_mcp.tools.query_tools import (
+    QueryActionsTool,
+    QueryAgentsTool,
+    QueryStatesTool,
+)
+
+# Action steps per simulation: fan_c ties with fan_a on every step it has
+ACTION_STEPS = {"fan_a": [0, 2, 4, 6, 8], "fan_b": [1, 3, 5, 7, 9], "fan_c": [0, 4, 8]}
+AGENT_COUNTS = {"fan_a": 2, "fan_b": 3, "fan_c": 0}
+# Death step of each agent (None: alive)
+DEATH_TIMES = {"fan_a": [9, None], "fan_b": [None, 3, 7], "fan_c": []}
+
+
+@pytest.fixture(scope="module")
+def fan_db_path(tmp_path_factory):
+    """Create an experiment with three simulations of interleaved actions."""
+    db_path = tmp_path_factory.mktemp("fan_out") / "fan.db"
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(ExperimentModel(experiment_id="exp_fan", name="Fan-out", status="completed"))
+    session.add(ExperimentModel(experiment_id="exp_empty", name="Empty", status="planned"))
+    for simulation_id, steps in ACTION_STEPS.items():
+        session.add(
+            Simulation(
+                simulation_id=simulation_id,
+                experiment_id="exp_fan",
+                status="completed",
+                parameters={},
+                simulation_db_path=str(db_path),
+            )
+        )
+        for j in range(AGENT_COUNTS[simulation_id]):
+            session.add(
+                AgentModel(
+                    simulation_id=simulation_id,
+                    agent_id=f"{simulation_id}_agent_{j}",
+                    agent_type="system",
+                    death_time=DEATH_TIMES[simulation_id][j],
+                )
+            )
+        for step in steps:
+            session.add(
+                ActionModel(
+                    simulation_id=simulation_id,
+                    agent_id=f"{simulation_id}_agent_0",
+                    step_number=step,
+                    action_type="move",
+                    reward=float(step),
+                )
+            )
+    session.commit()
+    session.close()
+    engine.dispose()
+    return db_path
+
+
+@pytest.fixture
+def fan_services(fan_db_path):
+    """Database and cache services over the fan-out database."""
+    db_service = DatabaseService(DatabaseConfig(path=str(fan_db_path)))
+    yield db_service, CacheService(CacheConfig(enabled=False))
+    db_service.close()
+
+
+@pytest.fixture
+def actions_tool(fan_services):
+    """Create QueryActionsTool over the fan-out database."""
+    return QueryActionsTool(*fan_services)
+
+
+def _expected_actions():
+    """All actions merged by step, ties in simulation order."""
+    merged = [
+        (step, simulation_id)
+        for simulation_id, steps in ACTION_STEPS.items()
+        for step in steps
+    ]
+    return sorted(merged, key=lambda item: item[0])
+
+
+def test_fan_out_merges_by_step(actions_tool):
+    """Test rows from all simulations are merged in step order, ties stable."""
+    result = actions_tool(simulation_ids=["fan_a", "fan_b", "fan_c"], limit=100)
+
+    assert result["success"] is True
+    data = result["data"]
+    assert [(row["step_number"], row["simulation_id"]) for row in data["actions"]] == (
+        _expected_actions()
+    )
+    assert data["total_count"] == 13
+    assert data["simulation_counts"] == {"fan_a": 5, "fan_b": 5, "fan_c": 3}
+    assert data["next_cursor"] is None
+
+
+def test_fan_out_cursor_pages(actions_tool):
+    """Test following next_cursor yields the merged result without gaps or repeats."""
+    seen = []
+    cursor = None
+    for _ in range(10):
+        data = actions_tool(
+            simulation_ids=["fan_a", "fan_b", "fan_c"], limit=4, cursor=cursor
+        )["data"]
+        assert data["returned_count"] <= 4
+        seen.extend((row["step_number"], row["simulation_id"]) for row in data["actions"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == _expected_actions()
+
+
+def test_fan_out_offset(actions_tool):
+    """Test offset pagination slices the merged result."""
+    data = actions_tool(simulation_ids=["fan_a", "fan_b", "fan_c"], limit=3, offset=5)["data"]
+
+    assert [(row["step_number"], row["simulation_id"]) for row in data["actions"]] == (
+        _expected_actions()[5:8]
+    )
+    assert data["offset"] == 5
+    assert data["next_cursor"] is not None
+
+
+def test_fan_out_projection_keeps_merge_order(actions_tool):
+    """Test a projection without the sort field still merges by step."""
+    data = actions_tool(
+        simulation_ids=["fan_b", "fan_a"], fields=["reward"], limit=100
+    )["data"]
+
+    assert all(set(row) == {"simulation_id", "reward"} for row in data["actions"])
+    assert [row["reward"] for row in data["actions"]] == [float(step) for step in range(10)]
+
+
+def test_fan_out_experiment(fan_services):
+    """Test experiment_id covers its simulations in ID order."""
+    tool = QueryAgentsTool(*fan_services)
+
+    data = tool(experiment_id="exp_fan")["data"]
+
+    assert [row["simulation_id"] for row in data["agents"]] == ["fan_a"] * 2 + ["fan_b"] * 3
+    assert data["simulation_counts"] == {"fan_a": 2, "fan_b": 3, "fan_c": 0}
+
+    empty = tool(experiment_id="exp_empty")["data"]
+    assert empty["agents"] == []
+    assert empty["total_count"] == 0
+
+
+def test_fan_out_sorted_descending(fan_services):
+    """Test pages sorted in descending order merge in that order."""
+    tool = QueryAgentsTool(*fan_services)
+
+    data = tool(simulation_ids=["fan_a", "fan_b"], sort_by="agent_id", order="desc")["data"]
+
+    assert [row["agent_id"] for row in data["agents"]] == [
+        "fan_b_agent_2",
+        "fan_b_agent_1",
+        "fan_b_agent_0",
+        "fan_a_agent_1",
+        "fan_a_agent_0",
+    ]
+
+
+@pytest.mark.parametrize(
+    "order, expected",
+    [
+        (
+            "asc",
+            [
+                ("fan_a_agent_1", None),
+                ("fan_b_agent_0", None),
+                ("fan_b_agent_1", 3),
+                ("fan_b_agent_2", 7),
+                ("fan_a_agent_0", 9),
+            ],
+        ),
+        (
+            "desc",
+            [
+                ("fan_a_agent_0", 9),
+                ("fan_b_agent_2", 7),
+                ("fan_b_agent_1", 3),
+                ("fan_a_agent_1", None),
+                ("fan_b_agent_0", None),
+            ],
+        ),
+    ],
+)
+def test_fan_out_sorted_with_nulls(fan_services, order, expected):
+    """Test NULL sort values merge where each simulation's query puts them."""
+    tool = QueryAgentsTool(*fan_services)
+    params = dict(simulation_ids=["fan_a", "fan_b"], sort_by="death_time", order=order)
+
+    data = tool(**params)["data"]
+    first = tool(**params, limit=2)["data"]
+    second = tool(**params, limit=2, cursor=first["next_cursor"])["data"]
+
+    assert [(row["agent_id"], row["death_time"]) for row in data["agents"]] == expected
+    pages = [first["agents"], second["agents"]]
+    assert [[row["agent_id"] for row in page] for page in pages] == [
+        [agent_id for agent_id, _ in expected[:2]],
+        [agent_id for agent_id, _ in expected[2:4]],
+    ]
+
+
+def test_fan_out_columnar(actions_tool):
+    """Test the merged rows convert to columns with a simulation_id column."""
+    data = actions_tool(simulation_ids=["fan_a", "fan_c"], format="columnar")["data"]
+
+    assert data["actions"]["simulation_id"][:3] == ["fan_a", "fan_c", "fan_a"]
+
+
+def test_single_simulation_unchanged(actions_tool):
+    """Test a plain simulation_id query keeps its response shape."""
+    data = actions_tool(simulation_id="fan_a")["data"]
+
+    assert "simulation_id" not in data["actions"][0]
+    assert "next_cursor" not in data
+    assert data["total_count"] == 5
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {},
+        {"simulation_id": "fan_a", "simulation_ids": ["fan_b"]},
+        {"simulation_ids": []},
+        {"simulation_id": "fan_a", "cursor": "e30="},
+        {"simulation_ids": ["fan_a"], "cursor": "e30=", "offset": 5},
+    ],
+)
+def test_fan_out_invalid_scope(actions_tool, params):
+    """Test invalid simulation selections are rejected."""
+    result = actions_tool(**params)
+
+    assert result["success"] is False
+    assert result["error"]["type"] == "ValidationError"
+
+
+def test_fan_out_foreign_cursor(actions_tool):
+    """Test a cursor from a different simulation set is rejected."""
+    cursor = actions_tool(simulation_ids=["fan_a", "fan_b"], limit=2)["data"]["next_cursor"]
+
+    result = actions_tool(simulation_ids=["fan_a", "fan_c"], cursor=cursor)
+    assert result["error"]["type"] == "ValidationError"
+
+    result = actions_tool(simulation_ids=["fan_a", "fan_b"], cursor="not a cursor")
+    assert result["error"]["type"] == "ValidationError"
+
+
+def test_fan_out_not_found(fan_services, actions_tool):
+    """Test unknown simulations and experiments are reported."""
+    result = actions_tool(simulation_ids=["fan_a", "missing"])
+    assert result["error"]["type"] == "SimulationNotFoundError"
+
+    result = actions_tool(experiment_id="missing")
+    assert result["error"]["type"] == "ExperimentNotFoundError"
+
+
+def test_fan_out_rejects_trajectory(fan_services):
+    """Test trajectory mode needs a single simulation."""
+    tool = QueryStatesTool(*fan_services)
+
+    result = tool(simulation_ids=["fan_a", "fan_b"], agent_id="fan_a_agent_0", trajectory=True)
+
+    assert result["error"]["type"] == "ValidationError"
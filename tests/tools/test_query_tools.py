@@ -1,15 +1,26 @@
 """Unit tests for query tools."""
 
+import json
+
 import pytest
+from sqlalchemy import text
 
+from agentfarm_mcp.models.database_models import AgentModel
 from agentfarm_mcp.tools.query_tools import (
+    BULK_LOOKUP_CHUNK_SIZE,
+    MAX_BULK_AGENT_IDS,
+    GetAgentsBulkTool,
     GetSimulationMetricsTool,
     QueryActionsTool,
+    QueryActionsWithStatesTool,
     QueryAgentsTool,
     QueryInteractionsTool,
     QueryResourcesTool,
     QueryStatesTool,
+    TopAgentsTool,
+    _agent_ordering,
 )
+from agentfarm_mcp.utils.trajectory import decode_trajectory
 
 
 @pytest.fixture
@@ -26,6 +37,13 @@ def query_actions_tool(services):
     return QueryActionsTool(db_service, cache_service)
 
 
+@pytest.fixture
+def query_actions_with_states_tool(services):
+    """Create QueryActionsWithStatesTool instance."""
+    db_service, cache_service = services
+    return QueryActionsWithStatesTool(db_service, cache_service)
+
+
 @pytest.fixture
 def query_states_tool(services):
     """Create QueryStatesTool instance."""
@@ -54,6 +72,20 @@ def get_simulation_metrics_tool(services):
     return GetSimulationMetricsTool(db_service, cache_service)
 
 
+@pytest.fixture
+def get_agents_bulk_tool(services):
+    """Create GetAgentsBulkTool instance."""
+    db_service, cache_service = services
+    return GetAgentsBulkTool(db_service, cache_service)
+
+
+@pytest.fixture
+def top_agents_tool(services):
+    """Create TopAgentsTool instance."""
+    db_service, cache_service = services
+    return TopAgentsTool(db_service, cache_service)
+
+
 # QueryAgentsTool Tests
 
 
@@ -128,6 +160,202 @@ def test_query_agents_invalid_simulation(query_agents_tool):
     assert "not found" in result["error"]["message"].lower()
 
 
+def test_query_agents_sort_by_column(query_agents_tool, test_simulation_id):
+    """Test sorting by a column; ties are broken by agent ID in the same direction."""
+    result = query_agents_tool(
+        simulation_id=test_simulation_id, sort_by="generation", order="desc", limit=6
+    )
+
+    agents = result["data"]["agents"]
+    assert [a["agent_id"] for a in agents] == [f"agent_{j:03d}" for j in range(19, 13, -1)]
+    assert [a["generation"] for a in agents] == [3] * 5 + [2]
+    assert result["data"]["total_count"] == 20
+
+
+def test_query_agents_sort_by_lifespan(query_agents_tool, test_simulation_id):
+    """Test sorting by the derived lifespan; rows carry the sort value."""
+    result = query_agents_tool(
+        simulation_id=test_simulation_id,
+        sort_by="lifespan",
+        order="desc",
+        fields=["agent_id"],
+        limit=3,
+    )
+
+    assert result["data"]["agents"] == [
+        {"agent_id": "agent_018", "lifespan": 200},
+        {"agent_id": "agent_016", "lifespan": 180},
+        {"agent_id": "agent_014", "lifespan": 170},
+    ]
+
+
+def test_query_agents_sort_by_total_reward(query_agents_tool, test_simulation_id):
+    """Test sorting by final total reward puts agents without states last."""
+    result = query_agents_tool(
+        simulation_id=test_simulation_id, sort_by="total_reward", order="desc", limit=7
+    )
+
+    agents = result["data"]["agents"]
+    assert [a["total_reward"] for a in agents] == [45.0] * 5 + [None, None]
+    assert [a["agent_id"] for a in agents[:5]] == [f"agent_{j:03d}" for j in range(4, -1, -1)]
+
+
+def test_top_agents_lifespan(top_agents_tool, test_simulation_id):
+    """Test ranking agents by lifespan."""
+    result = top_agents_tool(simulation_id=test_simulation_id, metric="lifespan", k=3)
+
+    assert result["success"] is True
+    agents = result["data"]["agents"]
+    assert [(a["rank"], a["agent_id"], a["value"]) for a in agents] == [
+        (1, "agent_018", 200),
+        (2, "agent_016", 180),
+        (3, "agent_014", 170),
+    ]
+    assert agents[0]["death_time"] == 230
+    assert result["data"]["returned_count"] == 3
+
+
+def test_top_agents_filters(top_agents_tool, test_simulation_id):
+    """Test ascending ranks with type and alive filters."""
+    result = top_agents_tool(
+        simulation_id=test_simulation_id,
+        metric="generation",
+        order="asc",
+        k=3,
+        agent_type="independent",
+        alive_only=True,
+    )
+
+    agents = result["data"]["agents"]
+    assert [a["agent_id"] for a in agents] == ["agent_001", "agent_005", "agent_007"]
+    assert all(a["death_time"] is None for a in agents)
+
+
+def test_top_agents_invalid_metric(top_agents_tool, test_simulation_id):
+    """Test unknown metrics are rejected."""
+    result = top_agents_tool(simulation_id=test_simulation_id, metric="charisma")
+
+    assert result["success"] is False
+    assert result["error"]["type"] == "ValidationError"
+
+
+@pytest.mark.parametrize("order", ["desc", "asc"])
+def test_top_agents_ordering_uses_index(top_agents_tool, test_simulation_id, order):
+    """Test top-k ordering on a column is read from the composite index."""
+
+    def plan(session):
+        query = (
+            session.query(AgentModel.agent_id)
+            .filter(
+                AgentModel.simulation_id == test_simulation_id,
+                AgentModel.generation.isnot(None),
+            )
+            .order_by(*_agent_ordering(AgentModel.generation, order))
+            .limit(10)
+        )
+        sql = query.statement.compile(
+            dialect=session.bind.dialect, compile_kwargs={"literal_binds": True}
+        )
+        return " ".join(
+            str(row[-1]) for row in session.execute(text(f"EXPLAIN QUERY PLAN {sql}"))
+        )
+
+    query_plan = top_agents_tool.db.execute_query(plan)
+
+    assert "idx_agents_simulation_generation" in query_plan
+    assert "TEMP B-TREE" not in query_plan
+
+
+def test_top_agents_skips_agents_without_value(top_agents_tool, test_simulation_id):
+    """Test agents without a recorded state are not ranked in either direction."""
+    for order in ("asc", "desc"):
+        result = top_agents_tool(
+            simulation_id=test_simulation_id, metric="total_reward", order=order, k=10
+        )
+
+        values = [agent["value"] for agent in result["data"]["agents"]]
+        assert values == [45.0] * 5
+
+
+def test_query_agents_sort_ascending_nulls_first(query_agents_tool, test_simulation_id):
+    """Test ascending sorts keep SQLite's NULL order (living agents first by death_time)."""
+    result = query_agents_tool(
+        simulation_id=test_simulation_id, sort_by="death_time", order="asc", limit=1000
+    )
+
+    death_times = [agent["death_time"] for agent in result["data"]["agents"]]
+    living = death_times.count(None)
+    assert living > 0
+    assert death_times[:living] == [None] * living
+    assert death_times[living:] == sorted(death_times[living:])
+
+
+# GetAgentsBulkTool Tests
+
+
+def test_get_agents_bulk_basic(get_agents_bulk_tool, test_simulation_id):
+    """Test bulk lookup keys agents by ID in request order."""
+    result = get_agents_bulk_tool(
+        simulation_id=test_simulation_id,
+        agent_ids=["agent_005", "agent_000", "ghost", "agent_005"],
+    )
+
+    assert result["success"] is True
+    data = result["data"]
+    assert list(data["agents"]) == ["agent_005", "agent_000"]
+    assert data["agents"]["agent_005"]["generation"] == 1
+    assert data["agents"]["agent_005"]["position"] == {"x": 25.0, "y": 15.0}
+    assert data["missing"] == ["ghost"]
+    assert data["found_count"] == 2
+    assert data["queries"] == 1
+
+
+def test_get_agents_bulk_chunks(get_agents_bulk_tool, test_simulation_id):
+    """Test long ID lists are split into chunks of bound parameters."""
+    agent_ids = [f"agent_{j:03d}" for j in range(20)]
+    agent_ids += [f"unknown_{j}" for j in range(2 * BULK_LOOKUP_CHUNK_SIZE)]
+
+    data = get_agents_bulk_tool(simulation_id=test_simulation_id, agent_ids=agent_ids)["data"]
+
+    assert data["queries"] == 3
+    assert data["found_count"] == 20
+    assert len(data["missing"]) == 2 * BULK_LOOKUP_CHUNK_SIZE
+
+
+def test_get_agents_bulk_fields_and_lifespan(get_agents_bulk_tool, test_simulation_id):
+    """Test projection and lifespan as analyze_agent_performance computes it."""
+    data = get_agents_bulk_tool(
+        simulation_id=test_simulation_id,
+        agent_ids=["agent_000", "agent_001", "agent_006"],
+        fields=["generation"],
+        include_lifespan=True,
+    )["data"]
+
+    assert data["agents"]["agent_000"] == {"generation": 0, "status": "dead", "lifespan": 50}
+    assert data["agents"]["agent_001"] == {"generation": 0, "status": "alive", "lifespan": 99}
+    assert data["agents"]["agent_006"] == {"generation": 1, "status": "dead", "lifespan": 100}
+
+
+@pytest.mark.parametrize(
+    "agent_ids",
+    [[], [f"agent_{j}" for j in range(MAX_BULK_AGENT_IDS + 1)]],
+)
+def test_get_agents_bulk_invalid_ids(get_agents_bulk_tool, test_simulation_id, agent_ids):
+    """Test empty and oversized ID lists are rejected."""
+    result = get_agents_bulk_tool(simulation_id=test_simulation_id, agent_ids=agent_ids)
+
+    assert result["success"] is False
+    assert result["error"]["type"] == "ValidationError"
+
+
+def test_get_agents_bulk_invalid_simulation(get_agents_bulk_tool):
+    """Test bulk lookup in an unknown simulation."""
+    result = get_agents_bulk_tool(simulation_id="invalid_999", agent_ids=["agent_000"])
+
+    assert result["success"] is False
+    assert result["error"]["type"] == "SimulationNotFoundError"
+
+
 # QueryActionsTool Tests
 
 
@@ -173,6 +401,100 @@ def test_query_actions_step_range(query_actions_tool, test_simulation_id):
         assert 10 <= action["step_number"] <= 30
 
 
+# QueryActionsWithStatesTool Tests
+
+
+def test_query_actions_with_states(query_actions_with_states_tool, test_simulation_id):
+    """Test actions come back with the linked states and their delta."""
+    result = query_actions_with_states_tool(
+        simulation_id=test_simulation_id, agent_id="agent_001", start_step=10, end_step=10
+    )
+
+    assert result["success"] is True
+    data = result["data"]
+    assert data["total_count"] == 1
+    action = data["actions"][0]
+    assert action["action_type"] == "gather"
+    assert action["state_before"]["step_number"] == 10
+    assert action["state_before"]["position"] == pytest.approx(
+        {"x": 6.0, "y": 3.5, "z": 0.0}
+    )
+    assert action["state_after"]["step_number"] == 20
+    assert "agent_id" not in action["state_before"]
+
+    delta = action["delta"]
+    assert delta["step_number"] == 10
+    assert delta["age"] == 10
+    assert delta["resource_level"] == pytest.approx(-2.0)
+    assert delta["current_health"] == pytest.approx(-1.0)
+    assert delta["total_reward"] == pytest.approx(5.0)
+    assert delta["position"] == pytest.approx({"x": 1.0, "y": 0.5, "z": 0.0})
+    assert "is_defending" not in delta
+
+
+def test_query_actions_with_states_unlinked(query_actions_with_states_tool, test_simulation_id):
+    """Test actions without linked states get null parts."""
+    result = query_actions_with_states_tool(
+        simulation_id=test_simulation_id, agent_id="agent_000", start_step=5, end_step=5
+    )
+
+    action = result["data"]["actions"][0]
+    assert action["state_before"] is None
+    assert action["state_after"] is None
+    assert action["delta"] is None
+
+
+def test_query_actions_with_states_projection(query_actions_with_states_tool, test_simulation_id):
+    """Test action/state projections and the include list."""
+    result = query_actions_with_states_tool(
+        simulation_id=test_simulation_id,
+        agent_id="agent_002",
+        fields=["step_number", "action_type"],
+        state_fields=["current_health", "is_defending"],
+        include=["delta"],
+        limit=3,
+    )
+
+    data = result["data"]
+    assert data["total_count"] == 10
+    assert [a["step_number"] for a in data["actions"]] == [0, 5, 10]
+    assert data["actions"][0] == {
+        "step_number": 0,
+        "action_type": "move",
+        "delta": {"current_health": pytest.approx(-1.0)},
+    }
+    assert data["actions"][1]["delta"] is None
+
+
+def test_query_actions_with_states_columnar(query_actions_with_states_tool, test_simulation_id):
+    """Test nested state columns in columnar output."""
+    result = query_actions_with_states_tool(
+        simulation_id=test_simulation_id,
+        agent_id="agent_000",
+        state_fields=["resource_level"],
+        include=["before"],
+        limit=2,
+        format="columnar",
+    )
+
+    actions = result["data"]["actions"]
+    assert actions["state_before"]["resource_level"] == [50.0, None]
+
+
+def test_query_actions_with_states_invalid(query_actions_with_states_tool, test_simulation_id):
+    """Test invalid projections and unknown simulations."""
+    result = query_actions_with_states_tool(
+        simulation_id=test_simulation_id, state_fields=["mood"]
+    )
+    assert result["error"]["type"] == "ValidationError"
+
+    result = query_actions_with_states_tool(simulation_id=test_simulation_id, include=[])
+    assert result["error"]["type"] == "ValidationError"
+
+    result = query_actions_with_states_tool(simulation_id="invalid_999")
+    assert result["error"]["type"] == "SimulationNotFoundError"
+
+
 # QueryStatesTool Tests
 
 
@@ -323,6 +645,144 @@ def test_get_simulation_metrics_response_structure(get_simulation_metrics_tool,
         assert "average_agent_health" in metric
 
 
+def test_get_simulation_metrics_stream(get_simulation_metrics_tool, test_simulation_id):
+    """Test that streaming yields bounded chunks matching the full result."""
+    get_simulation_metrics_tool.stream_chunk_size = 30
+    full = get_simulation_metrics_tool(simulation_id=test_simulation_id, limit=100)
+
+    envelopes = list(get_simulation_metrics_tool.stream(simulation_id=test_simulation_id, limit=100))
+    chunks, end = envelopes[:-1], envelopes[-1]
+
+    assert [len(c["data"]["metrics"]) for c in chunks] == [30, 30, 30, 10]
+    assert [c["index"] for c in chunks] == [0, 1, 2, 3]
+    streamed = [row for c in chunks for row in c["data"]["metrics"]]
+    assert streamed == full["data"]["metrics"]
+
+    assert end["type"] == "end"
+    assert end["success"] is True
+    assert end["data"]["total_count"] == 100
+    assert end["data"]["returned_count"] == 100
+    assert end["metadata"]["chunks"] == 4
+
+
+def test_get_simulation_metrics_stream_error(get_simulation_metrics_tool):
+    """Test that streaming errors are delivered as a final error envelope."""
+    envelopes = list(get_simulation_metrics_tool.stream(simulation_id="missing_sim"))
+
+    assert len(envelopes) == 1
+    assert envelopes[0]["type"] == "end"
+    assert envelopes[0]["success"] is False
+    assert envelopes[0]["error"]["type"] == "SimulationNotFoundError"
+
+
+# Field projection
+
+
+@pytest.mark.parametrize(
+    "tool_fixture,key,fields",
+    [
+        ("query_agents_tool", "agents", ["agent_id", "position"]),
+        ("query_actions_tool", "actions", ["step_number", "action_type", "reward"]),
+        ("query_states_tool", "states", ["position", "resource_level"]),
+        ("get_simulation_metrics_tool", "metrics", ["step_number", "births"]),
+    ],
+)
+def test_field_projection(tool_fixture, key, fields, test_simulation_id, request):
+    """Test that projected rows contain only the requested fields with full values."""
+    tool = request.getfixturevalue(tool_fixture)
+
+    full = tool(simulation_id=test_simulation_id, limit=10)
+    projected = tool(simulation_id=test_simulation_id, limit=10, fields=fields)
+
+    assert projected["success"] is True
+    assert projected["data"]["total_count"] == full["data"]["total_count"]
+    expected = [{field: row[field] for field in fields} for row in full["data"][key]]
+    assert projected["data"][key] == expected
+
+
+def test_field_projection_invalid_field(query_agents_tool, test_simulation_id):
+    """Test that unknown and empty projections are rejected."""
+    result = query_agents_tool(simulation_id=test_simulation_id, fields=["agent_id", "bogus"])
+
+    assert result["success"] is False
+    assert result["error"]["type"] == "ValidationError"
+    assert "bogus" in result["error"]["message"]
+
+    result = query_agents_tool(simulation_id=test_simulation_id, fields=[])
+    assert result["success"] is False
+
+
+def test_field_projection_pushed_into_select(get_simulation_metrics_tool, test_simulation_id):
+    """Test that only the projected columns are selected."""
+    from sqlalchemy import event
+
+    statements = []
+    engine = get_simulation_metrics_tool.db._engine
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        get_simulation_metrics_tool(
+            simulation_id=test_simulation_id, limit=5, fields=["step_number", "births"]
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    selects = [sql for sql in statements if "simulation_steps.births" in sql]
+    assert selects
+    assert all("genetic_diversity" not in sql for sql in selects)
+
+
+def test_get_simulation_metrics_stream_fields(get_simulation_metrics_tool, test_simulation_id):
+    """Test that streaming honours the field projection."""
+    envelopes = list(
+        get_simulation_metrics_tool.stream(
+            simulation_id=test_simulation_id, limit=10, fields=["step_number"]
+        )
+    )
+
+    rows = [row for envelope in envelopes[:-1] for row in envelope["data"]["metrics"]]
+    assert rows == [{"step_number": step} for step in range(10)]
+
+
+def test_get_simulation_metrics_columnar(get_simulation_metrics_tool, test_simulation_id):
+    """Test columnar output for full and streamed metrics."""
+    rows = get_simulation_metrics_tool(simulation_id=test_simulation_id, limit=20)
+    columnar = get_simulation_metrics_tool(
+        simulation_id=test_simulation_id, limit=20, format="columnar"
+    )
+
+    metrics = columnar["data"]["metrics"]
+    assert metrics["step_number"] == [row["step_number"] for row in rows["data"]["metrics"]]
+    assert metrics["births"] == [row["births"] for row in rows["data"]["metrics"]]
+    assert columnar["data"]["returned_count"] == 20
+
+    get_simulation_metrics_tool.stream_chunk_size = 15
+    envelopes = list(
+        get_simulation_metrics_tool.stream(
+            simulation_id=test_simulation_id, limit=20, format="columnar", fields=["births"]
+        )
+    )
+    assert [envelope["data"]["metrics"] for envelope in envelopes[:-1]] == [
+        {"births": metrics["births"][:15]},
+        {"births": metrics["births"][15:]},
+    ]
+
+
+def test_query_actions_columnar_categoricals(query_actions_tool, test_simulation_id):
+    """Test that action types are dictionary-encoded."""
+    result = query_actions_tool(simulation_id=test_simulation_id, limit=50, format="columnar")
+
+    action_type = result["data"]["actions"]["action_type"]
+    rows = query_actions_tool(simulation_id=test_simulation_id, limit=50)["data"]["actions"]
+    assert [action_type["dictionary"][code] for code in action_type["codes"]] == [
+        row["action_type"] for row in rows
+    ]
+    assert len(action_type["dictionary"]) == len({row["action_type"] for row in rows})
+
+
 # Test pagination across all query tools
 
 
@@ -414,4 +874,143 @@ def test_get_simulation_metrics_ordering(get_simulation_metrics_tool, test_simul
     steps = result["data"]["metrics"]
     if len(steps) > 1:
         for i in range(len(steps) - 1):
-            assert steps[i]["step_number"] <= steps[i + 1]["step_number"]
\ No newline at end of file
+            assert steps[i]["step_number"] <= steps[i + 1]["step_number"]
+
+def test_get_simulation_metrics_max_points_buckets(
+    get_simulation_metrics_tool, test_simulation_id
+):
+    """Test SQL bucket downsampling with min/mean/max per bucket."""
+    result = get_simulation_metrics_tool(
+        simulation_id=test_simulation_id, max_points=4, fields=["total_agents", "births"]
+    )
+
+    assert result["success"] is True
+    data = result["data"]
+    assert data["total_count"] == 100
+    assert data["returned_count"] == 4
+    assert data["downsample"] == {"method": "buckets", "resolution": 25, "source_points": 100}
+
+    first = data["metrics"][0]
+    assert (first["step_number"], first["step_end"], first["samples"]) == (0, 24, 25)
+    assert set(first) == {"step_number", "step_end", "samples", "total_agents", "births"}
+    stats = first["total_agents"]
+    assert stats["min"] <= stats["mean"] <= stats["max"]
+    assert sum(point["samples"] for point in data["metrics"]) == 100
+
+
+def test_get_simulation_metrics_resolution(get_simulation_metrics_tool, test_simulation_id):
+    """Test buckets of a fixed number of steps aligned to the start of the range."""
+    result = get_simulation_metrics_tool(
+        simulation_id=test_simulation_id, start_step=10, resolution=30, fields=["births"]
+    )
+
+    assert result["success"] is True
+    points = result["data"]["metrics"]
+    assert [point["step_number"] for point in points] == [10, 40, 70]
+    assert [point["samples"] for point in points] == [30, 30, 30]
+
+
+def test_get_simulation_metrics_lttb(get_simulation_metrics_tool, test_simulation_id):
+    """Test LTTB downsampling returns original rows including the endpoints."""
+    full = get_simulation_metrics_tool(
+        simulation_id=test_simulation_id, fields=["step_number", "total_agents"]
+    )["data"]["metrics"]
+
+    result = get_simulation_metrics_tool(
+        simulation_id=test_simulation_id,
+        max_points=10,
+        downsample="lttb",
+        fields=["step_number", "total_agents"],
+    )
+
+    assert result["success"] is True
+    points = result["data"]["metrics"]
+    assert len(points) == 10
+    assert points[0] == full[0]
+    assert points[-1] == full[-1]
+    assert all(point in full for point in points)
+
+
+def test_get_simulation_metrics_downsample_smaller_response(
+    get_simulation_metrics_tool, test_simulation_id
+):
+    """Test that a downsampled whole run is much smaller than the full series."""
+    full = get_simulation_metrics_tool(simulation_id=test_simulation_id)
+    downsampled = get_simulation_metrics_tool(
+        simulation_id=test_simulation_id, max_points=10, fields=["total_agents"]
+    )
+
+    assert len(json.dumps(downsampled["data"])) * 10 < len(json.dumps(full["data"]))
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"max_points": 10, "resolution": 5},
+        {"max_points": 2},
+        {"max_points": 10, "downsample": "lttb", "lttb_field": "step_number"},
+    ],
+)
+def test_get_simulation_metrics_downsample_invalid(
+    get_simulation_metrics_tool, test_simulation_id, params
+):
+    """Test invalid downsampling parameters."""
+    result = get_simulation_metrics_tool(simulation_id=test_simulation_id, **params)
+
+    assert result["success"] is False
+    assert result["error"]["type"] == "ValidationError"
+
+
+def test_get_simulation_metrics_downsample_stream(get_simulation_metrics_tool, test_simulation_id):
+    """Test that streaming a downsampled series yields one chunk."""
+    envelopes = list(
+        get_simulation_metrics_tool.stream(
+            simulation_id=test_simulation_id, max_points=5, fields=["births"]
+        )
+    )
+
+    assert [envelope["type"] for envelope in envelopes] == ["chunk", "end"]
+    assert len(envelopes[0]["data"]["metrics"]) == 5
+    assert envelopes[-1]["data"]["downsample"]["source_points"] == 100
+
+
+def test_query_states_trajectory_round_trip(query_states_tool, test_simulation_id, test_agent_id):
+    """Test that a decoded trajectory equals the row states, in a smaller payload."""
+    rows = query_states_tool(simulation_id=test_simulation_id, agent_id=test_agent_id, limit=1000)
+    result = query_states_tool(
+        simulation_id=test_simulation_id, agent_id=test_agent_id, trajectory=True
+    )
+
+    assert result["success"] is True
+    data = result["data"]
+    assert data["total_count"] == 10
+    assert data["trajectory"]["step_number"] == [[0, 10, 10]]
+    assert data["trajectory"]["agent_id"] == [[test_agent_id, 0, 10]]
+    assert decode_trajectory(data["trajectory"]) == rows["data"]["states"]
+    assert len(json.dumps(data)) * 2 < len(json.dumps(rows["data"]))
+
+
+def test_query_states_trajectory_fields(query_states_tool, test_simulation_id, test_agent_id):
+    """Test that trajectories honour projections and step ranges and keep the step axis."""
+    result = query_states_tool(
+        simulation_id=test_simulation_id,
+        agent_id=test_agent_id,
+        trajectory=True,
+        fields=["position"],
+        start_step=20,
+        end_step=50,
+    )
+
+    trajectory = result["data"]["trajectory"]
+    assert list(trajectory) == ["step_number", "position"]
+    states = decode_trajectory(trajectory)
+    assert [state["step_number"] for state in states] == [20, 30, 40, 50]
+    assert states[0]["position"]["z"] == 0.0
+
+
+def test_query_states_trajectory_requires_agent(query_states_tool, test_simulation_id):
+    """Test that trajectory mode is limited to one agent."""
+    result = query_states_tool(simulation_id=test_simulation_id, trajectory=True)
+
+    assert result["success"] is False
+    assert result["error"]["type"] == "ValidationError"
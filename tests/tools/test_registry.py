@@ -0,0 +1,87 @@
+"""Tests for the tool catalog and lazy startup paths."""
+
+import json
+import subprocess
+import sys
+
+from agentfarm_mcp.tools.base import ToolBase
+from agentfarm_mcp.tools.registry import (
+    CATALOG_PATH,
+    TOOL_CATALOG,
+    build_catalog,
+    describe_tools,
+    load_catalog,
+    load_tool_classes,
+)
+
+
+def test_load_tool_classes():
+    """Test that every catalog entry resolves to a tool class."""
+    classes = load_tool_classes()
+
+    assert len(classes) == len(TOOL_CATALOG)
+    assert all(issubclass(tool_class, ToolBase) for tool_class in classes)
+
+
+def test_catalog_file_up_to_date():
+    """Test that catalog.json matches the tool classes.
+
+    Regenerate it with ``python -m agentfarm_mcp.tools.registry``.
+    """
+    with open(CATALOG_PATH, encoding="utf-8") as f:
+        assert json.load(f) == build_catalog()
+
+
+def test_describe_tools_matches_server(server):
+    """Test that tool metadata without services matches the running server."""
+    described = {tool["name"] for tool in describe_tools()}
+
+    assert described == set(server.list_tools())
+    assert len(described) == len(TOOL_CATALOG)
+
+
+def test_tools_load_on_first_call(server):
+    """Test that tools are instantiated when first requested, once."""
+    assert server._tools == {}
+
+    tool = server.get_tool("list_simulations")
+
+    assert server.get_tool("list_simulations") is tool
+    assert set(server._tools) == {"list_simulations"}
+    assert server.health_check()["components"]["tools"]["loaded"] == 1
+
+    server.load_tools()
+    assert set(server._tools) == {spec.name for spec in load_catalog()}
+
+
+def test_heavy_dependencies_not_imported_at_startup(test_db_with_data):
+    """Test that building the server imports no tool module and no heavy dependency."""
+    code = (
+        "import sys\n"
+        "from agentfarm_mcp.config import MCPConfig\n"
+        "from agentfarm_mcp.server import SimulationMCPServer\n"
+        f"SimulationMCPServer(MCPConfig.from_db_path({str(test_db_with_data)!r}))\n"
+        "heavy = ('deepdiff', 'pandas', 'redis', 'numpy', 'psutil')\n"
+        "loaded = [m for m in heavy if m in sys.modules]\n"
+        "loaded += [m for m in sys.modules if m.startswith('agentfarm_mcp.tools.')]\n"
+        "print(','.join(sorted(loaded)))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    )
+
+    loaded = result.stdout.strip().splitlines()[-1].split(",")
+    assert sorted(loaded) == ["agentfarm_mcp.tools.base", "agentfarm_mcp.tools.registry"]
+
+
+def test_cli_list_tools_without_database():
+    """Test that --list-tools works without a database."""
+    result = subprocess.run(
+        [sys.executable, "-m", "agentfarm_mcp", "--list-tools"],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    assert f"Total: {len(TOOL_CATALOG)} tools" in result.stdout
+    assert "query_agents" in result.stdout
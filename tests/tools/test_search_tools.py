@@ -0,0 +1,67 @@
+"""Unit tests for search tools."""
+
+import pytest
+
+from agentfarm_mcp.tools.search_tools import SearchEventsTool
+
+
+@pytest.fixture
+def search_tool(services):
+    """Create SearchEventsTool instance."""
+    db_service, cache_service = services
+    return SearchEventsTool(db_service, cache_service)
+
+
+def test_search_events(search_tool, test_simulation_id):
+    """Test ranked search across event sources."""
+    result = search_tool(simulation_id=test_simulation_id, query="gather")
+
+    assert result["success"] is True
+    data = result["data"]
+    assert data["total_count"] == 19  # 9 gather actions + 10 gather interactions
+    assert {row["source"] for row in data["results"]} == {"actions", "interactions"}
+    assert data["index"]["documents"] == 41
+
+
+def test_search_events_rebuild(search_tool, test_simulation_id):
+    """Test that repeated searches reuse the index and rebuild=True rebuilds it."""
+    search_tool(simulation_id=test_simulation_id, query="gather")
+    reused = search_tool(simulation_id=test_simulation_id, query="gather")
+    rebuilt = search_tool(simulation_id=test_simulation_id, query="gather", rebuild=True)
+
+    assert reused["data"]["index"]["built_now"] is False
+    assert rebuilt["data"]["index"]["built_now"] is True
+    assert rebuilt["data"]["total_count"] == 19
+
+
+def test_search_events_sources_and_columnar(search_tool, test_simulation_id):
+    """Test restricting sources and columnar output."""
+    result = search_tool(
+        simulation_id=test_simulation_id,
+        query="gather",
+        sources=["interactions"],
+        format="columnar",
+    )
+
+    results = result["data"]["results"]
+    assert results["source"] == {"dictionary": ["interactions"], "codes": [0] * 10}
+    assert results["details"]["amount"] == [5.0] * 10
+
+
+@pytest.mark.parametrize(
+    "params",
+    [{}, {"query": "x", "sources": []}, {"query": "x", "sources": ["agents"]}, {"query": "("}],
+)
+def test_search_events_invalid(search_tool, test_simulation_id, params):
+    """Test parameter and query validation."""
+    result = search_tool(simulation_id=test_simulation_id, **params)
+
+    assert result["success"] is False
+    assert result["error"]["type"] == "ValidationError"
+
+
+def test_search_events_unknown_simulation(search_tool):
+    """Test that an unknown simulation is reported."""
+    result = search_tool(simulation_id="missing", query="attack")
+
+    assert result["error"]["type"] == "SimulationNotFoundError"
@@ -0,0 +1,97 @@
+"""Unit tests for world snapshot tools."""
+
+import pytest
+from sqlalchemy import text
+
+from agentfarm_mcp.tools.snapshot_tools import GetWorldSnapshotTool
+from agentfarm_mcp.utils.columnar import from_columnar
+
+
+@pytest.fixture
+def snapshot_tool(services):
+    """Create GetWorldSnapshotTool instance."""
+    db_service, cache_service = services
+    return GetWorldSnapshotTool(db_service, cache_service)
+
+
+def test_world_snapshot_columns(snapshot_tool, test_simulation_id):
+    """Test that agents and resources of a step come back as columns."""
+    result = snapshot_tool(simulation_id=test_simulation_id, step_number=50)
+
+    assert result["success"] is True
+    data = result["data"]
+    assert data["agent_count"] == 5
+    assert data["resource_count"] == 10
+
+    agents = data["agents"]
+    assert agents["agent_id"] == [f"agent_{j:03d}" for j in range(5)]
+    assert agents["position"]["x"] == pytest.approx([j * 5 + 5.0 for j in range(5)])
+    assert set(agents["agent_type"]) == {"dictionary", "codes"}
+    assert len(agents["agent_type"]["codes"]) == 5
+
+    resources = from_columnar(data["resources"])
+    assert resources[3] == {"resource_id": 3, "amount": 75.0, "position": {"x": 30.0, "y": 15.0}}
+
+
+def test_world_snapshot_include(snapshot_tool, test_simulation_id):
+    """Test returning only part of the world."""
+    result = snapshot_tool(simulation_id=test_simulation_id, step_number=0, include=["resources"])
+
+    data = result["data"]
+    assert "agents" not in data
+    assert data["resource_count"] == 10
+
+
+def test_world_snapshot_empty_step(snapshot_tool, test_simulation_id):
+    """Test that a step without data returns empty columns."""
+    result = snapshot_tool(simulation_id=test_simulation_id, step_number=5)
+
+    data = result["data"]
+    assert data["agent_count"] == 0
+    assert data["agents"]["agent_id"] == []
+    assert data["agents"]["position"] == {"x": [], "y": []}
+    assert data["resource_count"] == 0
+
+
+def test_world_snapshot_cached(snapshot_tool, test_simulation_id):
+    """Test that repeated snapshots of a step are served from the cache."""
+    snapshot_tool(simulation_id=test_simulation_id, step_number=10)
+    result = snapshot_tool(simulation_id=test_simulation_id, step_number=10)
+
+    assert result["metadata"]["from_cache"] is True
+
+
+def test_world_snapshot_uses_composite_index(snapshot_tool, test_simulation_id):
+    """Test that both step lookups use the (simulation_id, step_number) indexes."""
+
+    def plans(session):
+        return [
+            " ".join(
+                str(row[-1])
+                for row in session.execute(
+                    text(
+                        f"EXPLAIN QUERY PLAN SELECT * FROM {table} "
+                        "WHERE simulation_id = :sim AND step_number = :step"
+                    ),
+                    {"sim": test_simulation_id, "step": 10},
+                )
+            )
+            for table in ("agent_states", "resource_states")
+        ]
+
+    agent_plan, resource_plan = snapshot_tool.db.execute_query(plans)
+
+    assert "idx_agent_states_simulation_step" in agent_plan
+    assert "idx_resource_states_simulation_step" in resource_plan
+
+
+def test_world_snapshot_invalid_params(snapshot_tool, test_simulation_id):
+    """Test validation of the include list and unknown simulations."""
+    result = snapshot_tool(simulation_id=test_simulation_id, step_number=0, include=[])
+    assert result["error"]["type"] == "ValidationError"
+
+    result = snapshot_tool(simulation_id=test_simulation_id, step_number=0, include=["actions"])
+    assert result["error"]["type"] == "ValidationError"
+
+    result = snapshot_tool(simulation_id="missing", step_number=0)
+    assert result["error"]["type"] == "SimulationNotFoundError"
@@ -0,0 +1,133 @@
+"""Unit tests for spatial tools."""
+
+import math
+
+import pytest
+
+from agentfarm_mcp.tools import spatial_tools
+from agentfarm_mcp.tools.spatial_tools import QuerySpatialTool
+from agentfarm_mcp.utils.spatial_index import GridIndex
+
+
+@pytest.fixture
+def spatial_tool(services):
+    """Create QuerySpatialTool instance."""
+    db_service, cache_service = services
+    return QuerySpatialTool(db_service, cache_service)
+
+
+def test_query_spatial_bbox(spatial_tool, test_simulation_id):
+    """Test finding agents inside a bounding box."""
+    result = spatial_tool(
+        simulation_id=test_simulation_id, step_number=0, shape="bbox", bbox=[4, 2, 16, 10]
+    )
+
+    assert result["success"] is True
+    data = result["data"]
+    assert [row["agent_id"] for row in data["results"]] == ["agent_001", "agent_002", "agent_003"]
+    assert data["results"][0]["position"] == {"x": 5.0, "y": 3.0}
+    assert "current_health" in data["results"][0]
+    assert data["indexed_points"] == 5
+    assert data["truncated"] is False
+
+
+def test_query_spatial_radius(spatial_tool, test_simulation_id):
+    """Test finding agents within a radius, nearest first."""
+    result = spatial_tool(
+        simulation_id=test_simulation_id, step_number=0, shape="radius", x=10, y=6, radius=6
+    )
+
+    results = result["data"]["results"]
+    assert [row["agent_id"] for row in results] == ["agent_002", "agent_001", "agent_003"]
+    assert results[0]["distance"] == 0.0
+    assert results[1]["distance"] == pytest.approx(math.hypot(5, 3))
+
+
+def test_query_spatial_nearest_resources(spatial_tool, test_simulation_id):
+    """Test k-nearest search over resources."""
+    result = spatial_tool(
+        simulation_id=test_simulation_id,
+        step_number=50,
+        entity="resources",
+        shape="nearest",
+        x=31,
+        y=15,
+        k=2,
+    )
+
+    data = result["data"]
+    assert [row["resource_id"] for row in data["results"]] == [3, 4]
+    assert data["results"][0]["amount"] == 75.0
+    assert data["total_matches"] == 2
+
+
+def test_query_spatial_reuses_index(spatial_tool, test_simulation_id, monkeypatch):
+    """Test that the step index is built once and reused across shapes."""
+    built = []
+    monkeypatch.setattr(
+        spatial_tools,
+        "GridIndex",
+        lambda xs, ys: built.append(len(xs)) or GridIndex(xs, ys),
+    )
+
+    spatial_tool(simulation_id=test_simulation_id, step_number=10, shape="nearest", x=0, y=0, k=1)
+    second = spatial_tool(
+        simulation_id=test_simulation_id, step_number=10, shape="bbox", bbox=[0, 0, 100, 100]
+    )
+
+    assert built == [5]
+    assert list(spatial_tool._indexes) == [(test_simulation_id, "agents", 10)]
+    assert second["data"]["total_matches"] == 5
+
+
+def test_query_spatial_not_cached(spatial_tool, test_simulation_id):
+    """Test that repeated calls are answered from the index, not the response cache."""
+    params = dict(simulation_id=test_simulation_id, step_number=0, shape="bbox", bbox=[0, 0, 9, 9])
+
+    spatial_tool(**params)
+    result = spatial_tool(**params)
+
+    assert result["metadata"]["from_cache"] is False
+    assert spatial_tool.cache.get_stats()["size"] == 0
+
+
+def test_query_spatial_limit(spatial_tool, test_simulation_id):
+    """Test that results are truncated to the limit."""
+    result = spatial_tool(
+        simulation_id=test_simulation_id,
+        step_number=0,
+        shape="bbox",
+        bbox=[-1, -1, 100, 100],
+        limit=2,
+    )
+
+    data = result["data"]
+    assert data["returned_count"] == 2
+    assert data["total_matches"] == 5
+    assert data["truncated"] is True
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"shape": "radius", "x": 0, "y": 0},
+        {"shape": "nearest", "x": 0},
+        {"shape": "bbox"},
+        {"shape": "bbox", "bbox": [10, 0, 0, 10]},
+        {"shape": "bbox", "bbox": [0, 0, 10]},
+    ],
+)
+def test_query_spatial_invalid_params(spatial_tool, test_simulation_id, params):
+    """Test that incomplete or inconsistent shapes are rejected."""
+    result = spatial_tool(simulation_id=test_simulation_id, step_number=0, **params)
+
+    assert result["success"] is False
+    assert result["error"]["type"] == "ValidationError"
+
+
+def test_query_spatial_unknown_simulation(spatial_tool):
+    """Test that an unknown simulation is reported."""
+    result = spatial_tool(simulation_id="missing", step_number=0, shape="bbox", bbox=[0, 0, 1, 1])
+
+    assert result["success"] is False
+    assert result["error"]["type"] == "SimulationNotFoundError"